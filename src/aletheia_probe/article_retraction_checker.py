@@ -7,7 +7,8 @@ from typing import Any
 
 import aiohttp
 
-from .cache import RetractionCache
+from .cache import RetractionCache, get_cache_registry
+from .config import get_config_manager
 from .logging_config import get_detail_logger, get_status_logger
 
 
@@ -75,12 +76,14 @@ class ArticleRetractionChecker:
             cache_ttl_hours: Cache time-to-live in hours (default: 720 = 30 days)
         """
         self.email = email
-        self.crossref_base_url = "https://api.crossref.org"
+        self.crossref_base_url = get_config_manager().load_config().endpoints.crossref
         self.headers = {
             "User-Agent": f"AletheiaProbe/1.0 (mailto:{email})",
         }
         self.retraction_cache = (
-            retraction_cache if retraction_cache else RetractionCache()
+            retraction_cache
+            if retraction_cache
+            else get_cache_registry().get(RetractionCache)
         )
         self.api_timeout_seconds = api_timeout_seconds
         self.cache_ttl_hours = cache_ttl_hours
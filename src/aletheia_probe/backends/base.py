@@ -18,7 +18,7 @@ from ..backend_exceptions import (
     BackendTimeoutError,
     RateLimitError,
 )
-from ..cache import AssessmentCache, JournalCache, OpenAlexCache
+from ..cache import AssessmentCache, JournalCache, OpenAlexCache, get_cache_registry
 from ..confidence_utils import MatchQuality, calculate_base_confidence
 from ..constants import CONFIDENCE_THRESHOLD_LOW
 from ..enums import AssessmentType, EvidenceType
@@ -27,6 +27,7 @@ from ..fallback_executor import automatic_fallback
 from ..models import AssessmentResult, BackendResult, BackendStatus, QueryInput
 from ..utils.dead_code import code_is_used
 from .fallback_mixin import FallbackStrategyMixin
+from .stale_refresh import get_stale_refresher
 
 
 # Import DataSyncCapable for explicit protocol implementation
@@ -133,8 +134,9 @@ class CachedBackend(Backend, FallbackStrategyMixin):
         super().__init__(cache_ttl_hours)
         self._source_name = source_name
         self.list_type = list_type
-        self.journal_cache = JournalCache()
-        self.assessment_cache = AssessmentCache()
+        cache_registry = get_cache_registry()
+        self.journal_cache = cache_registry.get(JournalCache)
+        self.assessment_cache = cache_registry.get(AssessmentCache)
 
     @code_is_used  # Decorator replaces method body
     @automatic_fallback(
@@ -403,10 +405,11 @@ class ApiBackendWithCache(Backend):
 
     def __init__(self, cache_ttl_hours: int = 24):
         super().__init__(cache_ttl_hours)
-        # Initialize cache instances (db_path will be fetched from config)
-        self.journal_cache = JournalCache()
-        self.assessment_cache = AssessmentCache()
-        self.openalex_cache = OpenAlexCache()
+        # Shared cache instances (db_path will be fetched from config)
+        cache_registry = get_cache_registry()
+        self.journal_cache = cache_registry.get(JournalCache)
+        self.assessment_cache = cache_registry.get(AssessmentCache)
+        self.openalex_cache = cache_registry.get(OpenAlexCache)
 
     async def query(self, query_input: QueryInput) -> BackendResult:
         """Check cache first, then query live API if needed."""
@@ -427,10 +430,70 @@ class ApiBackendWithCache(Backend):
                     backend_result.data = {**backend_result.data, "from_cache": True}
                     return backend_result
 
+        # Expired but recent entries are served immediately when
+        # stale-while-revalidate is enabled; the refresh runs in the background
+        stale_result = self._get_stale_result(cache_key, query_input, start_time)
+        if stale_result is not None:
+            return stale_result
+
         # Cache miss - query the live API
         result = await self._query_api(query_input)
+        self._cache_api_result(cache_key, query_input, result)
+        return result
+
+    def _get_stale_result(
+        self, cache_key: str, query_input: QueryInput, start_time: float
+    ) -> BackendResult | None:
+        """Return a stale cached result and schedule its background refresh.
+
+        Args:
+            cache_key: Assessment cache key for the query
+            query_input: Original query input (used for the refresh)
+            start_time: Query start time for response time calculation
 
-        # Cache the result if successful
+        Returns:
+            Stale BackendResult with ``stale_age_seconds`` in its data, or None if
+            stale-while-revalidate is disabled or no entry is in the stale window
+        """
+        refresher = get_stale_refresher()
+        if not refresher.enabled:
+            return None
+
+        stale = self.assessment_cache.get_stale_assessment(
+            cache_key, refresher.max_stale_hours
+        )
+        if stale is None:
+            return None
+
+        stale_assessment, stale_age_seconds = stale
+        for backend_result in stale_assessment.backend_results:
+            if backend_result.backend_name == self.get_name():
+                refresher.schedule(
+                    f"{self.get_name()}:{cache_key}",
+                    lambda: self._refresh_cached_result(cache_key, query_input),
+                )
+                backend_result.cached = True
+                backend_result.response_time = time.time() - start_time
+                backend_result.data = {
+                    **backend_result.data,
+                    "from_cache": True,
+                    "stale": True,
+                    "stale_age_seconds": round(stale_age_seconds, 1),
+                }
+                return backend_result
+        return None
+
+    async def _refresh_cached_result(
+        self, cache_key: str, query_input: QueryInput
+    ) -> None:
+        """Re-query the live API and overwrite the stale cache entry."""
+        result = await self._query_api(query_input)
+        self._cache_api_result(cache_key, query_input, result)
+
+    def _cache_api_result(
+        self, cache_key: str, query_input: QueryInput, result: BackendResult
+    ) -> None:
+        """Cache a live API result if it is a definitive answer."""
         if result.status in [BackendStatus.FOUND, BackendStatus.NOT_FOUND]:
             # For caching, we need to create a minimal AssessmentResult
             assessment_result = AssessmentResult(
@@ -449,8 +512,6 @@ class ApiBackendWithCache(Backend):
                 self.cache_ttl_hours,
             )
 
-        return result
-
     @code_is_used  # Called by _build_error_result
     def _map_exception_to_backend_status(self, exception: Exception) -> BackendStatus:
         """Map exception type to BackendStatus enum.
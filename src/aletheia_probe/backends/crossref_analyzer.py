@@ -8,6 +8,7 @@ from typing import Any
 import aiohttp
 
 from ..backend_exceptions import BackendError, RateLimitError
+from ..config import get_config_manager
 from ..enums import AssessmentType, EvidenceType
 from ..fallback_chain import FallbackStrategy, QueryFallbackChain
 from ..fallback_executor import automatic_fallback
@@ -171,7 +172,7 @@ class CrossrefAnalyzerBackend(ApiBackendWithCache, FallbackStrategyMixin):
         """
         super().__init__(cache_ttl_hours)
         self.email = validate_email(email)
-        self.base_url = "https://api.crossref.org"
+        self.base_url = get_config_manager().load_config().endpoints.crossref
         self.headers = {
             "User-Agent": f"AletheiaProbe/1.0 (mailto:{email})",
         }
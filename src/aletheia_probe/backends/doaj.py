@@ -13,6 +13,7 @@ from ..confidence_utils import (
     calculate_base_confidence,
     calculate_name_similarity,
 )
+from ..config import get_config_manager
 from ..constants import CONFIDENCE_THRESHOLD_HIGH
 from ..enums import AssessmentType, EvidenceType
 from ..fallback_chain import FallbackStrategy, QueryFallbackChain
@@ -51,7 +52,8 @@ class DOAJBackend(ApiBackendWithCache, FallbackStrategyMixin):
             cache_ttl_hours: Time-to-live for cached results in hours. Defaults to 24.
         """
         super().__init__(cache_ttl_hours=cache_ttl_hours)
-        self.base_url = "https://doaj.org/api/search/journals"
+        api_url = get_config_manager().load_config().endpoints.doaj
+        self.base_url = f"{api_url.rstrip('/')}/search/journals"
 
     def get_name(self) -> str:
         """Return the human-readable name of this backend.
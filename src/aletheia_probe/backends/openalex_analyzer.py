@@ -4,7 +4,7 @@
 from datetime import datetime
 from typing import Any
 
-from ..cache import AcronymCache
+from ..cache import AcronymCache, get_cache_registry
 from ..constants import CONFIDENCE_THRESHOLD_LOW
 from ..enums import AssessmentType, EvidenceType
 from ..fallback_chain import FallbackStrategy, QueryFallbackChain
@@ -360,7 +360,7 @@ class OpenAlexAnalyzerBackend(ApiBackendWithCache, FallbackStrategyMixin):
             entity_type = query_input.venue_type.value
 
             # Store each mapping in the cache
-            acronym_cache = AcronymCache()
+            acronym_cache = get_cache_registry().get(AcronymCache)
             for acronym, full_name in mappings.items():
                 acronym_cache.store_acronym_mapping(
                     acronym, full_name, entity_type, source="openalex_response"
@@ -7,6 +7,7 @@ from typing import Any
 import aiohttp
 
 from ..backend_exceptions import BackendError, RateLimitError
+from ..config import get_config_manager
 from ..enums import AssessmentType, EvidenceType
 from ..fallback_chain import FallbackStrategy, QueryFallbackChain
 from ..fallback_executor import automatic_fallback
@@ -35,7 +36,7 @@ class OpenCitationsAnalyzerBackend(ApiBackendWithCache, FallbackStrategyMixin):
     def __init__(self, cache_ttl_hours: int = _DEFAULT_CACHE_TTL_HOURS):
         """Initialize backend with configurable cache TTL."""
         super().__init__(cache_ttl_hours)
-        self.base_url = "https://api.opencitations.net/index/v2"
+        self.base_url = get_config_manager().load_config().endpoints.opencitations
         self.detail_logger = get_detail_logger()
 
     def get_name(self) -> str:
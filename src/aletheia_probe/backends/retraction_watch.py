@@ -7,7 +7,7 @@ from typing import Any
 import aiohttp
 
 from ..backend_exceptions import RateLimitError
-from ..cache import RetractionCache
+from ..cache import RetractionCache, get_cache_registry
 from ..confidence_utils import MatchQuality, calculate_base_confidence
 from ..constants import CONFIDENCE_THRESHOLD_LOW
 from ..enums import AssessmentType, EvidenceType, RiskLevel
@@ -23,6 +23,7 @@ from ..utils.dead_code import code_is_used
 from .base import ApiBackendWithCache, get_backend_registry
 from .fallback_mixin import FallbackStrategyMixin
 from .protocols import DataSyncCapable
+from .stale_refresh import get_stale_refresher
 
 
 detail_logger = get_detail_logger()
@@ -97,7 +98,7 @@ class RetractionWatchBackend(
         data appears to be missing.
         """
         try:
-            retraction_cache = RetractionCache()
+            retraction_cache = get_cache_registry().get(RetractionCache)
             # Check if we have any retraction statistics by querying a simple journal
             # If the cache returns None for a basic query, we likely need sync
             test_result = retraction_cache.get_retraction_statistics(1)
@@ -230,7 +231,7 @@ class RetractionWatchBackend(
             raise ValueError(f"Invalid journal_id: {journal_id}")
 
         # Fetch retraction statistics from dedicated table
-        retraction_cache = RetractionCache()
+        retraction_cache = get_cache_registry().get(RetractionCache)
         stats = retraction_cache.get_retraction_statistics(journal_id)
 
         if stats:
@@ -320,6 +321,9 @@ class RetractionWatchBackend(
                 openalex_data.get("openalex_url") if openalex_data else None
             ),
             "has_publication_data": openalex_data is not None,
+            "openalex_stale_age_seconds": (
+                openalex_data.get("stale_age_seconds") if openalex_data else None
+            ),
         }
 
         return BackendResult(
@@ -475,25 +479,26 @@ class RetractionWatchBackend(
             detail_logger.debug(f"OpenAlex cache hit for {journal_name}")
             return cached
 
+        # Serve recently expired data and refresh it in the background
+        refresher = get_stale_refresher()
+        if refresher.enabled:
+            stale = self.openalex_cache.get_stale_openalex_data(
+                issn=issn,
+                journal_name=journal_name,
+                max_stale_hours=refresher.max_stale_hours,
+            )
+            if stale is not None:
+                stale_data, stale_age_seconds = stale
+                refresher.schedule(
+                    f"openalex:{issn or ''}:{journal_name}",
+                    lambda: self._fetch_and_cache_openalex_data(journal_name, issn),
+                )
+                return {**stale_data, "stale_age_seconds": round(stale_age_seconds, 1)}
+
         # Fetch from OpenAlex API
         status_logger.info(f"Fetching OpenAlex data on-demand for: {journal_name}")
         try:
-            openalex_data = await get_publication_stats(journal_name, issn)
-
-            if openalex_data:
-                # Cache successful result for 30 days
-                self.openalex_cache.set_openalex_data(
-                    issn=issn,
-                    journal_name=journal_name,
-                    openalex_data=openalex_data,
-                    ttl_hours=24 * 30,
-                )
-                return openalex_data
-            else:
-                # No data found - return None without caching
-                # (failures are not cached to allow retries)
-                return None
-
+            return await self._fetch_and_cache_openalex_data(journal_name, issn)
         except (
             RateLimitError,
             aiohttp.ClientError,
@@ -508,6 +513,33 @@ class RetractionWatchBackend(
             # Don't cache failures - allow retries
             return None
 
+    async def _fetch_and_cache_openalex_data(
+        self, journal_name: str, issn: str | None
+    ) -> dict[str, Any] | None:
+        """Fetch OpenAlex data from the API and cache it for 30 days.
+
+        Args:
+            journal_name: Name of the journal
+            issn: Optional ISSN for more accurate matching
+
+        Returns:
+            Dictionary with publication statistics, or None if not found
+        """
+        openalex_data = await get_publication_stats(journal_name, issn)
+
+        if openalex_data:
+            self.openalex_cache.set_openalex_data(
+                issn=issn,
+                journal_name=journal_name,
+                openalex_data=openalex_data,
+                ttl_hours=24 * 30,
+            )
+            return openalex_data
+
+        # No data found - return None without caching
+        # (failures are not cached to allow retries)
+        return None
+
     def _search_exact_match(self, name: str) -> list[dict[str, Any]]:
         """Search for exact journal name matches using database-level filtering."""
         return self.journal_cache.search_journals_by_name(
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: MIT
+"""Bounded background refresher for stale-while-revalidate caching.
+
+When stale-while-revalidate is enabled in the cache configuration, API
+backends serve recently expired cache entries immediately and hand the live
+re-query to this refresher. At most ``stale_refresh_concurrency`` refreshes
+run at once and each cache key is refreshed at most once at a time; stale
+hits that arrive while the refresher is saturated are still served but do not
+schedule additional work.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from ..config import get_config_manager
+from ..logging_config import get_detail_logger
+
+
+detail_logger = get_detail_logger()
+
+# Upper bound for waiting on background refreshes before a CLI run exits
+DRAIN_TIMEOUT_SECONDS: float = 30.0
+
+
+class StaleRefresher:
+    """Schedules background refreshes for stale cache entries."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_stale_hours: float = 24,
+        max_concurrent_refreshes: int = 4,
+    ) -> None:
+        """Initialize refresher.
+
+        Args:
+            enabled: Whether stale entries may be served at all
+            max_stale_hours: Maximum hours past expiry an entry may be served
+            max_concurrent_refreshes: Maximum number of refreshes in flight
+        """
+        self.enabled = enabled
+        self.max_stale_hours = max_stale_hours
+        self.max_concurrent_refreshes = max_concurrent_refreshes
+        self._in_flight: dict[str, asyncio.Task[None]] = {}
+
+    @property
+    def in_flight_count(self) -> int:
+        """Number of refreshes currently running."""
+        return len(self._in_flight)
+
+    def schedule(self, key: str, refresh: Callable[[], Awaitable[object]]) -> bool:
+        """Schedule a background refresh for a cache key.
+
+        Args:
+            key: Identifier of the cache entry (deduplicates concurrent refreshes)
+            refresh: Coroutine factory performing the live query and cache write
+
+        Returns:
+            True if a refresh was started, False if disabled, already running
+            for this key, or the concurrency limit is reached
+        """
+        if not self.enabled or key in self._in_flight:
+            return False
+        if len(self._in_flight) >= self.max_concurrent_refreshes:
+            detail_logger.debug(
+                f"Stale refresh for '{key}' skipped: "
+                f"{self.max_concurrent_refreshes} refreshes already in flight"
+            )
+            return False
+
+        task = asyncio.get_running_loop().create_task(self._run(key, refresh))
+        self._in_flight[key] = task
+        return True
+
+    async def _run(self, key: str, refresh: Callable[[], Awaitable[object]]) -> None:
+        """Run a refresh, logging failures instead of propagating them."""
+        try:
+            await refresh()
+            detail_logger.debug(f"Stale refresh for '{key}' completed")
+        except Exception as e:
+            # Background task: nobody awaits the result, so failures are only
+            # logged and the stale entry remains until the next attempt.
+            detail_logger.warning(f"Stale refresh for '{key}' failed: {e}")
+        finally:
+            self._in_flight.pop(key, None)
+
+    async def drain(self, timeout: float | None = DRAIN_TIMEOUT_SECONDS) -> None:
+        """Wait for in-flight refreshes to finish.
+
+        Refreshes still running when the event loop shuts down are cancelled,
+        so one-shot commands call this before exiting.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        """
+        tasks = list(self._in_flight.values())
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+
+
+_stale_refresher_instance: StaleRefresher | None = None
+
+
+def get_stale_refresher() -> StaleRefresher:
+    """Get or create the global stale refresher from cache configuration.
+
+    Returns:
+        The global StaleRefresher instance
+    """
+    global _stale_refresher_instance
+    if _stale_refresher_instance is None:
+        cache_config = get_config_manager().load_config().cache
+        _stale_refresher_instance = StaleRefresher(
+            enabled=cache_config.stale_while_revalidate,
+            max_stale_hours=cache_config.stale_max_age_hours,
+            max_concurrent_refreshes=cache_config.stale_refresh_concurrency,
+        )
+    return _stale_refresher_instance
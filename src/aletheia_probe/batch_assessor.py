@@ -19,6 +19,7 @@ from .models import (
     VenueType,
 )
 from .normalizer import input_normalizer
+from .tracing import span
 
 
 class BibtexBatchAssessor:
@@ -78,11 +79,12 @@ class BibtexBatchAssessor:
         start_time = time.time()
 
         # Parse BibTeX file
-        bibtex_entries, skipped_count, preprint_count = (
-            BibtexBatchAssessor._parse_bibtex_file(
-                file_path, relax_bibtex, detail_logger, status_logger
+        with span("bibtex_parse", "input"):
+            bibtex_entries, skipped_count, preprint_count = (
+                BibtexBatchAssessor._parse_bibtex_file(
+                    file_path, relax_bibtex, detail_logger, status_logger
+                )
             )
-        )
 
         # Initialize result object
         result = BibtexBatchAssessor._initialize_assessment_result(
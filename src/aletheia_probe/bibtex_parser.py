@@ -20,7 +20,7 @@ from pybtex.database import (  # type: ignore
 )
 from pybtex.scanner import PybtexError, PybtexSyntaxError  # type: ignore
 
-from .cache import AcronymCache
+from .cache import AcronymCache, get_cache_registry
 from .constants import DEFAULT_ACRONYM_CONFIDENCE_MIN
 from .logging_config import get_detail_logger, get_status_logger
 from .models import BibtexEntry, VenueType
@@ -1054,7 +1054,7 @@ class BibtexParser:
             acronym = macro_name.upper()  # Convert to uppercase (e.g., pasp -> PASP)
 
             # Try to look up the acronym in the cache (for journals)
-            acronym_cache = AcronymCache()
+            acronym_cache = get_cache_registry().get(AcronymCache)
             full_name = acronym_cache.get_full_name_for_acronym(
                 acronym,
                 "journal",
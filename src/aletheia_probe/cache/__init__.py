@@ -8,13 +8,19 @@ This module provides a refactored cache system with focused components:
 - AssessmentCache: Assessment result caching
 - OpenAlexCache: OpenAlex publication statistics caching
 - DataSourceManager: Data source management
+- DownloadCache: Validators and payloads of data source downloads
+
+Shared instances are obtained from the process-wide CacheRegistry
+(get_cache_registry()).
 """
 
 from .acronym_cache import AcronymCache
 from .assessment_cache import AssessmentCache
-from .data_source_manager import DataSourceManager
+from .data_source_manager import DataSourceManager, SourceUpdateTiming
+from .download_cache import DownloadCache, DownloadRecord
 from .journal_cache import JournalCache
 from .openalex_cache import OpenAlexCache
+from .registry import CacheRegistry, get_cache_registry
 from .retraction_cache import RetractionCache
 
 
@@ -25,4 +31,9 @@ __all__ = [
     "AssessmentCache",
     "OpenAlexCache",
     "DataSourceManager",
+    "SourceUpdateTiming",
+    "DownloadCache",
+    "DownloadRecord",
+    "CacheRegistry",
+    "get_cache_registry",
 ]
@@ -4,6 +4,7 @@
 from datetime import datetime, timedelta
 
 from ..logging_config import get_detail_logger, get_status_logger
+from ..metrics import get_metrics_registry
 from ..models import AssessmentResult
 from .base import CacheBase
 
@@ -101,6 +102,9 @@ class AssessmentCache(CacheBase):
             )
 
             row = cursor.fetchone()
+            get_metrics_registry().record_cache_lookup(
+                "assessment_cache", "hit" if row else "miss"
+            )
             if row:
                 result = AssessmentResult.model_validate_json(row[0])
                 detail_logger.debug(
@@ -113,6 +117,49 @@ class AssessmentCache(CacheBase):
                 )
                 return None
 
+    def get_stale_assessment(
+        self, query_hash: str, max_stale_hours: float
+    ) -> tuple[AssessmentResult, float] | None:
+        """Get an expired assessment result that is still within the stale window.
+
+        Used for stale-while-revalidate: the caller serves the returned result
+        immediately and refreshes the entry in the background.
+
+        Args:
+            query_hash: Hash of the query
+            max_stale_hours: Maximum hours past expiry an entry may be served
+
+        Returns:
+            Tuple of (assessment result, seconds since expiry), or None if there is
+            no entry, the entry is still fresh, or it expired too long ago
+        """
+        self._validate_query_hash(query_hash)
+
+        now = datetime.now()
+        oldest_allowed = now - timedelta(hours=max_stale_hours)
+
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT assessment_result, expires_at FROM assessment_cache
+                WHERE query_hash = ? AND expires_at <= ? AND expires_at > ?
+            """,
+                (query_hash, now.isoformat(), oldest_allowed.isoformat()),
+            )
+            row = cursor.fetchone()
+
+        if not row:
+            return None
+
+        get_metrics_registry().record_cache_lookup("assessment_cache", "stale")
+        result = AssessmentResult.model_validate_json(row[0])
+        stale_age_seconds = (now - datetime.fromisoformat(row[1])).total_seconds()
+        detail_logger.debug(
+            f"Found stale assessment for query_hash '{query_hash}' "
+            f"(expired {stale_age_seconds:.0f}s ago)"
+        )
+        return result, stale_age_seconds
+
     def cleanup_expired_cache(self) -> int:
         """Remove expired assessment cache entries.
 
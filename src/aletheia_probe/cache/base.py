@@ -4,12 +4,14 @@
 This module provides the CacheBase class, which serves as the foundation for all
 cache components in the system. It handles shared functionality including:
 
-- Database initialization and path management
+- Database initialization (once per path and process) and path management
+- Per-thread persistent connections
 - Text normalization for robust name comparison (removing stop words, special chars)
 - Common utility methods used across cache implementations
 """
 
 import sqlite3
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
@@ -17,14 +19,55 @@ from pathlib import Path
 from ..config import get_config_manager
 from ..logging_config import get_detail_logger, get_status_logger
 from ..utils.dead_code import code_is_used
-from .connection_utils import configure_sqlite_connection
-from .schema import init_database
+from .connection_utils import connect_sqlite
+from .schema import ensure_database
 
 
 detail_logger = get_detail_logger()
 status_logger = get_status_logger()
 
 
+def get_default_db_path() -> Path:
+    """Resolve the configured cache database path and ensure its schema.
+
+    The schema is initialized or validated only once per path and process
+    (see ensure_database()).
+
+    Returns:
+        Path to the SQLite database file from config.cache.db_path
+
+    Raises:
+        RuntimeError: If config structure is invalid or database initialization fails.
+    """
+    try:
+        db_path = Path(get_config_manager().load_config().cache.db_path)
+    except AttributeError as e:
+        error_msg = "Invalid config structure: missing 'cache.db_path' configuration"
+        status_logger.error(error_msg)
+        detail_logger.exception(f"{error_msg}: {e}")
+        raise RuntimeError(error_msg) from e
+
+    try:
+        # Ensure parent directory exists
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        error_msg = f"Failed to create database directory: {db_path.parent}"
+        status_logger.error(error_msg)
+        detail_logger.exception(f"{error_msg}: {e}")
+        raise RuntimeError(error_msg) from e
+
+    try:
+        # Initialize database schema
+        ensure_database(db_path)
+    except (sqlite3.Error, OSError) as e:
+        error_msg = f"Failed to initialize database at {db_path}"
+        status_logger.error(error_msg)
+        detail_logger.exception(f"{error_msg}: {e}")
+        raise RuntimeError(error_msg) from e
+
+    return db_path
+
+
 class CacheBase:
     """Base class for cache components with shared utilities.
 
@@ -32,10 +75,13 @@ class CacheBase:
 
     - Automatic database initialization from config or explicit path
     - Shared database path management (self.db_path)
+    - One lazily opened connection per thread, released by close()
 
     Subclasses should call super().__init__(db_path) to initialize the database
     connection path and schema. The db_path parameter defaults to the value from
-    the application configuration (config.cache.db_path).
+    the application configuration (config.cache.db_path). Long-lived code should
+    obtain shared instances from the cache registry (see get_cache_registry())
+    instead of constructing its own.
 
     Attributes:
         db_path: Path to the SQLite database file used by this cache component.
@@ -52,49 +98,39 @@ class CacheBase:
             RuntimeError: If config structure is invalid or database initialization fails.
         """
         if db_path is None:
-            try:
-                db_path_str = get_config_manager().load_config().cache.db_path
-                db_path = Path(db_path_str)
-            except AttributeError as e:
-                error_msg = (
-                    "Invalid config structure: missing 'cache.db_path' configuration"
-                )
-                status_logger.error(error_msg)
-                detail_logger.exception(f"{error_msg}: {e}")
-                raise RuntimeError(error_msg) from e
-
-            try:
-                # Ensure parent directory exists
-                db_path.parent.mkdir(parents=True, exist_ok=True)
-            except OSError as e:
-                error_msg = f"Failed to create database directory: {db_path.parent}"
-                status_logger.error(error_msg)
-                detail_logger.exception(f"{error_msg}: {e}")
-                raise RuntimeError(error_msg) from e
-
-            try:
-                # Initialize database schema
-                init_database(db_path)
-            except (sqlite3.Error, OSError) as e:
-                error_msg = f"Failed to initialize database at {db_path}"
-                status_logger.error(error_msg)
-                detail_logger.exception(f"{error_msg}: {e}")
-                raise RuntimeError(error_msg) from e
+            db_path = get_default_db_path()
 
         self.db_path = db_path
-        self._conn: sqlite3.Connection | None = None
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
 
     def _open_conn(self) -> sqlite3.Connection:
-        """Open and configure the persistent connection (called once per instance)."""
-        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
-        configure_sqlite_connection(conn)
-        return conn
+        """Open and configure a persistent connection (called once per thread)."""
+        # Each connection is only used by the thread that opened it, but close()
+        # may run on another thread, hence check_same_thread=False.
+        return connect_sqlite(self.db_path, timeout=30.0, check_same_thread=False)
 
     def _get_or_open_conn(self) -> sqlite3.Connection:
-        """Return the persistent connection, creating it on first use."""
-        if self._conn is None:
-            self._conn = self._open_conn()
-        return self._conn
+        """Return this thread's persistent connection, creating it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open_conn()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close all connections opened by this instance.
+
+        The instance stays usable; the next access opens a new connection.
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
 
     @contextmanager
     def get_connection(
@@ -102,7 +138,7 @@ class CacheBase:
     ) -> Iterator[sqlite3.Connection]:
         """Get the persistent SQLite connection to this cache's database.
 
-        Reuses a single long-lived connection per instance. Commits on success
+        Reuses a single long-lived connection per instance and thread. Commits on success
         and rolls back on exception, but does not close the connection.
 
         Args:
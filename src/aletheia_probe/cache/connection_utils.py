@@ -8,36 +8,173 @@ timeout settings, and performance optimizations across all components.
 The main function `get_configured_connection()` should be used instead of
 direct `sqlite3.connect()` calls to ensure database lock conflicts are
 minimized during concurrent operations.
+
+PRAGMA settings come from named profiles (SQLITE_PROFILES), selected per
+workload: interactive queries, the mass-eval reader, the sync writer and the
+loader of ``sync --bulk`` builds.
+The profile for each workload can be adjusted through
+``cache.sqlite_profiles`` in the configuration.
 """
 
 import sqlite3
 from collections.abc import Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
 
+from ..config import SqliteWorkload, get_config_manager
+
+
+@dataclass(frozen=True)
+class SqliteProfile:
+    """PRAGMA settings applied to a new SQLite connection."""
+
+    synchronous: str = "NORMAL"
+    cache_size: int = 10000
+    mmap_size: int = 0
+    temp_store: str = "MEMORY"
+    query_only: bool = False
+    locking_mode: str = "NORMAL"
+    cached_statements: int = 128
+
+
+# Built-in profiles. "default" is the historical configuration for all
+# connections; cache_size values below zero are KiB rather than pages.
+SQLITE_PROFILES: dict[str, SqliteProfile] = {
+    "default": SqliteProfile(),
+    # Short-lived CLI lookups: modest page cache, mmap for the hot indexes
+    "interactive": SqliteProfile(
+        cache_size=-16384, mmap_size=64 * 1024 * 1024, cached_statements=256
+    ),
+    # Long mass-eval runs that repeat the same lookups across many entries
+    "reader": SqliteProfile(
+        cache_size=-65536, mmap_size=256 * 1024 * 1024, cached_statements=512
+    ),
+    # Like "reader", but rejects writes (shared or read-only deployments)
+    "readonly": SqliteProfile(
+        cache_size=-65536,
+        mmap_size=256 * 1024 * 1024,
+        cached_statements=512,
+        query_only=True,
+    ),
+    # Sync writer on the live database, which also holds custom lists,
+    # acronyms and API caches: large page cache, WAL-safe fsync
+    "writer": SqliteProfile(cache_size=-262144),
+    # Writer of a throwaway bulk build file, no fsync per commit. An
+    # interrupted build is discarded, so power loss cannot corrupt live data.
+    "bulk_load": SqliteProfile(synchronous="OFF", cache_size=-262144),
+}
+
+# Built-in profile used by each workload unless configured otherwise
+DEFAULT_WORKLOAD_PROFILES: dict[SqliteWorkload, str] = {
+    "query": "interactive",
+    "mass_eval": "reader",
+    "sync": "writer",
+    "bulk_sync": "bulk_load",
+}
+
+# Workload of connections that do not request a profile explicitly
+_active_workload: SqliteWorkload = "query"
+
+
+def set_sqlite_workload(workload: SqliteWorkload) -> None:
+    """Select the workload whose profile applies to new connections.
+
+    Args:
+        workload: "query", "mass_eval", "sync" or "bulk_sync"
+
+    Raises:
+        ValueError: If the workload is unknown
+    """
+    global _active_workload
+    if workload not in DEFAULT_WORKLOAD_PROFILES:
+        raise ValueError(f"Unknown SQLite workload: {workload}")
+    _active_workload = workload
+
+
+def get_sqlite_profile(workload: SqliteWorkload | None = None) -> SqliteProfile:
+    """Resolve the SQLite profile for a workload from configuration.
+
+    Args:
+        workload: Workload name; defaults to the active workload
+
+    Returns:
+        Built-in profile with any configured overrides applied
+    """
+    workload = workload or _active_workload
+    configured = get_config_manager().load_config().cache.sqlite_profiles.get(workload)
+    if configured is None:
+        return SQLITE_PROFILES[DEFAULT_WORKLOAD_PROFILES[workload]]
+
+    overrides = configured.model_dump(exclude={"base"}, exclude_none=True)
+    return replace(SQLITE_PROFILES[configured.base], **overrides)
+
 
 def configure_sqlite_connection(
     conn: sqlite3.Connection,
     enable_wal: bool = True,
+    profile: SqliteProfile | None = None,
 ) -> None:
     """Configure SQLite connection with performance optimizations and WAL mode.
 
-    Applies consistent PRAGMA settings across all database connections:
+    Applies the PRAGMA settings of a profile:
     - WAL mode for concurrent read/write support
-    - NORMAL synchronous mode for balanced safety/performance
-    - Large cache size for reduced disk I/O
-    - Memory temp storage for faster operations
+    - synchronous mode, page cache size and memory-mapped I/O size
+    - temp storage location, locking mode and query_only
 
     Args:
         conn: SQLite database connection to configure
         enable_wal: Whether to enable WAL mode (default: True)
+        profile: PRAGMA settings; defaults to the active workload's profile
     """
+    if profile is None:
+        profile = get_sqlite_profile()
+
     if enable_wal:
         conn.execute("PRAGMA journal_mode = WAL")
 
-    conn.execute("PRAGMA synchronous = NORMAL")
-    conn.execute("PRAGMA cache_size = 10000")
-    conn.execute("PRAGMA temp_store = MEMORY")
+    # Values are typed (ints) or validated against fixed choices by the config
+    conn.execute(f"PRAGMA synchronous = {profile.synchronous}")
+    conn.execute(f"PRAGMA cache_size = {int(profile.cache_size)}")
+    conn.execute(f"PRAGMA mmap_size = {int(profile.mmap_size)}")
+    conn.execute(f"PRAGMA temp_store = {profile.temp_store}")
+    conn.execute(f"PRAGMA locking_mode = {profile.locking_mode}")
+    conn.execute(f"PRAGMA query_only = {'ON' if profile.query_only else 'OFF'}")
+
+
+def connect_sqlite(
+    db_path: str | Path,
+    timeout: float = 30.0,
+    enable_wal: bool = True,
+    profile: SqliteProfile | None = None,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    """Open a SQLite connection configured with a profile.
+
+    Args:
+        db_path: Path to the SQLite database file
+        timeout: Connection timeout in seconds (default: 30.0)
+        enable_wal: Whether to enable WAL mode (default: True)
+        profile: PRAGMA settings; defaults to the active workload's profile
+        check_same_thread: Passed to sqlite3.connect()
+
+    Returns:
+        Configured SQLite connection (the caller closes it)
+    """
+    if profile is None:
+        profile = get_sqlite_profile()
+    conn = sqlite3.connect(
+        str(db_path),
+        timeout=timeout,
+        cached_statements=profile.cached_statements,
+        check_same_thread=check_same_thread,
+    )
+    try:
+        configure_sqlite_connection(conn, enable_wal=enable_wal, profile=profile)
+    except Exception:
+        conn.close()
+        raise
+    return conn
 
 
 @contextmanager
@@ -45,6 +182,7 @@ def get_configured_connection(
     db_path: str | Path,
     timeout: float = 30.0,
     enable_wal: bool = True,
+    profile: SqliteProfile | None = None,
 ) -> Iterator[sqlite3.Connection]:
     """Get a configured SQLite connection with proper timeout and settings.
 
@@ -52,13 +190,14 @@ def get_configured_connection(
     application. It provides:
     - 30-second timeout (handles large data chunks during sync)
     - WAL mode for concurrent read/write access
-    - Performance optimizations (cache size, synchronous mode, etc.)
+    - Performance optimizations from the workload's SQLite profile
     - Automatic connection cleanup
 
     Args:
         db_path: Path to the SQLite database file
         timeout: Connection timeout in seconds (default: 30.0)
         enable_wal: Whether to enable WAL mode (default: True)
+        profile: PRAGMA settings; defaults to the active workload's profile
 
     Yields:
         Configured SQLite connection
@@ -71,15 +210,9 @@ def get_configured_connection(
             results = cursor.fetchall()
         ```
     """
-    # Convert Path to string for sqlite3.connect()
-    db_path_str = str(db_path)
-
-    # Create connection with timeout
-    conn = sqlite3.connect(db_path_str, timeout=timeout)
+    conn = connect_sqlite(db_path, timeout, enable_wal=enable_wal, profile=profile)
 
     try:
-        # Apply standard configuration
-        configure_sqlite_connection(conn, enable_wal=enable_wal)
         yield conn
         # Commit on successful completion (mimics sqlite3.Connection context manager)
         conn.commit()
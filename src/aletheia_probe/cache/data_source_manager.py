@@ -1,10 +1,14 @@
 # SPDX-License-Identifier: MIT
 """Data source management for the cache system."""
 
+import sqlite3
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from ..enums import UpdateStatus
+from ..enums import UpdateStatus, UpdateType
 from ..logging_config import get_detail_logger, get_status_logger
 from .base import CacheBase
 
@@ -12,6 +16,86 @@ from .base import CacheBase
 detail_logger = get_detail_logger()
 status_logger = get_status_logger()
 
+# Journals handled per transaction when removing data; also keeps IN (...)
+# lists below SQLite's bound-parameter limit (999)
+CLEANUP_CHUNK_SIZE = 900
+
+# Longest a removal or cleanup transaction holds the write lock
+CLEANUP_TRANSACTION_SECONDS = 1.0
+
+# Tables whose rows belong to a single journal. Foreign keys are not enforced,
+# so these rows are deleted explicitly together with the journal.
+JOURNAL_CHILD_TABLES: tuple[str, ...] = (
+    "journal_names",
+    "journal_urls",
+    "retraction_statistics",
+)
+
+# Recent timed updates averaged to predict a source's next update duration
+EXPECTED_DURATION_RUNS = 3
+
+
+@dataclass(frozen=True)
+class SourceUpdateTiming:
+    """Duration and download volume of one source update.
+
+    Attributes:
+        started_at: When the update started, in UTC like completed_at.
+        duration_seconds: Time from the start until the data was ready to
+            be written.
+        bytes_downloaded: Payload bytes received over the network.
+    """
+
+    started_at: datetime
+    duration_seconds: float
+    bytes_downloaded: int
+
+
+def delete_orphaned_journals(cursor: sqlite3.Cursor, journal_ids: Sequence[int]) -> int:
+    """Delete the given journals that no source lists, with their child rows.
+
+    Only the candidate journals are checked, each through an indexed lookup
+    on source_assessments.journal_id, so the cost does not grow with the
+    size of the database.
+
+    Args:
+        cursor: Cursor inside the caller's transaction
+        journal_ids: Candidate journal IDs, e.g. journals a source dropped
+
+    Returns:
+        Number of journals deleted
+    """
+    deleted = 0
+    for start in range(0, len(journal_ids), CLEANUP_CHUNK_SIZE):
+        chunk = list(journal_ids[start : start + CLEANUP_CHUNK_SIZE])
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(
+            f"""
+            SELECT id FROM journals j
+            WHERE id IN ({placeholders})
+              AND NOT EXISTS (
+                  SELECT 1 FROM source_assessments sa WHERE sa.journal_id = j.id
+              )
+            """,  # nosec B608
+            chunk,
+        )
+        orphan_ids = [row[0] for row in cursor.fetchall()]
+        if not orphan_ids:
+            continue
+
+        placeholders = ",".join("?" * len(orphan_ids))
+        for table in JOURNAL_CHILD_TABLES:
+            cursor.execute(
+                f"DELETE FROM {table} WHERE journal_id IN ({placeholders})",  # nosec B608
+                orphan_ids,
+            )
+        cursor.execute(
+            f"DELETE FROM journals WHERE id IN ({placeholders})",  # nosec B608
+            orphan_ids,
+        )
+        deleted += len(orphan_ids)
+    return deleted
+
 
 class DataSourceManager(CacheBase):
     """Manages data sources and their statistics."""
@@ -27,6 +111,9 @@ class DataSourceManager(CacheBase):
     ) -> int:
         """Register a data source and return its ID.
 
+        Registering an existing name updates its details in place and keeps
+        its ID, so assessments and sync fingerprints stay attached to it.
+
         Args:
             name: Unique name for the data source
             display_name: Human-readable display name
@@ -45,9 +132,15 @@ class DataSourceManager(CacheBase):
             cursor = conn.cursor()
             cursor.execute(
                 """
-                INSERT OR REPLACE INTO data_sources
+                INSERT INTO data_sources
                 (name, display_name, source_type, authority_level, base_url, description)
                 VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    display_name = excluded.display_name,
+                    source_type = excluded.source_type,
+                    authority_level = excluded.authority_level,
+                    base_url = excluded.base_url,
+                    description = excluded.description
             """,
                 (
                     name,
@@ -112,6 +205,7 @@ class DataSourceManager(CacheBase):
         records_updated: int = 0,
         records_removed: int = 0,
         error_message: str | None = None,
+        timing: SourceUpdateTiming | None = None,
     ) -> None:
         """Log a source update operation.
 
@@ -123,6 +217,7 @@ class DataSourceManager(CacheBase):
             records_updated: Number of records updated
             records_removed: Number of records removed
             error_message: Error message if update failed
+            timing: Duration and download volume of the update
         """
         detail_logger.debug(
             f"Logging update for source '{source_name}': type={update_type}, status={status}, "
@@ -137,8 +232,9 @@ class DataSourceManager(CacheBase):
                 cursor.execute(
                     """
                     INSERT INTO source_updates
-                    (source_id, update_type, status, records_added, records_updated, records_removed, error_message)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    (source_id, update_type, status, records_added, records_updated, records_removed, error_message,
+                     started_at, duration_seconds, bytes_downloaded)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                     (
                         source_row[0],
@@ -148,6 +244,11 @@ class DataSourceManager(CacheBase):
                         records_updated,
                         records_removed,
                         error_message,
+                        timing.started_at.strftime("%Y-%m-%d %H:%M:%S")
+                        if timing
+                        else None,
+                        timing.duration_seconds if timing else None,
+                        timing.bytes_downloaded if timing else None,
                     ),
                 )
                 detail_logger.debug(
@@ -188,6 +289,47 @@ class DataSourceManager(CacheBase):
             detail_logger.debug(f"Source '{source_name}' has no successful updates")
             return None
 
+    def get_expected_durations(
+        self, source_names: Sequence[str], runs: int = EXPECTED_DURATION_RUNS
+    ) -> dict[str, float]:
+        """Estimate how long updating each source will take.
+
+        Args:
+            source_names: Names of the data sources
+            runs: Number of most recent timed successful updates to average;
+                verification runs, which found the source not modified and
+                parsed nothing, are not counted
+
+        Returns:
+            Mean duration in seconds per source; sources without timed
+            updates are missing.
+        """
+        if not source_names:
+            return {}
+        placeholders = ", ".join("?" for _ in source_names)
+        durations: dict[str, list[float]] = {}
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT ds.name, su.duration_seconds FROM source_updates su
+                JOIN data_sources ds ON su.source_id = ds.id
+                WHERE ds.name IN ({placeholders}) AND su.status = ?
+                    AND su.update_type != ?
+                    AND su.duration_seconds IS NOT NULL
+                ORDER BY su.id DESC
+                """,  # nosec B608
+                (
+                    *source_names,
+                    UpdateStatus.SUCCESS.value,
+                    UpdateType.VERIFICATION.value,
+                ),
+            )
+            for name, duration in cursor:
+                recent = durations.setdefault(name, [])
+                if len(recent) < runs:
+                    recent.append(duration)
+        return {name: sum(recent) / len(recent) for name, recent in durations.items()}
+
     def has_source_data(self, source_name: str) -> bool:
         """Check if a data source has any journal entries.
 
@@ -214,6 +356,12 @@ class DataSourceManager(CacheBase):
     def remove_source_data(self, source_name: str) -> int:
         """Remove all data for a specific source.
 
+        Assessments are deleted a chunk of journals at a time in transactions
+        of at most CLEANUP_TRANSACTION_SECONDS, so the write lock is released
+        regularly on large sources.
+        Journals that no other source lists are deleted with their names,
+        URLs and retraction statistics.
+
         Args:
             source_name: Name of the data source
 
@@ -222,11 +370,9 @@ class DataSourceManager(CacheBase):
         """
         detail_logger.debug(f"Removing data for source '{source_name}'")
         with self.get_connection() as conn:
-            # Get source ID
-            cursor = conn.execute(
+            source_row = conn.execute(
                 "SELECT id FROM data_sources WHERE name = ?", (source_name,)
-            )
-            source_row = cursor.fetchone()
+            ).fetchone()
             if not source_row:
                 detail_logger.debug(
                     f"Source '{source_name}' not found, no data to remove"
@@ -235,36 +381,141 @@ class DataSourceManager(CacheBase):
 
             source_id = source_row[0]
 
-            # Count records to be removed
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM source_assessments WHERE source_id = ?",
-                (source_id,),
+            # Forget the fingerprints, download validators and extracted
+            # texts first, so the next sync downloads, parses and writes every
+            # record again even if the removal below is interrupted
+            conn.execute(
+                "DELETE FROM source_fingerprints WHERE source_id = ?", (source_id,)
             )
-            count: int = cursor.fetchone()[0]
-            detail_logger.debug(
-                f"Found {count} records to remove for source '{source_name}'"
+            conn.execute(
+                "DELETE FROM source_downloads WHERE source_name = ?", (source_name,)
             )
-
-            # Remove source assessments
             conn.execute(
-                "DELETE FROM source_assessments WHERE source_id = ?", (source_id,)
+                "DELETE FROM extracted_texts WHERE source_name = ?", (source_name,)
             )
-            detail_logger.debug(f"Deleted {count} source assessments")
 
-            # Clean up orphaned journals (journals with no source assessments)
-            cursor = conn.execute(
-                """
-                DELETE FROM journals WHERE id NOT IN (
-                    SELECT DISTINCT journal_id FROM source_assessments
-                )
+        removed = 0
+        orphaned_journals = 0
+
+        def remove_chunk(cursor: sqlite3.Cursor) -> bool:
+            nonlocal removed, orphaned_journals
+            cursor.execute(
+                "SELECT journal_id FROM source_assessments WHERE source_id = ? LIMIT ?",
+                (source_id, CLEANUP_CHUNK_SIZE),
+            )
+            journal_ids = [row[0] for row in cursor.fetchall()]
+            if not journal_ids:
+                return False
+
+            placeholders = ",".join("?" * len(journal_ids))
+            cursor.execute(
+                f"DELETE FROM source_assessments WHERE source_id = ? AND journal_id IN ({placeholders})",  # nosec B608
+                [source_id, *journal_ids],
+            )
+            removed += cursor.rowcount
+            orphaned_journals += delete_orphaned_journals(cursor, journal_ids)
+            return True
+
+        self._run_in_short_transactions(remove_chunk)
+
+        detail_logger.debug(
+            f"Deleted {removed} source assessments and {orphaned_journals} orphaned journals"
+        )
+        status_logger.info(f"Removed {removed} records from source '{source_name}'")
+        return removed
+
+    def cleanup_orphaned_records(self) -> int:
+        """Remove rows that no registered data source accounts for.
+
+        Deletes assessments of unregistered sources, journals that no source
+        lists, and names, URLs and retraction statistics of journals that no
+        longer exist. Such rows are left behind by databases written by
+        earlier versions. The journals table is walked in ID ranges using the
+        journal_id indexes, in transactions of at most
+        CLEANUP_TRANSACTION_SECONDS.
+
+        Returns:
+            Number of journals removed
+        """
+        # Highest journal ID referenced anywhere; MAX() on indexed columns is cheap
+        id_columns = [("journals", "id")] + [
+            (table, "journal_id")
+            for table in ("source_assessments", *JOURNAL_CHILD_TABLES)
+        ]
+        with self.get_connection() as conn:
+            max_id = max(
+                conn.execute(f"SELECT MAX({column}) FROM {table}").fetchone()[0]  # nosec B608
+                or 0
+                for table, column in id_columns
+            )
+
+        removed_assessments = 0
+        removed_journals = 0
+        range_starts = iter(range(0, max_id + 1, CLEANUP_CHUNK_SIZE))
+
+        def sweep_range(cursor: sqlite3.Cursor) -> bool:
+            nonlocal removed_assessments, removed_journals
+            low = next(range_starts, None)
+            if low is None:
+                return False
+            high = low + CLEANUP_CHUNK_SIZE - 1
+
+            cursor.execute(
                 """
+                DELETE FROM source_assessments
+                WHERE journal_id BETWEEN ? AND ?
+                  AND source_id NOT IN (SELECT id FROM data_sources)
+                """,
+                (low, high),
+            )
+            removed_assessments += cursor.rowcount
+
+            cursor.execute(
+                "SELECT id FROM journals WHERE id BETWEEN ? AND ?", (low, high)
             )
-            orphaned_journals = cursor.rowcount
-            detail_logger.debug(f"Cleaned up {orphaned_journals} orphaned journals")
+            journal_ids = [row[0] for row in cursor.fetchall()]
+            removed_journals += delete_orphaned_journals(cursor, journal_ids)
+
+            for table in JOURNAL_CHILD_TABLES:
+                cursor.execute(
+                    f"""
+                    DELETE FROM {table}
+                    WHERE journal_id BETWEEN ? AND ?
+                      AND NOT EXISTS (
+                          SELECT 1 FROM journals j WHERE j.id = {table}.journal_id
+                      )
+                    """,  # nosec B608
+                    (low, high),
+                )
+            return True
 
-            conn.commit()
-            status_logger.info(f"Removed {count} records from source '{source_name}'")
-            return count
+        self._run_in_short_transactions(sweep_range)
+
+        detail_logger.info(
+            f"Orphan cleanup removed {removed_assessments} assessments and "
+            f"{removed_journals} journals"
+        )
+        return removed_journals
+
+    def _run_in_short_transactions(
+        self, step: Callable[[sqlite3.Cursor], bool]
+    ) -> None:
+        """Call step() until it returns False, committing every few hundred ms.
+
+        Grouping steps into transactions avoids rewriting the same index
+        pages on every commit, while the time limit keeps the write lock
+        short enough for concurrent readers and writers.
+
+        Args:
+            step: Function doing one chunk of work; returns False when done
+        """
+        more = True
+        while more:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                deadline = time.monotonic() + CLEANUP_TRANSACTION_SECONDS
+                while more and time.monotonic() < deadline:
+                    more = step(cursor)
 
     def get_available_sources(self) -> list[str]:
         """Get list of all available data sources.
@@ -0,0 +1,301 @@
+# SPDX-License-Identifier: MIT
+"""Validators and payloads of the files downloaded by data sources.
+
+For every (source, URL) pair the ``source_downloads`` table keeps the ETag,
+Last-Modified value and SHA-256 hash of the last payload the source was
+synced from. The payload itself is stored once per hash in a ``downloads``
+directory next to the database, so a ``304 Not Modified`` answer can be
+served from disk when another file of the same source did change.
+
+Sources that parse documents out of a download (e.g. PDFs inside an
+archive) can keep the extracted text per document hash in the
+``extracted_texts`` table, so unchanged documents are not parsed again.
+"""
+
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from ..logging_config import get_detail_logger
+from .base import CacheBase
+
+
+detail_logger = get_detail_logger()
+
+DOWNLOADS_DIRECTORY = "downloads"
+
+# Partial payloads of interrupted syncs are deleted after this many seconds
+STALE_SPOOL_SECONDS = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class DownloadRecord:
+    """Validators of one downloaded payload.
+
+    Attributes:
+        url: URL the payload was downloaded from.
+        content_hash: Hex SHA-256 digest of the payload.
+        etag: ETag response header, if the server sent one.
+        last_modified: Last-Modified response header, if the server sent one.
+    """
+
+    url: str
+    content_hash: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class DownloadCache(CacheBase):
+    """Read/write access to source download validators and payloads."""
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        super().__init__(db_path)
+        self.body_dir = self.db_path.parent / DOWNLOADS_DIRECTORY
+
+    def get_download(self, source_name: str, url: str) -> DownloadRecord | None:
+        """Return the stored validators for a URL of a source.
+
+        Records whose payload is missing from disk are not returned, since a
+        ``304`` answer to them could not be served.
+
+        Args:
+            source_name: Name of the data source
+            url: Downloaded URL
+
+        Returns:
+            The stored record, or None if the URL has no usable record.
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT content_hash, etag, last_modified FROM source_downloads
+                WHERE source_name = ? AND url = ?
+                """,
+                (source_name, url),
+            ).fetchone()
+        if row is None or not self._body_path(row[0]).exists():
+            return None
+        return DownloadRecord(
+            url=url, content_hash=row[0], etag=row[1], last_modified=row[2]
+        )
+
+    def get_download_urls(self, source_name: str) -> set[str]:
+        """Return the URLs a source was last synced from.
+
+        Args:
+            source_name: Name of the data source
+
+        Returns:
+            Set of URLs with a stored record.
+        """
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT url FROM source_downloads WHERE source_name = ?",
+                (source_name,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def read_body(self, content_hash: str) -> bytes:
+        """Read a stored payload.
+
+        Args:
+            content_hash: Hash of the payload
+
+        Returns:
+            The payload bytes.
+
+        Raises:
+            FileNotFoundError: If the payload is not stored.
+        """
+        return self._body_path(content_hash).read_bytes()
+
+    def open_body(self, content_hash: str) -> IO[bytes]:
+        """Open a stored payload for streaming.
+
+        Args:
+            content_hash: Hash of the payload
+
+        Returns:
+            Binary file object positioned at the start of the payload.
+
+        Raises:
+            FileNotFoundError: If the payload is not stored.
+        """
+        return self._body_path(content_hash).open("rb")
+
+    def spool_file(self) -> IO[bytes]:
+        """Create a temporary file to stream a new payload into.
+
+        The file is moved into place by store_downloads(). Its ``name`` is
+        the path to pass there.
+
+        Returns:
+            Binary file object open for writing.
+        """
+        self.body_dir.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(
+            dir=self.body_dir, suffix=".tmp", delete=False
+        )
+
+    def store_downloads(
+        self,
+        source_name: str,
+        downloads: list[tuple[DownloadRecord, bytes | Path | None]],
+        fetched_urls: set[str] | None = None,
+    ) -> None:
+        """Store the validators and payloads a source was synced from.
+
+        Payloads are written before the validators that reference them.
+        Payloads no longer referenced by any record are deleted afterwards.
+
+        Args:
+            source_name: Name of the data source
+            downloads: Records with their payload, the path of a spool file
+                holding it (see spool_file()), or None for payloads that are
+                already stored
+            fetched_urls: URLs the source fetched in this sync, if known;
+                records of the source's other URLs are deleted
+        """
+        stale_urls: list[str] = []
+        if fetched_urls is not None:
+            stale_urls = sorted(self.get_download_urls(source_name) - fetched_urls)
+        if not downloads and not stale_urls:
+            return
+
+        self.body_dir.mkdir(parents=True, exist_ok=True)
+        for record, body in downloads:
+            if body is not None:
+                self._write_body(record.content_hash, body)
+
+        with self.get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO source_downloads
+                    (source_name, url, etag, last_modified, content_hash, checked_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(source_name, url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_hash = excluded.content_hash,
+                    checked_at = excluded.checked_at
+                """,
+                [
+                    (
+                        source_name,
+                        record.url,
+                        record.etag,
+                        record.last_modified,
+                        record.content_hash,
+                    )
+                    for record, _ in downloads
+                ],
+            )
+            conn.executemany(
+                "DELETE FROM source_downloads WHERE source_name = ? AND url = ?",
+                [(source_name, url) for url in stale_urls],
+            )
+            referenced = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT content_hash FROM source_downloads"
+                )
+            }
+
+        self._prune_bodies(referenced)
+        detail_logger.debug(
+            f"Stored {len(downloads)} download records for source '{source_name}'"
+            f" and deleted {len(stale_urls)}"
+        )
+
+    def get_extracted_texts(
+        self, source_name: str, extractor: str, content_hashes: list[str]
+    ) -> dict[str, str]:
+        """Return the stored texts of documents extracted by a source.
+
+        Args:
+            source_name: Name of the data source
+            extractor: Identifier of the extractor (e.g. library and version);
+                texts extracted by another extractor are not returned
+            content_hashes: Hashes of the documents
+
+        Returns:
+            Dictionary mapping the hashes of known documents to their text.
+        """
+        if not content_hashes:
+            return {}
+        placeholders = ",".join("?" * len(content_hashes))
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT content_hash, text FROM extracted_texts
+                WHERE source_name = ? AND extractor = ?
+                  AND content_hash IN ({placeholders})
+                """,  # nosec B608 - placeholders only
+                (source_name, extractor, *content_hashes),
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def store_extracted_texts(
+        self, source_name: str, extractor: str, texts: dict[str, str]
+    ) -> None:
+        """Replace the stored document texts of a source.
+
+        Texts of documents not in ``texts`` are deleted, so only the
+        documents of the source's latest download are kept.
+
+        Args:
+            source_name: Name of the data source
+            extractor: Identifier of the extractor that produced the texts
+            texts: Dictionary mapping document hashes to their text
+        """
+        with self.get_connection() as conn:
+            conn.execute(
+                "DELETE FROM extracted_texts WHERE source_name = ?", (source_name,)
+            )
+            conn.executemany(
+                """
+                INSERT INTO extracted_texts
+                    (source_name, content_hash, extractor, text)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (source_name, content_hash, extractor, text)
+                    for content_hash, text in texts.items()
+                ],
+            )
+        detail_logger.debug(
+            f"Stored {len(texts)} extracted texts for source '{source_name}'"
+        )
+
+    def _body_path(self, content_hash: str) -> Path:
+        return self.body_dir / content_hash
+
+    def _write_body(self, content_hash: str, body: bytes | Path) -> None:
+        path = self._body_path(content_hash)
+        if isinstance(body, Path):
+            if path.exists():
+                body.unlink(missing_ok=True)
+            else:
+                os.replace(body, path)
+            return
+        if path.exists():
+            return
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(body)
+        os.replace(temp_path, path)
+
+    def _prune_bodies(self, referenced: set[str]) -> None:
+        stale_before = time.time() - STALE_SPOOL_SECONDS
+        for path in self.body_dir.iterdir():
+            if path.name in referenced:
+                continue
+            try:
+                # Spool files may belong to a sync that is still running
+                if path.suffix and path.stat().st_mtime > stale_before:
+                    continue
+                path.unlink()
+            except OSError as e:
+                detail_logger.debug(f"Could not delete stale download {path}: {e}")
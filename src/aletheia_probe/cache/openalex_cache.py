@@ -2,10 +2,12 @@
 """OpenAlex caching for publication statistics."""
 
 import json
+import sqlite3
 from datetime import datetime, timedelta
 from typing import Any
 
 from ..logging_config import get_detail_logger, get_status_logger
+from ..metrics import get_metrics_registry
 from .base import CacheBase
 
 
@@ -158,36 +160,12 @@ class OpenAlexCache(CacheBase):
         )
 
         with self.get_connection_with_row_factory() as conn:
-            # Build query based on available parameters
-            params: tuple[str, ...] | tuple[str | None, ...]
-            if issn and journal_name:
-                query = """
-                    SELECT * FROM openalex_cache
-                    WHERE (issn = ? OR normalized_journal_name = ?)
-                    AND expires_at > ?
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """
-                params = (issn, journal_name, datetime.now().isoformat())
-            elif issn:
-                query = """
-                    SELECT * FROM openalex_cache
-                    WHERE issn = ? AND expires_at > ?
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """
-                params = (issn, datetime.now().isoformat())
-            else:  # journal_name only
-                query = """
-                    SELECT * FROM openalex_cache
-                    WHERE normalized_journal_name = ? AND expires_at > ?
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """
-                params = (journal_name, datetime.now().isoformat())
-
-            cursor = conn.execute(query, params)
-            row = cursor.fetchone()
+            row = self._select_entry(
+                conn, issn, journal_name, "expires_at > ?", datetime.now()
+            )
+            get_metrics_registry().record_cache_lookup(
+                "openalex_cache", "hit" if row else "miss"
+            )
 
             if not row:
                 detail_logger.debug(
@@ -198,34 +176,117 @@ class OpenAlexCache(CacheBase):
             detail_logger.debug(
                 f"Cache hit for issn={issn}, journal_name={journal_name}"
             )
+            return self._row_to_openalex_data(row)
+
+    def get_stale_openalex_data(
+        self,
+        issn: str | None = None,
+        journal_name: str | None = None,
+        max_stale_hours: float = 24,
+    ) -> tuple[dict[str, Any], float] | None:
+        """Get expired OpenAlex data that is still within the stale window.
 
-            # Reconstruct the openalex_data dictionary
-            # Convert year keys from strings to integers (JSON serialization converts int keys to strings)
-            recent_pubs_by_year = {}
-            if row["recent_publications_by_year"]:
-                year_data = json.loads(row["recent_publications_by_year"])
-                recent_pubs_by_year = {
-                    int(year): count for year, count in year_data.items()
-                }
-
-            return {
-                "openalex_id": row["openalex_id"],
-                "openalex_url": row["openalex_url"],
-                "display_name": row["display_name"],
-                "source_type": row["source_type"],
-                "issn_l": row["issn_l"],
-                "issns": json.loads(row["issns"]) if row["issns"] else [],
-                "total_publications": row["total_publications"],
-                "recent_publications": row["recent_publications"],
-                "recent_publications_by_year": recent_pubs_by_year,
-                "publisher": row["publisher"],
-                "first_publication_year": row["first_publication_year"],
-                "last_publication_year": row["last_publication_year"],
-                "cited_by_count": row["cited_by_count"],
-                "is_in_doaj": bool(row["is_in_doaj"]),
-                "fetched_at": row["fetched_at"],
+        Used for stale-while-revalidate: the caller serves the returned data
+        immediately and refreshes the entry in the background.
+
+        Args:
+            issn: ISSN to search for
+            journal_name: Normalized journal name to search for
+            max_stale_hours: Maximum hours past expiry an entry may be served
+
+        Returns:
+            Tuple of (OpenAlex data, seconds since expiry), or None if there is
+            no entry within the stale window
+
+        Raises:
+            ValueError: If both issn and journal_name are None
+        """
+        if not issn and not journal_name:
+            raise ValueError("Either issn or journal_name must be provided")
+
+        now = datetime.now()
+        with self.get_connection_with_row_factory() as conn:
+            row = self._select_entry(
+                conn,
+                issn,
+                journal_name,
+                "expires_at <= ? AND expires_at > ?",
+                now,
+                now - timedelta(hours=max_stale_hours),
+            )
+            if not row:
+                return None
+
+            get_metrics_registry().record_cache_lookup("openalex_cache", "stale")
+            stale_age_seconds = (
+                now - datetime.fromisoformat(row["expires_at"])
+            ).total_seconds()
+            detail_logger.debug(
+                f"Stale cache hit for issn={issn}, journal_name={journal_name} "
+                f"(expired {stale_age_seconds:.0f}s ago)"
+            )
+            return self._row_to_openalex_data(row), stale_age_seconds
+
+    @staticmethod
+    def _select_entry(
+        conn: sqlite3.Connection,
+        issn: str | None,
+        journal_name: str | None,
+        expiry_clause: str,
+        *expiry_bounds: datetime,
+    ) -> sqlite3.Row | None:
+        """Select the newest entry matching ISSN/name and an expiry condition."""
+        expiry_params = tuple(bound.isoformat() for bound in expiry_bounds)
+        params: tuple[str | None, ...]
+        if issn and journal_name:
+            match_clause = "(issn = ? OR normalized_journal_name = ?)"
+            params = (issn, journal_name, *expiry_params)
+        elif issn:
+            match_clause = "issn = ?"
+            params = (issn, *expiry_params)
+        else:  # journal_name only
+            match_clause = "normalized_journal_name = ?"
+            params = (journal_name, *expiry_params)
+
+        query = f"""
+            SELECT * FROM openalex_cache
+            WHERE {match_clause}
+            AND {expiry_clause}
+            ORDER BY created_at DESC
+            LIMIT 1
+        """  # nosec B608 - clauses are fixed literals, values are bound
+        row: sqlite3.Row | None = conn.execute(query, params).fetchone()
+        return row
+
+    @staticmethod
+    def _row_to_openalex_data(row: sqlite3.Row) -> dict[str, Any]:
+        """Reconstruct the openalex_data dictionary from a cache row."""
+        # Convert year keys from strings to integers (JSON serialization converts int keys to strings)
+        recent_pubs_by_year = {}
+        if row["recent_publications_by_year"]:
+            year_data = json.loads(row["recent_publications_by_year"])
+            recent_pubs_by_year = {
+                int(year): count for year, count in year_data.items()
             }
 
+        return {
+            "openalex_id": row["openalex_id"],
+            "openalex_url": row["openalex_url"],
+            "display_name": row["display_name"],
+            "source_type": row["source_type"],
+            "issn_l": row["issn_l"],
+            "issns": json.loads(row["issns"]) if row["issns"] else [],
+            "total_publications": row["total_publications"],
+            "recent_publications": row["recent_publications"],
+            "recent_publications_by_year": recent_pubs_by_year,
+            "publisher": row["publisher"],
+            "first_publication_year": row["first_publication_year"],
+            "last_publication_year": row["last_publication_year"],
+            "cited_by_count": row["cited_by_count"],
+            "is_in_doaj": bool(row["is_in_doaj"]),
+            "fetched_at": row["fetched_at"],
+        }
+
     def cleanup_expired_entries(self) -> int:
         """Remove expired cache entries.
 
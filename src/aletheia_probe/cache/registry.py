@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: MIT
+"""Process-wide registry of shared cache services.
+
+Cache components are cheap to use but not free to create: resolving the
+configured database path and validating the schema costs a connection and a
+handful of queries. Backends, the dispatcher and the sync writer therefore
+share one instance per cache class and database path, obtained through
+``get_cache_registry().get(...)``. Connections are owned by the instances
+(one per thread) and released together by ``close_all()``.
+"""
+
+import threading
+from pathlib import Path
+from typing import TypeVar
+
+from .base import CacheBase, get_default_db_path
+from .schema import ensure_database, forget_ensured_databases
+
+
+CacheT = TypeVar("CacheT", bound=CacheBase)
+
+
+class CacheRegistry:
+    """Shared cache instances keyed by cache class and database path."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._services: dict[tuple[type[CacheBase], Path], CacheBase] = {}
+        self._lock = threading.Lock()
+
+    def get(self, cache_cls: type[CacheT], db_path: Path | None = None) -> CacheT:
+        """Return the shared instance of a cache class for a database.
+
+        Args:
+            cache_cls: Cache component class (e.g. JournalCache)
+            db_path: Database path; defaults to config.cache.db_path
+
+        Returns:
+            Shared instance, created on first request
+
+        Raises:
+            RuntimeError: If the configured database cannot be initialized.
+        """
+        if db_path is None:
+            db_path = get_default_db_path()
+        else:
+            ensure_database(db_path)
+        key = (cache_cls, db_path.resolve())
+
+        with self._lock:
+            service = self._services.get(key)
+            if service is None:
+                service = cache_cls(db_path)
+                self._services[key] = service
+        return service  # type: ignore[return-value]
+
+    def close_all(self) -> None:
+        """Close the connections of all shared instances.
+
+        Instances stay registered and reopen connections on next use.
+        """
+        with self._lock:
+            services = list(self._services.values())
+        for service in services:
+            service.close()
+
+    def reset(self) -> None:
+        """Close and drop all shared instances and forget validated schemas."""
+        self.close_all()
+        with self._lock:
+            self._services.clear()
+        forget_ensured_databases()
+
+
+_cache_registry_instance: CacheRegistry | None = None
+
+
+def get_cache_registry() -> CacheRegistry:
+    """Get or create the global cache registry.
+
+    Returns:
+        The global CacheRegistry instance
+    """
+    global _cache_registry_instance
+    if _cache_registry_instance is None:
+        _cache_registry_instance = CacheRegistry()
+    return _cache_registry_instance
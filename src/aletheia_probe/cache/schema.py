@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: MIT
 """Database schema initialization for the cache system."""
 
+import sqlite3
+import threading
 from pathlib import Path
 
 from ..enums import AssessmentType, NameType, UpdateStatus, UpdateType
@@ -12,6 +14,60 @@ from .connection_utils import get_configured_connection
 SCHEMA_VERSION = 3  # Current schema version
 MIN_COMPATIBLE_VERSION = 3  # Minimum version this code can work with
 
+# Per-source record fingerprints that let sync write only changed records.
+# Derived data: created on existing databases too, since it can always be
+# rebuilt by the next sync.
+SOURCE_FINGERPRINTS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS source_fingerprints (
+        source_id INTEGER NOT NULL,
+        normalized_name TEXT NOT NULL,
+        fingerprint BLOB NOT NULL,
+        PRIMARY KEY (source_id, normalized_name),
+        FOREIGN KEY (source_id) REFERENCES data_sources(id) ON DELETE CASCADE
+    ) WITHOUT ROWID
+"""
+
+# HTTP validators and content hashes of the last payload each source
+# downloaded per URL, used for conditional requests. Derived data like the
+# fingerprints above.
+SOURCE_DOWNLOADS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS source_downloads (
+        source_name TEXT NOT NULL,
+        url TEXT NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        content_hash TEXT NOT NULL,
+        checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (source_name, url)
+    ) WITHOUT ROWID
+"""
+
+# Text extracted from downloaded documents (e.g. PDFs inside an archive),
+# keyed by the document's content hash so unchanged documents are not parsed
+# again. Derived data like the tables above.
+EXTRACTED_TEXTS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS extracted_texts (
+        source_name TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        extractor TEXT NOT NULL,
+        text TEXT NOT NULL,
+        extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (source_name, content_hash)
+    )
+"""
+
+# Timing of each source update, used to start the slowest sources of a sync
+# first. Added to the source_updates table of existing databases as well;
+# older rows simply have no timing.
+SOURCE_UPDATES_TIMING_COLUMNS = {
+    "duration_seconds": "REAL",
+    "bytes_downloaded": "INTEGER",
+}
+
+# Database paths whose schema was initialized or validated in this process
+_ensured_db_paths: set[Path] = set()
+_ensured_db_paths_lock = threading.Lock()
+
 
 class SchemaVersionError(Exception):
     """Raised when database schema version is incompatible."""
@@ -129,6 +185,16 @@ def check_schema_compatibility(db_path: Path) -> bool:
     return True
 
 
+def _ensure_source_updates_timing_columns(conn: sqlite3.Connection) -> None:
+    """Add the timing columns to a source_updates table created without them."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(source_updates)")}
+    for column, column_type in SOURCE_UPDATES_TIMING_COLUMNS.items():
+        if column not in existing:
+            conn.execute(
+                f"ALTER TABLE source_updates ADD COLUMN {column} {column_type}"
+            )
+
+
 def init_database(db_path: Path) -> None:
     """Initialize normalized database schema with version tracking.
 
@@ -159,6 +225,10 @@ def init_database(db_path: Path) -> None:
         if not is_new_db:
             # Existing database: version must match. No migration in pre-1.0.
             check_schema_compatibility(db_path)
+            conn.execute(SOURCE_FINGERPRINTS_TABLE_SQL)
+            conn.execute(SOURCE_DOWNLOADS_TABLE_SQL)
+            conn.execute(EXTRACTED_TEXTS_TABLE_SQL)
+            _ensure_source_updates_timing_columns(conn)
             return
 
         # New database - create with current schema
@@ -293,6 +363,15 @@ def init_database(db_path: Path) -> None:
             CREATE INDEX IF NOT EXISTS idx_venue_acronym_issns_issn
                 ON venue_acronym_issns(issn);
 
+            -- Per-source record fingerprints for differential sync
+            {SOURCE_FINGERPRINTS_TABLE_SQL};
+
+            -- Validators of the payloads downloaded by each source
+            {SOURCE_DOWNLOADS_TABLE_SQL};
+
+            -- Text extracted from downloaded documents, by content hash
+            {EXTRACTED_TEXTS_TABLE_SQL};
+
             -- Retraction statistics (purpose-built for RetractionWatch data)
             CREATE TABLE IF NOT EXISTS retraction_statistics (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -323,6 +402,8 @@ def init_database(db_path: Path) -> None:
                 error_message TEXT,
                 started_at TIMESTAMP,
                 completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                duration_seconds REAL,
+                bytes_downloaded INTEGER,
                 FOREIGN KEY (source_id) REFERENCES data_sources(id),
                 CHECK (update_type IN ({update_type_values})),
                 CHECK (status IN ({update_status_values}))
@@ -429,3 +510,30 @@ def init_database(db_path: Path) -> None:
             SCHEMA_VERSION,
             "Schema v3: acronym-level venue data with canonical, variants, and ISSN",
         )
+
+
+def ensure_database(db_path: Path) -> None:
+    """Initialize or validate a database schema once per path and process.
+
+    The first call for a path runs init_database(); later calls return
+    immediately as long as the file still exists. A database that is deleted
+    (e.g. by ``cache clear``) is initialized again on the next call.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Raises:
+        SchemaVersionError: If existing database has an incompatible schema version
+    """
+    key = db_path.resolve()
+    with _ensured_db_paths_lock:
+        if key in _ensured_db_paths and key.exists():
+            return
+        init_database(db_path)
+        _ensured_db_paths.add(key)
+
+
+def forget_ensured_databases() -> None:
+    """Make the next ensure_database() call re-validate every path."""
+    with _ensured_db_paths_lock:
+        _ensured_db_paths.clear()
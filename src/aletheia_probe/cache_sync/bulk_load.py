@@ -0,0 +1,285 @@
+# SPDX-License-Identifier: MIT
+"""Bulk-load builds of the cache database for full rebuilds.
+
+A bulk build writes all source data into a fresh database file next to the
+live one, with the secondary indexes of the journal tables dropped so rows
+are appended without per-row index maintenance. ``finalize()`` carries over
+the tables that sync does not produce (custom lists, acronyms, API caches)
+and the sync history, creates the indexes once, runs ``ANALYZE`` and
+atomically renames the file over the live database. An aborted build leaves
+the live database untouched.
+
+The rename must not happen under another process' connection to the live
+database: that connection would keep the old file but share the ``-wal``
+and ``-shm`` files with the new one. finalize() therefore takes the live
+database out of WAL mode first, which SQLite only allows to its sole
+connection, and refuses to swap while the database is in use.
+"""
+
+import gc
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from ..cache import get_cache_registry
+from ..cache.connection_utils import get_configured_connection, get_sqlite_profile
+from ..cache.schema import (
+    SchemaVersionError,
+    check_schema_compatibility,
+    init_database,
+)
+from ..logging_config import get_detail_logger, get_status_logger
+
+
+detail_logger = get_detail_logger()
+status_logger = get_status_logger()
+
+# Tables filled by sync whose secondary indexes are deferred
+BULK_LOADED_TABLES: tuple[str, ...] = (
+    "journals",
+    "journal_names",
+    "journal_urls",
+    "source_assessments",
+    "retraction_statistics",
+)
+
+# Tables not produced by sync, copied from the live database on finalize.
+# Download validators and extracted texts are kept for the sources that
+# write none in the build; rows written by the build win.
+PRESERVED_TABLES: tuple[str, ...] = (
+    "custom_lists",
+    "venue_acronyms",
+    "venue_acronym_variants",
+    "venue_acronym_issns",
+    "assessment_cache",
+    "article_retractions",
+    "openalex_cache",
+    "source_downloads",
+    "extracted_texts",
+)
+
+_SQLITE_SUFFIXES = ("", "-wal", "-shm", "-journal")
+
+# Suffix of the build database next to the live one
+BULK_BUILD_SUFFIX = ".bulk"
+
+
+def is_bulk_build(db_path: Path) -> bool:
+    """Return whether a database path is the file of a bulk build."""
+    return Path(db_path).name.endswith(BULK_BUILD_SUFFIX)
+
+
+class BulkLoadBuild:
+    """Fresh cache database built beside the live one and swapped in at the end."""
+
+    def __init__(self, target_path: Path):
+        """Initialize a build for a live database path.
+
+        Args:
+            target_path: Path of the live cache database (may not exist yet)
+        """
+        self.target_path = target_path
+        self.build_path = target_path.with_name(
+            f"{target_path.name}{BULK_BUILD_SUFFIX}"
+        )
+        self._deferred_indexes: list[tuple[str, str]] = []
+
+    def prepare(self) -> None:
+        """Create the build database and drop the deferred secondary indexes.
+
+        Raises:
+            sqlite3.Error: If the build database cannot be created
+            OSError: If a leftover build file cannot be removed
+        """
+        self._remove_build_files()
+        self.build_path.parent.mkdir(parents=True, exist_ok=True)
+        init_database(self.build_path)
+
+        placeholders = ",".join("?" for _ in BULK_LOADED_TABLES)
+        with get_configured_connection(self.build_path) as conn:
+            # sql IS NULL marks the automatic indexes behind UNIQUE constraints,
+            # which the writer's upserts rely on and cannot be dropped
+            rows = conn.execute(
+                f"""
+                SELECT name, sql FROM sqlite_master
+                WHERE type = 'index' AND sql IS NOT NULL
+                  AND tbl_name IN ({placeholders})
+                ORDER BY name
+                """,  # nosec B608
+                BULK_LOADED_TABLES,
+            ).fetchall()
+            self._deferred_indexes = [(name, sql) for name, sql in rows]
+            for name, _ in self._deferred_indexes:
+                conn.execute(f'DROP INDEX "{name}"')
+
+        detail_logger.info(
+            f"Bulk build prepared at {self.build_path} with "
+            f"{len(self._deferred_indexes)} deferred indexes"
+        )
+
+    def finalize(self) -> None:
+        """Complete the build and atomically replace the live database.
+
+        Raises:
+            sqlite3.Error: If copying, indexing or analyzing fails, or another
+                process uses the live database
+            OSError: If the file cannot be renamed into place
+        """
+        # Release this process' connections to both files before the swap
+        get_cache_registry().close_all()
+
+        started = time.monotonic()
+        with get_configured_connection(
+            self.build_path, profile=get_sqlite_profile("bulk_sync")
+        ) as conn:
+            self._copy_preserved_tables(conn)
+            for name, sql in self._deferred_indexes:
+                detail_logger.debug(f"Creating index {name}")
+                conn.execute(sql)
+            conn.execute("ANALYZE")
+        status_logger.info(
+            f"    Bulk build: created {len(self._deferred_indexes)} indexes and "
+            f"analyzed in {time.monotonic() - started:.1f}s"
+        )
+
+        # Fold the WAL into the main file so the build is a single file
+        with get_configured_connection(self.build_path, enable_wal=False) as conn:
+            conn.execute("PRAGMA journal_mode = DELETE")
+
+        # Cache instances dropped in reference cycles keep their connections
+        # until collected, and would count as another user of the database
+        gc.collect()
+        self._release_target()
+        os.replace(self.build_path, self.target_path)
+        detail_logger.info(f"Bulk build swapped into {self.target_path}")
+
+    def abort(self) -> None:
+        """Discard the build, leaving the live database untouched."""
+        get_cache_registry().close_all()
+        try:
+            self._remove_build_files()
+        except OSError as e:
+            detail_logger.warning(f"Could not remove bulk build files: {e}")
+
+    def _copy_preserved_tables(self, conn: sqlite3.Connection) -> None:
+        """Copy the tables sync does not produce from the live database."""
+        if not self.target_path.exists():
+            return
+        try:
+            check_schema_compatibility(self.target_path)
+        except SchemaVersionError:
+            status_logger.warning(
+                "    Bulk build: live database has an incompatible schema; "
+                "custom lists, acronyms and API caches are not carried over"
+            )
+            return
+
+        conn.execute("ATTACH DATABASE ? AS live", (str(self.target_path),))
+        for table in PRESERVED_TABLES:
+            self._copy_table(conn, table)
+        self._copy_source_updates(conn)
+        conn.commit()
+        conn.execute("DETACH DATABASE live")
+
+    @staticmethod
+    def _copy_table(conn: sqlite3.Connection, table: str) -> None:
+        """Copy one preserved table from the attached live database.
+
+        Rows written by this sync (e.g. Retraction Watch article retractions)
+        win over live rows with the same unique key. Row ids are kept when the
+        build table is empty, so references between the acronym tables hold.
+        """
+        # PRAGMA table_info rows: (cid, name, type, notnull, default, pk)
+        table_info = conn.execute(f"PRAGMA main.table_info({table})").fetchall()
+        build_is_empty = (
+            conn.execute(f"SELECT 1 FROM main.{table} LIMIT 1").fetchone() is None  # nosec B608
+        )
+        key_columns = [row for row in table_info if row[5]]
+        row_id_column = (
+            key_columns[0][1]
+            if len(key_columns) == 1 and key_columns[0][2].upper() == "INTEGER"
+            else None
+        )
+        columns = [
+            name
+            for _, name, *_ in table_info
+            if build_is_empty or name != row_id_column
+        ]
+        column_list = ", ".join(columns)
+        conn.execute(
+            f"INSERT OR IGNORE INTO main.{table} ({column_list}) "  # nosec B608
+            f"SELECT {column_list} FROM live.{table}"
+        )
+
+    @staticmethod
+    def _copy_source_updates(conn: sqlite3.Connection) -> None:
+        """Copy the update history of the live database before the build's own.
+
+        The next sync orders sources by their recorded durations. Rows are
+        matched to the build's data sources by name and renumbered, so the
+        history stays in chronological id order; history of sources the
+        build does not have is dropped.
+        """
+        columns = [
+            name
+            for _, name, *_ in conn.execute(
+                "PRAGMA main.table_info(source_updates)"
+            ).fetchall()
+            if name not in ("id", "source_id")
+        ]
+        column_list = ", ".join(columns)
+        live_columns = ", ".join(f"lu.{name}" for name in columns)
+        conn.execute(
+            "CREATE TEMP TABLE build_updates AS SELECT * FROM main.source_updates"
+        )
+        conn.execute("DELETE FROM main.source_updates")
+        conn.execute(
+            f"""
+            INSERT INTO main.source_updates (source_id, {column_list})
+            SELECT mds.id, {live_columns} FROM live.source_updates lu
+            JOIN live.data_sources lds ON lds.id = lu.source_id
+            JOIN main.data_sources mds ON mds.name = lds.name
+            ORDER BY lu.id
+            """  # nosec B608
+        )
+        conn.execute(
+            f"""
+            INSERT INTO main.source_updates (source_id, {column_list})
+            SELECT source_id, {column_list} FROM temp.build_updates ORDER BY id
+            """  # nosec B608
+        )
+        conn.execute("DROP TABLE temp.build_updates")
+
+    def _release_target(self) -> None:
+        """Take the live database out of WAL mode before it is replaced.
+
+        Leaving WAL mode checkpoints the WAL and deletes the ``-wal`` and
+        ``-shm`` files, so no frames outlive the swap. SQLite only allows it
+        to the database's sole connection.
+
+        Raises:
+            sqlite3.OperationalError: If another process uses the database
+        """
+        if not self.target_path.exists():
+            return
+        try:
+            with get_configured_connection(
+                self.target_path, timeout=5.0, enable_wal=False
+            ) as conn:
+                mode = conn.execute("PRAGMA journal_mode = DELETE").fetchone()[0]
+        except sqlite3.OperationalError as e:
+            raise sqlite3.OperationalError(
+                f"{self.target_path} is in use by another process ({e}); "
+                "stop it before the bulk build replaces the database"
+            ) from e
+        if str(mode).lower() != "delete":
+            raise sqlite3.OperationalError(
+                f"{self.target_path} is in use by another process; "
+                "stop it before the bulk build replaces the database"
+            )
+
+    def _remove_build_files(self) -> None:
+        """Remove the build database and its journal files."""
+        for suffix in _SQLITE_SUFFIXES:
+            Path(f"{self.build_path}{suffix}").unlink(missing_ok=True)
@@ -2,25 +2,117 @@
 """Asynchronous database writer for cache synchronization."""
 
 import asyncio
+import hashlib
+import json
 import sqlite3
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
-from ..cache import DataSourceManager, RetractionCache
-from ..cache.connection_utils import get_configured_connection
+from ..cache import (
+    DataSourceManager,
+    RetractionCache,
+    SourceUpdateTiming,
+    get_cache_registry,
+)
+from ..cache.connection_utils import (
+    SqliteProfile,
+    get_configured_connection,
+    get_sqlite_profile,
+)
+from ..cache.data_source_manager import delete_orphaned_journals
 from ..data_models import JournalDataDict
 from ..enums import NameType, UpdateStatus, UpdateType
 from ..logging_config import get_detail_logger, get_status_logger
+from .bulk_load import is_bulk_build
+
+
+# Names per IN (...) lookup; below SQLITE_MAX_VARIABLE_NUMBER on all builds (999)
+JOURNAL_ID_LOOKUP_CHUNK_SIZE = 900
+
+# Part of every fingerprint; bump when the fingerprinted fields or the way
+# records are written change, so the next sync rewrites every record
+FINGERPRINT_VERSION = 1
+
+# Share of a source's stored records a sync may remove without force; a
+# larger drop usually means a truncated download rather than a shrunk list.
+# Sources with fewer stored records are not guarded.
+MAX_REMOVED_SHARE = 0.5
+REMOVAL_GUARD_MIN_RECORDS = 20
+
+# Stable encoding of the fingerprinted fields (key order and spacing fixed)
+_FINGERPRINT_ENCODER = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), default=str
+)
+
+
+def _sync_profile(db_path: Path) -> SqliteProfile:
+    """Return the connection profile for sync writes to a database.
+
+    Only a bulk build, which is discarded when interrupted, skips fsync.
+    """
+    return get_sqlite_profile("bulk_sync" if is_bulk_build(db_path) else "sync")
+
+
+@dataclass
+class _SourceWrite:
+    """Progress of writing one source's records, possibly over several chunks.
+
+    Attributes:
+        source_id: Database ID of the data source.
+        source_name: Name of the data source.
+        list_type: Type of list (e.g., "predatory", "legitimate").
+        stored: Fingerprints stored by the previous sync.
+        seen: Normalized names written or confirmed unchanged so far.
+        total_records: Input records with a normalized name so far.
+        added: Records added so far.
+        updated: Records updated so far.
+        removed: Records removed when the write finished.
+        force: Whether more than MAX_REMOVED_SHARE of the stored records
+            may be removed.
+    """
+
+    source_id: int
+    source_name: str
+    list_type: str
+    stored: dict[str, bytes]
+    seen: set[str] = field(default_factory=set)
+    total_records: int = 0
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    force: bool = False
+
+    def result(self) -> dict[str, int]:
+        """Return the write statistics reported by the writer loop."""
+        return {
+            "total_records": self.total_records,
+            "unique_journals": len(self.seen),
+            "duplicates": self.total_records - len(self.seen),
+            "records_added": self.added,
+            "records_updated": self.updated,
+            "records_removed": self.removed,
+            "previous_records": len(self.stored),
+        }
 
 
 class AsyncDBWriter:
     """Handles database writes asynchronously to prevent blocking."""
 
-    def __init__(self) -> None:
-        """Initialize the database writer with an empty queue and loggers."""
+    def __init__(self, db_path: Path | None = None) -> None:
+        """Initialize the database writer with an empty queue and loggers.
+
+        Args:
+            db_path: Database to write to. If None, uses the configured cache DB.
+        """
+        self.db_path = db_path
         self.write_queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
         self.writer_task: asyncio.Task[None] | None = None
+        # Sources with queued chunks still to come, and those that failed
+        self._chunked_writes: dict[str, _SourceWrite] = {}
+        self._failed_chunked_writes: set[str] = set()
         self.detail_logger = get_detail_logger()
         self.status_logger = get_status_logger()
 
@@ -51,14 +143,33 @@ class AsyncDBWriter:
             self.status_logger.info("    DBWriter: Database writer task stopped")
 
     async def queue_write(
-        self, source_name: str, list_type: str, journals: list[JournalDataDict]
+        self,
+        source_name: str,
+        list_type: str,
+        journals: list[JournalDataDict],
+        on_written: Callable[[], None] | None = None,
+        final: bool = True,
+        timing: SourceUpdateTiming | None = None,
+        force: bool = False,
     ) -> None:
         """Queue data for database writing.
 
+        A source may queue its records in several chunks by passing
+        ``final=False`` for all but the last one. Each chunk is written when
+        it is dequeued; records the source no longer lists are removed after
+        the final chunk. A normalized name should only appear in one chunk.
+
         Args:
             source_name: Name of the data source
             list_type: Type of list (e.g., "predatory", "legitimate")
             journals: List of journal data dictionaries conforming to JournalDataDict structure
+            on_written: Called after the data was written successfully
+            final: Whether this is the last chunk of the source's records
+            timing: Duration and download volume of the source update, logged
+                with the final chunk
+            force: Remove the records the source no longer lists even if they
+                are more than MAX_REMOVED_SHARE of its stored records;
+                otherwise such a write fails and changes nothing
         """
         self.status_logger.info(
             f"    DBWriter: Received {len(journals)} records from {source_name} for queuing"
@@ -68,12 +179,32 @@ class AsyncDBWriter:
             f"record_count={len(journals)}, current_queue_size={self.write_queue.qsize()}"
         )
         await self.write_queue.put(
-            {"source_name": source_name, "list_type": list_type, "journals": journals}
+            {
+                "source_name": source_name,
+                "list_type": list_type,
+                "journals": journals,
+                "on_written": on_written,
+                "final": final,
+                "timing": timing,
+                "force": force,
+            }
         )
         self.status_logger.info(
             f"    DBWriter: Queued {len(journals)} records from {source_name}"
         )
 
+    async def discard_chunks(self, source_name: str) -> None:
+        """Abandon a source whose remaining chunks will not be queued.
+
+        Chunks already queued are still written, but the source is not
+        finished, so none of its previous records are removed.
+
+        Args:
+            source_name: Name of the data source
+        """
+        self.detail_logger.debug(f"Queueing discard of chunked write: {source_name}")
+        await self.write_queue.put({"source_name": source_name, "discard": True})
+
     async def _db_writer_loop(self) -> None:
         """Main database writer loop - processes write queue sequentially.
 
@@ -94,47 +225,114 @@ class AsyncDBWriter:
                     break
 
                 source_name = write_data["source_name"]
+                if write_data.get("discard"):
+                    self._chunked_writes.pop(source_name, None)
+                    self._failed_chunked_writes.discard(source_name)
+                    self.status_logger.warning(
+                        f"    DBWriter: Discarded incomplete write of {source_name}"
+                    )
+                    continue
+
                 list_type = write_data["list_type"]
                 journals = write_data["journals"]
+                final = write_data.get("final", True)
+                force = write_data.get("force", False)
+
+                if source_name in self._failed_chunked_writes:
+                    # An earlier chunk failed; finishing the source would
+                    # remove the records of the chunks that were written
+                    if final:
+                        self._failed_chunked_writes.discard(source_name)
+                    self.status_logger.warning(
+                        f"    DBWriter: Skipping {len(journals)} records of {source_name} "
+                        "after an earlier write error"
+                    )
+                    continue
 
                 self.status_logger.info(
                     f"    DBWriter: Processing {source_name} - Writing {len(journals)} records to database..."
                 )
                 self.detail_logger.debug(
                     f"Dequeued write operation: source={source_name}, list_type={list_type}, "
-                    f"record_count={len(journals)}"
+                    f"record_count={len(journals)}, final={final}"
                 )
 
-                # Perform optimized batch database writes
-                write_result = self._batch_write_journals(
-                    source_name, list_type, journals
-                )
+                chunked_write = self._chunked_writes.pop(source_name, None)
+                if final and chunked_write is None:
+                    # Perform optimized batch database writes
+                    write_result = self._batch_write_journals(
+                        source_name, list_type, journals, force=force
+                    )
+                else:
+                    try:
+                        chunked_write = self._write_journal_chunk(
+                            source_name, list_type, journals, chunked_write, force
+                        )
+                        if not final:
+                            self._chunked_writes[source_name] = chunked_write
+                            continue
+                        write_result = self._finish_journal_chunks(chunked_write)
+                    except (sqlite3.Error, KeyError, ValueError, TypeError):
+                        if not final:
+                            self._failed_chunked_writes.add(source_name)
+                        raise
 
                 total_records = write_result["total_records"]
                 unique_journals = write_result["unique_journals"]
                 duplicates = write_result["duplicates"]
+                records_added = write_result["records_added"]
+                records_updated = write_result["records_updated"]
+                records_removed = write_result["records_removed"]
 
                 self.detail_logger.debug(
                     f"Batch write completed: total_records={total_records}, "
-                    f"unique_journals={unique_journals}, duplicates={duplicates}"
+                    f"unique_journals={unique_journals}, duplicates={duplicates}, "
+                    f"added={records_added}, updated={records_updated}, "
+                    f"removed={records_removed}"
                 )
 
-                data_source_manager = DataSourceManager()
+                # A source without stored fingerprints was written in full
+                update_type = (
+                    UpdateType.INCREMENTAL
+                    if write_result["previous_records"]
+                    else UpdateType.FULL
+                )
+                data_source_manager = get_cache_registry().get(
+                    DataSourceManager, self.db_path
+                )
                 data_source_manager.log_update(
                     source_name,
-                    UpdateType.FULL.value,
+                    update_type.value,
                     UpdateStatus.SUCCESS.value,
-                    records_updated=total_records,
+                    records_added=records_added,
+                    records_updated=records_updated,
+                    records_removed=records_removed,
+                    timing=write_data.get("timing"),
                 )
 
+                on_written = write_data.get("on_written")
+                if on_written is not None:
+                    try:
+                        on_written()
+                    except (OSError, sqlite3.Error) as e:
+                        self.status_logger.warning(
+                            f"    DBWriter: Post-write step for {source_name} failed - {e}"
+                        )
+
+                changes = (
+                    f"{records_added} added, {records_updated} updated, "
+                    f"{records_removed} removed"
+                )
                 if duplicates > 0:
                     self.status_logger.info(
                         f"    DBWriter: Completed {source_name} - {total_records} records → "
-                        f"{unique_journals} unique journals ({duplicates} duplicates merged)"
+                        f"{unique_journals} unique journals ({duplicates} duplicates merged; "
+                        f"{changes})"
                     )
                 else:
                     self.status_logger.info(
-                        f"    DBWriter: Completed {source_name} - {unique_journals} unique journals"
+                        f"    DBWriter: Completed {source_name} - {unique_journals} unique journals "
+                        f"({changes})"
                     )
 
             except (sqlite3.Error, KeyError, ValueError, TypeError) as e:
@@ -143,24 +341,6 @@ class AsyncDBWriter:
                     f"Detailed database write error for {source_name}"
                 )
 
-    def _setup_db_connection(self, conn: sqlite3.Connection) -> None:
-        """Configure SQLite performance optimizations for batch operations.
-
-        Args:
-            conn: SQLite database connection to configure
-        """
-        self.detail_logger.debug(
-            "Configuring SQLite PRAGMA settings for batch operations"
-        )
-        conn.execute("PRAGMA journal_mode = WAL")
-        self.detail_logger.debug("Set PRAGMA journal_mode = WAL")
-        conn.execute("PRAGMA synchronous = NORMAL")
-        self.detail_logger.debug("Set PRAGMA synchronous = NORMAL")
-        conn.execute("PRAGMA cache_size = 10000")
-        self.detail_logger.debug("Set PRAGMA cache_size = 10000")
-        conn.execute("PRAGMA temp_store = MEMORY")
-        self.detail_logger.debug("Set PRAGMA temp_store = MEMORY")
-
     def _ensure_source_registered(
         self,
         data_source_manager: DataSourceManager,
@@ -312,12 +492,16 @@ class AsyncDBWriter:
         # The actual normalized_names values are passed separately to cursor.execute()
         # and are safely bound by SQLite, preventing SQL injection.
         # This pattern is verified by test_sql_injection_protection_in_get_journal_ids
-        placeholders = ",".join("?" * len(normalized_names))
-        cursor.execute(
-            f"SELECT id, normalized_name FROM journals WHERE normalized_name IN ({placeholders})",  # nosec B608
-            normalized_names,
-        )
-        journal_ids = {row[1]: row[0] for row in cursor.fetchall()}
+        # Lookups are chunked to stay below SQLite's bound-parameter limit
+        journal_ids: dict[str, int] = {}
+        for start in range(0, len(normalized_names), JOURNAL_ID_LOOKUP_CHUNK_SIZE):
+            chunk = normalized_names[start : start + JOURNAL_ID_LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT id, normalized_name FROM journals WHERE normalized_name IN ({placeholders})",  # nosec B608
+                chunk,
+            )
+            journal_ids.update({row[1]: row[0] for row in cursor.fetchall()})
         self.detail_logger.debug(
             f"Retrieved {len(journal_ids)} journal IDs from database"
         )
@@ -467,6 +651,11 @@ class AsyncDBWriter:
     ) -> None:
         """Insert article retractions for RetractionWatch.
 
+        A sync that only collected the DOIs changed since the previous sync
+        carries a ``_article_retractions_delta`` entry: the changed DOIs no
+        longer listed are deleted, and the expiry of the kept rows is
+        extended.
+
         Args:
             source_name: Name of the data source
             journals: List of journal data dictionaries
@@ -476,18 +665,32 @@ class AsyncDBWriter:
 
         # Extract article retractions from metadata (stored in first journal)
         article_retractions = []
+        delta: dict[str, Any] | None = None
         if journals:
             metadata: dict[str, Any] = journals[0].get("metadata", {})
             article_retractions = metadata.get("_article_retractions", [])
+            delta = metadata.get("_article_retractions_delta")
 
-        if not article_retractions:
+        if not article_retractions and delta is None:
             return
 
-        retraction_cache = RetractionCache()
+        retraction_cache = get_cache_registry().get(RetractionCache, self.db_path)
 
         # Batch insert article retractions
         with retraction_cache.get_connection() as conn:
             cursor = conn.cursor()
+            if delta is not None:
+                cursor.executemany(
+                    "DELETE FROM article_retractions WHERE doi = ? AND source = ?",
+                    [(doi, source_name) for doi in delta["removed_dois"]],
+                )
+                cursor.execute(
+                    "UPDATE article_retractions SET expires_at = ? WHERE source = ?",
+                    (delta["expires_at"], source_name),
+                )
+                self.detail_logger.debug(
+                    f"Deleted {len(delta['removed_dois'])} article retraction records"
+                )
             records = [
                 (
                     article["doi"],
@@ -536,7 +739,7 @@ class AsyncDBWriter:
         if source_name != "retraction_watch":
             return
 
-        retraction_cache = RetractionCache()
+        retraction_cache = get_cache_registry().get(RetractionCache, self.db_path)
         stats_count = 0
 
         for journal in journals:
@@ -679,6 +882,137 @@ class AsyncDBWriter:
 
         return unique_journals, total_input_records, existing_journals
 
+    def _compute_fingerprints(
+        self, journals: list[JournalDataDict], list_type: str
+    ) -> dict[str, bytes]:
+        """Compute one fingerprint per normalized name over the written fields.
+
+        Records sharing a normalized name are hashed together in input order,
+        since they are merged into a single journal. Metadata keys starting
+        with an underscore carry source-wide payloads (e.g. Retraction Watch
+        article retractions) and are left out.
+
+        Args:
+            journals: List of journal data dictionaries
+            list_type: Type of list (e.g., "predatory", "legitimate")
+
+        Returns:
+            Dictionary mapping normalized names to 16-byte fingerprints
+        """
+        encode = _FINGERPRINT_ENCODER.encode
+        records: dict[str, list[str]] = {}
+        for journal in journals:
+            normalized_name = journal.get("normalized_name")
+            if not normalized_name:
+                continue
+
+            metadata = journal.get("metadata")
+            if metadata:
+                metadata = {k: v for k, v in metadata.items() if not k.startswith("_")}
+            encoded = encode(
+                [
+                    journal["journal_name"],
+                    journal.get("issn"),
+                    journal.get("eissn"),
+                    journal.get("publisher"),
+                    journal.get("urls"),
+                    metadata,
+                ]
+            )
+            group = records.get(normalized_name)
+            if group is None:
+                records[normalized_name] = [encoded]
+            else:
+                group.append(encoded)
+
+        prefix = f"{FINGERPRINT_VERSION}:{list_type}\n"
+        return {
+            name: hashlib.blake2b(
+                (prefix + "\n".join(group)).encode(), digest_size=16
+            ).digest()
+            for name, group in records.items()
+        }
+
+    def _load_fingerprints(
+        self, cursor: sqlite3.Cursor, source_id: int
+    ) -> dict[str, bytes]:
+        """Load the fingerprints stored by the previous sync of a source.
+
+        Args:
+            cursor: Database cursor for executing queries
+            source_id: Database ID of the data source
+
+        Returns:
+            Dictionary mapping normalized names to stored fingerprints
+        """
+        cursor.execute(
+            "SELECT normalized_name, fingerprint FROM source_fingerprints WHERE source_id = ?",
+            (source_id,),
+        )
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def _remove_source_records(
+        self,
+        cursor: sqlite3.Cursor,
+        source_id: int,
+        source_name: str,
+        removed_names: list[str],
+    ) -> None:
+        """Remove a source's assessments for journals it no longer lists.
+
+        Journals that no other source lists are deleted as well.
+
+        Args:
+            cursor: Database cursor for executing queries
+            source_id: Database ID of the data source
+            source_name: Name of the data source
+            removed_names: Normalized names dropped from the source
+        """
+        if not removed_names:
+            return
+
+        self.detail_logger.debug(
+            f"Removing {len(removed_names)} records no longer listed by {source_name}"
+        )
+        journal_ids = list(self._get_journal_ids(cursor, removed_names).values())
+        cursor.executemany(
+            "DELETE FROM source_assessments WHERE journal_id = ? AND source_id = ?",
+            [(journal_id, source_id) for journal_id in journal_ids],
+        )
+        if source_name == "retraction_watch":
+            cursor.executemany(
+                "DELETE FROM retraction_statistics WHERE journal_id = ?",
+                [(journal_id,) for journal_id in journal_ids],
+            )
+        cursor.executemany(
+            "DELETE FROM source_fingerprints WHERE source_id = ? AND normalized_name = ?",
+            [(source_id, name) for name in removed_names],
+        )
+        delete_orphaned_journals(cursor, journal_ids)
+
+    def _store_fingerprints(
+        self,
+        cursor: sqlite3.Cursor,
+        source_id: int,
+        fingerprints: dict[str, bytes],
+        names: list[str],
+    ) -> None:
+        """Store the fingerprints of the records written by this sync.
+
+        Args:
+            cursor: Database cursor for executing queries
+            source_id: Database ID of the data source
+            fingerprints: Fingerprints of all records in the sync
+            names: Normalized names whose records were written
+        """
+        if names:
+            cursor.executemany(
+                """INSERT OR REPLACE INTO source_fingerprints
+                   (source_id, normalized_name, fingerprint)
+                   VALUES (?, ?, ?)""",
+                [(source_id, name, fingerprints[name]) for name in names],
+            )
+
     @contextmanager
     def _database_transaction(
         self, conn: sqlite3.Connection
@@ -713,52 +1047,260 @@ class AsyncDBWriter:
             raise
 
     def _batch_write_journals(
-        self, source_name: str, list_type: str, journals: list[JournalDataDict]
+        self,
+        source_name: str,
+        list_type: str,
+        journals: list[JournalDataDict],
+        force: bool = False,
     ) -> dict[str, int]:
-        """Optimized batch writing of journals to database using SQLite performance tuning.
+        """Write the records of a source that changed since its previous sync.
+
+        Every record is fingerprinted per normalized name and compared with
+        the fingerprints stored by the previous sync. Only added and changed
+        records are written, and the source's assessments for dropped records
+        are removed. A source without stored fingerprints is written in full.
 
         Args:
             source_name: Name of the data source
             list_type: Type of list (e.g., "predatory", "legitimate")
             journals: List of journal data dictionaries to write
+            force: Allow removing more than MAX_REMOVED_SHARE of the source's
+                stored records
 
         Returns:
-            Dictionary with keys: total_records, unique_journals, duplicates
+            Dictionary with keys: total_records, unique_journals, duplicates,
+            records_added, records_updated, records_removed, previous_records
 
         Raises:
             sqlite3.Error: Database operation errors
             KeyError: Missing required keys in journal data
-            ValueError: Invalid data values
+            ValueError: Invalid data values, or too many records would be
+                removed without force
             TypeError: Incorrect data types
         """
         self.detail_logger.debug(
             f"Starting batch write: source={source_name}, list_type={list_type}, "
             f"journal_count={len(journals)}"
         )
-        data_source_manager = DataSourceManager()
+        data_source_manager = get_cache_registry().get(DataSourceManager, self.db_path)
 
-        with get_configured_connection(data_source_manager.db_path) as conn:
-            self._setup_db_connection(conn)
+        with get_configured_connection(
+            data_source_manager.db_path,
+            profile=_sync_profile(data_source_manager.db_path),
+        ) as conn:
             cursor = conn.cursor()
-
             source_id = self._ensure_source_registered(
                 data_source_manager, source_name, list_type
             )
 
             with self._database_transaction(conn):
-                unique_journals, total_input_records, existing_journals = (
-                    self._execute_transaction(
-                        cursor, conn, journals, source_id, source_name, list_type
+                write = self._begin_source_write(
+                    cursor, source_id, source_name, list_type, force
+                )
+                existing_journals = self._write_source_chunk(
+                    cursor, conn, write, journals
+                )
+                self._finish_source_write(cursor, write)
+
+        # Handle retraction cache operations OUTSIDE the main transaction to avoid deadlocks.
+        # Article retractions ride on the first record and are always written;
+        # statistics are written for changed journals only.
+        self._handle_retraction_operations_post_transaction(
+            source_name, journals, existing_journals
+        )
+        return write.result()
+
+    def _write_journal_chunk(
+        self,
+        source_name: str,
+        list_type: str,
+        journals: list[JournalDataDict],
+        write: _SourceWrite | None,
+        force: bool = False,
+    ) -> _SourceWrite:
+        """Write one chunk of a source whose records arrive in several chunks.
+
+        Each chunk is diffed and written in its own transaction. Records whose
+        normalized name already appeared in an earlier chunk are skipped.
+        Dropped records are only removed by _finish_journal_chunks().
+
+        Args:
+            source_name: Name of the data source
+            list_type: Type of list (e.g., "predatory", "legitimate")
+            journals: Records of this chunk
+            write: Progress of the source, or None for its first chunk
+            force: Allow removing more than MAX_REMOVED_SHARE of the source's
+                stored records when it is finished
+
+        Returns:
+            Progress of the source including this chunk
+
+        Raises:
+            sqlite3.Error: Database operation errors
+            KeyError: Missing required keys in journal data
+            ValueError: Invalid data values
+            TypeError: Incorrect data types
+        """
+        data_source_manager = get_cache_registry().get(DataSourceManager, self.db_path)
+
+        with get_configured_connection(
+            data_source_manager.db_path,
+            profile=_sync_profile(data_source_manager.db_path),
+        ) as conn:
+            cursor = conn.cursor()
+            if write is None:
+                source_id = self._ensure_source_registered(
+                    data_source_manager, source_name, list_type
+                )
+                with self._database_transaction(conn):
+                    write = self._begin_source_write(
+                        cursor, source_id, source_name, list_type, force
                     )
+            with self._database_transaction(conn):
+                existing_journals = self._write_source_chunk(
+                    cursor, conn, write, journals
                 )
 
-            # Handle retraction cache operations OUTSIDE the main transaction to avoid deadlocks
-            self._handle_retraction_operations_post_transaction(
-                source_name, journals, existing_journals
+        self._handle_retraction_operations_post_transaction(
+            source_name, journals, existing_journals
+        )
+        return write
+
+    def _finish_journal_chunks(self, write: _SourceWrite) -> dict[str, int]:
+        """Complete a source written in chunks by removing its dropped records.
+
+        Args:
+            write: Progress of the source after its last chunk
+
+        Returns:
+            Same statistics as _batch_write_journals()
+
+        Raises:
+            sqlite3.Error: Database operation errors
+            ValueError: If too many records would be removed without force
+        """
+        data_source_manager = get_cache_registry().get(DataSourceManager, self.db_path)
+
+        with get_configured_connection(
+            data_source_manager.db_path,
+            profile=_sync_profile(data_source_manager.db_path),
+        ) as conn:
+            with self._database_transaction(conn):
+                self._finish_source_write(conn.cursor(), write)
+        return write.result()
+
+    def _begin_source_write(
+        self,
+        cursor: sqlite3.Cursor,
+        source_id: int,
+        source_name: str,
+        list_type: str,
+        force: bool = False,
+    ) -> _SourceWrite:
+        """Load the previous sync's fingerprints of a source.
+
+        Args:
+            cursor: Database cursor inside a transaction
+            source_id: Database ID of the data source
+            source_name: Name of the data source
+            list_type: Type of list (e.g., "predatory", "legitimate")
+            force: Allow removing more than MAX_REMOVED_SHARE of the stored
+                records
+
+        Returns:
+            Progress of the source before its first record
+        """
+        stored = self._load_fingerprints(cursor, source_id)
+        if not stored:
+            # Nothing to diff against: drop assessments left by
+            # earlier writes so the source is rebuilt from this sync
+            cursor.execute(
+                "DELETE FROM source_assessments WHERE source_id = ?",
+                (source_id,),
             )
+        return _SourceWrite(source_id, source_name, list_type, stored, force=force)
 
-            return {
-                "total_records": total_input_records,
-                "unique_journals": unique_journals,
-                "duplicates": total_input_records - unique_journals,
-            }
+    def _write_source_chunk(
+        self,
+        cursor: sqlite3.Cursor,
+        conn: sqlite3.Connection,
+        write: _SourceWrite,
+        journals: list[JournalDataDict],
+    ) -> dict[str, int]:
+        """Write the added and changed records of a chunk.
+
+        Args:
+            cursor: Database cursor inside a transaction
+            conn: Database connection of the cursor
+            write: Progress of the source, updated in place
+            journals: Records of this chunk
+
+        Returns:
+            Mapping of the written normalized names to journal IDs
+        """
+        fingerprints = self._compute_fingerprints(journals, write.list_type)
+        repeated = write.seen.intersection(fingerprints)
+        for name in repeated:
+            del fingerprints[name]
+
+        stored = write.stored
+        added = [name for name in fingerprints if name not in stored]
+        updated = [
+            name
+            for name in fingerprints
+            if name in stored and stored[name] != fingerprints[name]
+        ]
+        changed = set(added).union(updated)
+        changed_journals = [
+            journal for journal in journals if journal.get("normalized_name") in changed
+        ]
+        self.detail_logger.debug(
+            f"Fingerprint diff for {write.source_name}: {len(added)} added, "
+            f"{len(updated)} updated, {len(fingerprints) - len(changed)} unchanged"
+        )
+
+        _, _, existing_journals = self._execute_transaction(
+            cursor,
+            conn,
+            changed_journals,
+            write.source_id,
+            write.source_name,
+            write.list_type,
+        )
+        self._store_fingerprints(cursor, write.source_id, fingerprints, added + updated)
+
+        write.seen.update(fingerprints)
+        write.total_records += sum(
+            1 for journal in journals if journal.get("normalized_name")
+        )
+        write.added += len(added)
+        write.updated += len(updated)
+        return existing_journals
+
+    def _finish_source_write(self, cursor: sqlite3.Cursor, write: _SourceWrite) -> None:
+        """Remove the records the previous sync wrote but this one did not.
+
+        Args:
+            cursor: Database cursor inside a transaction
+            write: Progress of the source after its last record
+
+        Raises:
+            ValueError: If more than MAX_REMOVED_SHARE of the stored records
+                would be removed and the write is not forced
+        """
+        removed = [name for name in write.stored if name not in write.seen]
+        self.detail_logger.debug(
+            f"Fingerprint diff for {write.source_name}: {len(removed)} removed"
+        )
+        if (
+            not write.force
+            and len(write.stored) >= REMOVAL_GUARD_MIN_RECORDS
+            and len(removed) > MAX_REMOVED_SHARE * len(write.stored)
+        ):
+            raise ValueError(
+                f"{write.source_name} no longer lists {len(removed)} of its "
+                f"{len(write.stored)} stored records; refusing to remove them "
+                "(sync with --force if the source really shrank)"
+            )
+        self._remove_source_records(cursor, write.source_id, write.source_name, removed)
+        write.removed = len(removed)
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: MIT
+"""Start order and time estimate for the backends of a sync run.
+
+The total time of a sync is bounded by its slowest source. Backends are
+therefore started longest-expected-first, using the durations recorded in
+``source_updates`` by previous syncs, so that a long pole like DBLP does not
+start behind a queue of short ones. Backends without recorded durations
+start first, since nothing says they are short.
+"""
+
+import heapq
+import math
+import time
+from collections.abc import Mapping, Sequence
+
+
+class SyncSchedule:
+    """Order the backends of a sync and predict its remaining time.
+
+    Args:
+        backend_names: Backends to sync
+        expected: Expected duration in seconds per backend name; backends
+            without history are missing
+        slots: Number of backends that run concurrently
+    """
+
+    def __init__(
+        self,
+        backend_names: Sequence[str],
+        expected: Mapping[str, float],
+        slots: int,
+    ) -> None:
+        self.expected = dict(expected)
+        self.slots = max(slots, 1)
+        # sorted() is stable, so backends without history keep their order
+        self.order = sorted(
+            backend_names, key=lambda name: -self.expected.get(name, math.inf)
+        )
+        self._started: dict[str, float] = {}
+        self._finished: set[str] = set()
+
+    def start(self, backend_name: str) -> None:
+        """Record that a backend started syncing."""
+        self._started[backend_name] = time.monotonic()
+
+    def finish(self, backend_name: str) -> None:
+        """Record that a backend finished syncing."""
+        self._finished.add(backend_name)
+
+    @property
+    def finished_count(self) -> int:
+        """Number of backends that finished."""
+        return len(self._finished)
+
+    def remaining_seconds(self) -> float | None:
+        """Predict the time until every backend finished.
+
+        Running backends occupy a slot for the rest of their expected
+        duration; waiting backends take the earliest free slot in start
+        order. Backends without history count with the mean of the others.
+
+        Returns:
+            Predicted seconds, or None if no backend has a history.
+        """
+        if not self.expected:
+            return None
+        fallback = sum(self.expected.values()) / len(self.expected)
+        now = time.monotonic()
+
+        slot_free_at: list[float] = []
+        waiting: list[float] = []
+        for name in self.order:
+            if name in self._finished:
+                continue
+            duration = self.expected.get(name, fallback)
+            if name in self._started:
+                elapsed = now - self._started[name]
+                slot_free_at.append(max(duration - elapsed, 0.0))
+            else:
+                waiting.append(duration)
+
+        slot_free_at.extend([0.0] * (self.slots - len(slot_free_at)))
+        heapq.heapify(slot_free_at)
+        for duration in waiting:
+            heapq.heappush(slot_free_at, heapq.heappop(slot_free_at) + duration)
+        return max(slot_free_at, default=0.0)
+
+
+def format_eta(seconds: float) -> str:
+    """Format a predicted duration for progress output, e.g. ``4m 05s``."""
+    minutes, secs = divmod(round(seconds), 60)
+    if minutes == 0:
+        return f"{secs}s"
+    hours, minutes = divmod(minutes, 60)
+    if hours == 0:
+        return f"{minutes}m {secs:02d}s"
+    return f"{hours}h {minutes:02d}m"
@@ -4,6 +4,7 @@
 import asyncio
 import sqlite3
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from ..backends.base import (
@@ -18,8 +19,11 @@ from ..config import get_config_manager
 from ..enums import UpdateStatus, UpdateType
 from ..logging_config import get_detail_logger, get_status_logger
 from ..updater import sync_utils as updater_sync_utils
+from ..updater.parse_pool import NetworkSlot, ParsePool
+from .bulk_load import BulkLoadBuild
 from .cache_cleanup_registry import CacheCleanupRegistry
 from .db_writer import AsyncDBWriter
+from .scheduling import SyncSchedule, format_eta
 
 
 class _CacheConfig:
@@ -42,6 +46,8 @@ class CacheSyncManager:
         self.detail_logger = get_detail_logger()
         self.status_logger = get_status_logger()
         self.db_writer = AsyncDBWriter()
+        self.parse_pool: ParsePool | None = None
+        self.schedule: SyncSchedule | None = None
         self.cleanup_registry = CacheCleanupRegistry()
         self._register_cache_cleaners()
 
@@ -228,13 +234,32 @@ class CacheSyncManager:
                 f"Starting {len(backends_needing_sync)} backends concurrently: {backends_needing_sync}"
             )
 
-            # Use moderate concurrency with proper semaphore control
+            # Parse jobs of all sources share one pool of worker processes
+            self.parse_pool = ParsePool.for_sync()
+
+            # Use moderate concurrency with proper semaphore control. The
+            # semaphore bounds downloads: sources give up their slot while
+            # their parse jobs run in the parse pool
             max_concurrent = self.MAX_CONCURRENT_SOURCES
             semaphore = asyncio.Semaphore(max_concurrent)
             self.status_logger.info(
                 f"Using {max_concurrent} concurrent backends with proper semaphore control"
             )
 
+            # Start the backends expected to take longest first
+            self.schedule = SyncSchedule(
+                backends_needing_sync,
+                self._expected_durations(backends_needing_sync),
+                max_concurrent,
+            )
+            backends_needing_sync = self.schedule.order
+            self.detail_logger.debug(f"Sync order: {backends_needing_sync}")
+            estimate = self.schedule.remaining_seconds()
+            if show_progress and estimate is not None:
+                self.status_logger.info(
+                    f"Estimated sync time: about {format_eta(estimate)}"
+                )
+
             tasks = [
                 self._process_backend_with_semaphore(
                     backend_name,
@@ -296,8 +321,80 @@ class CacheSyncManager:
         finally:
             # Stop the database writer
             await self.db_writer.stop_writer()
+            if self.parse_pool is not None:
+                await asyncio.to_thread(self.parse_pool.shutdown)
+                self.parse_pool = None
+            self.schedule = None
             self.sync_in_progress = False
 
+    async def sync_cache_bulk(
+        self, show_progress: bool = True
+    ) -> dict[str, str | dict[str, Any]]:
+        """Rebuild the cache database from all backends in bulk-load mode.
+
+        All backends are synced into a fresh database file with deferred
+        secondary indexes (see BulkLoadBuild), which replaces the live
+        database only if every backend succeeded.
+
+        Args:
+            show_progress: Show progress output to console. Defaults to True.
+
+        Returns:
+            Dictionary with sync results for each backend
+        """
+        if self.sync_in_progress:
+            self.status_logger.warning("Cache sync already in progress")
+            return {"status": UpdateStatus.SKIPPED.value, "reason": "sync_in_progress"}
+
+        cache_config = get_config_manager().load_config().cache
+        live_db_path = cache_config.db_path
+        build = BulkLoadBuild(Path(live_db_path))
+        build.prepare()
+        if show_progress:
+            self.status_logger.info(f"Bulk-loading into {build.build_path}...")
+
+        # Route every cache component created during the sync to the build
+        cache_config.db_path = str(build.build_path)
+        try:
+            sync_results = await self.sync_cache_with_config(
+                force=True, backend_filter=None, show_progress=show_progress
+            )
+        except BaseException:
+            cache_config.db_path = live_db_path
+            build.abort()
+            raise
+        cache_config.db_path = live_db_path
+
+        failed_backends = [
+            name
+            for name, result in sync_results.items()
+            if isinstance(result, dict)
+            and result.get("status")
+            in {UpdateStatus.ERROR.value, UpdateStatus.FAILED.value}
+        ]
+        if isinstance(sync_results.get("status"), str) or failed_backends:
+            build.abort()
+            self.status_logger.error(
+                "Bulk sync aborted; the live cache database was not replaced"
+                + (
+                    f" (failed: {', '.join(failed_backends)})"
+                    if failed_backends
+                    else ""
+                )
+            )
+            return sync_results
+
+        try:
+            build.finalize()
+        except (sqlite3.Error, OSError) as e:
+            self.detail_logger.exception(f"Failed to finalize bulk build: {e}")
+            build.abort()
+            return {"status": UpdateStatus.ERROR.value, "error": str(e)}
+
+        if show_progress:
+            self.status_logger.info(f"Bulk sync complete: replaced {live_db_path}")
+        return sync_results
+
     def _filter_backends_to_sync(
         self,
         all_backend_names: list[str],
@@ -426,10 +523,12 @@ class CacheSyncManager:
                 }
 
         # Use semaphore to limit concurrent network operations
-        async with semaphore:
+        async with NetworkSlot(semaphore):
             # Show start message only after acquiring semaphore slot
             if isinstance(backend, CachedBackend) and show_progress:
                 self.status_logger.info(f"  {backend_name}: Starting sync...")
+            if self.schedule is not None:
+                self.schedule.start(backend_name)
             try:
                 result = await self._ensure_backend_data_available(
                     backend, force, show_progress
@@ -485,6 +584,60 @@ class CacheSyncManager:
                     "error": str(e),
                     "type": type(e).__name__,
                 }
+            finally:
+                self._log_progress(backend_name, show_progress)
+
+    def _expected_durations(self, backend_names: list[str]) -> dict[str, float]:
+        """Look up how long the sources of backends took in previous syncs.
+
+        Args:
+            backend_names: Backends about to be synced
+
+        Returns:
+            Expected duration in seconds per backend name; backends without
+            recorded durations are missing.
+        """
+        backend_registry = get_backend_registry()
+        source_names: dict[str, str] = {}
+        for backend_name in backend_names:
+            backend = backend_registry.get_backend(backend_name)
+            if isinstance(backend, DataSyncCapable):
+                source_names[backend_name] = backend.source_name
+
+        try:
+            durations = DataSourceManager().get_expected_durations(
+                list(source_names.values())
+            )
+        except sqlite3.Error as e:
+            self.detail_logger.warning(f"Could not read previous sync durations: {e}")
+            return {}
+        return {
+            backend_name: durations[source_name]
+            for backend_name, source_name in source_names.items()
+            if source_name in durations
+        }
+
+    def _log_progress(self, backend_name: str, show_progress: bool) -> None:
+        """Record a finished backend and show the predicted remaining time.
+
+        Args:
+            backend_name: Backend that finished
+            show_progress: Show progress output to console
+        """
+        if self.schedule is None:
+            return
+        self.schedule.finish(backend_name)
+        remaining = self.schedule.remaining_seconds()
+        total = len(self.schedule.order)
+        if (
+            show_progress
+            and remaining is not None
+            and self.schedule.finished_count < total
+        ):
+            self.status_logger.info(
+                f"  {self.schedule.finished_count}/{total} backends done, "
+                f"about {format_eta(remaining)} remaining"
+            )
 
     async def _ensure_backend_data_available(
         self, backend: Backend, force: bool = False, show_progress: bool = True
@@ -640,7 +793,10 @@ class CacheSyncManager:
             )
 
             result = await updater_sync_utils.update_source_data(
-                data_source, db_writer=db_writer, force=force
+                data_source,
+                db_writer=db_writer,
+                force=force,
+                parse_pool=self.parse_pool,
             )
 
             self.detail_logger.info(
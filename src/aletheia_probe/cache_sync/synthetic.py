@@ -0,0 +1,617 @@
+# SPDX-License-Identifier: MIT
+"""Synthetic cache database generator for scale and performance testing.
+
+Generates a schema-valid cache database of configurable size and source mix
+without network access. Journal records are loaded through ``AsyncDBWriter``,
+exactly as ``sync`` loads them, so generation also exercises the write path.
+Venue acronyms are loaded through ``AcronymCache.import_acronyms``.
+
+Generation is deterministic for a given ``SyntheticCacheSpec`` (including its
+seed), which keeps benchmark databases comparable across releases.
+"""
+
+import itertools
+import random
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..cache import AcronymCache, DataSourceManager
+from ..cache.connection_utils import get_configured_connection
+from ..cache.schema import init_database
+from ..data_models import JournalDataDict
+from ..enums import AssessmentType
+from ..logging_config import get_detail_logger, get_status_logger
+from ..models import VenueType
+from ..normalizer import input_normalizer
+from .db_writer import AsyncDBWriter
+
+
+detail_logger = get_detail_logger()
+status_logger = get_status_logger()
+
+
+@dataclass(frozen=True)
+class SyntheticSource:
+    """A data source populated in a synthetic database."""
+
+    name: str
+    list_type: AssessmentType
+    weight: float
+
+
+# Default source mix, roughly proportional to real list sizes
+DEFAULT_SYNTHETIC_SOURCES: tuple[SyntheticSource, ...] = (
+    SyntheticSource("scopus", AssessmentType.LEGITIMATE, 0.40),
+    SyntheticSource("doaj", AssessmentType.LEGITIMATE, 0.25),
+    SyntheticSource("bealls", AssessmentType.PREDATORY, 0.10),
+    SyntheticSource("predatoryjournals", AssessmentType.PREDATORY, 0.10),
+    SyntheticSource("retraction_watch", AssessmentType.QUALITY_INDICATOR, 0.15),
+)
+
+# Share of journals without a print ISSN (online-only) or without an eISSN
+MISSING_ISSN_RATIO = 0.10
+MISSING_EISSN_RATIO = 0.30
+
+# Publishers follow a Zipf-like distribution: a few publish most journals
+JOURNALS_PER_PUBLISHER = 40
+PUBLISHER_ZIPF_EXPONENT = 1.1
+
+# Popular fields are more common than niche ones
+FIELD_ZIPF_EXPONENT = 0.5
+
+# Share of title fields with a qualifier ("Applied Physics")
+QUALIFIER_RATIO = 0.3
+
+# Title draws before a colliding title is disambiguated as a series (Part A, ...)
+TITLE_DRAW_ATTEMPTS = 5
+
+# Title patterns with relative frequency; two-field titles dominate real lists
+_TITLE_PATTERNS: tuple[tuple[str, float], ...] = (
+    ("Journal of {field}", 1.0),
+    ("International Journal of {field}", 1.0),
+    ("{region} Journal of {field}", 1.0),
+    ("{field} {suffix}", 1.0),
+    ("Annals of {field}", 0.5),
+    ("Advances in {field}", 0.5),
+    ("Open {field} Journal", 0.5),
+    ("Current {field} {suffix}", 0.5),
+    ("Journal of {field} and {field2}", 3.0),
+    ("International Journal of {field} and {field2}", 3.0),
+    ("{region} Journal of {field} and {field2}", 2.0),
+    ("{field} and {field2} {suffix}", 2.0),
+)
+_FIELDS = (
+    "Medicine",
+    "Engineering",
+    "Computer Science",
+    "Chemistry",
+    "Physics",
+    "Biology",
+    "Economics",
+    "Education",
+    "Psychology",
+    "Mathematics",
+    "Materials Science",
+    "Environmental Science",
+    "Public Health",
+    "Nursing",
+    "Agriculture",
+    "Management",
+    "Law",
+    "Linguistics",
+    "Neuroscience",
+    "Pharmacology",
+    "Civil Engineering",
+    "Oncology",
+    "Geology",
+    "Sociology",
+    "Cardiology",
+    "Robotics",
+    "Ecology",
+    "Genetics",
+    "Immunology",
+    "Statistics",
+    "Finance",
+    "Marketing",
+    "Philosophy",
+    "History",
+    "Architecture",
+    "Energy",
+    "Microbiology",
+    "Biochemistry",
+    "Dentistry",
+    "Veterinary Science",
+    "Food Science",
+    "Hydrology",
+    "Astronomy",
+    "Optics",
+    "Telecommunications",
+    "Artificial Intelligence",
+    "Data Science",
+    "Nanotechnology",
+    "Political Science",
+    "Anthropology",
+    "Tourism",
+    "Sports Science",
+    "Radiology",
+    "Surgery",
+    "Pediatrics",
+    "Dermatology",
+    "Ophthalmology",
+    "Endocrinology",
+    "Epidemiology",
+    "Toxicology",
+    "Oceanography",
+    "Meteorology",
+    "Forestry",
+    "Fisheries",
+    "Mechanical Engineering",
+    "Electrical Engineering",
+    "Chemical Engineering",
+    "Software Engineering",
+    "Information Systems",
+    "Accounting",
+    "Criminology",
+    "Communication",
+    "Musicology",
+    "Archaeology",
+    "Geography",
+    "Urban Planning",
+    "Logistics",
+    "Biomedical Engineering",
+    "Rehabilitation",
+    "Nutrition",
+)
+_QUALIFIERS = (
+    "Applied",
+    "Clinical",
+    "Computational",
+    "Experimental",
+    "Theoretical",
+    "Molecular",
+    "Sustainable",
+    "Digital",
+    "Advanced",
+    "Modern",
+    "Quantitative",
+    "Comparative",
+    "Industrial",
+    "Integrative",
+    "Translational",
+    "Environmental",
+)
+_REGIONS = (
+    "European",
+    "American",
+    "Asian",
+    "African",
+    "Indian",
+    "Chinese",
+    "British",
+    "Nordic",
+    "Latin American",
+    "Pacific",
+)
+_SUFFIXES = ("Research", "Letters", "Reviews", "Reports", "Studies", "Quarterly")
+_PUBLISHER_FORMS = (
+    "{name} Publishing",
+    "{name} Press",
+    "{name} Science Publishers",
+    "{name} Academic",
+    "{name} Publishing Group",
+    "{name} & Sons",
+)
+_PUBLISHER_SYLLABLES = (
+    ("Bel", "Cor", "Dan", "El", "Fal", "Gar", "Hal", "Kem", "Lor", "Mar"),
+    ("ton", "berg", "ley", "ford", "wick", "dale", "mont", "field", "son", "ham"),
+)
+_PATTERNS = tuple(pattern for pattern, _ in _TITLE_PATTERNS)
+_PATTERN_CUM_WEIGHTS = tuple(
+    itertools.accumulate(weight for _, weight in _TITLE_PATTERNS)
+)
+_FIELD_CUM_WEIGHTS = tuple(
+    itertools.accumulate(
+        1 / rank**FIELD_ZIPF_EXPONENT for rank in range(1, len(_FIELDS) + 1)
+    )
+)
+_ACRONYM_STOP_WORDS = frozenset({"of", "and", "the", "in", "on", "for"})
+_RETRACTION_REASONS = (
+    "Duplication of Article",
+    "Fake Peer Review",
+    "Plagiarism of Data",
+    "Error in Analyses",
+    "Concerns/Issues About Authorship",
+    "Paper Mill",
+)
+_RETRACTION_TYPES = ("Retraction", "Retraction", "Retraction", "Expression of concern")
+
+
+@dataclass(frozen=True)
+class SyntheticCacheSpec:
+    """Size and composition of a synthetic cache database."""
+
+    journal_count: int
+    sources: tuple[SyntheticSource, ...] = DEFAULT_SYNTHETIC_SOURCES
+    overlap_ratio: float = 0.2
+    retractions_per_journal: float = 2.0
+    acronym_ratio: float = 0.05
+    seed: int = 0
+    # Article retraction records never expire, so lookups always hit the cache
+    expires_at: str = "2099-12-31T00:00:00"
+
+    def __post_init__(self) -> None:
+        """Validate the specification."""
+        if self.journal_count < 1:
+            raise ValueError("journal_count must be at least 1")
+        if not self.sources:
+            raise ValueError("At least one source is required")
+        if any(source.weight <= 0 for source in self.sources):
+            raise ValueError("Source weights must be positive")
+        if len({source.name for source in self.sources}) != len(self.sources):
+            raise ValueError("Source names must be unique")
+        if not 0.0 <= self.overlap_ratio <= 1.0:
+            raise ValueError("overlap_ratio must be between 0 and 1")
+        if not 0.0 <= self.acronym_ratio <= 1.0:
+            raise ValueError("acronym_ratio must be between 0 and 1")
+        if self.retractions_per_journal < 0:
+            raise ValueError("retractions_per_journal must not be negative")
+
+
+def issn_check_digit(digits: str) -> str:
+    """Compute the ISSN check character for the first seven digits.
+
+    Args:
+        digits: Seven-digit ISSN prefix
+
+    Returns:
+        Check character ("0"-"9" or "X")
+    """
+    total = sum(
+        int(digit) * weight
+        for digit, weight in zip(digits, range(8, 1, -1), strict=True)
+    )
+    check = (11 - total % 11) % 11
+    return "X" if check == 10 else str(check)
+
+
+class SyntheticCacheGenerator:
+    """Generates and loads synthetic journal, retraction and acronym data."""
+
+    def __init__(self, spec: SyntheticCacheSpec) -> None:
+        """Initialize generator.
+
+        Args:
+            spec: Size and composition of the database to generate
+        """
+        self.spec = spec
+        self._rng = random.Random(spec.seed)
+        self._used_issns: set[str] = set()
+
+    def generate_journals(self) -> list[JournalDataDict]:
+        """Generate unique journal records in the shape produced by data sources.
+
+        Returns:
+            List of journal data dictionaries (without source assignment)
+        """
+        rng = self._rng
+        publishers = self._generate_publishers()
+        publisher_weights = list(
+            itertools.accumulate(
+                1 / rank**PUBLISHER_ZIPF_EXPONENT
+                for rank in range(1, len(publishers) + 1)
+            )
+        )
+
+        name_counts: dict[str, int] = {}
+        journals: list[JournalDataDict] = []
+        for index in range(self.spec.journal_count):
+            # Redraw on collision; only persistent collisions become a series
+            for _ in range(TITLE_DRAW_ATTEMPTS):
+                name = self._draw_title()
+                normalized_name = _normalize_title(name)
+                if normalized_name.lower() not in name_counts:
+                    break
+            unique_name = self._make_unique(name, normalized_name, name_counts)
+            if unique_name != name:
+                name = unique_name
+                normalized_name = _normalize_title(name)
+
+            issn = None if rng.random() < MISSING_ISSN_RATIO else self._new_issn()
+            eissn = None if rng.random() < MISSING_EISSN_RATIO else self._new_issn()
+            publisher = rng.choices(publishers, cum_weights=publisher_weights)[0]
+            journals.append(
+                {
+                    "journal_name": name,
+                    "normalized_name": normalized_name,
+                    "issn": issn,
+                    "eissn": eissn,
+                    "publisher": publisher,
+                    "urls": [f"https://journals.example.org/{index}"],
+                }
+            )
+        return journals
+
+    def assign_sources(
+        self, journals: list[JournalDataDict]
+    ) -> dict[str, list[JournalDataDict]]:
+        """Distribute journals across sources by weight.
+
+        Every journal belongs to one primary source; ``overlap_ratio`` of them
+        are also listed by a second source, as real lists overlap.
+
+        Args:
+            journals: Journal records from ``generate_journals``
+
+        Returns:
+            Mapping of source name to the journals it lists
+        """
+        rng = self._rng
+        sources = self.spec.sources
+        cum_weights = list(itertools.accumulate(source.weight for source in sources))
+        assignments: dict[str, list[JournalDataDict]] = {
+            source.name: [] for source in sources
+        }
+
+        for journal in journals:
+            primary = rng.choices(sources, cum_weights=cum_weights)[0]
+            assignments[primary.name].append(journal)
+            if len(sources) > 1 and rng.random() < self.spec.overlap_ratio:
+                secondary = primary
+                while secondary is primary:
+                    secondary = rng.choices(sources, cum_weights=cum_weights)[0]
+                assignments[secondary.name].append(journal)
+
+        return assignments
+
+    def attach_retraction_data(self, journals: list[JournalDataDict]) -> int:
+        """Attach Retraction Watch statistics and article retractions.
+
+        Follows the layout of the Retraction Watch source: statistics in each
+        journal's metadata, article records in the first journal's metadata.
+        Copies are attached, so records shared with other sources are unchanged.
+
+        Args:
+            journals: Journals listed by the retraction_watch source (modified)
+
+        Returns:
+            Number of article retraction records generated
+        """
+        rng = self._rng
+        mean = self.spec.retractions_per_journal
+        doi_counter = itertools.count()
+        articles: list[dict[str, Any]] = []
+
+        for position, journal in enumerate(journals):
+            # Heavy-tailed: most journals have few retractions, some have many
+            total = int(rng.expovariate(1 / mean)) if mean > 0 else 0
+            years = sorted(rng.randint(2000, 2025) for _ in range(total))
+            recent = sum(1 for year in years if year >= 2020)
+            journal_articles = []
+            for year in years:
+                nature = rng.choice(_RETRACTION_TYPES)
+                journal_articles.append(
+                    {
+                        "doi": f"10.{5000 + position % 4000}/synthetic.{next(doi_counter)}",
+                        "is_retracted": nature == "Retraction",
+                        "retraction_type": nature,
+                        "retraction_date": f"{year}-{rng.randint(1, 12):02d}-01",
+                        "retraction_doi": None,
+                        "retraction_reason": rng.choice(_RETRACTION_REASONS),
+                        "source": "retraction_watch",
+                        "expires_at": self.spec.expires_at,
+                    }
+                )
+            articles.extend(journal_articles)
+
+            journals[position] = {
+                **journal,
+                "metadata": {
+                    "total_retractions": total,
+                    "recent_retractions": recent,
+                    "very_recent_retractions": sum(1 for year in years if year >= 2023),
+                    "first_retraction_date": (f"{years[0]}-01-01" if years else None),
+                    "last_retraction_date": f"{years[-1]}-12-31" if years else None,
+                },
+            }
+
+        if journals:
+            journals[0]["metadata"]["_article_retractions"] = articles
+        return len(articles)
+
+    def generate_acronyms(
+        self, journals: list[JournalDataDict]
+    ) -> list[dict[str, Any]]:
+        """Generate venue acronym entries for a sample of journals.
+
+        Args:
+            journals: Journal records from ``generate_journals``
+
+        Returns:
+            Entries in the format accepted by ``AcronymCache.import_acronyms``
+        """
+        sample_size = int(len(journals) * self.spec.acronym_ratio)
+        entries: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        for journal in self._rng.sample(journals, sample_size):
+            name = journal["journal_name"]
+            if " Part " in name:
+                continue
+            words = [w for w in name.split() if w.lower() not in _ACRONYM_STOP_WORDS]
+            acronym = "".join(word[0] for word in words if word[0].isalpha()).upper()
+            if len(acronym) < 2 or acronym in seen:
+                continue
+            seen.add(acronym)
+            entries.append(
+                {
+                    "acronym": acronym,
+                    "entity_type": VenueType.JOURNAL.value,
+                    "canonical": name.lower(),
+                    "confidence_score": round(self._rng.uniform(0.6, 1.0), 3),
+                    "issn": [
+                        value
+                        for value in (journal.get("issn"), journal.get("eissn"))
+                        if value
+                    ],
+                    "variants": [" ".join(word[:4] + "." for word in words)],
+                }
+            )
+        return entries
+
+    async def generate(self, db_path: Path) -> dict[str, int]:
+        """Generate the database and load it via AsyncDBWriter.
+
+        Args:
+            db_path: Database file to create (must not already contain data)
+
+        Returns:
+            Row counts per table after loading
+        """
+        init_database(db_path)
+        journals = self.generate_journals()
+        assignments = self.assign_sources(journals)
+        acronyms = self.generate_acronyms(journals)
+        del journals
+
+        data_source_manager = DataSourceManager(db_path)
+        writer = AsyncDBWriter(db_path)
+        await writer.start_writer()
+        try:
+            for source in self.spec.sources:
+                records = assignments.pop(source.name)
+                if not records:
+                    continue
+                if source.name == "retraction_watch":
+                    self.attach_retraction_data(records)
+                data_source_manager.register_data_source(
+                    source.name, source.name, source.list_type.value
+                )
+                await writer.queue_write(source.name, source.list_type.value, records)
+        finally:
+            await writer.stop_writer()
+
+        if acronyms:
+            AcronymCache(db_path).import_acronyms(
+                acronyms, source_file="synthetic-generator"
+            )
+
+        counts = count_table_rows(db_path)
+        detail_logger.debug(f"Synthetic database row counts: {counts}")
+        return counts
+
+    def _generate_publishers(self) -> list[str]:
+        """Build the publisher pool, largest publishers first."""
+        count = max(1, self.spec.journal_count // JOURNALS_PER_PUBLISHER)
+        first, second = _PUBLISHER_SYLLABLES
+        return [
+            self._rng.choice(_PUBLISHER_FORMS).format(
+                name=self._rng.choice(first) + self._rng.choice(second)
+            )
+            for _ in range(count)
+        ]
+
+    def _draw_title(self) -> str:
+        """Draw a random journal title."""
+        rng = self._rng
+        field_name, field_name2 = rng.choices(
+            _FIELDS, cum_weights=_FIELD_CUM_WEIGHTS, k=2
+        )
+        if rng.random() < QUALIFIER_RATIO:
+            field_name = f"{rng.choice(_QUALIFIERS)} {field_name}"
+        if rng.random() < QUALIFIER_RATIO:
+            field_name2 = f"{rng.choice(_QUALIFIERS)} {field_name2}"
+        pattern = rng.choices(_PATTERNS, cum_weights=_PATTERN_CUM_WEIGHTS)[0]
+        return pattern.format(
+            field=field_name,
+            field2=field_name2,
+            region=rng.choice(_REGIONS),
+            suffix=rng.choice(_SUFFIXES),
+        )
+
+    def _make_unique(
+        self, name: str, normalized_name: str, name_counts: dict[str, int]
+    ) -> str:
+        """Disambiguate colliding titles the way real series do (Part A, B, ...)."""
+        key = normalized_name.lower()
+        occurrences = name_counts.get(key, 0)
+        name_counts[key] = occurrences + 1
+        if occurrences == 0:
+            return name
+        return f"{name} Part {_series_label(occurrences - 1)}"
+
+    def _new_issn(self) -> str:
+        """Draw a random, unused, checksum-valid ISSN."""
+        while True:
+            digits = f"{self._rng.randrange(10_000_000):07d}"
+            issn = f"{digits[:4]}-{digits[4:]}{issn_check_digit(digits)}"
+            if issn not in self._used_issns:
+                self._used_issns.add(issn)
+                return issn
+
+
+def _normalize_title(name: str) -> str:
+    """Normalize a title the way data sources do before storing it."""
+    normalized = input_normalizer.normalize(name).normalized_venue
+    return normalized.name if normalized and normalized.name else name
+
+
+def _series_label(index: int) -> str:
+    """Convert 0, 1, ..., 25, 26, ... to A, B, ..., Z, AA, ..."""
+    label = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(ord("A") + remainder) + label
+    return label
+
+
+# Tables reported after generation
+SYNTHETIC_TABLES: tuple[str, ...] = (
+    "journals",
+    "journal_names",
+    "journal_urls",
+    "source_assessments",
+    "retraction_statistics",
+    "article_retractions",
+    "venue_acronyms",
+)
+
+
+def count_table_rows(db_path: Path) -> dict[str, int]:
+    """Count rows in the tables populated by the generator.
+
+    Args:
+        db_path: Database file
+
+    Returns:
+        Mapping of table name to row count
+    """
+    counts: dict[str, int] = {}
+    with get_configured_connection(db_path) as conn:
+        for table in SYNTHETIC_TABLES:
+            try:
+                row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()  # nosec B608
+            except sqlite3.OperationalError:
+                continue
+            counts[table] = int(row[0])
+    return counts
+
+
+async def generate_synthetic_cache(
+    db_path: Path, spec: SyntheticCacheSpec
+) -> dict[str, int]:
+    """Generate a synthetic cache database.
+
+    Args:
+        db_path: Database file to create
+        spec: Size and composition of the database
+
+    Returns:
+        Row counts per table
+    """
+    status_logger.info(
+        f"Generating synthetic cache with {spec.journal_count:,} journals "
+        f"across {len(spec.sources)} sources (seed={spec.seed})"
+    )
+    return await SyntheticCacheGenerator(spec).generate(db_path)
@@ -1,12 +1,50 @@
 # SPDX-License-Identifier: MIT
 """Assessment-oriented CLI commands."""
 
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import Any
+
 import click
 
+from ..logging_config import get_status_logger
+from ..metrics import get_metrics_registry
 from ..models import VenueType
+from ..tracing import tracer
 from .context import CoreCommandContext
 
 
+def _run_instrumented(
+    context: CoreCommandContext,
+    coro: Coroutine[Any, Any, Any],
+    profile_path: str | None,
+    metrics_out: str | None,
+) -> None:
+    """Run an assessment coroutine, optionally recording a profile and metrics.
+
+    The trace and metrics are written even when the command exits early (e.g.
+    via the BibTeX exit code), so partial runs can still be analysed.
+    """
+    if profile_path is None and metrics_out is None:
+        context.run_async(coro)
+        return
+
+    if profile_path is not None:
+        tracer.enable()
+    try:
+        context.run_async(coro)
+    finally:
+        status_logger = get_status_logger()
+        if profile_path is not None:
+            tracer.disable()
+            tracer.export_chrome_trace(Path(profile_path))
+            status_logger.info(tracer.format_summary())
+            status_logger.info(f"Profile trace written to {profile_path}")
+        if metrics_out is not None:
+            get_metrics_registry().write_json(Path(metrics_out))
+            status_logger.info(f"Runtime metrics written to {metrics_out}")
+
+
 def register_assessment_commands(
     main: click.Group, context: CoreCommandContext
 ) -> None:
@@ -34,15 +72,31 @@ def register_assessment_commands(
         type=click.Choice(["text", "json"]),
         help="Output format",
     )
+    @click.option(
+        "--profile",
+        "profile_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Write a Chrome trace-event profile to this file and print a timing summary",
+    )
+    @click.option(
+        "--metrics-out",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Write runtime metrics (backend latencies, cache hit rates) as JSON",
+    )
     def journal(
         journal_name: str,
         verbose: bool,
         no_acronyms: bool,
         confidence_min: float,
         output_format: str,
+        profile_path: str | None,
+        metrics_out: str | None,
     ) -> None:
         """Assess whether a journal is predatory or legitimate."""
-        context.run_async(
+        _run_instrumented(
+            context,
             context.async_assess_publication(
                 journal_name,
                 "journal",
@@ -50,7 +104,9 @@ def register_assessment_commands(
                 output_format,
                 use_acronyms=not no_acronyms,
                 confidence_min=confidence_min,
-            )
+            ),
+            profile_path,
+            metrics_out,
         )
 
     @main.command()
@@ -75,15 +131,31 @@ def register_assessment_commands(
         type=click.Choice(["text", "json"]),
         help="Output format",
     )
+    @click.option(
+        "--profile",
+        "profile_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Write a Chrome trace-event profile to this file and print a timing summary",
+    )
+    @click.option(
+        "--metrics-out",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Write runtime metrics (backend latencies, cache hit rates) as JSON",
+    )
     def conference(
         conference_name: str,
         verbose: bool,
         no_acronyms: bool,
         confidence_min: float,
         output_format: str,
+        profile_path: str | None,
+        metrics_out: str | None,
     ) -> None:
         """Assess whether a conference is predatory or legitimate."""
-        context.run_async(
+        _run_instrumented(
+            context,
             context.async_assess_publication(
                 conference_name,
                 "conference",
@@ -91,7 +163,9 @@ def register_assessment_commands(
                 output_format,
                 use_acronyms=not no_acronyms,
                 confidence_min=confidence_min,
-            )
+            ),
+            profile_path,
+            metrics_out,
         )
 
     @main.command()
@@ -109,17 +183,38 @@ def register_assessment_commands(
         is_flag=True,
         help="Enable relaxed BibTeX parsing to handle malformed files",
     )
+    @click.option(
+        "--profile",
+        "profile_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Write a Chrome trace-event profile to this file and print a timing summary",
+    )
+    @click.option(
+        "--metrics-out",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Write runtime metrics (backend latencies, cache hit rates) as JSON",
+    )
     def bibtex(
-        bibtex_file: str, verbose: bool, output_format: str, relax_bibtex: bool
+        bibtex_file: str,
+        verbose: bool,
+        output_format: str,
+        relax_bibtex: bool,
+        profile_path: str | None,
+        metrics_out: str | None,
     ) -> None:
         """Assess all journals in a BibTeX file for predatory status."""
-        context.run_async(
+        _run_instrumented(
+            context,
             context.async_bibtex_main(
                 bibtex_file,
                 verbose,
                 output_format,
                 relax_bibtex,
-            )
+            ),
+            profile_path,
+            metrics_out,
         )
 
     @main.command("mass-eval")
@@ -165,7 +260,10 @@ def register_assessment_commands(
         type=click.IntRange(min=1),
         default=1,
         show_default=True,
-        help="Concurrent entry workers per file",
+        help=(
+            "Concurrent entry workers per open file; open files share a pool "
+            "of max-concurrency x max-parallel-files workers"
+        ),
     )
     @click.option(
         "--collect-cache-file",
@@ -188,6 +286,32 @@ def register_assessment_commands(
         show_default=True,
         help="Maximum number of .bib files processed concurrently",
     )
+    @click.option(
+        "--metrics-out",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Write runtime metrics as JSON, refreshed at every checkpoint",
+    )
+    @click.option(
+        "--output-compression",
+        type=click.Choice(["none", "gzip", "xz"]),
+        default="none",
+        show_default=True,
+        help="Compress the JSONL output (.jsonl.gz or .jsonl.xz)",
+    )
+    @click.option(
+        "--shard",
+        default=None,
+        metavar="I/N",
+        help="Process only shard I of N, e.g. 2/4, for runs spread over machines",
+    )
+    @click.option(
+        "--shard-by",
+        type=click.Choice(["files", "venues"]),
+        default="files",
+        show_default=True,
+        help="Partition .bib files, or unique venues (collect mode only)",
+    )
     def mass_eval(
         input_path: str,
         mode: str,
@@ -200,6 +324,10 @@ def register_assessment_commands(
         collect_cache_file: str,
         cache_ttl_hours: int,
         max_parallel_files: int,
+        metrics_out: str | None,
+        output_compression: str,
+        shard: str | None,
+        shard_by: str,
     ) -> None:
         """Run massive multi-file BibTeX evaluation with checkpoint/resume."""
         context.run_async(
@@ -215,8 +343,73 @@ def register_assessment_commands(
                 collect_cache_file=collect_cache_file,
                 cache_ttl_hours=cache_ttl_hours,
                 max_parallel_files=max_parallel_files,
+                metrics_out=metrics_out,
+                output_compression=output_compression,
+                shard=shard,
+                shard_by=shard_by,
             )
         )
 
+    @main.command("mass-eval-merge")
+    @click.option(
+        "--shards",
+        "shard_count",
+        type=click.IntRange(min=1),
+        required=True,
+        help="Number of shards N the run was split into",
+    )
+    @click.option(
+        "--state-file",
+        type=click.Path(dir_okay=False),
+        default=".aletheia-probe/mass-eval-state.json",
+        show_default=True,
+        help="State file given to the shards; receives the merged state",
+    )
+    @click.option(
+        "--output-dir",
+        type=click.Path(file_okay=False, dir_okay=True),
+        default=None,
+        help="Output directory given to the shards (required in assess mode)",
+    )
+    @click.option(
+        "--collect-cache-file",
+        type=click.Path(dir_okay=False),
+        default=".aletheia-probe/mass-eval-collect-cache.keys",
+        show_default=True,
+        help="Collect dedupe key file given to the shards; receives all keys",
+    )
+    @click.option(
+        "--allow-incomplete",
+        is_flag=True,
+        help="Merge even if shards still have unprocessed files",
+    )
+    @click.option(
+        "--cache-db",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help=(
+            "Cache database receiving the shards' copies named "
+            "<name>.shard-I-of-N.db next to it (collect mode; defaults to "
+            "the configured cache database)"
+        ),
+    )
+    def mass_eval_merge(
+        shard_count: int,
+        state_file: str,
+        output_dir: str | None,
+        collect_cache_file: str,
+        allow_incomplete: bool,
+        cache_db: str | None,
+    ) -> None:
+        """Combine the state and output of the shards of a mass-eval run."""
+        context.mass_eval_merge_main(
+            state_file=state_file,
+            shard_count=shard_count,
+            output_dir=output_dir,
+            collect_cache_file=collect_cache_file,
+            allow_incomplete=allow_incomplete,
+            cache_db=cache_db,
+        )
+
 
 __all__ = ["register_assessment_commands", "VenueType"]
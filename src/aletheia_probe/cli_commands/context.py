@@ -61,9 +61,27 @@ class AsyncMassEvalMain(Protocol):
         collect_cache_file: str | None = ...,
         cache_ttl_hours: int = ...,
         max_parallel_files: int = ...,
+        metrics_out: str | None = ...,
+        output_compression: str = ...,
+        shard: str | None = ...,
+        shard_by: str = ...,
     ) -> Coroutine[Any, Any, None]: ...
 
 
+class MassEvalMerge(Protocol):
+    """Mass evaluation shard merge signature."""
+
+    def __call__(
+        self,
+        state_file: str,
+        shard_count: int,
+        output_dir: str | None = ...,
+        collect_cache_file: str | None = ...,
+        allow_incomplete: bool = ...,
+        cache_db: str | None = ...,
+    ) -> None: ...
+
+
 @dataclass(frozen=True)
 class CoreCommandContext:
     """Dependency container for core command module registration."""
@@ -86,6 +104,7 @@ class CoreCommandContext:
     run_lookup_cli: RunLookupCli
     async_bibtex_main: Callable[[str, bool, str, bool], Coroutine[Any, Any, None]]
     async_mass_eval_main: AsyncMassEvalMain
+    mass_eval_merge_main: MassEvalMerge
     get_latest_acronym_dataset_url: Callable[[str], tuple[str, str]]
     fetch_https_json: Callable[
         [str, int, set[str]], Coroutine[Any, Any, dict[str, Any] | list[Any]]
@@ -13,6 +13,7 @@ from .context import (
     AsyncMassEvalMain,
     CliErrorDecorator,
     CoreCommandContext,
+    MassEvalMerge,
     RunLookupCli,
 )
 from .lookup_commands import register_lookup_commands
@@ -40,6 +41,7 @@ def register_core_commands(
     run_lookup_cli: RunLookupCli,
     async_bibtex_main: Callable[[str, bool, str, bool], Coroutine[Any, Any, None]],
     async_mass_eval_main: AsyncMassEvalMain,
+    mass_eval_merge_main: MassEvalMerge,
     get_latest_acronym_dataset_url: Callable[[str], tuple[str, str]],
     fetch_https_json: Callable[
         [str, int, set[str]], Coroutine[Any, Any, dict[str, Any] | list[Any]]
@@ -65,6 +67,7 @@ def register_core_commands(
         run_lookup_cli=run_lookup_cli,
         async_bibtex_main=async_bibtex_main,
         async_mass_eval_main=async_mass_eval_main,
+        mass_eval_merge_main=mass_eval_merge_main,
         get_latest_acronym_dataset_url=get_latest_acronym_dataset_url,
         fetch_https_json=fetch_https_json,
     )
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 """Database maintenance CLI commands."""
 
+import asyncio
 import sys
 from collections.abc import Callable
 from pathlib import Path
@@ -8,9 +9,17 @@ from typing import ParamSpec, Protocol, TypeVar
 
 import click
 
+from ..cache import DataSourceManager
 from ..cache.migrations import migrate_database, reset_database
 from ..cache.schema import SCHEMA_VERSION, get_schema_version
+from ..cache_sync.synthetic import (
+    DEFAULT_SYNTHETIC_SOURCES,
+    SyntheticCacheSpec,
+    SyntheticSource,
+    generate_synthetic_cache,
+)
 from ..config import get_config_manager
+from ..enums import AssessmentType
 from ..logging_config import get_status_logger
 
 
@@ -24,6 +33,45 @@ class CliErrorDecorator(Protocol):
     def __call__(self, func: Callable[P, R]) -> Callable[P, R]: ...
 
 
+def _parse_synthetic_source(value: str) -> SyntheticSource:
+    """Parse a ``NAME[:LIST_TYPE]=WEIGHT`` synthetic source option.
+
+    Args:
+        value: Option value, e.g. ``scopus=0.4`` or ``mylist:predatory=0.1``
+
+    Returns:
+        Parsed synthetic source
+
+    Raises:
+        click.BadParameter: If the value is malformed
+    """
+    known_types = {
+        source.name: source.list_type for source in DEFAULT_SYNTHETIC_SOURCES
+    }
+    spec, separator, weight_text = value.partition("=")
+    name, _, list_type_text = spec.partition(":")
+    name = name.strip()
+    if not separator or not name:
+        raise click.BadParameter(f"Expected NAME[:LIST_TYPE]=WEIGHT, got {value!r}")
+    try:
+        weight = float(weight_text)
+    except ValueError as e:
+        raise click.BadParameter(f"Invalid weight in {value!r}") from e
+
+    if list_type_text:
+        try:
+            list_type = AssessmentType(list_type_text.strip().lower())
+        except ValueError as e:
+            raise click.BadParameter(f"Unknown list type in {value!r}") from e
+    elif name in known_types:
+        list_type = known_types[name]
+    else:
+        raise click.BadParameter(
+            f"List type required for unknown source {name!r} (NAME:LIST_TYPE=WEIGHT)"
+        )
+    return SyntheticSource(name, list_type, weight)
+
+
 def register_db_commands(
     main: click.Group,
     handle_cli_errors: CliErrorDecorator,
@@ -149,3 +197,126 @@ def register_db_commands(
         except Exception as e:
             status_logger.error(f"Reset failed: {e}")
             sys.exit(1)
+
+    @db.command(name="cleanup")
+    @handle_cli_errors
+    def db_cleanup() -> None:
+        """Remove journals and assessments that no data source accounts for.
+
+        Works through the database in small transactions, so other processes
+        can keep using the cache meanwhile.
+        """
+        status_logger = get_status_logger()
+
+        db_path = Path(get_config_manager().load_config().cache.db_path)
+
+        if not db_path.exists():
+            status_logger.info("Database does not exist yet (nothing to clean up)")
+            return
+
+        removed = DataSourceManager(db_path).cleanup_orphaned_records()
+        status_logger.info(f"Removed {removed:,} orphaned journals")
+
+    @db.command(name="generate-synthetic")
+    @click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+    @click.option(
+        "--journals",
+        "journal_count",
+        type=click.IntRange(min=1),
+        default=10_000,
+        show_default=True,
+        help="Number of distinct journals to generate",
+    )
+    @click.option(
+        "--source",
+        "source_options",
+        multiple=True,
+        metavar="NAME[:LIST_TYPE]=WEIGHT",
+        help="Source and relative share of journals (repeatable; default: "
+        + ", ".join(
+            f"{source.name}={source.weight:g}" for source in DEFAULT_SYNTHETIC_SOURCES
+        )
+        + ")",
+    )
+    @click.option(
+        "--overlap",
+        type=click.FloatRange(0.0, 1.0),
+        default=0.2,
+        show_default=True,
+        help="Share of journals also listed by a second source",
+    )
+    @click.option(
+        "--retractions-per-journal",
+        type=click.FloatRange(min=0.0),
+        default=2.0,
+        show_default=True,
+        help="Mean article retractions per retraction_watch journal",
+    )
+    @click.option(
+        "--acronym-ratio",
+        type=click.FloatRange(0.0, 1.0),
+        default=0.05,
+        show_default=True,
+        help="Share of journals with a venue acronym",
+    )
+    @click.option("--seed", type=int, default=0, show_default=True, help="Random seed")
+    @click.option("--force", is_flag=True, help="Overwrite an existing OUTPUT file")
+    @handle_cli_errors
+    def db_generate_synthetic(
+        output: Path,
+        journal_count: int,
+        source_options: tuple[str, ...],
+        overlap: float,
+        retractions_per_journal: float,
+        acronym_ratio: float,
+        seed: int,
+        force: bool,
+    ) -> None:
+        """Generate a synthetic cache database for benchmarking.
+
+        The database is built offline with realistic name, ISSN and publisher
+        distributions. Point ``cache.db_path`` at OUTPUT to query it.
+
+        Args:
+            output: Database file to create.
+            journal_count: Number of distinct journals.
+            source_options: Source mix as NAME[:LIST_TYPE]=WEIGHT values.
+            overlap: Share of journals listed by a second source.
+            retractions_per_journal: Mean article retractions per journal.
+            acronym_ratio: Share of journals with a venue acronym.
+            seed: Random seed.
+            force: Whether to overwrite an existing file.
+        """
+        status_logger = get_status_logger()
+
+        if output.exists():
+            if not force:
+                status_logger.error(
+                    f"{output} already exists (use --force to overwrite)"
+                )
+                sys.exit(1)
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{output}{suffix}").unlink(missing_ok=True)
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+        sources = (
+            tuple(_parse_synthetic_source(value) for value in source_options)
+            or DEFAULT_SYNTHETIC_SOURCES
+        )
+        try:
+            spec = SyntheticCacheSpec(
+                journal_count=journal_count,
+                sources=sources,
+                overlap_ratio=overlap,
+                retractions_per_journal=retractions_per_journal,
+                acronym_ratio=acronym_ratio,
+                seed=seed,
+            )
+        except ValueError as e:
+            raise click.BadParameter(str(e)) from e
+
+        counts = asyncio.run(generate_synthetic_cache(output, spec))
+
+        status_logger.info(f"Synthetic cache written to {output}")
+        for table, count in counts.items():
+            status_logger.info(f"  {table:<24} {count:>12,}")
@@ -0,0 +1,255 @@
+# SPDX-License-Identifier: MIT
+"""Load-testing CLI commands backed by the local mock API server."""
+
+import asyncio
+import json
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, ParamSpec, Protocol, TypeVar
+
+import click
+
+from ..loadtest import (
+    MOCK_SERVICES,
+    FaultProfile,
+    MockApiServer,
+    run_mass_eval_load_test,
+)
+from ..loadtest.mock_api import LATENCY_DISTRIBUTIONS
+from ..logging_config import get_status_logger
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class CliErrorDecorator(Protocol):
+    """Decorator signature for CLI error handling wrappers."""
+
+    def __call__(self, func: Callable[P, R]) -> Callable[P, R]: ...
+
+
+def _fault_options(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Attach the mock server fault-injection options to a command."""
+    options = [
+        click.option(
+            "--latency-ms",
+            type=click.FloatRange(min=0.0),
+            default=50.0,
+            show_default=True,
+            help="Median response latency",
+        ),
+        click.option(
+            "--latency-distribution",
+            type=click.Choice(LATENCY_DISTRIBUTIONS),
+            default="lognormal",
+            show_default=True,
+            help="Latency distribution",
+        ),
+        click.option(
+            "--rate-limit-ratio",
+            type=click.FloatRange(0.0, 1.0),
+            default=0.0,
+            show_default=True,
+            help="Share of requests answered with 429",
+        ),
+        click.option(
+            "--server-error-ratio",
+            type=click.FloatRange(0.0, 1.0),
+            default=0.0,
+            show_default=True,
+            help="Share of requests answered with 500/502/503",
+        ),
+        click.option(
+            "--max-rps",
+            type=click.FloatRange(min=0.0, min_open=True),
+            default=None,
+            help="Per-service requests/second above which 429 is returned",
+        ),
+        click.option(
+            "--retry-after",
+            type=click.IntRange(min=0),
+            default=1,
+            show_default=True,
+            help="Retry-After seconds sent with 429/503 responses",
+        ),
+        click.option(
+            "--override",
+            "overrides",
+            multiple=True,
+            metavar="SERVICE.FIELD=VALUE",
+            help="Per-service fault profile field, e.g. openalex.latency_ms=400 "
+            f"(services: {', '.join(MOCK_SERVICES)}; repeatable)",
+        ),
+        click.option(
+            "--seed", type=int, default=None, help="Seed for latency/fault draws"
+        ),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def _build_server(
+    latency_ms: float,
+    latency_distribution: str,
+    rate_limit_ratio: float,
+    server_error_ratio: float,
+    max_rps: float | None,
+    retry_after: int,
+    overrides: tuple[str, ...],
+    seed: int | None,
+) -> MockApiServer:
+    """Create a mock server from fault-injection option values.
+
+    Raises:
+        click.BadParameter: If an override is malformed or invalid
+    """
+    try:
+        profile = FaultProfile(
+            latency_ms=latency_ms,
+            latency_distribution=latency_distribution,
+            rate_limit_ratio=rate_limit_ratio,
+            server_error_ratio=server_error_ratio,
+            max_requests_per_second=max_rps,
+            retry_after_seconds=retry_after,
+        )
+        per_service: dict[str, dict[str, str]] = {}
+        for value in overrides:
+            target, separator, field_value = value.partition("=")
+            service, _, field_name = target.partition(".")
+            if not separator or not field_name:
+                raise ValueError(f"Expected SERVICE.FIELD=VALUE, got {value!r}")
+            per_service.setdefault(service.strip(), {})[field_name.strip()] = (
+                field_value.strip()
+            )
+        service_profiles = {
+            service: profile.with_overrides(fields)
+            for service, fields in per_service.items()
+        }
+        return MockApiServer(profile, service_profiles, seed=seed)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+def register_loadtest_commands(
+    main: click.Group,
+    handle_cli_errors: CliErrorDecorator,
+) -> None:
+    """Register loadtest commands on the main CLI group."""
+
+    @main.group(name="loadtest")
+    def loadtest() -> None:
+        """Load-test against a local mock of the remote APIs."""
+        pass
+
+    @loadtest.command(name="serve")
+    @click.option("--host", default="127.0.0.1", show_default=True)
+    @click.option("--port", type=int, default=8700, show_default=True)
+    @_fault_options
+    @handle_cli_errors
+    def loadtest_serve(host: str, port: int, **fault_options: Any) -> None:
+        """Serve mock OpenAlex, Crossref, DOAJ and OpenCitations APIs.
+
+        Prints the environment variables that route aletheia-probe to the
+        server, then serves until interrupted.
+        """
+        status_logger = get_status_logger()
+        server = _build_server(**fault_options)
+
+        async def _serve() -> None:
+            await server.start(host=host, port=port)
+            status_logger.info(f"Mock API server listening on {server.root_url}")
+            status_logger.info("Route aletheia-probe to it with:")
+            for service, url in server.endpoint_urls().items():
+                status_logger.info(
+                    f"  export ALETHEIA_PROBE_ENDPOINTS_{service.upper()}={url}"
+                )
+            try:
+                await asyncio.Event().wait()
+            finally:
+                await server.stop()
+                status_logger.info(json.dumps(server.stats(), indent=2))
+
+        try:
+            asyncio.run(_serve())
+        except KeyboardInterrupt:
+            pass
+
+    @loadtest.command(name="run")
+    @click.argument("input_path", type=click.Path(exists=True, path_type=Path))
+    @click.option(
+        "--work-dir",
+        type=click.Path(file_okay=False, path_type=Path),
+        default=None,
+        help="Scratch directory for the run (default: a temporary directory)",
+    )
+    @click.option(
+        "--max-concurrency",
+        type=click.IntRange(min=1),
+        default=4,
+        show_default=True,
+        help="mass-eval concurrent entry workers per file",
+    )
+    @click.option(
+        "--max-parallel-files",
+        type=click.IntRange(min=1),
+        default=8,
+        show_default=True,
+        help="mass-eval maximum number of .bib files processed concurrently",
+    )
+    @click.option(
+        "--report-out",
+        type=click.Path(dir_okay=False, path_type=Path),
+        default=None,
+        help="Write the report as JSON",
+    )
+    @_fault_options
+    @handle_cli_errors
+    def loadtest_run(
+        input_path: Path,
+        work_dir: Path | None,
+        max_concurrency: int,
+        max_parallel_files: int,
+        report_out: Path | None,
+        **fault_options: Any,
+    ) -> None:
+        """Run mass-eval on INPUT_PATH against the mock APIs and report throughput.
+
+        mass-eval runs in a scratch directory with an empty cache database, so
+        every lookup reaches the mock server.
+        """
+        status_logger = get_status_logger()
+        server = _build_server(**fault_options)
+
+        async def _run(scratch_dir: Path) -> Any:
+            async with server:
+                status_logger.info(
+                    f"Running mass-eval on {input_path} against {server.root_url} "
+                    f"(max_concurrency={max_concurrency}, "
+                    f"max_parallel_files={max_parallel_files})"
+                )
+                return await run_mass_eval_load_test(
+                    input_path,
+                    scratch_dir,
+                    server,
+                    max_concurrency=max_concurrency,
+                    max_parallel_files=max_parallel_files,
+                )
+
+        if work_dir is not None:
+            report = asyncio.run(_run(work_dir))
+        else:
+            with tempfile.TemporaryDirectory(prefix="aletheia-loadtest-") as tmp:
+                report = asyncio.run(_run(Path(tmp)))
+
+        status_logger.info(report.format_summary())
+        if report_out is not None:
+            report_out.parent.mkdir(parents=True, exist_ok=True)
+            report_out.write_text(json.dumps(report.to_dict(), indent=2))
+            status_logger.info(f"Report written to {report_out}")
+        if report.exit_code != 0:
+            status_logger.warning(f"mass-eval exited with code {report.exit_code}")
+            sys.exit(1)
@@ -31,11 +31,27 @@ def register_system_commands(main: click.Group, context: CoreCommandContext) ->
             f"Currently: {', '.join(sorted(context.large_sync_backends))}"
         ),
     )
+    @click.option(
+        "--bulk",
+        is_flag=True,
+        help=(
+            "Rebuild the cache database from all backends into a fresh file with "
+            "deferred indexes, then swap it in (implies --force and "
+            "--include-large-datasets)"
+        ),
+    )
     @click.argument("backend_names", nargs=-1, required=False)
     def sync(
-        force: bool, include_large_datasets: bool, backend_names: tuple[str, ...]
+        force: bool,
+        include_large_datasets: bool,
+        bulk: bool,
+        backend_names: tuple[str, ...],
     ) -> None:
         """Manually sync cache with backend configuration."""
+        if bulk and backend_names:
+            raise click.UsageError(
+                "--bulk rebuilds all backends and cannot be combined with BACKEND_NAMES"
+            )
         context.auto_register_custom_lists_fn()
         backend_filter: list[str] | None = None
         if backend_names:
@@ -49,13 +65,18 @@ def register_system_commands(main: click.Group, context: CoreCommandContext) ->
 
         try:
             cache_sync_manager = context.get_cache_sync_manager_fn()
-            result = context.run_async(
-                cache_sync_manager.sync_cache_with_config(
-                    force=force,
-                    backend_filter=backend_filter,
-                    show_progress=True,
+            if bulk:
+                result = context.run_async(
+                    cache_sync_manager.sync_cache_bulk(show_progress=True)
+                )
+            else:
+                result = context.run_async(
+                    cache_sync_manager.sync_cache_with_config(
+                        force=force,
+                        backend_filter=backend_filter,
+                        show_progress=True,
+                    )
                 )
-            )
 
             if result.get("status") == "error":
                 sys.exit(1)
@@ -5,6 +5,7 @@ import json
 import sys
 from pathlib import Path
 
+from ..backends.stale_refresh import get_stale_refresher
 from ..batch_assessor import BibtexBatchAssessor
 from ..cache import AcronymCache
 from ..constants import DEFAULT_ACRONYM_CONFIDENCE_MIN
@@ -28,6 +29,7 @@ from ..publication_assessment_workflow import (
 from ..publication_assessment_workflow import (
     resolve_candidate_selection as workflow_resolve_candidate_selection,
 )
+from ..tracing import span
 from ..validation import validate_issn
 from .error_handling import handle_cli_exception
 from .network import _resolve_issn_title
@@ -49,18 +51,24 @@ async def _async_bibtex_main(
             file_path, verbose, relax_bibtex
         )
 
-        if output_format == "json":
-            result_dict = result.model_dump()
-            assessment_list = []
-            for entry, assessment in result.assessment_results:
-                assessment_list.append(
-                    {"entry": entry.model_dump(), "assessment": assessment.model_dump()}
-                )
-            result_dict["assessment_results"] = assessment_list
-            print(json.dumps(result_dict, indent=2, default=str))
-        else:
-            summary = BibtexBatchAssessor.format_summary(result, verbose)
-            print(summary)
+        with span("output_formatting", "output"):
+            if output_format == "json":
+                result_dict = result.model_dump()
+                assessment_list = []
+                for entry, assessment in result.assessment_results:
+                    assessment_list.append(
+                        {
+                            "entry": entry.model_dump(),
+                            "assessment": assessment.model_dump(),
+                        }
+                    )
+                result_dict["assessment_results"] = assessment_list
+                print(json.dumps(result_dict, indent=2, default=str))
+            else:
+                summary = BibtexBatchAssessor.format_summary(result, verbose)
+                print(summary)
+
+        await get_stale_refresher().drain()
 
         exit_code = BibtexBatchAssessor.get_exit_code(result)
         sys.exit(exit_code)
@@ -139,13 +147,16 @@ async def _async_assess_publication(
             input_normalizer=input_normalizer,
         )
 
-        if output_format == "json":
-            print(json.dumps(result.model_dump(), indent=2, default=str))
-        else:
-            formatted_output = output_formatter.format_text_output(
-                result, publication_type, verbose
-            )
-            print(formatted_output)
+        with span("output_formatting", "output"):
+            if output_format == "json":
+                print(json.dumps(result.model_dump(), indent=2, default=str))
+            else:
+                formatted_output = output_formatter.format_text_output(
+                    result, publication_type, verbose
+                )
+                print(formatted_output)
+
+        await get_stale_refresher().drain()
 
     except Exception as e:
         handle_cli_exception(e, verbose, "publication assessment")
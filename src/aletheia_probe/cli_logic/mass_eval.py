@@ -4,29 +4,42 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 import hashlib
 import json
+import lzma
 import multiprocessing
+import os
 import random
 import sys
 import time
+import uuid
+import zlib
+from collections import deque
 from collections.abc import Awaitable, Callable
 from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
+from ..backends.stale_refresh import get_stale_refresher
 from ..bibtex_parser import BibtexParser
-from ..cache import AcronymCache
+from ..cache import AcronymCache, get_cache_registry
+from ..cache.connection_utils import set_sqlite_workload
 from ..dispatcher import query_dispatcher
 from ..enums import AssessmentType
 from ..logging_config import get_detail_logger, get_status_logger
+from ..metrics import get_metrics_registry
 from ..models import AssessmentResult, BackendStatus, BibtexEntry, QueryInput
 from ..normalizer import input_normalizer
 from .error_handling import handle_cli_exception
 
 
-STATE_VERSION = 2
+STATE_VERSION = 3
+STATE_JOURNAL_COMPACT_MIN_BYTES = 1024 * 1024
 CHECKPOINT_INTERVAL_SECONDS = 120
 RETRY_INITIAL_SECONDS = 15.0
 RETRY_MAX_SECONDS = 600.0
@@ -36,6 +49,161 @@ COLLECT_CACHE_FLUSH_INTERVAL_SECONDS = 30
 # 30 days: prevents cache expiry during multi-day mass-eval runs
 MASS_EVAL_DEFAULT_CACHE_TTL_HOURS = 720
 DEFAULT_MAX_PARALLEL_FILES = 8
+OUTPUT_FLUSH_BYTES = 1024 * 1024
+OUTPUT_FLUSH_INTERVAL_SECONDS = 10
+# Compressed bytes read at a time when scanning output members
+OUTPUT_SCAN_BLOCK_BYTES = 64 * 1024
+# File suffix and whole-stream compressor per --output-compression choice
+OUTPUT_COMPRESSION: dict[str, tuple[str, Callable[[bytes], bytes] | None]] = {
+    "none": (".jsonl", None),
+    "gzip": (".jsonl.gz", gzip.compress),
+    "xz": (".jsonl.xz", lzma.compress),
+}
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """One of the shards of a mass-eval run spread over several machines.
+
+    Files, or in collect mode unique venues, belong to the shard selected by
+    a stable hash of their key, so every machine computes the same
+    partition. Each shard has its own state file, collect cache key file
+    and output directory, named after its label.
+
+    Attributes:
+        index: 1-based shard number
+        count: Total number of shards
+    """
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> ShardSpec:
+        """Parse the ``i/N`` form of ``--shard``.
+
+        Raises:
+            ValueError: If the value is not of the form i/N with 1 <= i <= N.
+        """
+        index_text, separator, count_text = value.partition("/")
+        try:
+            index, count = int(index_text), int(count_text)
+        except ValueError:
+            index, count = 0, 0
+        if not separator or not 1 <= index <= count:
+            raise ValueError(f"Invalid shard: {value}. Use i/N with 1 <= i <= N.")
+        return cls(index=index, count=count)
+
+    @property
+    def label(self) -> str:
+        """Name suffix of the shard's files, e.g. ``shard-2-of-4``."""
+        return f"shard-{self.index}-of-{self.count}"
+
+    def owns(self, key: str) -> bool:
+        """Whether the item with this key belongs to the shard."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % self.count == self.index - 1
+
+    def file_path(self, path: Path) -> Path:
+        """Return the shard's variant of a state or cache file path."""
+        return path.with_name(f"{path.stem}.{self.label}{path.suffix}")
+
+
+def _shard_key(file_path: Path, input_root: Path) -> str:
+    """Key of a .bib file that is the same on every machine."""
+    if input_root.is_dir():
+        return file_path.relative_to(input_root).as_posix()
+    return file_path.name
+
+
+class EntryScheduler:
+    """Pool of entry workers shared by all open files of a mass-eval run.
+
+    Files hand their pending entry indices to :meth:`run`. Idle workers take
+    the next entry of the file at the head of a round-robin queue of files,
+    so every open file progresses, a large file can use all workers once the
+    small ones are done, and the number of entries in flight stays at the
+    pool size. Entries of a file are started in index order, which keeps the
+    file's contiguous checkpoint pointer advancing.
+
+    Args:
+        workers: Number of entries processed concurrently
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self._condition = asyncio.Condition()
+        self._ready: deque[_EntryJob] = deque()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def __aenter__(self) -> EntryScheduler:
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run(
+        self,
+        process_entry: Callable[[int], Awaitable[None]],
+        indices: list[int],
+    ) -> None:
+        """Process the entries of one file and wait until all are done.
+
+        If an entry fails, the file's remaining entries are dropped and the
+        error is raised once the entries already in flight finished.
+        """
+        if not indices:
+            return
+        job = _EntryJob(
+            process_entry, deque(indices), asyncio.get_running_loop().create_future()
+        )
+        async with self._condition:
+            self._ready.append(job)
+            self._condition.notify(len(indices))
+        await job.done
+
+    async def _worker(self) -> None:
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(lambda: bool(self._ready))
+                job = self._ready[0]
+                index = job.pending.popleft()
+                if job.pending:
+                    self._ready.rotate(-1)
+                else:
+                    self._ready.popleft()
+                job.in_flight += 1
+
+            try:
+                await job.process_entry(index)
+            except Exception as e:
+                if job.error is None:
+                    job.error = e
+                job.pending.clear()
+                if job in self._ready:
+                    self._ready.remove(job)
+            finally:
+                job.in_flight -= 1
+                if not job.pending and job.in_flight == 0 and not job.done.done():
+                    if job.error is not None:
+                        job.done.set_exception(job.error)
+                    else:
+                        job.done.set_result(None)
+
+
+@dataclass
+class _EntryJob:
+    """Entries of one file waiting in an EntryScheduler."""
+
+    process_entry: Callable[[int], Awaitable[None]]
+    pending: deque[int]
+    done: asyncio.Future[None]
+    in_flight: int = 0
+    error: Exception | None = None
 
 
 class AssessDedupeCache:
@@ -64,15 +232,18 @@ class AssessDedupeCache:
         async with self._lock:
             if key in self._results:
                 self.cache_hits += 1
+                get_metrics_registry().record_cache_lookup("mass_eval_dedupe", "hit")
                 return False, self._results[key]
             if key in self._inflight:
                 self.cache_hits += 1
+                get_metrics_registry().record_cache_lookup("mass_eval_dedupe", "hit")
                 return False, self._inflight[key]
             owner_future: asyncio.Future[AssessmentResult] = (
                 asyncio.get_running_loop().create_future()
             )
             self._inflight[key] = owner_future
             self.cache_misses += 1
+            get_metrics_registry().record_cache_lookup("mass_eval_dedupe", "miss")
             return True, owner_future
 
     async def mark_done(
@@ -259,8 +430,178 @@ class CollectDedupeCache:
             }
 
 
+class JsonlOutputWriter:
+    """Buffered append-only JSONL writer for one mass-eval output file.
+
+    The file stays open for the whole file run. Records are buffered and
+    written when OUTPUT_FLUSH_BYTES are pending or OUTPUT_FLUSH_INTERVAL_SECONDS
+    passed since the last flush, and always before a checkpoint is persisted
+    (see MassEvalState.register_writer), so a checkpoint never counts records
+    that are not on disk.
+
+    With compression, every flush appends one complete gzip member or xz
+    stream. Both formats read concatenated members as one stream, so the
+    file stays readable after every flush.
+
+    Given the file's progress dict, the writer keeps the file size in it as
+    ``output_bytes``, a high-water mark that the next checkpoint persists
+    with the entries it counts. On resume, bytes past the mark belong to
+    entries the checkpoint does not count and are truncated, since those
+    entries are processed again.
+
+    Raises:
+        ValueError: If the file is shorter than its high-water mark.
+    """
+
+    def __init__(
+        self,
+        output_file: Path,
+        compression: str = "none",
+        progress: dict[str, Any] | None = None,
+    ) -> None:
+        self.output_file = output_file
+        self._compress = OUTPUT_COMPRESSION[compression][1]
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._last_flush_time = time.time()
+        self._progress = progress
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(output_file, "ab")
+
+        size = self._file.seek(0, os.SEEK_END)
+        high_water_mark = _output_high_water_mark(progress, output_file)
+        if high_water_mark is not None:
+            if size < high_water_mark:
+                self._file.close()
+                raise ValueError(
+                    f"Output file {output_file} has {size} bytes, "
+                    f"the checkpoint counts {high_water_mark}"
+                )
+            if size > high_water_mark:
+                self._file.truncate(high_water_mark)
+                size = self._file.seek(0, os.SEEK_END)
+        self._update_progress(size)
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Buffer one record, flushing when a threshold is reached."""
+        line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        if (
+            self._pending_bytes >= OUTPUT_FLUSH_BYTES
+            or (time.time() - self._last_flush_time) >= OUTPUT_FLUSH_INTERVAL_SECONDS
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+        self._last_flush_time = time.time()
+        if not self._pending:
+            return
+        data = b"".join(self._pending)
+        if self._compress is not None:
+            data = self._compress(data)
+        self._file.write(data)
+        self._file.flush()
+        self._pending.clear()
+        self._pending_bytes = 0
+        self._update_progress(self._file.tell())
+
+    def _update_progress(self, size: int) -> None:
+        if self._progress is not None:
+            self._progress["output_file"] = str(self.output_file)
+            self._progress["output_bytes"] = size
+
+    def close(self) -> None:
+        """Flush buffered records and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def _output_high_water_mark(
+    progress: dict[str, Any] | None, output_file: Path
+) -> int | None:
+    """Return the checkpointed size of the output file, if known."""
+    if progress is None or progress.get("output_file") != str(output_file):
+        return None
+    return int(progress["output_bytes"])
+
+
+def _open_jsonl_for_reading(output_file: Path) -> IO[str]:
+    """Open a plain, gzip or xz JSONL output file as text."""
+    if output_file.suffix == ".gz":
+        return gzip.open(output_file, "rt", encoding="utf-8")
+    if output_file.suffix == ".xz":
+        return lzma.open(output_file, "rt", encoding="utf-8")
+    return open(output_file, encoding="utf-8")
+
+
+def _complete_members_size(output_file: Path) -> int:
+    """Return the size of the complete gzip members or xz streams of a file.
+
+    Every flush of a compressed JsonlOutputWriter appends one member, so a
+    crash can only leave the last one incomplete.
+    """
+    new_decompressor: Callable[[], Any] = (
+        partial(zlib.decompressobj, wbits=31)
+        if output_file.suffix == ".gz"
+        else lzma.LZMADecompressor
+    )
+    complete = 0
+    position = 0
+    decompressor = new_decompressor()
+    with open(output_file, "rb") as f:
+        while block := f.read(OUTPUT_SCAN_BLOCK_BYTES):
+            data = block
+            while data:
+                try:
+                    decompressor.decompress(data)
+                except (zlib.error, lzma.LZMAError):
+                    return complete
+                if not decompressor.eof:
+                    position += len(data)
+                    break
+                unused = decompressor.unused_data
+                position += len(data) - len(unused)
+                complete = position
+                decompressor = new_decompressor()
+                data = unused
+    return complete
+
+
+def _truncate_incomplete_member(output_file: Path) -> int:
+    """Cut a compressed output file back to its last complete member.
+
+    Only needed for output files without a checkpointed high-water mark,
+    whose torn last member JsonlOutputWriter would otherwise append to.
+
+    Returns:
+        Number of bytes removed.
+    """
+    if output_file.suffix not in (".gz", ".xz") or not output_file.exists():
+        return 0
+    size = output_file.stat().st_size
+    complete = _complete_members_size(output_file)
+    if complete < size:
+        os.truncate(output_file, complete)
+    return size - complete
+
+
 class MassEvalState:
-    """Simple file-backed checkpoint state for long-running mass evaluation."""
+    """File-backed checkpoint state for long-running mass evaluation.
+
+    The state is persisted as a snapshot at ``state_path`` and an append-only
+    journal next to it. Both hold JSON lines of the same records: a ``run``
+    record with the mode, input path and counters, and a ``file`` record per
+    .bib file with its status and progress. A checkpoint appends the run
+    record and the records of files that changed since the previous
+    checkpoint, so its cost does not grow with the number of files. Once the
+    journal outgrows the snapshot and STATE_JOURNAL_COMPACT_MIN_BYTES, it is
+    compacted into a new snapshot. Loading replays the snapshot and then the
+    journal, the last record of a file winning; a journal that cannot be
+    appended to safely is folded into a new snapshot right away.
+    """
 
     def __init__(self, state_path: Path, mode: str, input_path: Path):
         self.state_path = state_path
@@ -268,7 +609,7 @@ class MassEvalState:
         self.input_path = str(input_path)
         self.started_at = datetime.now(timezone.utc).isoformat()
         self.updated_at = self.started_at
-        self.completed_files: list[str] = []
+        self.completed_files: set[str] = set()
         self.failed_files: dict[str, str] = {}
         self.file_progress: dict[str, dict[str, Any]] = {}
         self.current_file: str | None = None
@@ -276,46 +617,241 @@ class MassEvalState:
         self.written_records: int = 0
         self.retry_count: int = 0
         self.collect_cache_hits: int = 0
+        self.shard: str | None = None
+        self.shard_by: str = "files"
+        self.files_total: int | None = None
         # Runtime-only: not persisted to disk
         self._last_checkpoint_time: float = 0.0
+        self._writers: set[JsonlOutputWriter] = set()
+        # Files being processed change between checkpoints without notice
+        self._active_files: set[str] = set()
+        self._changed_files: set[str] = set()
+        self._snapshot_id: str | None = None
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
+
+    @property
+    def journal_path(self) -> Path:
+        """Path of the journal appended to between snapshots."""
+        return self.state_path.with_suffix(self.state_path.suffix + ".journal")
+
+    def register_writer(self, writer: JsonlOutputWriter) -> None:
+        """Flush the writer's buffered records before every checkpoint."""
+        self._writers.add(writer)
+
+    def unregister_writer(self, writer: JsonlOutputWriter) -> None:
+        """Stop flushing a closed writer at checkpoints."""
+        self._writers.discard(writer)
+
+    def begin_file(self, file_key: str) -> dict[str, Any]:
+        """Return the progress of a file, journaling it while it is processed."""
+        self._active_files.add(file_key)
+        return self.file_progress.setdefault(file_key, _new_file_progress())
+
+    def mark_file_completed(self, file_key: str) -> None:
+        """Record that all entries of a file were processed."""
+        self.completed_files.add(file_key)
+        self.failed_files.pop(file_key, None)
+        self._active_files.discard(file_key)
+        self._changed_files.add(file_key)
+
+    def mark_file_failed(self, file_key: str, error: str) -> None:
+        """Record that processing a file failed."""
+        self.completed_files.discard(file_key)
+        self.failed_files[file_key] = error
+        self.file_progress.setdefault(file_key, _new_file_progress())["last_error"] = (
+            error
+        )
+        self._active_files.discard(file_key)
+        self._changed_files.add(file_key)
+
+    def save(self) -> None:
+        """Journal the changes since the last save, compacting when due."""
+        if self._snapshot_id is None or self._journal_bytes > max(
+            self._snapshot_bytes, STATE_JOURNAL_COMPACT_MIN_BYTES
+        ):
+            self._write_snapshot()
+            return
+
+        records = [self._run_record()]
+        records.extend(
+            self._file_record(file_key)
+            for file_key in sorted(self._changed_files | self._active_files)
+        )
+        data = _encode_state_records(records)
+        with open(self.journal_path, "ab") as f:
+            f.write(data)
+        self._journal_bytes += len(data)
+        self._changed_files.clear()
+
+    def _write_snapshot(self) -> None:
+        """Write all records to a new snapshot and start an empty journal."""
+        self._snapshot_id = uuid.uuid4().hex
+        file_keys = (
+            self.file_progress.keys() | self.completed_files | self.failed_files.keys()
+        )
+        data = _encode_state_records(
+            [self._run_record()]
+            + [self._file_record(file_key) for file_key in sorted(file_keys)]
+        )
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        tmp_path.replace(self.state_path)
+        # A journal of an older snapshot is ignored on load, so a crash
+        # before it is replaced loses nothing
+        header = _encode_state_records(
+            [{"type": "journal", "snapshot_id": self._snapshot_id}]
+        )
+        self.journal_path.write_bytes(header)
+        self._snapshot_bytes = len(data)
+        self._journal_bytes = len(header)
+        self._changed_files.clear()
 
-    def to_dict(self) -> dict[str, Any]:
-        """Serialize state to dictionary."""
+    def _run_record(self) -> dict[str, Any]:
         return {
+            "type": "run",
             "version": STATE_VERSION,
+            "snapshot_id": self._snapshot_id,
             "mode": self.mode,
             "input_path": self.input_path,
             "started_at": self.started_at,
             "updated_at": self.updated_at,
-            "completed_files": self.completed_files,
-            "failed_files": self.failed_files,
-            "file_progress": self.file_progress,
             "current_file": self.current_file,
             "processed_entries": self.processed_entries,
             "written_records": self.written_records,
             "retry_count": self.retry_count,
             "collect_cache_hits": self.collect_cache_hits,
+            "shard": self.shard,
+            "shard_by": self.shard_by,
+            "files_total": self.files_total,
+        }
+
+    def _file_record(self, file_key: str) -> dict[str, Any]:
+        if file_key in self.completed_files:
+            status = "completed"
+        elif file_key in self.failed_files:
+            status = "failed"
+        else:
+            status = "pending"
+        return {
+            "type": "file",
+            "file": file_key,
+            "status": status,
+            "error": self.failed_files.get(file_key),
+            "progress": self.file_progress.get(file_key),
         }
 
     @classmethod
-    def from_dict(cls, state_path: Path, data: dict[str, Any]) -> MassEvalState:
-        """Restore state from serialized dictionary."""
-        mode = str(data.get("mode", "assess"))
-        input_path = Path(str(data.get("input_path", "")))
-        state = cls(state_path=state_path, mode=mode, input_path=input_path)
-        state.started_at = str(data.get("started_at", state.started_at))
-        state.updated_at = str(data.get("updated_at", state.updated_at))
-        state.completed_files = list(data.get("completed_files", []))
-        state.failed_files = dict(data.get("failed_files", {}))
-        state.file_progress = dict(data.get("file_progress", {}))
-        current_file = data.get("current_file")
-        state.current_file = str(current_file) if current_file else None
-        state.processed_entries = int(data.get("processed_entries", 0))
-        state.written_records = int(data.get("written_records", 0))
-        state.retry_count = int(data.get("retry_count", 0))
-        state.collect_cache_hits = int(data.get("collect_cache_hits", 0))
+    def load(cls, state_path: Path) -> MassEvalState:
+        """Restore state from its snapshot and journal.
+
+        Raises:
+            ValueError: If the snapshot is not a state of STATE_VERSION.
+        """
+        with open(state_path, encoding="utf-8") as f:
+            try:
+                run = json.loads(f.readline())
+            except json.JSONDecodeError:
+                run = {}
+            if not isinstance(run, dict) or run.get("type") != "run":
+                raise ValueError(f"Unsupported state format in {state_path}")
+            if int(run.get("version", -1)) != STATE_VERSION:
+                raise ValueError(
+                    f"Unsupported state version in {state_path}: {run.get('version')}"
+                )
+            state = cls(
+                state_path=state_path,
+                mode=str(run.get("mode", "assess")),
+                input_path=Path(str(run.get("input_path", ""))),
+            )
+            state._apply_record(run)
+            for line in f:
+                state._apply_record(json.loads(line))
+        state._snapshot_id = str(run.get("snapshot_id"))
+        state._snapshot_bytes = state_path.stat().st_size
+
+        if not state._replay_journal():
+            # Later saves must not append to a journal that is ignored or
+            # whose last line is cut short
+            state._write_snapshot()
         return state
 
+    def _replay_journal(self) -> bool:
+        """Apply the journal of the loaded snapshot.
+
+        Returns:
+            False if the journal is missing, belongs to another snapshot or
+            ends in a line cut short by a crash.
+        """
+        if not self.journal_path.exists():
+            return False
+        with open(self.journal_path, encoding="utf-8") as f:
+            try:
+                header = json.loads(f.readline() or "{}")
+            except json.JSONDecodeError:
+                return False
+            if (
+                header.get("type") != "journal"
+                or header.get("snapshot_id") != self._snapshot_id
+            ):
+                return False
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Last checkpoint cut short by a crash
+                    return False
+                if not line.endswith("\n"):
+                    return False
+                self._apply_record(record)
+        self._journal_bytes = self.journal_path.stat().st_size
+        return True
+
+    def _apply_record(self, record: dict[str, Any]) -> None:
+        if record.get("type") == "run":
+            self.started_at = str(record.get("started_at", self.started_at))
+            self.updated_at = str(record.get("updated_at", self.updated_at))
+            current_file = record.get("current_file")
+            self.current_file = str(current_file) if current_file else None
+            self.processed_entries = int(record.get("processed_entries", 0))
+            self.written_records = int(record.get("written_records", 0))
+            self.retry_count = int(record.get("retry_count", 0))
+            self.collect_cache_hits = int(record.get("collect_cache_hits", 0))
+            shard = record.get("shard")
+            self.shard = str(shard) if shard else None
+            self.shard_by = str(record.get("shard_by", "files"))
+            files_total = record.get("files_total")
+            self.files_total = int(files_total) if files_total is not None else None
+            return
+
+        file_key = str(record["file"])
+        if record.get("progress") is not None:
+            self.file_progress[file_key] = dict(record["progress"])
+        self.completed_files.discard(file_key)
+        self.failed_files.pop(file_key, None)
+        if record.get("status") == "completed":
+            self.completed_files.add(file_key)
+        elif record.get("status") == "failed":
+            self.failed_files[file_key] = str(record.get("error"))
+
+
+def _new_file_progress() -> dict[str, Any]:
+    """Return the progress of a file that was not started."""
+    return {
+        "next_entry_index": 0,
+        "completed_entry_indices": [],
+        "written_records": 0,
+        "last_error": None,
+    }
+
+
+def _encode_state_records(records: list[dict[str, Any]]) -> bytes:
+    """Serialize checkpoint records as JSON lines."""
+    return "".join(
+        json.dumps(record, separators=(",", ":")) + "\n" for record in records
+    ).encode("utf-8")
+
 
 def _build_collect_cache_key_raw(venue_name: str, venue_type: Any) -> str:
     """Build stable collect dedupe key from raw venue text."""
@@ -339,13 +875,11 @@ def _checkpoint_state(state: MassEvalState, *, force: bool = False) -> None:
     now = time.monotonic()
     if not force and (now - state._last_checkpoint_time) < CHECKPOINT_INTERVAL_SECONDS:
         return
+    # Records counted by the checkpoint must be on disk before it is
+    for writer in state._writers:
+        writer.flush()
     state.updated_at = _utc_now()
-    payload = state.to_dict()
-    tmp_path = state.state_path.with_suffix(state.state_path.suffix + ".tmp")
-    tmp_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
-    tmp_path.replace(state.state_path)
+    state.save()
     state._last_checkpoint_time = now
 
 
@@ -358,15 +892,7 @@ def _load_or_init_state(
 ) -> MassEvalState:
     """Load state from disk or create a fresh state."""
     if resume and state_path.exists():
-        with open(state_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        if int(data.get("version", -1)) != STATE_VERSION:
-            raise ValueError(
-                f"Unsupported state version in {state_path}: {data.get('version')}"
-            )
-
-        state = MassEvalState.from_dict(state_path, data)
+        state = MassEvalState.load(state_path)
         if state.mode != mode:
             raise ValueError(
                 f"State mode mismatch: requested '{mode}', state has '{state.mode}'"
@@ -606,6 +1132,7 @@ async def _assess_with_retry(
         if not transient_backends:
             return result
 
+        get_metrics_registry().record_retry("mass_eval_assess")
         if on_retry is not None:
             attempt_number = await on_retry()
         else:
@@ -653,7 +1180,7 @@ async def _collect_with_retry(
 ) -> None:
     """Warm normalization/identifier caches without running assessments."""
     retry_delay = RETRY_INITIAL_SECONDS
-    acronym_cache = AcronymCache()
+    acronym_cache = get_cache_registry().get(AcronymCache)
     first_attempt = True
 
     while True:
@@ -726,31 +1253,33 @@ async def _sleep(seconds: float) -> None:
     await asyncio.sleep(seconds)
 
 
-def _append_jsonl_record(output_file: Path, record: dict[str, Any]) -> None:
-    """Append a single JSON record as one line."""
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record, default=str) + "\n")
-
-
 def _load_existing_record_ids(output_file: Path) -> set[str]:
-    """Load existing record IDs from JSONL file for duplicate suppression."""
+    """Load existing record IDs from JSONL file for duplicate suppression.
+
+    Only needed for output files without a checkpointed high-water mark,
+    e.g. those of an earlier run started with --no-resume.
+    """
     if not output_file.exists():
         return set()
 
     record_ids: set[str] = set()
-    with open(output_file, encoding="utf-8") as f:
-        for line in f:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                payload = json.loads(stripped)
-            except json.JSONDecodeError:
-                continue
-            record_id = payload.get("record_id")
-            if isinstance(record_id, str) and record_id:
-                record_ids.add(record_id)
+    with _open_jsonl_for_reading(output_file) as f:
+        try:
+            for line in f:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                try:
+                    payload = json.loads(stripped)
+                except json.JSONDecodeError:
+                    continue
+                record_id = payload.get("record_id")
+                if isinstance(record_id, str) and record_id:
+                    record_ids.add(record_id)
+        except (EOFError, lzma.LZMAError, gzip.BadGzipFile, zlib.error):
+            # A member cut short by a crash; the entries it held are
+            # reprocessed since the checkpoint did not count them
+            pass
     return record_ids
 
 
@@ -769,8 +1298,15 @@ async def _process_single_file(
     assess_dedupe_cache: AssessDedupeCache | None = None,
     files_lock: asyncio.Lock | None = None,
     executor: ProcessPoolExecutor | None = None,
+    output_compression: str = "none",
+    venue_shard: ShardSpec | None = None,
+    scheduler: EntryScheduler | None = None,
 ) -> None:
-    """Process one .bib file with entry-level checkpointing and resume."""
+    """Process one .bib file with entry-level checkpointing and resume.
+
+    The file's entries are processed by the shared ``scheduler`` of the run,
+    or without one by a pool of ``max_concurrency`` workers of its own.
+    """
     processed_before = state.processed_entries
     written_before = state.written_records
     collect_hits_before = state.collect_cache_hits
@@ -837,15 +1373,7 @@ async def _process_single_file(
         )
 
     file_key = str(file_path)
-    progress = state.file_progress.setdefault(
-        file_key,
-        {
-            "next_entry_index": 0,
-            "completed_entry_indices": [],
-            "written_records": 0,
-            "last_error": None,
-        },
-    )
+    progress = state.begin_file(file_key)
     next_entry_index = int(progress.get("next_entry_index", 0))
     completed_entry_indices = {
         int(index)
@@ -856,24 +1384,38 @@ async def _process_single_file(
     output_file: Path | None = None
     existing_record_ids: set[str] = set()
     if mode == "assess" and output_dir is not None:
+        output_suffix = OUTPUT_COMPRESSION[output_compression][0]
         if input_root.is_dir():
             relative_base = file_path.relative_to(input_root)
             relative_jsonl = (
-                "__".join(relative_base.parts).replace(".bib", "") + ".jsonl"
+                "__".join(relative_base.parts).replace(".bib", "") + output_suffix
             )
         else:
-            relative_jsonl = file_path.stem + ".jsonl"
+            relative_jsonl = file_path.stem + output_suffix
         output_file = output_dir / relative_jsonl
-        existing_record_ids = _load_existing_record_ids(output_file)
+        if _output_high_water_mark(progress, output_file) is not None:
+            # The writer truncates records past the checkpoint, so the
+            # output holds exactly the records of the completed entries
+            existing_record_ids = {
+                _record_id_for_entry(file_path, entries[index])
+                for index in chain(range(next_entry_index), completed_entry_indices)
+                if index < len(entries)
+            }
+        else:
+            removed_bytes = _truncate_incomplete_member(output_file)
+            if removed_bytes:
+                detail_logger.warning(
+                    f"Removed {removed_bytes} bytes of an incomplete compressed "
+                    f"member from {output_file}"
+                )
+            existing_record_ids = _load_existing_record_ids(output_file)
 
     if next_entry_index >= len(entries):
         status_logger.info(
             f"File already complete by checkpoint: {file_path} (entries={len(entries)})"
         )
         async with files_lock if files_lock else _NullContext():
-            if file_key not in state.completed_files:
-                state.completed_files.append(file_key)
-            state.failed_files.pop(file_key, None)
+            state.mark_file_completed(file_key)
             progress["completed_entry_indices"] = []
             progress["last_error"] = None
             _checkpoint_state(state, force=True)
@@ -888,20 +1430,17 @@ async def _process_single_file(
     if not pending_indices:
         _advance_file_progress(progress, completed_entry_indices, len(entries))
         async with files_lock if files_lock else _NullContext():
-            if file_key not in state.completed_files:
-                state.completed_files.append(file_key)
-            state.failed_files.pop(file_key, None)
+            state.mark_file_completed(file_key)
             progress["last_error"] = None
             _checkpoint_state(state, force=True)
         await _log_file_completion("already_complete_sparse")
         return
 
-    workers = max(1, min(max_concurrency, len(pending_indices)))
-    index_queue: asyncio.Queue[int] = asyncio.Queue()
-    for index in pending_indices:
-        index_queue.put_nowait(index)
-
     state_lock = asyncio.Lock()
+    writer: JsonlOutputWriter | None = None
+    if output_file is not None:
+        writer = JsonlOutputWriter(output_file, output_compression, progress)
+        state.register_writer(writer)
 
     async def _reserve_retry_attempt() -> int:
         async with state_lock:
@@ -919,13 +1458,13 @@ async def _process_single_file(
         if entry.state != "assessed":
             # Non-assessed entry: skip backend calls, write minimal record in assess mode
             if mode == "assess":
-                if output_file is None:
+                if writer is None:
                     raise ValueError("Output file is not configured in assess mode")
                 record = _build_minimal_record(file_path, entry)
                 record_id = str(record["record_id"])
                 async with state_lock:
                     if record_id not in existing_record_ids:
-                        _append_jsonl_record(output_file, record)
+                        writer.write(record)
                         existing_record_ids.add(record_id)
                         state.written_records += 1
                         progress["written_records"] = (
@@ -956,6 +1495,18 @@ async def _process_single_file(
                 entry.venue_type,
             )
 
+            if venue_shard is not None and not venue_shard.owns(collect_cache_key):
+                # Another shard collects this venue
+                async with state_lock:
+                    state.processed_entries += 1
+                    completed_entry_indices.add(entry_index)
+                    _advance_file_progress(
+                        progress, completed_entry_indices, len(entries)
+                    )
+                    progress["last_error"] = None
+                    _checkpoint_state(state)
+                return
+
             if collect_dedupe_cache is not None:
                 is_owner, wait_future = await collect_dedupe_cache.claim_or_wait(
                     collect_cache_key
@@ -1063,14 +1614,14 @@ async def _process_single_file(
                     status_logger=status_logger,
                     on_retry=_reserve_retry_attempt,
                 )
-            if output_file is None:
+            if writer is None:
                 raise ValueError("Output file is not configured in assess mode")
             record = _build_assess_record(file_path, entry, assessment)
             record_id = str(record["record_id"])
 
             async with state_lock:
                 if record_id not in existing_record_ids:
-                    _append_jsonl_record(output_file, record)
+                    writer.write(record)
                     existing_record_ids.add(record_id)
                     state.written_records += 1
                     progress["written_records"] = (
@@ -1083,37 +1634,21 @@ async def _process_single_file(
                 progress["last_error"] = None
                 _checkpoint_state(state)
 
-    async def _worker() -> None:
-        while True:
-            try:
-                entry_index = index_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                return
-            try:
-                await _process_entry(entry_index)
-            except Exception:
-                raise
-            finally:
-                index_queue.task_done()
-
-    status_logger.info(
-        f"Processing file with {workers} worker(s): {file_path} "
-        f"(pending entries: {len(pending_indices)})"
-    )
-    tasks = [asyncio.create_task(_worker()) for _ in range(workers)]
+    status_logger.info(f"Queued {len(pending_indices)} pending entries of {file_path}")
     try:
-        await asyncio.gather(*tasks)
-    except Exception:
-        for task in tasks:
-            if not task.done():
-                task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
-        raise
+        if scheduler is not None:
+            await scheduler.run(_process_entry, pending_indices)
+        else:
+            workers = max(1, min(max_concurrency, len(pending_indices)))
+            async with EntryScheduler(workers) as file_scheduler:
+                await file_scheduler.run(_process_entry, pending_indices)
+    finally:
+        if writer is not None:
+            state.unregister_writer(writer)
+            writer.close()
 
     async with files_lock if files_lock else _NullContext():
-        if file_key not in state.completed_files:
-            state.completed_files.append(file_key)
-        state.failed_files.pop(file_key, None)
+        state.mark_file_completed(file_key)
         progress["completed_entry_indices"] = []
         progress["last_error"] = None
         _checkpoint_state(state, force=True)
@@ -1133,6 +1668,10 @@ async def _async_mass_eval_main(
     collect_cache_file: str | None = ".aletheia-probe/mass-eval-collect-cache.keys",
     cache_ttl_hours: int = MASS_EVAL_DEFAULT_CACHE_TTL_HOURS,
     max_parallel_files: int = DEFAULT_MAX_PARALLEL_FILES,
+    metrics_out: str | None = None,
+    output_compression: str = "none",
+    shard: str | None = None,
+    shard_by: str = "files",
 ) -> None:
     """Run massive two-phase BibTeX evaluation workflow with checkpointing.
 
@@ -1144,10 +1683,19 @@ async def _async_mass_eval_main(
         resume: Whether to resume from an existing checkpoint
         relax_bibtex: Whether to use relaxed BibTeX parsing
         retry_forever: Retry indefinitely on transient backend failures
-        max_concurrency: Number of concurrent entry workers per file
+        max_concurrency: Number of concurrent entry workers per open file; all
+            open files share a pool of max_concurrency * max_parallel_files
+            workers
         checkpoint_interval_seconds: Maximum interval between forced checkpoints
         cache_ttl_hours: Assessment cache TTL in hours (default: 30 days)
         max_parallel_files: Maximum number of .bib files processed concurrently
+        metrics_out: Optional JSON file receiving runtime metrics snapshots,
+            refreshed at every checkpoint
+        output_compression: Compression of the assess mode JSONL output:
+            'none', 'gzip' or 'xz'
+        shard: Process only shard ``i/N`` of the run (see ShardSpec)
+        shard_by: Partition 'files' or, in collect mode, unique 'venues'
+            across shards
     """
     status_logger = get_status_logger()
     detail_logger = get_detail_logger()
@@ -1164,17 +1712,36 @@ async def _async_mass_eval_main(
             raise ValueError(
                 f"Invalid max_parallel_files={max_parallel_files}; expected value >= 1."
             )
+        if output_compression not in OUTPUT_COMPRESSION:
+            raise ValueError(
+                f"Invalid output_compression: {output_compression}. "
+                f"Use one of: {', '.join(OUTPUT_COMPRESSION)}."
+            )
+        shard_spec = ShardSpec.parse(shard) if shard else None
+        if shard_by not in {"files", "venues"}:
+            raise ValueError(f"Invalid shard_by: {shard_by}. Use 'files' or 'venues'.")
+        if shard_by == "venues" and normalized_mode != "collect":
+            raise ValueError("Sharding by venues is only supported in collect mode")
 
         query_dispatcher.set_cache_ttl_hours_override(cache_ttl_hours)
         status_logger.info(f"Assessment cache TTL set to {cache_ttl_hours}h")
 
+        # Reopen shared cache connections with the mass-eval SQLite profile
+        set_sqlite_workload("mass_eval")
+        get_cache_registry().close_all()
+
         input_root = Path(input_path).expanduser().resolve()
         state_path = Path(state_file).expanduser().resolve()
+        if shard_spec is not None:
+            state_path = shard_spec.file_path(state_path)
+        metrics_path = Path(metrics_out).expanduser().resolve() if metrics_out else None
 
         if normalized_mode == "assess":
             if not output_dir:
                 raise ValueError("--output-dir is required in assess mode")
             output_root = Path(output_dir).expanduser().resolve()
+            if shard_spec is not None:
+                output_root = output_root / shard_spec.label
             output_root.mkdir(parents=True, exist_ok=True)
         else:
             output_root = None
@@ -1186,6 +1753,8 @@ async def _async_mass_eval_main(
                 if collect_cache_file
                 else None
             )
+            if cache_path is not None and shard_spec is not None:
+                cache_path = shard_spec.file_path(cache_path)
             collect_dedupe_cache = await CollectDedupeCache.load(
                 cache_path=cache_path,
                 status_logger=status_logger,
@@ -1197,6 +1766,12 @@ async def _async_mass_eval_main(
             assess_dedupe_cache = AssessDedupeCache()
 
         bib_files = _discover_bib_files(input_root)
+        if shard_spec is not None and shard_by == "files":
+            bib_files = [
+                path
+                for path in bib_files
+                if shard_spec.owns(_shard_key(path, input_root))
+            ]
         state = _load_or_init_state(
             state_path=state_path,
             mode=normalized_mode,
@@ -1204,14 +1779,30 @@ async def _async_mass_eval_main(
             resume=resume,
             status_logger=status_logger,
         )
+        if state.shard is not None and state.shard_by != shard_by:
+            raise ValueError(
+                f"State shard_by mismatch: requested '{shard_by}', "
+                f"state has '{state.shard_by}'"
+            )
+        state.shard = shard_spec.label if shard_spec else None
+        state.shard_by = shard_by
+        state.files_total = len(bib_files)
 
-        completed = set(state.completed_files)
-        pending_files = [path for path in bib_files if str(path) not in completed]
+        pending_files = [
+            path for path in bib_files if str(path) not in state.completed_files
+        ]
 
+        if shard_spec is not None:
+            status_logger.info(
+                f"mass-eval {shard_spec.label} (by {shard_by}): state={state_path}"
+            )
+        # Open files share one pool, so that a large file can use the
+        # workers of files that are already done
+        entry_workers = max_concurrency * max_parallel_files
         status_logger.info(
             f"mass-eval mode={normalized_mode}, files_total={len(bib_files)}, "
             f"files_pending={len(pending_files)}, max_concurrency={max_concurrency}, "
-            f"max_parallel_files={max_parallel_files}"
+            f"max_parallel_files={max_parallel_files}, entry_workers={entry_workers}"
         )
 
         files_lock = asyncio.Lock()
@@ -1227,6 +1818,8 @@ async def _async_mass_eval_main(
                     _checkpoint_state(state, force=True)
                     if collect_dedupe_cache is not None:
                         await collect_dedupe_cache.flush()
+                if metrics_path is not None:
+                    get_metrics_registry().write_json(metrics_path)
 
         checkpoint_task = asyncio.create_task(_checkpoint_loop())
 
@@ -1252,20 +1845,13 @@ async def _async_mass_eval_main(
                         assess_dedupe_cache=assess_dedupe_cache,
                         files_lock=files_lock,
                         executor=executor,
+                        output_compression=output_compression,
+                        venue_shard=shard_spec if shard_by == "venues" else None,
+                        scheduler=entry_scheduler,
                     )
                 except Exception as e:
-                    file_key = str(bib_file)
                     async with files_lock:
-                        state.failed_files[file_key] = str(e)
-                        file_progress = state.file_progress.setdefault(
-                            file_key,
-                            {
-                                "next_entry_index": 0,
-                                "written_records": 0,
-                                "last_error": None,
-                            },
-                        )
-                        file_progress["last_error"] = str(e)
+                        state.mark_file_failed(str(bib_file), str(e))
                     status_logger.error(f"Failed processing {bib_file}: {e}")
                     detail_logger.exception(f"mass-eval file failure: {bib_file}: {e}")
 
@@ -1273,7 +1859,8 @@ async def _async_mass_eval_main(
             max_workers=max_parallel_files,
             mp_context=multiprocessing.get_context("spawn"),
         ) as executor:
-            await asyncio.gather(*[_file_task(f) for f in pending_files])
+            async with EntryScheduler(entry_workers) as entry_scheduler:
+                await asyncio.gather(*[_file_task(f) for f in pending_files])
 
         checkpoint_task.cancel()
         try:
@@ -1281,10 +1868,17 @@ async def _async_mass_eval_main(
         except asyncio.CancelledError:
             pass
 
+        # Background refreshes of stale cache entries are cancelled when the
+        # event loop shuts down
+        await get_stale_refresher().drain()
+
         state.current_file = None
         _checkpoint_state(state, force=True)
         if collect_dedupe_cache is not None:
             await collect_dedupe_cache.flush(force=True)
+        if metrics_path is not None:
+            get_metrics_registry().write_json(metrics_path)
+            status_logger.info(f"Runtime metrics written to {metrics_path}")
 
         status_logger.info(
             "mass-eval completed. "
@@ -0,0 +1,337 @@
+# SPDX-License-Identifier: MIT
+"""Combine the shards of a mass-eval run spread over several machines.
+
+Every shard of ``mass-eval --shard i/N`` writes its own state file, collect
+cache key file and output directory (see ShardSpec). Once the shards'
+files are copied next to each other, the merge moves the shard outputs into
+the common output directory, unions the collect cache keys and writes a
+combined state to the unsharded state path, from which an unsharded run can
+resume.
+
+Collect mode stores what it finds in the cache database of its machine.
+Copies of the shards' databases, named like ``cache.shard-2-of-4.db`` next
+to the common one, are merged into it.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from ..cache.base import get_default_db_path
+from ..cache.connection_utils import get_configured_connection
+from ..cache.schema import check_schema_compatibility
+from ..logging_config import get_status_logger
+from .error_handling import handle_cli_exception
+from .mass_eval import (
+    MassEvalState,
+    ShardSpec,
+    _checkpoint_state,
+    _new_file_progress,
+)
+
+
+def _load_shard_states(state_path: Path, shard_count: int) -> list[MassEvalState]:
+    """Load the state of every shard.
+
+    Raises:
+        ValueError: If a shard state is missing or belongs to another run,
+            including one over another input path.
+    """
+    states: list[MassEvalState] = []
+    for index in range(1, shard_count + 1):
+        shard = ShardSpec(index, shard_count)
+        shard_state_path = shard.file_path(state_path)
+        if not shard_state_path.exists():
+            raise ValueError(f"Missing state of {shard.label}: {shard_state_path}")
+        state = MassEvalState.load(shard_state_path)
+        if state.shard != shard.label:
+            raise ValueError(
+                f"{shard_state_path} is the state of {state.shard or 'no shard'}, "
+                f"expected {shard.label}"
+            )
+        if states and (state.mode, state.shard_by) != (
+            states[0].mode,
+            states[0].shard_by,
+        ):
+            raise ValueError(
+                f"{shard.label} ran in mode={state.mode}, shard_by={state.shard_by}; "
+                f"shard-1-of-{shard_count} in mode={states[0].mode}, "
+                f"shard_by={states[0].shard_by}"
+            )
+        # Completed files and their progress are keyed by absolute path
+        if states and Path(state.input_path) != Path(states[0].input_path):
+            raise ValueError(
+                f"{shard.label} read {state.input_path}; "
+                f"shard-1-of-{shard_count} read {states[0].input_path}. "
+                "Run all shards on the same input path."
+            )
+        states.append(state)
+    return states
+
+
+def _pending_file_count(state: MassEvalState) -> int:
+    """Number of a shard's files that were neither completed nor failed."""
+    if state.files_total is None:
+        return 0
+    return state.files_total - len(state.completed_files) - len(state.failed_files)
+
+
+def _merge_output_dir(output_root: Path, shard: ShardSpec, state: MassEvalState) -> int:
+    """Move a shard's output files into the common output directory.
+
+    Returns:
+        Number of moved files.
+
+    Raises:
+        ValueError: If an output file exists in both places.
+    """
+    shard_dir = output_root / shard.label
+    if not shard_dir.is_dir():
+        return 0
+
+    moved: dict[str, str] = {}
+    for shard_file in sorted(shard_dir.iterdir()):
+        target = output_root / shard_file.name
+        if target.exists():
+            raise ValueError(f"Output of {shard.label} already merged: {target}")
+        os.replace(shard_file, target)
+        moved[str(shard_file)] = str(target)
+    shard_dir.rmdir()
+
+    # Keep the high-water marks of the moved files valid for resuming
+    for progress in state.file_progress.values():
+        output_file = progress.get("output_file")
+        if output_file in moved:
+            progress["output_file"] = moved[output_file]
+    return len(moved)
+
+
+def _merge_collect_keys(cache_path: Path, shard_count: int) -> int:
+    """Append the shards' collect cache keys missing from the common file.
+
+    Returns:
+        Number of appended keys.
+    """
+    known: set[str] = set()
+    if cache_path.exists():
+        with open(cache_path, encoding="utf-8") as f:
+            known.update(line.strip() for line in f if line.strip())
+
+    new_keys: list[str] = []
+    for index in range(1, shard_count + 1):
+        shard_cache_path = ShardSpec(index, shard_count).file_path(cache_path)
+        if not shard_cache_path.exists():
+            continue
+        with open(shard_cache_path, encoding="utf-8") as f:
+            for line in f:
+                key = line.strip()
+                if key and key not in known:
+                    known.add(key)
+                    new_keys.append(key)
+
+    if new_keys:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "a", encoding="utf-8") as f:
+            f.write("\n".join(new_keys))
+            f.write("\n")
+    return len(new_keys)
+
+
+def _merge_collect_database(cache_db_path: Path, shard_db_path: Path) -> None:
+    """Copy what collect mode stored in a shard's cache database.
+
+    Collect mode persists acronym mappings and journal identifiers resolved
+    through OpenAlex (see _collect_with_retry). Entries the common database
+    already has are kept.
+
+    Raises:
+        SchemaVersionError: If the shard database has another schema version.
+    """
+    check_schema_compatibility(shard_db_path)
+    with get_configured_connection(cache_db_path) as conn:
+        conn.execute("ATTACH DATABASE ? AS shard", (str(shard_db_path),))
+        conn.execute(
+            """
+            INSERT INTO main.venue_acronyms
+                (acronym, entity_type, canonical, confidence_score, source_file,
+                 imported_at)
+            SELECT acronym, entity_type, canonical, confidence_score, source_file,
+                imported_at
+            FROM shard.venue_acronyms WHERE true
+            ON CONFLICT(acronym, entity_type) DO NOTHING
+            """
+        )
+        for table, column in (
+            ("venue_acronym_variants", "variant"),
+            ("venue_acronym_issns", "issn"),
+        ):
+            conn.execute(
+                f"""
+                INSERT OR IGNORE INTO main.{table} (venue_acronym_id, {column})
+                SELECT ma.id, st.{column} FROM shard.{table} st
+                JOIN shard.venue_acronyms sa ON sa.id = st.venue_acronym_id
+                JOIN main.venue_acronyms ma
+                    ON ma.acronym = sa.acronym AND ma.entity_type = sa.entity_type
+                """  # nosec B608
+            )
+        conn.execute(
+            """
+            INSERT INTO main.journals
+                (normalized_name, display_name, issn, eissn, publisher, updated_at)
+            SELECT normalized_name, display_name, issn, eissn, publisher, updated_at
+            FROM shard.journals
+            WHERE id IN (
+                SELECT journal_id FROM shard.journal_names
+                WHERE source_name = 'identifier_enrichment_openalex'
+            )
+            ON CONFLICT(normalized_name) DO UPDATE SET
+                issn = COALESCE(journals.issn, excluded.issn),
+                eissn = COALESCE(journals.eissn, excluded.eissn),
+                publisher = COALESCE(journals.publisher, excluded.publisher)
+            """
+        )
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO main.journal_names
+                (journal_id, name, name_type, source_name)
+            SELECT mj.id, sn.name, sn.name_type, sn.source_name
+            FROM shard.journal_names sn
+            JOIN shard.journals sj ON sj.id = sn.journal_id
+            JOIN main.journals mj ON mj.normalized_name = sj.normalized_name
+            WHERE sn.source_name = 'identifier_enrichment_openalex'
+            """
+        )
+        conn.commit()
+        conn.execute("DETACH DATABASE shard")
+
+
+def _merge_collect_databases(cache_db_path: Path, shard_count: int) -> int:
+    """Merge the shard cache databases found next to the common one.
+
+    Returns:
+        Number of merged shard databases.
+    """
+    merged = 0
+    for index in range(1, shard_count + 1):
+        shard_db_path = ShardSpec(index, shard_count).file_path(cache_db_path)
+        if shard_db_path.exists():
+            _merge_collect_database(cache_db_path, shard_db_path)
+            merged += 1
+    return merged
+
+
+def mass_eval_merge_main(
+    state_file: str,
+    shard_count: int,
+    output_dir: str | None = None,
+    collect_cache_file: str | None = None,
+    allow_incomplete: bool = False,
+    cache_db: str | None = None,
+) -> None:
+    """Merge the shards of a mass-eval run.
+
+    Args:
+        state_file: State file path given to the shards (without shard label)
+        shard_count: Number of shards N of the run
+        output_dir: Output directory given to the shards in assess mode
+        collect_cache_file: Collect cache key file given to the shards
+        allow_incomplete: Merge even if shards have unprocessed files
+        cache_db: Cache database receiving the shard databases in collect
+            mode; defaults to the configured cache database
+    """
+    status_logger = get_status_logger()
+
+    try:
+        if shard_count < 1:
+            raise ValueError(f"Invalid shard_count={shard_count}; expected value >= 1.")
+        state_path = Path(state_file).expanduser().resolve()
+        states = _load_shard_states(state_path, shard_count)
+        mode = states[0].mode
+
+        pending = {
+            state.shard: _pending_file_count(state)
+            for state in states
+            if _pending_file_count(state) > 0
+        }
+        if pending and not allow_incomplete:
+            summary = ", ".join(f"{label}: {count}" for label, count in pending.items())
+            raise ValueError(
+                f"Shards have unprocessed files ({summary}). Resume them first "
+                "or pass --allow-incomplete."
+            )
+
+        if mode == "assess":
+            if not output_dir:
+                raise ValueError("--output-dir is required to merge assess mode runs")
+            output_root = Path(output_dir).expanduser().resolve()
+            moved = sum(
+                _merge_output_dir(output_root, ShardSpec(index, shard_count), state)
+                for index, state in enumerate(states, start=1)
+            )
+            status_logger.info(f"Moved {moved} shard output files to {output_root}")
+        elif collect_cache_file:
+            cache_path = Path(collect_cache_file).expanduser().resolve()
+            appended = _merge_collect_keys(cache_path, shard_count)
+            status_logger.info(f"Added {appended:,} collect cache keys to {cache_path}")
+        if mode == "collect":
+            cache_db_path = (
+                Path(cache_db).expanduser().resolve()
+                if cache_db
+                else get_default_db_path()
+            )
+            merged_dbs = _merge_collect_databases(cache_db_path, shard_count)
+            if merged_dbs:
+                status_logger.info(
+                    f"Merged {merged_dbs} shard cache databases into {cache_db_path}"
+                )
+            else:
+                status_logger.warning(
+                    f"No shard cache databases next to {cache_db_path}; what "
+                    "shards on other machines collected stays in their "
+                    f"databases (copy them as "
+                    f"{ShardSpec(1, shard_count).file_path(cache_db_path).name} etc.)"
+                )
+
+        merged = MassEvalState(
+            state_path=state_path, mode=mode, input_path=Path(states[0].input_path)
+        )
+        merged.started_at = min(state.started_at for state in states)
+        for state in states:
+            merged.completed_files |= state.completed_files
+            merged.failed_files.update(state.failed_files)
+            merged.file_progress.update(state.file_progress)
+            merged.processed_entries += state.processed_entries
+            merged.written_records += state.written_records
+            merged.retry_count += state.retry_count
+            merged.collect_cache_hits += state.collect_cache_hits
+        if states[0].shard_by == "files":
+            merged.files_total = sum(state.files_total or 0 for state in states)
+        else:
+            # Every shard went through all files and entries
+            merged.files_total = states[0].files_total
+            merged.completed_files = set.intersection(
+                *(state.completed_files for state in states)
+            )
+            # A file's entry progress differs per shard; files not completed
+            # by every shard are read again from the start
+            for file_key in merged.file_progress.keys() - merged.completed_files:
+                merged.file_progress[file_key] = _new_file_progress()
+            merged.processed_entries = max(state.processed_entries for state in states)
+        _checkpoint_state(merged, force=True)
+
+        status_logger.info(
+            f"mass-eval merge of {shard_count} shards completed. "
+            f"mode={mode}, completed_files={len(merged.completed_files)}, "
+            f"processed_entries={merged.processed_entries}, "
+            f"written_records={merged.written_records}, "
+            f"failed_files={len(merged.failed_files)}, "
+            f"collect_cache_hits={merged.collect_cache_hits}, "
+            f"state={state_path}"
+        )
+        sys.exit(0 if not merged.failed_files and not pending else 1)
+
+    except Exception as e:
+        handle_cli_exception(e, verbose=True, context="mass evaluation merge")
+
+
+__all__ = ["mass_eval_merge_main"]
@@ -4,7 +4,7 @@
 import copy
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import BaseModel, Field
@@ -17,6 +17,10 @@ from .constants import (
     DEFAULT_CACHE_DB_PATH,
     DEFAULT_CACHE_UPDATE_THRESHOLD_DAYS,
     DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_CROSSREF_API_URL,
+    DEFAULT_DOAJ_API_URL,
+    DEFAULT_OPENALEX_API_URL,
+    DEFAULT_OPENCITATIONS_API_URL,
     DEFAULT_OUTPUT_FORMAT,
     DEFAULT_UNKNOWN_THRESHOLD,
 )
@@ -47,6 +51,41 @@ class OutputConfig(BaseModel):
     )
 
 
+# Workloads with their own SQLite connection profile
+SqliteWorkload = Literal["query", "mass_eval", "sync", "bulk_sync"]
+
+
+class SqliteProfileConfig(BaseModel):
+    """SQLite connection settings for one workload.
+
+    Starts from a built-in profile (see ``cache.connection_utils``) and
+    overrides the settings that are not None.
+    """
+
+    base: Literal[
+        "default", "interactive", "reader", "readonly", "writer", "bulk_load"
+    ] = Field("default", description="Built-in profile to start from")
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] | None = Field(
+        None, description="PRAGMA synchronous"
+    )
+    cache_size: int | None = Field(
+        None, description="PRAGMA cache_size (pages if positive, KiB if negative)"
+    )
+    mmap_size: int | None = Field(
+        None, ge=0, description="PRAGMA mmap_size in bytes (0 disables mmap)"
+    )
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] | None = Field(
+        None, description="PRAGMA temp_store"
+    )
+    query_only: bool | None = Field(None, description="PRAGMA query_only")
+    locking_mode: Literal["NORMAL", "EXCLUSIVE"] | None = Field(
+        None, description="PRAGMA locking_mode"
+    )
+    cached_statements: int | None = Field(
+        None, ge=0, description="Prepared statement cache size per connection"
+    )
+
+
 class CacheConfig(BaseModel):
     """Configuration for cache synchronization."""
 
@@ -63,6 +102,22 @@ class CacheConfig(BaseModel):
     update_threshold_days: int = Field(
         7, ge=1, description="Update cache if data is older than N days"
     )
+    stale_while_revalidate: bool = Field(
+        False,
+        description="Serve recently expired API cache entries while refreshing them in the background",
+    )
+    stale_max_age_hours: int = Field(
+        24, ge=1, description="Maximum hours past expiry a stale entry may be served"
+    )
+    stale_refresh_concurrency: int = Field(
+        4, ge=1, description="Maximum number of concurrent background cache refreshes"
+    )
+    sqlite_profiles: dict[SqliteWorkload, SqliteProfileConfig] = Field(
+        default_factory=dict,
+        description=(
+            "SQLite connection profile per workload (query, mass_eval, sync, bulk_sync)"
+        ),
+    )
 
 
 class DataSourceUrlConfig(BaseModel):
@@ -137,6 +192,27 @@ class DataSourceUrlConfig(BaseModel):
     )
 
 
+class ApiEndpointConfig(BaseModel):
+    """Base URLs of the remote APIs queried during assessment.
+
+    Point these at a local stand-in (``aletheia-probe loadtest serve``) to
+    test concurrency, rate limiting and timeouts offline, e.g. via
+    ``ALETHEIA_PROBE_ENDPOINTS_OPENALEX=http://127.0.0.1:8700/openalex``.
+    """
+
+    openalex: str = Field(
+        DEFAULT_OPENALEX_API_URL, description="Base URL of the OpenAlex API"
+    )
+    crossref: str = Field(
+        DEFAULT_CROSSREF_API_URL, description="Base URL of the Crossref REST API"
+    )
+    doaj: str = Field(DEFAULT_DOAJ_API_URL, description="Base URL of the DOAJ API")
+    opencitations: str = Field(
+        DEFAULT_OPENCITATIONS_API_URL,
+        description="Base URL of the OpenCitations Index API",
+    )
+
+
 class DataSourceProcessingConfig(BaseModel):
     """Configuration for data source processing parameters."""
 
@@ -161,6 +237,29 @@ class DataSourceProcessingConfig(BaseModel):
         },
         description="Column header mappings for Scopus Excel files",
     )
+    page_fetch_concurrency: int = Field(
+        4,
+        ge=1,
+        le=32,
+        description="Maximum pages fetched concurrently from a paginated source",
+    )
+    page_fetch_rate: float = Field(
+        2.0,
+        gt=0,
+        description="Maximum page requests per second to a paginated source",
+    )
+    page_fetch_max_retries: int = Field(
+        3, ge=1, description="Attempts per page before the page is skipped"
+    )
+    parse_workers: int | None = Field(
+        None,
+        ge=0,
+        le=64,
+        description=(
+            "Worker processes parsing source data during sync; "
+            "None uses one per CPU core, 0 parses in threads"
+        ),
+    )
 
 
 class AppConfig(BaseModel):
@@ -173,6 +272,7 @@ class AppConfig(BaseModel):
     output: OutputConfig = OutputConfig()
     cache: CacheConfig = CacheConfig()
     data_source_urls: DataSourceUrlConfig = DataSourceUrlConfig()
+    endpoints: ApiEndpointConfig = ApiEndpointConfig()
     data_source_processing: DataSourceProcessingConfig = DataSourceProcessingConfig()
 
 
@@ -43,6 +43,12 @@ DEFAULT_CACHE_AUTO_SYNC: bool = True
 # Default output format
 DEFAULT_OUTPUT_FORMAT: str = "json"
 
+# Default base URLs of the remote APIs (overridable via the endpoints config)
+DEFAULT_OPENALEX_API_URL: str = "https://api.openalex.org"
+DEFAULT_CROSSREF_API_URL: str = "https://api.crossref.org"
+DEFAULT_DOAJ_API_URL: str = "https://doaj.org/api"
+DEFAULT_OPENCITATIONS_API_URL: str = "https://api.opencitations.net/index/v2"
+
 # Backends that support a runtime mode switch (env var → "local" or "remote")
 RUNTIME_MODE_ENV_BY_BACKEND: dict[str, str] = {
     "crossref_analyzer": "CROSSREF_MODE",
@@ -7,7 +7,12 @@ from dataclasses import dataclass
 from typing import Any
 
 from .backends.base import Backend, get_backend_registry
-from .cache import AcronymCache, JournalCache, custom_list_manager
+from .cache import (
+    AcronymCache,
+    JournalCache,
+    custom_list_manager,
+    get_cache_registry,
+)
 from .config import get_config_manager
 from .constants import (
     AGREEMENT_BONUS_AMOUNT,
@@ -20,6 +25,7 @@ from .enums import AssessmentType, EvidenceType
 from .fallback_chain import QueryFallbackChain
 from .logging_config import get_detail_logger, get_status_logger
 from .lookup import VenueLookupService
+from .metrics import get_metrics_registry
 from .models import (
     AssessmentResult,
     BackendResult,
@@ -31,6 +37,7 @@ from .models import (
 from .normalizer import InputNormalizer, input_normalizer
 from .openalex import create_openalex_client
 from .quality_assessment import QualityAssessmentProcessor
+from .tracing import span
 from .validation import validate_issn
 
 
@@ -95,7 +102,7 @@ class QueryDispatcher:
         self.status_logger = get_status_logger()
         self.cross_validation_registry = get_cross_validation_registry()
         self.quality_processor = QualityAssessmentProcessor()
-        self.journal_cache = JournalCache()
+        self.journal_cache = get_cache_registry().get(JournalCache)
         self.lookup_service = VenueLookupService(journal_cache=self.journal_cache)
         self._cache_ttl_hours_override: int | None = None
         self._backend_cache: dict[str, Backend] = {}
@@ -131,7 +138,8 @@ class QueryDispatcher:
                 query_input, normalization_failure, start_time
             )
 
-        query_input = await self._enrich_query_identifiers(query_input)
+        with span("identifier_enrichment", "enrichment"):
+            query_input = await self._enrich_query_identifiers(query_input)
 
         # Get enabled backends from registry
         enabled_backends = self._get_enabled_backends()
@@ -170,9 +178,10 @@ class QueryDispatcher:
 
         # Acronym fallback: If initial query yields no confident results and input looks
         # like an acronym with a cached expansion, retry with the expanded name
-        return await self._try_acronym_fallback(
-            assessment_result, query_input, enabled_backends, start_time
-        )
+        with span("acronym_fallback", "dispatch"):
+            return await self._try_acronym_fallback(
+                assessment_result, query_input, enabled_backends, start_time
+            )
 
     async def _normalize_for_dispatch(
         self, query_input: QueryInput
@@ -184,11 +193,12 @@ class QueryDispatcher:
             else VenueType.JOURNAL
         )
 
-        lookup_result = self.lookup_service.lookup(
-            query_input.raw_input,
-            venue_type=requested_venue_type,
-            confidence_min=DEFAULT_ACRONYM_CONFIDENCE_MIN,
-        )
+        with span("normalization", "normalization"):
+            lookup_result = self.lookup_service.lookup(
+                query_input.raw_input,
+                venue_type=requested_venue_type,
+                confidence_min=DEFAULT_ACRONYM_CONFIDENCE_MIN,
+            )
         query_identifiers = (
             dict(query_input.normalized_venue.input_identifiers)
             if query_input.normalized_venue
@@ -646,7 +656,7 @@ class QueryDispatcher:
         """
         if self._should_try_acronym_fallback(assessment_result, query_input):
             normalizer = InputNormalizer()
-            acronym_cache = AcronymCache()
+            acronym_cache = get_cache_registry().get(AcronymCache)
 
             # Use original venue type for all acronym/variant lookups
             entity_type = query_input.venue_type.value
@@ -883,7 +893,11 @@ class QueryDispatcher:
         Returns:
             BackendResult with execution_time_ms populated
         """
-        result = await backend.query_with_timeout(query_input, timeout)
+        with span(f"backend:{backend.get_name()}", "backend"):
+            result = await backend.query_with_timeout(query_input, timeout)
+        get_metrics_registry().record_backend_result(
+            backend.get_name(), result.status.value, result.response_time
+        )
 
         # Convert response_time (seconds) to execution_time_ms (milliseconds)
         # response_time already contains the actual backend execution time
@@ -963,7 +977,8 @@ class QueryDispatcher:
             )
 
         # Apply cross-validation adjustments to backend results
-        backend_results = self._apply_cross_validation(backend_results, reasoning)
+        with span("cross_validation", "aggregation"):
+            backend_results = self._apply_cross_validation(backend_results, reasoning)
 
         # Refresh successful results after cross-validation adjustments
         successful_results = [
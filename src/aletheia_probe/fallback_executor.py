@@ -17,6 +17,7 @@ from .backend_exceptions import (
 )
 from .fallback_chain import FallbackStrategy, QueryFallbackChain
 from .models import BackendResult, QueryInput
+from .tracing import span
 
 
 T = TypeVar("T")
@@ -130,7 +131,8 @@ def automatic_fallback(
             result_data = None
             for strategy in strategies:
                 try:
-                    result_data = await executor.execute_strategy(strategy)
+                    with span(f"{self.get_name()}:{strategy.value}", "fallback"):
+                        result_data = await executor.execute_strategy(strategy)
                     if result_data is not None:
                         # Success - log attempt and build result
                         confidence = await executor.calculate_confidence(
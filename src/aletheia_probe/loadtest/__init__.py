@@ -0,0 +1,15 @@
+# SPDX-License-Identifier: MIT
+"""Offline load testing against a local stand-in for the remote APIs."""
+
+from .harness import LoadTestReport, build_subprocess_env, run_mass_eval_load_test
+from .mock_api import MOCK_SERVICES, FaultProfile, MockApiServer
+
+
+__all__ = [
+    "MOCK_SERVICES",
+    "FaultProfile",
+    "LoadTestReport",
+    "MockApiServer",
+    "build_subprocess_env",
+    "run_mass_eval_load_test",
+]
@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: MIT
+"""Load-test harness driving ``mass-eval`` against the mock API server.
+
+The harness starts a ``MockApiServer`` in the current event loop and runs
+``aletheia-probe mass-eval`` as a subprocess whose ``endpoints`` config is
+pointed at the server through ``ALETHEIA_PROBE_ENDPOINTS_*`` variables. The
+subprocess runs in a scratch working directory, so it starts from an empty
+cache database and never touches the user's cache. Throughput is derived
+from the mass-eval checkpoint state; backend latencies and retries come from
+its ``--metrics-out`` snapshot.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..cli_logic.mass_eval import MassEvalState
+from ..constants import RUNTIME_MODE_ENV_BY_BACKEND
+from ..logging_config import get_detail_logger
+from .mock_api import MockApiServer
+
+
+detail_logger = get_detail_logger()
+
+# Command line that runs the CLI with the current interpreter
+_CLI_COMMAND: tuple[str, ...] = (
+    sys.executable,
+    "-c",
+    "from aletheia_probe.cli import main; main()",
+)
+
+
+@dataclass
+class LoadTestReport:
+    """Outcome of one load-test run."""
+
+    processed_entries: int
+    written_records: int
+    failed_files: int
+    elapsed_seconds: float
+    exit_code: int
+    server_stats: dict[str, dict[str, Any]] = field(default_factory=dict)
+    metrics: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def entries_per_second(self) -> float:
+        """Processed BibTeX entries per second of wall time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.processed_entries / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the report."""
+        return {
+            "processed_entries": self.processed_entries,
+            "written_records": self.written_records,
+            "failed_files": self.failed_files,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "entries_per_second": round(self.entries_per_second, 3),
+            "exit_code": self.exit_code,
+            "server": self.server_stats,
+            "metrics": self.metrics,
+        }
+
+    def format_summary(self) -> str:
+        """Format a human-readable summary."""
+        lines = [
+            f"Entries processed: {self.processed_entries:,} in "
+            f"{self.elapsed_seconds:.1f}s ({self.entries_per_second:.2f} entries/s)",
+            f"Records written:   {self.written_records:,}",
+            f"Failed files:      {self.failed_files}",
+            "",
+            f"{'service':<16} {'requests':>9}  statuses",
+        ]
+        for service, stats in self.server_stats.items():
+            statuses = ", ".join(
+                f"{status}: {count}" for status, count in stats["statuses"].items()
+            )
+            lines.append(f"{service:<16} {stats['requests']:>9}  {statuses or '-'}")
+
+        backends = self.metrics.get("backends", {})
+        if backends:
+            lines += [
+                "",
+                f"{'backend':<36} {'requests':>9} {'p50 ms':>9} {'p95 ms':>9} "
+                f"{'p99 ms':>9}",
+            ]
+            for name, backend in backends.items():
+                latency = backend["latency"]
+                lines.append(
+                    f"{name:<36} {backend['requests']:>9} "
+                    f"{_format_ms(latency['p50_ms'])} {_format_ms(latency['p95_ms'])} "
+                    f"{_format_ms(latency['p99_ms'])}"
+                )
+        retries = self.metrics.get("retries", {}).get("total")
+        if retries is not None:
+            lines += ["", f"Retries: {retries:,}"]
+        return "\n".join(lines)
+
+
+def _format_ms(value: float | None) -> str:
+    """Right-align an optional millisecond value."""
+    return f"{value:>9.1f}" if value is not None else f"{'-':>9}"
+
+
+def build_subprocess_env(endpoint_urls: dict[str, str]) -> dict[str, str]:
+    """Environment routing a CLI subprocess to the given API endpoints.
+
+    Runtime modes are forced to ``remote`` so locally backed adapters do not
+    bypass the endpoints.
+
+    Args:
+        endpoint_urls: Base URL per service, as returned by
+            ``MockApiServer.endpoint_urls``
+
+    Returns:
+        Environment for the subprocess
+    """
+    env = dict(os.environ)
+    for service, url in endpoint_urls.items():
+        env[f"ALETHEIA_PROBE_ENDPOINTS_{service.upper()}"] = url
+    for mode_variable in RUNTIME_MODE_ENV_BY_BACKEND.values():
+        env[mode_variable] = "remote"
+    return env
+
+
+async def run_mass_eval_load_test(
+    input_path: Path,
+    work_dir: Path,
+    server: MockApiServer,
+    max_concurrency: int = 1,
+    max_parallel_files: int = 8,
+    extra_args: tuple[str, ...] = (),
+) -> LoadTestReport:
+    """Run ``mass-eval`` in assess mode against a mock API server.
+
+    Args:
+        input_path: .bib file or directory of .bib files
+        work_dir: Scratch directory (cache database, state, output, metrics)
+        server: Mock server; started here if not already running
+        max_concurrency: mass-eval ``--max-concurrency``
+        max_parallel_files: mass-eval ``--max-parallel-files``
+        extra_args: Additional mass-eval arguments
+
+    Returns:
+        Load-test report
+    """
+    work_dir = work_dir.resolve()
+    work_dir.mkdir(parents=True, exist_ok=True)
+    state_path = work_dir / "mass-eval-state.json"
+    metrics_path = work_dir / "metrics.json"
+    if server.root_url is None:
+        await server.start()
+
+    command = [
+        *_CLI_COMMAND,
+        "mass-eval",
+        str(input_path.resolve()),
+        "--mode",
+        "assess",
+        "--output-dir",
+        str(work_dir / "output"),
+        "--state-file",
+        str(state_path),
+        "--no-resume",
+        "--max-concurrency",
+        str(max_concurrency),
+        "--max-parallel-files",
+        str(max_parallel_files),
+        "--metrics-out",
+        str(metrics_path),
+        *extra_args,
+    ]
+    detail_logger.debug(f"Load test command: {' '.join(command)}")
+
+    started = time.monotonic()
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=work_dir,
+        env=build_subprocess_env(server.endpoint_urls()),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    exit_code = await process.wait()
+    elapsed = time.monotonic() - started
+
+    state = MassEvalState.load(state_path) if state_path.exists() else None
+    return LoadTestReport(
+        processed_entries=state.processed_entries if state else 0,
+        written_records=state.written_records if state else 0,
+        failed_files=len(state.failed_files) if state else 0,
+        elapsed_seconds=elapsed,
+        exit_code=exit_code,
+        server_stats=server.stats(),
+        metrics=_read_json(metrics_path),
+    )
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    """Read a JSON object, returning an empty dict if it is missing."""
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data if isinstance(data, dict) else {}
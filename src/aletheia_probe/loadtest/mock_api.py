@@ -0,0 +1,487 @@
+# SPDX-License-Identifier: MIT
+"""Local stand-in for the remote APIs queried during assessment.
+
+``MockApiServer`` serves the OpenAlex, Crossref, DOAJ and OpenCitations
+endpoints used by the API backends, with configurable latency, rate limiting
+and error injection. Each service is mounted under its own path prefix
+(``/openalex``, ``/crossref``, ``/doaj``, ``/opencitations``); point the
+``endpoints`` config section at these URLs to send traffic to the server.
+
+Responses are synthesized from a hash of the requested identifier, so the
+same query always yields the same answer (found or not, counts, years).
+"""
+
+import asyncio
+import hashlib
+import random
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime
+from typing import Any
+
+from aiohttp import web
+
+from ..logging_config import get_detail_logger
+
+
+detail_logger = get_detail_logger()
+
+# Services served by the mock, matching the fields of the endpoints config
+MOCK_SERVICES: tuple[str, ...] = ("openalex", "crossref", "doaj", "opencitations")
+
+# Supported latency distributions
+LATENCY_DISTRIBUTIONS: tuple[str, ...] = ("constant", "uniform", "lognormal")
+
+# Status codes drawn for injected server errors
+_SERVER_ERROR_STATUSES = (500, 502, 503)
+
+# Metadata fields reported in Crossref coverage blocks
+_CROSSREF_COVERAGE_FIELDS = (
+    "orcids",
+    "funders",
+    "licenses",
+    "abstracts",
+    "affiliations",
+    "references",
+    "award-numbers",
+    "ror-ids",
+    "similarity-checking",
+)
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """Latency and failure behaviour of one mocked service."""
+
+    # Median response latency; "uniform" draws from [0, 2 * latency_ms]
+    latency_ms: float = 50.0
+    latency_distribution: str = "lognormal"
+    # Shape (sigma) of the lognormal distribution; larger means heavier tail
+    latency_sigma: float = 0.6
+    latency_max_ms: float = 10_000.0
+    # Share of requests answered with 429 / 5xx regardless of load
+    rate_limit_ratio: float = 0.0
+    server_error_ratio: float = 0.0
+    # Requests per second above which 429 is returned (None: unlimited)
+    max_requests_per_second: float | None = None
+    # Retry-After header value on 429/503 responses (None: header omitted)
+    retry_after_seconds: int | None = 1
+    # Share of lookups that find a venue
+    found_ratio: float = 0.7
+
+    def __post_init__(self) -> None:
+        """Validate the profile."""
+        if self.latency_ms < 0 or self.latency_max_ms < 0:
+            raise ValueError("Latencies must not be negative")
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution {self.latency_distribution!r}; "
+                f"expected one of {', '.join(LATENCY_DISTRIBUTIONS)}"
+            )
+        for name in ("rate_limit_ratio", "server_error_ratio", "found_ratio"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if self.max_requests_per_second is not None and (
+            self.max_requests_per_second <= 0
+        ):
+            raise ValueError("max_requests_per_second must be positive")
+
+    def with_overrides(self, overrides: dict[str, str]) -> "FaultProfile":
+        """Return a copy with fields replaced by string values.
+
+        Values are converted to the type of the field's default; ``none``
+        clears optional fields.
+
+        Args:
+            overrides: Mapping of field name to string value
+
+        Returns:
+            New fault profile
+
+        Raises:
+            ValueError: If a field is unknown or a value cannot be converted
+        """
+        field_defaults = {f.name: f.default for f in fields(self)}
+        changes: dict[str, Any] = {}
+        for name, raw_value in overrides.items():
+            if name not in field_defaults:
+                raise ValueError(f"Unknown fault profile field {name!r}")
+            default = field_defaults[name]
+            if raw_value.strip().lower() == "none":
+                changes[name] = None
+            elif isinstance(default, str):
+                changes[name] = raw_value
+            elif isinstance(default, int) and not isinstance(default, bool):
+                changes[name] = int(raw_value)
+            else:
+                changes[name] = float(raw_value)
+        return replace(self, **changes)
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Draw one response latency in seconds."""
+        if self.latency_distribution == "constant":
+            latency_ms = self.latency_ms
+        elif self.latency_distribution == "uniform":
+            latency_ms = rng.uniform(0.0, 2 * self.latency_ms)
+        else:
+            latency_ms = self.latency_ms * rng.lognormvariate(0.0, self.latency_sigma)
+        return min(latency_ms, self.latency_max_ms) / 1000
+
+
+@dataclass
+class _ServiceState:
+    """Runtime counters of one mocked service."""
+
+    profile: FaultProfile
+    requests: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+    recent_requests: deque[float] = field(default_factory=deque)
+
+    def over_rate_limit(self, now: float) -> bool:
+        """Record a request and check it against the per-second limit."""
+        limit = self.profile.max_requests_per_second
+        if limit is None:
+            return False
+        window = self.recent_requests
+        while window and now - window[0] >= 1.0:
+            window.popleft()
+        window.append(now)
+        return len(window) > limit
+
+
+def _stable_hash(value: str) -> int:
+    """Process-independent hash of a query identifier."""
+    return int.from_bytes(
+        hashlib.blake2b(value.lower().encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class MockApiServer:
+    """aiohttp server imitating the remote assessment APIs."""
+
+    def __init__(
+        self,
+        profile: FaultProfile | None = None,
+        service_profiles: dict[str, FaultProfile] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize server.
+
+        Args:
+            profile: Fault profile applied to every service
+            service_profiles: Per-service profiles replacing ``profile``
+            seed: Seed for latency and fault injection (None: random)
+
+        Raises:
+            ValueError: If a service profile names an unknown service
+        """
+        default_profile = profile or FaultProfile()
+        service_profiles = service_profiles or {}
+        unknown = set(service_profiles) - set(MOCK_SERVICES)
+        if unknown:
+            raise ValueError(f"Unknown mock services: {', '.join(sorted(unknown))}")
+        self._services = {
+            name: _ServiceState(service_profiles.get(name, default_profile))
+            for name in MOCK_SERVICES
+        }
+        self._rng = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.root_url: str | None = None
+
+    async def __aenter__(self) -> "MockApiServer":
+        """Start the server on a free local port."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Stop the server."""
+        await self.stop()
+
+    def build_app(self) -> web.Application:
+        """Build the aiohttp application with all mocked routes."""
+        app = web.Application(middlewares=[self._fault_middleware])
+        app.router.add_get("/openalex/sources", self._openalex_sources)
+        app.router.add_get("/openalex/works", self._openalex_works)
+        app.router.add_get("/crossref/journals/{issn}", self._crossref_journal)
+        app.router.add_get("/crossref/works", self._crossref_works)
+        app.router.add_get("/crossref/works/{doi:.+}", self._crossref_work)
+        app.router.add_get("/doaj/search/journals/{query:.+}", self._doaj_search)
+        app.router.add_get(
+            "/opencitations/{metric:venue-(?:citation|reference)-count}/{venue_id}",
+            self._opencitations_count,
+        )
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+
+        Returns:
+            Root URL of the server
+        """
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.root_url = f"http://{host}:{bound_port}"
+        detail_logger.debug(f"Mock API server listening on {self.root_url}")
+        return self.root_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def endpoint_urls(self) -> dict[str, str]:
+        """Base URLs to configure as ``endpoints`` for each service.
+
+        Raises:
+            RuntimeError: If the server has not been started
+        """
+        if self.root_url is None:
+            raise RuntimeError("MockApiServer is not running")
+        return {service: f"{self.root_url}/{service}" for service in MOCK_SERVICES}
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Request and status counts per service."""
+        return {
+            name: {
+                "requests": state.requests,
+                "statuses": {
+                    str(status): count
+                    for status, count in sorted(state.statuses.items())
+                },
+            }
+            for name, state in self._services.items()
+        }
+
+    @web.middleware
+    async def _fault_middleware(
+        self,
+        request: web.Request,
+        handler: Any,
+    ) -> web.StreamResponse:
+        """Apply latency, rate limiting and error injection to every request."""
+        service = request.path.strip("/").split("/", 1)[0]
+        state = self._services.get(service)
+        if state is None:
+            raise web.HTTPNotFound()
+
+        profile = state.profile
+        state.requests += 1
+        await asyncio.sleep(profile.sample_latency(self._rng))
+
+        response: web.StreamResponse
+        if state.over_rate_limit(time.monotonic()) or (
+            self._rng.random() < profile.rate_limit_ratio
+        ):
+            response = self._error_response(429, "Too Many Requests", profile)
+        elif self._rng.random() < profile.server_error_ratio:
+            status = self._rng.choice(_SERVER_ERROR_STATUSES)
+            response = self._error_response(status, "Injected server error", profile)
+        else:
+            response = await handler(request)
+
+        state.statuses[response.status] = state.statuses.get(response.status, 0) + 1
+        return response
+
+    @staticmethod
+    def _error_response(
+        status: int, message: str, profile: FaultProfile
+    ) -> web.Response:
+        """Build an error response, with Retry-After where servers send one."""
+        headers = {}
+        if status in (429, 503) and profile.retry_after_seconds is not None:
+            headers["Retry-After"] = str(profile.retry_after_seconds)
+        return web.json_response(
+            {"status": "error", "message": message}, status=status, headers=headers
+        )
+
+    def _found(self, service: str, key: str) -> bool:
+        """Decide deterministically whether a service knows a venue."""
+        ratio = self._services[service].profile.found_ratio
+        return (_stable_hash(f"{service}:{key}") % 10_000) < ratio * 10_000
+
+    async def _openalex_sources(self, request: web.Request) -> web.Response:
+        """Imitate ``/sources?filter=issn:...`` and ``/sources?search=...``."""
+        filter_value = request.query.get("filter", "")
+        search = request.query.get("search", "").strip()
+        if filter_value.startswith("issn:"):
+            issn = filter_value.removeprefix("issn:").split(",")[0].upper()
+            key, name, issns = issn, f"Journal {issn}", [issn]
+        elif search:
+            key, name, issns = search, search, []
+        else:
+            return web.json_response({"error": "Invalid query"}, status=400)
+
+        results = []
+        if self._found("openalex", key):
+            results.append(_openalex_source(key, name, issns))
+        return web.json_response(
+            {"meta": {"count": len(results), "page": 1}, "results": results}
+        )
+
+    async def _openalex_works(self, request: web.Request) -> web.Response:
+        """Imitate ``/works?filter=...&group_by=publication_year``."""
+        current_year = datetime.now().year
+        filter_value = request.query.get("filter", "")
+        years = re.search(r"publication_year:(\d{4})-(\d{4})", filter_value)
+        start, end = (
+            (int(years.group(1)), int(years.group(2)))
+            if years
+            else (current_year - 5, current_year)
+        )
+        base = _stable_hash(filter_value) % 2_000
+        group_by = [
+            {
+                "key": str(year),
+                "key_display_name": str(year),
+                "count": base + (year - start) * 10,
+            }
+            for year in range(start, end + 1)
+        ]
+        return web.json_response(
+            {"meta": {"count": sum(g["count"] for g in group_by)}, "group_by": group_by}
+        )
+
+    async def _crossref_journal(self, request: web.Request) -> web.Response:
+        """Imitate ``/journals/{issn}``."""
+        issn = request.match_info["issn"].upper()
+        if not self._found("crossref", issn):
+            return web.json_response(
+                {"status": "error", "message": "Resource not found."}, status=404
+            )
+
+        value = _stable_hash(issn)
+        current_year = datetime.now().year
+        total_dois = 20 + value % 30_000
+        coverage = {
+            name: round(((value >> (index * 4)) % 100) / 100, 2)
+            for index, name in enumerate(_CROSSREF_COVERAGE_FIELDS)
+        }
+        return web.json_response(
+            {
+                "status": "ok",
+                "message-type": "journal",
+                "message": {
+                    "title": f"Journal {issn}",
+                    "publisher": f"Mock Publisher {value % 97}",
+                    "ISSN": [issn],
+                    "counts": {
+                        "total-dois": total_dois,
+                        "current-dois": total_dois // 4,
+                        "backfile-dois": total_dois - total_dois // 4,
+                    },
+                    "coverage": coverage,
+                    "coverage-type": {"current": coverage, "all": coverage},
+                    "breakdowns": {
+                        "dois-by-issued-year": [
+                            [year, total_dois // 10 + (year % 7)]
+                            for year in range(current_year - 9, current_year + 1)
+                        ]
+                    },
+                },
+            }
+        )
+
+    async def _crossref_works(self, request: web.Request) -> web.Response:
+        """Imitate the ``/works`` search endpoint (counts only)."""
+        total = _stable_hash(request.query_string) % 50_000
+        return web.json_response(
+            {
+                "status": "ok",
+                "message-type": "work-list",
+                "message": {"total-results": total, "items": []},
+            }
+        )
+
+    async def _crossref_work(self, request: web.Request) -> web.Response:
+        """Imitate ``/works/{doi}``; about 1% of works are retracted."""
+        doi = request.match_info["doi"]
+        if not self._found("crossref", doi):
+            return web.json_response(
+                {"status": "error", "message": "Resource not found."}, status=404
+            )
+
+        message: dict[str, Any] = {"DOI": doi, "type": "journal-article"}
+        if _stable_hash(doi) % 100 == 0:
+            message["updated-by"] = [
+                {
+                    "type": "retraction",
+                    "DOI": f"{doi}.retraction",
+                    "updated": {"date-parts": [[2023, 1, 1]]},
+                }
+            ]
+        return web.json_response(
+            {"status": "ok", "message-type": "work", "message": message}
+        )
+
+    async def _doaj_search(self, request: web.Request) -> web.Response:
+        """Imitate ``/search/journals/{query}`` for ISSN and title queries."""
+        query = request.match_info["query"]
+        field_name, _, value = query.partition(":")
+        value = value.strip().strip('"')
+        if field_name == "issn":
+            key, title, issn = value.upper(), f"Journal {value.upper()}", value.upper()
+        else:
+            key, title, issn = value, value, None
+
+        results = []
+        if value and self._found("doaj", key):
+            hashed = _stable_hash(key)
+            results.append(
+                {
+                    "id": f"{hashed:032x}"[:32],
+                    "bibjson": {
+                        "title": title,
+                        "pissn": issn,
+                        "eissn": None,
+                        "publisher": {"name": f"Mock Publisher {hashed % 97}"},
+                        "subject": [{"term": "General"}],
+                        "ref": {"journal": f"https://journal-{hashed % 10_000}.test"},
+                    },
+                }
+            )
+        return web.json_response(
+            {
+                "total": len(results),
+                "page": 1,
+                "pageSize": int(request.query.get("pageSize", 10)),
+                "results": results,
+            }
+        )
+
+    async def _opencitations_count(self, request: web.Request) -> web.Response:
+        """Imitate ``/venue-citation-count`` and ``/venue-reference-count``."""
+        venue_id = request.match_info["venue_id"].upper()
+        if not self._found("opencitations", venue_id):
+            return web.json_response([])
+        value = _stable_hash(f"{request.match_info['metric']}:{venue_id}")
+        return web.json_response([{"count": str(value % 200_000)}])
+
+
+def _openalex_source(key: str, name: str, issns: list[str]) -> dict[str, Any]:
+    """Build an OpenAlex source record for a venue key."""
+    value = _stable_hash(key)
+    current_year = datetime.now().year
+    first_year = 1960 + value % 60
+    return {
+        "id": f"https://openalex.org/S{value % 10**10}",
+        "display_name": name,
+        "issn_l": issns[0] if issns else None,
+        "issn": issns,
+        "type": "journal",
+        "host_organization_name": f"Mock Publisher {value % 97}",
+        "works_count": 50 + value % 50_000,
+        "cited_by_count": value % 2_000_000,
+        "is_in_doaj": value % 3 == 0,
+        "first_publication_year": first_year,
+        "last_publication_year": current_year,
+    }
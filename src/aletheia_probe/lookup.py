@@ -3,7 +3,7 @@
 
 from dataclasses import asdict, dataclass, field
 
-from .cache import AcronymCache, JournalCache
+from .cache import AcronymCache, JournalCache, get_cache_registry
 from .constants import DEFAULT_ACRONYM_CONFIDENCE_MIN
 from .models import QueryInput, VenueType
 from .normalizer import input_normalizer
@@ -70,8 +70,9 @@ class VenueLookupService:
         acronym_cache: AcronymCache | None = None,
         journal_cache: JournalCache | None = None,
     ) -> None:
-        self.acronym_cache = acronym_cache or AcronymCache()
-        self.journal_cache = journal_cache or JournalCache()
+        cache_registry = get_cache_registry()
+        self.acronym_cache = acronym_cache or cache_registry.get(AcronymCache)
+        self.journal_cache = journal_cache or cache_registry.get(JournalCache)
 
     def lookup(
         self,
@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: MIT
+"""In-process runtime metrics for backends, caches and retries.
+
+Backends, caches and retry helpers report into a single process-wide
+``MetricsRegistry``. The registry keeps aggregate numbers only (counters and
+fixed-bucket latency histograms), so its memory use does not grow with the
+number of queries. A snapshot can be dumped as JSON via ``--metrics-out``.
+"""
+
+import bisect
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+# Upper bounds (milliseconds) of latency histogram buckets; the last bucket is
+# open-ended. Roughly logarithmic from 1 ms to 2 min.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    30_000,
+    60_000,
+    120_000,
+)
+
+# Percentiles reported for each latency histogram
+REPORTED_PERCENTILES: tuple[int, ...] = (50, 90, 95, 99)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles."""
+
+    def __init__(self, bounds_ms: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds_ms = bounds_ms
+        self.bucket_counts = [0] * (len(bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: float | None = None
+        self.max_ms: float | None = None
+
+    def observe(self, value_ms: float) -> None:
+        """Record one latency observation in milliseconds."""
+        self.bucket_counts[bisect.bisect_left(self.bounds_ms, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+        self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Estimate a percentile by linear interpolation within its bucket.
+
+        Args:
+            percentile: Percentile in the range 0-100
+
+        Returns:
+            Estimated latency in milliseconds, or None without observations
+        """
+        if self.count == 0 or self.min_ms is None or self.max_ms is None:
+            return None
+
+        rank = percentile / 100 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            if bucket_count == 0:
+                continue
+            if cumulative + bucket_count >= rank:
+                lower = self.bounds_ms[index - 1] if index > 0 else 0.0
+                upper = (
+                    self.bounds_ms[index]
+                    if index < len(self.bounds_ms)
+                    else self.max_ms
+                )
+                # Observed extremes tighten the estimate at the edges
+                lower = max(lower, self.min_ms)
+                upper = min(upper, self.max_ms)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize histogram summary and bucket counts."""
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+        }
+        for percentile in REPORTED_PERCENTILES:
+            value = self.percentile(percentile)
+            summary[f"p{percentile}_ms"] = (
+                round(value, 3) if value is not None else None
+            )
+        summary["buckets"] = {
+            f"le_{bound:g}": bucket_count
+            for bound, bucket_count in zip(
+                self.bounds_ms, self.bucket_counts, strict=False
+            )
+        }
+        summary["buckets"]["le_inf"] = self.bucket_counts[-1]
+        return summary
+
+
+class MetricsRegistry:
+    """Process-wide aggregate metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all collected metrics."""
+        with self._lock:
+            self._started_at = datetime.now(timezone.utc)
+            self._started_monotonic = time.monotonic()
+            self._backend_requests: dict[str, int] = {}
+            self._backend_statuses: dict[str, dict[str, int]] = {}
+            self._backend_latency: dict[str, LatencyHistogram] = {}
+            self._cache_lookups: dict[str, dict[str, int]] = {}
+            self._retries: dict[str, int] = {}
+
+    def record_backend_result(
+        self, backend_name: str, status: str, latency_seconds: float
+    ) -> None:
+        """Record one backend query outcome.
+
+        Args:
+            backend_name: Backend identifier
+            status: BackendStatus value (found, not_found, error, timeout, ...)
+            latency_seconds: Query response time in seconds
+        """
+        with self._lock:
+            self._backend_requests[backend_name] = (
+                self._backend_requests.get(backend_name, 0) + 1
+            )
+            statuses = self._backend_statuses.setdefault(backend_name, {})
+            statuses[status] = statuses.get(status, 0) + 1
+            histogram = self._backend_latency.get(backend_name)
+            if histogram is None:
+                histogram = self._backend_latency[backend_name] = LatencyHistogram()
+            histogram.observe(latency_seconds * 1000)
+
+    def record_cache_lookup(self, cache_name: str, outcome: str) -> None:
+        """Record one cache lookup.
+
+        Args:
+            cache_name: Cache identifier (e.g. "assessment_cache")
+            outcome: "hit", "miss" or another outcome such as "stale"
+        """
+        with self._lock:
+            outcomes = self._cache_lookups.setdefault(cache_name, {})
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    def record_retry(self, operation: str) -> None:
+        """Record one retry of a failed operation (e.g. an HTTP request).
+
+        Args:
+            operation: Name of the retried operation
+        """
+        with self._lock:
+            self._retries[operation] = self._retries.get(operation, 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Build a JSON-serializable snapshot of all metrics."""
+        with self._lock:
+            backends = {
+                name: {
+                    "requests": requests,
+                    "statuses": dict(self._backend_statuses.get(name, {})),
+                    "latency": self._backend_latency[name].to_dict(),
+                }
+                for name, requests in sorted(self._backend_requests.items())
+            }
+            caches = {}
+            for name, outcomes in sorted(self._cache_lookups.items()):
+                lookups = sum(outcomes.values())
+                caches[name] = {
+                    "lookups": lookups,
+                    **dict(outcomes),
+                    "hit_ratio": (
+                        round(outcomes.get("hit", 0) / lookups, 4) if lookups else None
+                    ),
+                }
+            status_totals: dict[str, int] = {}
+            for statuses in self._backend_statuses.values():
+                for status, count in statuses.items():
+                    status_totals[status] = status_totals.get(status, 0) + count
+
+            return {
+                "started_at": self._started_at.isoformat(),
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "uptime_seconds": round(time.monotonic() - self._started_monotonic, 3),
+                "backend_totals": {
+                    "requests": sum(self._backend_requests.values()),
+                    "statuses": status_totals,
+                },
+                "backends": backends,
+                "caches": caches,
+                "retries": {
+                    "total": sum(self._retries.values()),
+                    "by_operation": dict(sorted(self._retries.items())),
+                },
+            }
+
+    def write_json(self, path: Path) -> None:
+        """Write a snapshot to a JSON file atomically.
+
+        Args:
+            path: Output file path
+        """
+        payload = self.snapshot()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        tmp_path.replace(path)
+
+
+# Global metrics registry with factory pattern
+_metrics_registry_instance: MetricsRegistry | None = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get or create the global metrics registry instance.
+
+    Returns:
+        The global MetricsRegistry instance
+    """
+    global _metrics_registry_instance
+    if _metrics_registry_instance is None:
+        _metrics_registry_instance = MetricsRegistry()
+    return _metrics_registry_instance
@@ -11,6 +11,8 @@ import aiohttp
 from aletheia_probe.normalizer import input_normalizer
 
 from .backend_exceptions import RateLimitError
+from .config import get_config_manager
+from .constants import DEFAULT_OPENALEX_API_URL
 from .logging_config import get_detail_logger
 from .retry_utils import async_retry_with_backoff
 
@@ -47,18 +49,25 @@ BONUS_CONF_LONG_RUNNING = 0.1
 class OpenAlexClient:
     """Client for OpenAlex API to fetch journal publication statistics."""
 
-    BASE_URL = "https://api.openalex.org"
+    BASE_URL = DEFAULT_OPENALEX_API_URL
 
     def __init__(
-        self, email: str = "noreply@aletheia-probe.org", max_concurrent: int = 10
+        self,
+        email: str = "noreply@aletheia-probe.org",
+        max_concurrent: int = 10,
+        base_url: str | None = None,
     ):
         """Initialize OpenAlex client.
 
         Args:
             email: Email for polite pool access (recommended for higher rate limits)
             max_concurrent: Maximum concurrent API requests
+            base_url: API base URL (default: ``endpoints.openalex`` from config)
         """
         self.email = email
+        self.base_url = (
+            base_url or get_config_manager().load_config().endpoints.openalex
+        ).rstrip("/")
         self.headers = {"User-Agent": f"AletheiaProbe/1.0 (mailto:{email})"}
         self.semaphore = asyncio.Semaphore(max_concurrent)
         self.session: aiohttp.ClientSession | None = None
@@ -93,7 +102,7 @@ class OpenAlexClient:
             Dictionary with source information or None if not found
         """
         async with self.semaphore:
-            url = f"{self.BASE_URL}/sources?filter=issn:{issn}"
+            url = f"{self.base_url}/sources?filter=issn:{issn}"
 
             if not self.session:
                 self.session = aiohttp.ClientSession(
@@ -221,7 +230,7 @@ class OpenAlexClient:
         async with self.semaphore:
             capped_per_page = max(1, min(per_page, 50))
             url = (
-                f"{self.BASE_URL}/sources?search={journal_name}"
+                f"{self.base_url}/sources?search={journal_name}"
                 f"&per-page={capped_per_page}"
             )
 
@@ -270,7 +279,7 @@ class OpenAlexClient:
         """
         async with self.semaphore:
             # Use search endpoint for fuzzy matching
-            url = f"{self.BASE_URL}/sources?search={journal_name}"
+            url = f"{self.base_url}/sources?search={journal_name}"
 
             if not self.session:
                 self.session = aiohttp.ClientSession(
@@ -359,7 +368,7 @@ class OpenAlexClient:
                 source_id = f"S{source_id}"
 
             url = (
-                f"{self.BASE_URL}/works?"
+                f"{self.base_url}/works?"
                 f"filter=primary_location.source.id:https://openalex.org/{source_id},"
                 f"publication_year:{start_year}-{end_year}&"
                 f"group_by=publication_year&per-page=200"
@@ -11,9 +11,10 @@ from typing import Any
 import aiohttp
 
 from .backend_exceptions import BackendError, RateLimitError
+from .constants import DEFAULT_OPENCITATIONS_API_URL
 
 
-_DEFAULT_BASE_URL = "https://api.opencitations.net/index/v2"
+_DEFAULT_BASE_URL = DEFAULT_OPENCITATIONS_API_URL
 _DEFAULT_TIMEOUT_SECONDS = 20
 
 
@@ -7,6 +7,7 @@ from functools import wraps
 from typing import Any, TypeVar
 
 from .logging_config import get_detail_logger
+from .metrics import get_metrics_registry
 
 
 detail_logger = get_detail_logger()
@@ -59,6 +60,7 @@ def async_retry_with_backoff(
                         f"{func.__name__} failed (attempt {attempt + 1}/{max_retries}): {e}. "
                         f"Retrying in {delay:.1f}s..."
                     )
+                    get_metrics_registry().record_retry(func.__name__)
                     await asyncio.sleep(delay)
                     delay = min(delay * exponential_base, max_delay)
                     attempt += 1
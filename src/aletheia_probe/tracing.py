@@ -0,0 +1,249 @@
+# SPDX-License-Identifier: MIT
+"""Lightweight span tracing for profiling assessment runs.
+
+Spans are recorded only while the global tracer is enabled (``--profile``).
+When disabled, ``span()`` returns a shared no-op context manager, so the
+instrumentation left in hot paths costs a single attribute check.
+
+Recorded spans can be exported in Chrome trace-event format (viewable in
+``chrome://tracing`` or Perfetto) and summarized as a text table of the top
+time consumers.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+
+# Shared no-op span returned while tracing is disabled
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """A completed span."""
+
+    name: str
+    category: str
+    start_ns: int
+    end_ns: int
+    lane: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds."""
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+
+class _Span:
+    """Context manager that records one span on exit."""
+
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start_ns")
+
+    def __init__(
+        self, tracer: "Tracer", name: str, category: str, args: dict[str, Any]
+    ) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start_ns = 0
+
+    def __enter__(self) -> None:
+        self._start_ns = time.perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        args = self._args
+        if exc_type is not None:
+            args = {**args, "error": exc_type.__name__}
+        self._tracer._record(
+            self._name, self._category, self._start_ns, time.perf_counter_ns(), args
+        )
+
+
+class Tracer:
+    """Collects timing spans for the current process."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._records: list[SpanRecord] = []
+        self._lanes: dict[int, tuple[int, str]] = {}
+        self._origin_ns = time.perf_counter_ns()
+
+    def enable(self) -> None:
+        """Start recording spans, discarding any previous recording."""
+        self.reset()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans (recorded spans are kept)."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Discard all recorded spans."""
+        self._records = []
+        self._lanes = {}
+        self._origin_ns = time.perf_counter_ns()
+
+    @property
+    def records(self) -> list[SpanRecord]:
+        """Spans recorded so far, in completion order."""
+        return list(self._records)
+
+    def span(
+        self, name: str, category: str = "app", **args: Any
+    ) -> AbstractContextManager[None]:
+        """Create a span context manager.
+
+        Args:
+            name: Span name (used for aggregation in the summary)
+            category: Span category (e.g. "backend", "fallback")
+            **args: Extra attributes attached to the trace event
+
+        Returns:
+            Context manager timing the enclosed block
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def _record(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        args: dict[str, Any],
+    ) -> None:
+        """Store a completed span on the lane of the running task/thread."""
+        self._records.append(
+            SpanRecord(name, category, start_ns, end_ns, self._current_lane(), args)
+        )
+
+    def _current_lane(self) -> int:
+        """Map the current asyncio task (or thread) to a stable lane number.
+
+        Concurrent backend queries run as separate tasks; giving each its own
+        lane keeps overlapping spans readable in trace viewers.
+        """
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        key = id(task) if task is not None else threading.get_ident()
+        lane = self._lanes.get(key)
+        if lane is None:
+            label = task.get_name() if task is not None else "main"
+            lane = (len(self._lanes) + 1, label)
+            self._lanes[key] = lane
+        return lane[0]
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Build a Chrome trace-event document from recorded spans.
+
+        Returns:
+            Dictionary with ``traceEvents`` using complete ("X") events
+        """
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": lane,
+                "args": {"name": label},
+            }
+            for lane, label in self._lanes.values()
+        ]
+        for record in self._records:
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": (record.start_ns - self._origin_ns) / 1000,
+                    "dur": (record.end_ns - record.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": record.lane,
+                    "args": record.args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: Path) -> None:
+        """Write recorded spans to a Chrome trace-event JSON file.
+
+        Args:
+            path: Output file path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+
+    def format_summary(self, top_n: int = 15) -> str:
+        """Format a table of the spans with the largest total time.
+
+        Times are inclusive: a parent span includes the time of its children.
+
+        Args:
+            top_n: Number of span names to list
+
+        Returns:
+            Human-readable summary
+        """
+        if not self._records:
+            return "Profile summary: no spans recorded"
+
+        totals: dict[tuple[str, str], list[float]] = {}
+        for record in self._records:
+            totals.setdefault((record.name, record.category), []).append(
+                record.duration_ms
+            )
+
+        ranked = sorted(totals.items(), key=lambda item: sum(item[1]), reverse=True)
+        lines = [
+            f"Profile summary: top {min(top_n, len(ranked))} of {len(ranked)} "
+            "span names by inclusive time",
+            f"{'span':<48} {'category':<16} {'calls':>7} {'total ms':>11} "
+            f"{'mean ms':>9} {'max ms':>9}",
+        ]
+        for (name, category), durations in ranked[:top_n]:
+            total = sum(durations)
+            lines.append(
+                f"{name[:48]:<48} {category[:16]:<16} {len(durations):>7} "
+                f"{total:>11.1f} {total / len(durations):>9.2f} "
+                f"{max(durations):>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+# Global tracer instance
+tracer = Tracer()
+
+
+def span(name: str, category: str = "app", **args: Any) -> AbstractContextManager[None]:
+    """Create a span on the global tracer (no-op unless profiling is enabled).
+
+    Args:
+        name: Span name
+        category: Span category
+        **args: Extra attributes attached to the trace event
+
+    Returns:
+        Context manager timing the enclosed block
+    """
+    return tracer.span(name, category, **args)
@@ -11,6 +11,7 @@ Main Components:
 - sources: Implementations for Beall's List, Retraction Watch, Scopus,
   Algerian Ministry, and Kscien predatory lists.
 - utils: Journal name normalization, HTML cleaning, and deduplication tools.
+- pagination: Concurrent, rate-limited fetching of paginated listings.
 - sync_utils: Database synchronization and update management.
 """
 
@@ -8,10 +8,13 @@ synchronization to maintain fresh local journal caches.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
 from ..enums import AssessmentType
 from ..utils.dead_code import code_is_used
+from .downloads import SourceDownloads
+from .parse_pool import ParsePool
 
 
 class DataSource(ABC):
@@ -26,6 +29,9 @@ class DataSource(ABC):
     to synchronize their data.
     """
 
+    _downloads: SourceDownloads | None = None
+    _parse_pool: ParsePool | None = None
+
     @abstractmethod
     @code_is_used
     def get_name(self) -> str:
@@ -57,6 +63,19 @@ class DataSource(ABC):
         """
         pass
 
+    async def fetch_chunks(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Fetch and parse data from the source in chunks.
+
+        Sources with large inputs override this to hand entries to the sync
+        while they are still parsing; each chunk is written as it arrives.
+        A normalized name should not appear in more than one chunk. The
+        default yields the result of fetch_data() as a single chunk.
+
+        Yields:
+            Lists of journal dictionaries, as returned by fetch_data()
+        """
+        yield await self.fetch_data()
+
     @abstractmethod
     @code_is_used
     def should_update(self) -> bool:
@@ -66,3 +85,52 @@ class DataSource(ABC):
             True if data should be fetched, False if current data is fresh
         """
         pass
+
+    @property
+    def downloads(self) -> SourceDownloads:
+        """Tracker for the files downloaded in the current sync run.
+
+        Outside of a sync this is a passive tracker that sends plain requests.
+        """
+        if self._downloads is None:
+            self._downloads = SourceDownloads(self.get_name())
+        return self._downloads
+
+    def track_downloads(self, revalidate: bool = True) -> SourceDownloads:
+        """Start recording downloads for a sync run.
+
+        Args:
+            revalidate: Whether to send conditional requests based on the
+                previous sync
+
+        Returns:
+            The new tracker, also available as ``downloads``
+        """
+        self._downloads = SourceDownloads.for_sync(self.get_name(), revalidate)
+        return self._downloads
+
+    @property
+    def parse_pool(self) -> ParsePool:
+        """Pool to run CPU-bound parse jobs in.
+
+        During a sync this is the pool shared by all sources; outside of a
+        sync jobs run in threads.
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ParsePool()
+        return self._parse_pool
+
+    def use_parse_pool(self, pool: ParsePool | None) -> None:
+        """Submit parse jobs to a sync's pool, or to threads again for None."""
+        self._parse_pool = pool
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the source without its sync-run state.
+
+        Parse jobs may be methods of the source; the source is then pickled
+        to the worker process running them.
+        """
+        state = self.__dict__.copy()
+        state.pop("_downloads", None)
+        state.pop("_parse_pool", None)
+        return state
@@ -0,0 +1,414 @@
+# SPDX-License-Identifier: MIT
+"""Conditional downloads for data source syncs.
+
+A :class:`SourceDownloads` tracker is attached to a source for one sync run
+(see :meth:`DataSource.track_downloads`). Sources fetch their files through
+it; it sends ``If-None-Match``/``If-Modified-Since`` headers from the
+validators stored at the previous sync and serves ``304 Not Modified``
+answers from the stored payload. Large files can be streamed through it
+(:meth:`SourceDownloads.stream`) instead of being read into memory. When the
+source fetched the same URLs as last time and every file was either not
+modified or hashes to the same content, :attr:`unchanged` is True and the
+source can skip parsing and the sync skips the DB write.
+
+Validators are only stored by :meth:`SourceDownloads.commit`, after the
+source's data was written, so a failed sync is never mistaken for an
+up-to-date one.
+"""
+
+import hashlib
+import io
+import ssl
+import urllib.request
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from email.message import Message
+from pathlib import Path
+from typing import IO, Any
+from urllib.error import HTTPError
+
+from aiohttp import ClientSession
+
+from ..cache import DownloadCache, DownloadRecord, get_cache_registry
+from ..logging_config import get_detail_logger
+
+
+detail_logger = get_detail_logger()
+
+HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+
+
+@dataclass(frozen=True)
+class Download:
+    """Payload of a downloaded URL.
+
+    Attributes:
+        url: Requested URL.
+        status: HTTP status; 304 when the payload was served from the cache.
+        body: Payload bytes; empty unless ``ok``.
+    """
+
+    url: str
+    status: int
+    body: bytes = b""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the payload is available."""
+        return self.status in (HTTP_OK, HTTP_NOT_MODIFIED)
+
+    def text(self) -> str:
+        """Return the payload decoded as UTF-8."""
+        return self.body.decode("utf-8", errors="replace")
+
+
+class SourceDownloads:
+    """Track the downloads of one source during one sync run.
+
+    Without a cache the tracker is passive: requests are sent unconditionally
+    and nothing is recorded. This is the default outside of a sync.
+
+    Args:
+        source_name: Name of the data source.
+        cache: Download cache to read and store validators in.
+        revalidate: Whether to send conditional requests and compare hashes
+            against the previous sync. When False (forced syncs) payloads are
+            still recorded for the next sync.
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        cache: DownloadCache | None = None,
+        revalidate: bool = True,
+    ) -> None:
+        self.source_name = source_name
+        self.cache = cache
+        self.revalidate = revalidate and cache is not None
+        self._previous: dict[str, DownloadRecord | None] = {}
+        self._pending: dict[str, tuple[DownloadRecord, bytes | Path | None]] = {}
+        self._unchanged: dict[str, bool] = {}
+        self._previous_urls: set[str] | None = None
+        # Payload bytes received in this run; 304 answers add nothing
+        self.bytes_downloaded = 0
+
+    @classmethod
+    def for_sync(
+        cls, source_name: str, revalidate: bool = True, db_path: Path | None = None
+    ) -> "SourceDownloads":
+        """Create a recording tracker backed by the shared download cache."""
+        cache = get_cache_registry().get(DownloadCache, db_path)
+        return cls(source_name, cache, revalidate=revalidate)
+
+    @property
+    def unchanged(self) -> bool:
+        """True if the URLs of the last sync were downloaded and none changed.
+
+        A URL fetched last time but not in this run (e.g. a listing that
+        lost its last page) makes the source changed as well.
+        """
+        if not (
+            self.revalidate and bool(self._unchanged) and all(self._unchanged.values())
+        ):
+            return False
+        if self._previous_urls is None and self.cache is not None:
+            self._previous_urls = self.cache.get_download_urls(self.source_name)
+        return set(self._unchanged) == self._previous_urls
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Return the conditional request headers for a URL."""
+        previous = self._previous_download(url)
+        headers: dict[str, str] = {}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+        return headers
+
+    def previous_body(self, url: str) -> bytes | None:
+        """Return the payload a URL had at the previous sync.
+
+        Args:
+            url: Downloaded URL
+
+        Returns:
+            The stored payload, or None if there is none or the tracker
+            does not revalidate.
+        """
+        previous = self._previous_download(url)
+        if self.cache is None or previous is None:
+            return None
+        return self.cache.read_body(previous.content_hash)
+
+    def accept(
+        self, url: str, status: int, headers: Mapping[str, str] | Message, body: bytes
+    ) -> bytes:
+        """Record a response to a request for a URL and return its payload.
+
+        Args:
+            url: Requested URL
+            status: 200, or 304 for a conditional request
+            headers: Response headers
+            body: Response payload; ignored for 304
+
+        Returns:
+            The payload, read from the cache for a 304 response.
+
+        Raises:
+            FileNotFoundError: If a 304 payload is no longer cached.
+        """
+        if status != HTTP_NOT_MODIFIED:
+            self.bytes_downloaded += len(body)
+        if self.cache is None:
+            return body
+
+        previous = self._previous_download(url)
+        if status == HTTP_NOT_MODIFIED:
+            if previous is None:
+                raise FileNotFoundError(f"No cached download for {url}")
+            detail_logger.debug(f"{self.source_name}: {url} not modified")
+            self._unchanged[url] = True
+            return self.cache.read_body(previous.content_hash)
+
+        self._stage(url, headers, previous, hashlib.sha256(body).hexdigest(), body)
+        return body
+
+    def stream(
+        self,
+        url: str,
+        status: int,
+        headers: Mapping[str, str] | Message,
+        response: IO[bytes] | None,
+    ) -> IO[bytes]:
+        """Record a response to a request for a URL and stream its payload.
+
+        Unlike accept(), the payload is not held in memory: a 200 payload is
+        copied to a spool file and hashed while the caller reads it, and is
+        recorded once it was read to the end. Until then the URL counts as
+        changed.
+
+        Args:
+            url: Requested URL
+            status: 200, or 304 for a conditional request
+            headers: Response headers
+            response: Response payload stream; None for 304
+
+        Returns:
+            Stream over the payload, opened from the cache for a 304 response.
+            The caller closes it.
+
+        Raises:
+            FileNotFoundError: If a 304 payload is no longer cached.
+        """
+        previous = self._previous_download(url)
+        if status == HTTP_NOT_MODIFIED:
+            if self.cache is None or previous is None:
+                raise FileNotFoundError(f"No cached download for {url}")
+            detail_logger.debug(f"{self.source_name}: {url} not modified")
+            self._unchanged[url] = True
+            return self.cache.open_body(previous.content_hash)
+
+        if response is None:
+            raise ValueError(f"No payload for {url}")
+        if self.cache is None:
+            return response
+
+        def record(content_hash: str, spool_path: Path) -> None:
+            self.bytes_downloaded += spool_path.stat().st_size
+            self._stage(url, headers, previous, content_hash, spool_path)
+
+        # Its hash is only known at the end of the payload
+        self._unchanged[url] = False
+        recorder = _RecordingReader(response, self.cache.spool_file(), record)
+        return io.BufferedReader(recorder)
+
+    async def get(self, session: ClientSession, url: str, **kwargs: Any) -> Download:
+        """Download a URL with an aiohttp session.
+
+        Args:
+            session: Session to send the request with
+            url: URL to download
+            **kwargs: Further arguments for ``session.get``
+
+        Returns:
+            The download; callers check ``ok`` before using the payload.
+        """
+        if self.cache is None:
+            async with session.get(url, **kwargs) as response:
+                if response.status != HTTP_OK:
+                    return Download(url, response.status)
+                return Download(url, response.status, (await response.text()).encode())
+
+        headers = {**kwargs.pop("headers", {}), **self.conditional_headers(url)}
+        async with session.get(url, headers=headers, **kwargs) as response:
+            if response.status == HTTP_NOT_MODIFIED:
+                body = self.accept(url, response.status, response.headers, b"")
+            elif response.status == HTTP_OK:
+                text = await response.text()
+                body = self.accept(
+                    url, response.status, response.headers, text.encode()
+                )
+            else:
+                return Download(url, response.status)
+        return Download(url, response.status, body)
+
+    def commit(self) -> None:
+        """Store the validators of this run's downloads for the next sync.
+
+        Records of URLs the source no longer fetched are deleted.
+        """
+        if self.cache is None or not self._unchanged:
+            return
+        self.cache.store_downloads(
+            self.source_name,
+            list(self._pending.values()),
+            fetched_urls=set(self._unchanged),
+        )
+        self._pending.clear()
+
+    def _stage(
+        self,
+        url: str,
+        headers: Mapping[str, str] | Message,
+        previous: DownloadRecord | None,
+        content_hash: str,
+        body: bytes | Path,
+    ) -> None:
+        same_content = previous is not None and previous.content_hash == content_hash
+        self._unchanged[url] = same_content
+        if same_content:
+            detail_logger.debug(f"{self.source_name}: {url} content unchanged")
+            if isinstance(body, Path):
+                body.unlink(missing_ok=True)
+        self._pending[url] = (
+            DownloadRecord(
+                url=url,
+                content_hash=content_hash,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            ),
+            None if same_content else body,
+        )
+
+    def _previous_download(self, url: str) -> DownloadRecord | None:
+        if not self.revalidate or self.cache is None:
+            return None
+        if url not in self._previous:
+            self._previous[url] = self.cache.get_download(self.source_name, url)
+        return self._previous[url]
+
+
+class _RecordingReader(io.RawIOBase):
+    """Copy a payload to a spool file and hash it while it is read.
+
+    When the payload was read to the end, the spool file is handed to a
+    callback with the payload's hash. A payload closed before its end is
+    discarded.
+    """
+
+    def __init__(
+        self,
+        source: IO[bytes],
+        spool: IO[bytes],
+        on_complete: Callable[[str, Path], None],
+    ) -> None:
+        super().__init__()
+        self._source = source
+        self._spool = spool
+        self._spool_path = Path(spool.name)
+        self._on_complete = on_complete
+        self._hasher = hashlib.sha256()
+        self._complete = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._source.read(len(buffer))
+        if not data:
+            if not self._complete:
+                self._complete = True
+                self._spool.close()
+                self._on_complete(self._hasher.hexdigest(), self._spool_path)
+            return 0
+        buffer[: len(data)] = data
+        self._hasher.update(data)
+        self._spool.write(data)
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._source.close()
+            if not self._complete:
+                self._spool.close()
+                self._spool_path.unlink(missing_ok=True)
+        super().close()
+
+
+def open_url_stream(
+    url: str,
+    headers: Mapping[str, str],
+    timeout: float,
+    context: ssl.SSLContext,
+) -> tuple[int, Message, IO[bytes] | None]:
+    """Open a blocking HTTPS GET that may be answered with 304.
+
+    Like open_url(), but the payload is returned as an open response for
+    the caller to read and close.
+
+    Args:
+        url: URL to fetch
+        headers: Request headers, e.g. from conditional_headers()
+        timeout: Socket timeout in seconds
+        context: SSL context for the connection
+
+    Returns:
+        Status, response headers and payload stream (None for 304).
+
+    Raises:
+        HTTPError: For error statuses.
+        URLError: For connection failures.
+    """
+    request = urllib.request.Request(url, headers=dict(headers))
+    try:
+        response = urllib.request.urlopen(  # nosec B310 - callers validate the scheme
+            request, timeout=timeout, context=context
+        )
+    except HTTPError as e:
+        if e.code == HTTP_NOT_MODIFIED:
+            return e.code, e.headers, None
+        raise
+    return response.status, response.headers, response
+
+
+def open_url(
+    url: str,
+    headers: Mapping[str, str],
+    timeout: float,
+    context: ssl.SSLContext,
+) -> tuple[int, Message, bytes]:
+    """Perform a blocking HTTPS GET that may be answered with 304.
+
+    urllib reports 304 as an ``HTTPError``; it is returned as a status here.
+    Callers must validate the URL scheme and host first.
+
+    Args:
+        url: URL to fetch
+        headers: Request headers, e.g. from conditional_headers()
+        timeout: Socket timeout in seconds
+        context: SSL context for the connection
+
+    Returns:
+        Status, response headers and payload (empty for 304).
+
+    Raises:
+        HTTPError: For error statuses.
+        URLError: For connection failures.
+    """
+    status, response_headers, response = open_url_stream(url, headers, timeout, context)
+    if response is None:
+        return status, response_headers, b""
+    with response:
+        return status, response_headers, response.read()
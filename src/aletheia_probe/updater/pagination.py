@@ -0,0 +1,234 @@
+# SPDX-License-Identifier: MIT
+"""Concurrent fetching of paginated data source listings.
+
+Paginated sources report how many results they hold on their first page.
+:func:`fetch_paginated` uses that count to fetch the remaining pages
+concurrently, bounded by a concurrency limit and a request rate, and parses
+each page as soon as it arrives. A page that fails is retried on its own and
+reported in the result if it keeps failing. Sources must not sync such a
+partial listing, since the records on the missing pages would be removed;
+see :meth:`PaginatedFetchResult.raise_for_failed_pages`.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import ClientError
+
+from ..config import get_config_manager
+from ..logging_config import get_detail_logger, get_status_logger
+
+
+detail_logger = get_detail_logger()
+status_logger = get_status_logger()
+
+DEFAULT_RETRY_BASE_DELAY_SECONDS = 1.0
+
+PageFetcher = Callable[[int], Awaitable[str]]
+PageParser = Callable[[int, str], list[dict[str, Any]]]
+PageCounter = Callable[[str, list[dict[str, Any]]], int | None]
+
+
+class PageFetchError(Exception):
+    """Raised by a page fetcher when a page could not be retrieved.
+
+    Args:
+        message: Description of the failure.
+        retryable: Whether fetching the same page again may succeed.
+    """
+
+    def __init__(self, message: str, retryable: bool = True) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class IncompletePaginationError(OSError):
+    """Raised when pages of a listing could not be fetched after all retries."""
+
+
+_PAGE_FETCH_ERRORS = (PageFetchError, ClientError, OSError, TimeoutError)
+
+
+@dataclass(frozen=True)
+class PageFetchPolicy:
+    """Concurrency, rate and retry limits for fetching one paginated source."""
+
+    concurrency: int = 4
+    requests_per_second: float = 2.0
+    max_retries: int = 3
+    retry_base_delay: float = DEFAULT_RETRY_BASE_DELAY_SECONDS
+
+    @classmethod
+    def from_config(cls) -> "PageFetchPolicy":
+        """Build the policy from the ``data_source_processing`` settings."""
+        processing = get_config_manager().load_config().data_source_processing
+        return cls(
+            concurrency=processing.page_fetch_concurrency,
+            requests_per_second=processing.page_fetch_rate,
+            max_retries=processing.page_fetch_max_retries,
+        )
+
+
+@dataclass
+class PaginatedFetchResult:
+    """Entries and bookkeeping from a paginated fetch.
+
+    Attributes:
+        entries: Parsed entries of all fetched pages, in page order.
+        pages_fetched: Number of pages that were fetched and parsed.
+        total_pages: Page count reported by the first page, if it had one.
+        failed_pages: Pages that could not be fetched after all retries.
+    """
+
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    pages_fetched: int = 0
+    total_pages: int | None = None
+    failed_pages: list[int] = field(default_factory=list)
+
+    def raise_for_failed_pages(self, source_name: str) -> None:
+        """Reject a listing that is missing pages.
+
+        Args:
+            source_name: Source name used in the error message.
+
+        Raises:
+            IncompletePaginationError: If any page could not be fetched.
+        """
+        if self.failed_pages:
+            pages = ", ".join(str(page) for page in self.failed_pages)
+            raise IncompletePaginationError(
+                f"{source_name}: could not fetch page(s) {pages}; "
+                "keeping the previous data"
+            )
+
+
+class _RequestPacer:
+    """Space request starts at least ``1 / requests_per_second`` apart."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        self._interval = 1.0 / requests_per_second
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """Wait until the next request slot is due and reserve it."""
+        now = time.monotonic()
+        delay = self._next_start - now
+        self._next_start = max(now, self._next_start) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def fetch_paginated(
+    fetch_page: PageFetcher,
+    parse_page: PageParser,
+    count_pages: PageCounter,
+    *,
+    max_pages: int,
+    source_name: str,
+    policy: PageFetchPolicy | None = None,
+) -> PaginatedFetchResult:
+    """Fetch and parse all pages of a paginated listing.
+
+    Page 1 is fetched first and passed to ``count_pages``. If it returns a
+    page count, pages 2..N are fetched concurrently under ``policy``.
+    Otherwise pages are fetched one after another until a page is empty or
+    cannot be fetched.
+
+    Args:
+        fetch_page: Coroutine returning the body of a page number. It raises
+            :class:`PageFetchError`, ``aiohttp.ClientError`` or ``OSError``
+            when the page cannot be retrieved.
+        parse_page: Parses a page body into entries.
+        count_pages: Returns the total page count from the first page body
+            and its entries, or None if the page does not report it.
+        max_pages: Upper bound on the number of pages fetched.
+        source_name: Source name used in log messages.
+        policy: Fetch limits; defaults to the configured policy.
+
+    Returns:
+        The parsed entries in page order and fetch statistics.
+    """
+    policy = policy or PageFetchPolicy.from_config()
+    pacer = _RequestPacer(policy.requests_per_second)
+    result = PaginatedFetchResult()
+    pages: dict[int, list[dict[str, Any]]] = {}
+    start_time = time.monotonic()
+
+    async def fetch_with_retries(page: int) -> str | None:
+        for attempt in range(1, policy.max_retries + 1):
+            await pacer.wait()
+            try:
+                return await fetch_page(page)
+            except _PAGE_FETCH_ERRORS as e:
+                retryable = not isinstance(e, PageFetchError) or e.retryable
+                if not retryable or attempt >= policy.max_retries:
+                    status_logger.warning(
+                        f"    {source_name}: Page {page} request failed after "
+                        f"{attempt} attempt(s) - {type(e).__name__}: {e}"
+                    )
+                    return None
+
+                status_logger.warning(
+                    f"    {source_name}: Page {page} attempt {attempt}/"
+                    f"{policy.max_retries} failed - {type(e).__name__}. Retrying..."
+                )
+                await asyncio.sleep(policy.retry_base_delay * attempt)
+        return None
+
+    first_page = await fetch_with_retries(1)
+    if first_page is None:
+        result.failed_pages.append(1)
+        return result
+
+    pages[1] = parse_page(1, first_page)
+    if pages[1]:
+        result.total_pages = count_pages(first_page, pages[1])
+
+    if not pages[1]:
+        detail_logger.info(f"{source_name}: No entries on page 1")
+    elif result.total_pages is None:
+        page = 2
+        while page <= max_pages:
+            html_content = await fetch_with_retries(page)
+            if html_content is None:
+                result.failed_pages.append(page)
+                break
+            page_entries = parse_page(page, html_content)
+            if not page_entries:
+                detail_logger.info(
+                    f"{source_name}: No entries on page {page}, stopping pagination"
+                )
+                break
+            pages[page] = page_entries
+            page += 1
+    else:
+        last_page = min(result.total_pages, max_pages)
+        if result.total_pages > max_pages:
+            detail_logger.warning(
+                f"{source_name}: {result.total_pages} pages reported, "
+                f"fetching only the first {max_pages}"
+            )
+        semaphore = asyncio.Semaphore(policy.concurrency)
+
+        async def fetch_one(page: int) -> None:
+            async with semaphore:
+                html_content = await fetch_with_retries(page)
+            if html_content is None:
+                result.failed_pages.append(page)
+                return
+            pages[page] = parse_page(page, html_content)
+
+        await asyncio.gather(*(fetch_one(page) for page in range(2, last_page + 1)))
+
+    result.failed_pages.sort()
+    result.pages_fetched = len(pages)
+    result.entries = [entry for page in sorted(pages) for entry in pages[page]]
+    detail_logger.info(
+        f"{source_name}: Fetched {result.pages_fetched} pages "
+        f"({len(result.failed_pages)} failed) with {len(result.entries)} entries "
+        f"in {time.monotonic() - start_time:.1f}s"
+    )
+    return result
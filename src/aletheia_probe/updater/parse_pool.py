@@ -0,0 +1,269 @@
+# SPDX-License-Identifier: MIT
+"""Worker processes for the CPU-bound parse stages of a sync.
+
+Sources are synced concurrently, but parsing XML, CSV, spreadsheets and
+PDFs in threads is serialized by the GIL. A :class:`ParsePool` is shared by
+all sources of one sync run (see :meth:`DataSource.use_parse_pool`) so that
+their parse jobs run on all cores. Jobs must be picklable: module-level
+functions, or methods of the source itself, which is pickled without its
+sync-run state. Jobs producing many records can yield them in chunks with
+:meth:`ParsePool.stream`. Log records of the workers are forwarded to the
+loggers of the syncing process.
+
+The sync bounds downloads separately: a source holds a :class:`NetworkSlot`
+while it runs, and gives it up while its parse jobs run, so that another
+source can download in the meantime.
+
+The default pool, used outside of a sync, runs jobs in threads.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import (
+    AbstractAsyncContextManager,
+    aclosing,
+    asynccontextmanager,
+    nullcontext,
+)
+from contextvars import ContextVar, Token
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.managers import SyncManager
+from threading import Event
+from typing import Any, TypeVar
+
+from ..config import get_config_manager
+from ..logging_config import (
+    DETAIL_LOGGER_NAME,
+    STATUS_LOGGER_NAME,
+    get_detail_logger,
+)
+
+
+detail_logger = get_detail_logger()
+
+T = TypeVar("T")
+
+# Chunks a streaming job may produce ahead of its consumer
+STREAM_QUEUE_SIZE = 4
+
+
+class NetworkSlot:
+    """A source's share of the concurrent downloads of a sync.
+
+    Entering the slot waits for the shared semaphore. While parse jobs of the
+    task holding the slot run in a :class:`ParsePool`, whose workers bound
+    the CPU-bound work, the semaphore is released; it is taken again before
+    the source continues after its last running job.
+
+    Args:
+        semaphore: Semaphore shared by the sources of one sync run
+    """
+
+    def __init__(self, semaphore: asyncio.Semaphore) -> None:
+        self._semaphore = semaphore
+        self._held = False
+        self._parse_jobs = 0
+        self._reacquire_lock = asyncio.Lock()
+        self._token: Token[NetworkSlot | None] | None = None
+
+    async def __aenter__(self) -> "NetworkSlot":
+        await self._semaphore.acquire()
+        self._held = True
+        self._token = _network_slot.set(self)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            _network_slot.reset(self._token)
+            self._token = None
+        if self._held:
+            self._held = False
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def parsing(self) -> AsyncIterator[None]:
+        """Give up the slot while a parse job runs."""
+        self._parse_jobs += 1
+        if self._held:
+            self._held = False
+            self._semaphore.release()
+        try:
+            yield
+        finally:
+            self._parse_jobs -= 1
+            async with self._reacquire_lock:
+                if self._parse_jobs == 0 and not self._held:
+                    await self._semaphore.acquire()
+                    self._held = True
+
+
+# Slot of the source whose task submits a parse job
+_network_slot: ContextVar[NetworkSlot | None] = ContextVar("network_slot", default=None)
+
+
+def _parsing() -> AbstractAsyncContextManager[None]:
+    slot = _network_slot.get()
+    return slot.parsing() if slot is not None else nullcontext()
+
+
+class ParsePool:
+    """Run parse jobs of data sources in worker processes.
+
+    The processes are started on the first submitted job, so a sync that
+    parses nothing does not pay for them.
+
+    Args:
+        max_workers: Number of worker processes; 0 runs jobs in threads.
+    """
+
+    def __init__(self, max_workers: int = 0) -> None:
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._manager: SyncManager | None = None
+        self._log_listener: QueueListener | None = None
+
+    @classmethod
+    def for_sync(cls) -> "ParsePool":
+        """Create a pool sized by the ``parse_workers`` setting."""
+        config = get_config_manager().load_config()
+        workers = config.data_source_processing.parse_workers
+        if workers is None:
+            workers = os.cpu_count() or 1
+        return cls(workers)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a job and return its result.
+
+        Args:
+            func: Picklable callable
+            *args: Picklable arguments
+
+        Returns:
+            The job's return value.
+        """
+        async with _parsing():
+            if self.max_workers == 0:
+                return await asyncio.to_thread(func, *args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    async def stream(
+        self, func: Callable[..., Iterable[list[T]]], *args: Any
+    ) -> AsyncGenerator[list[T], None]:
+        """Run a job that yields chunks and iterate over them as they arrive.
+
+        At most STREAM_QUEUE_SIZE chunks are buffered. When the caller stops
+        iterating early, the job is stopped before its next chunk.
+
+        Args:
+            func: Picklable callable returning an iterable of chunks
+            *args: Picklable arguments
+
+        Yields:
+            The chunks of the job, in order.
+        """
+        async with _parsing(), aclosing(self._stream(func, *args)) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    async def _stream(
+        self, func: Callable[..., Iterable[list[T]]], *args: Any
+    ) -> AsyncGenerator[list[T], None]:
+        if self.max_workers == 0:
+            chunks = iter(await asyncio.to_thread(func, *args))
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                yield chunk
+            return
+
+        executor = self._get_executor()
+        assert self._manager is not None  # started with the executor
+        chunk_queue = self._manager.Queue(STREAM_QUEUE_SIZE)
+        stop = self._manager.Event()
+        loop = asyncio.get_running_loop()
+        job = loop.run_in_executor(
+            executor, _stream_to_queue, func, args, chunk_queue, stop
+        )
+        finished = False
+        try:
+            while (chunk := await asyncio.to_thread(chunk_queue.get)) is not None:
+                yield chunk
+            finished = True
+            await job
+        finally:
+            if not finished:
+                stop.set()
+                await asyncio.to_thread(_drain, chunk_queue)
+                await asyncio.gather(job, return_exceptions=True)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; blocks until running jobs finished."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            context = multiprocessing.get_context("spawn")
+            self._manager = context.Manager()
+            log_queue = self._manager.Queue()
+            self._log_listener = QueueListener(log_queue, _LogRelay())
+            self._log_listener.start()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(log_queue,),
+            )
+            detail_logger.info(f"Started {self.max_workers} parse worker processes")
+        return self._executor
+
+
+class _LogRelay(logging.Handler):
+    """Hand log records forwarded by workers to the local logger of that name."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logger = logging.getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+
+
+def _init_worker(log_queue: "queue.Queue[logging.LogRecord]") -> None:
+    """Route the worker's status and detail logs to the syncing process."""
+    for name in (DETAIL_LOGGER_NAME, STATUS_LOGGER_NAME):
+        logger = logging.getLogger(name)
+        logger.handlers = [QueueHandler(log_queue)]
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+
+def _stream_to_queue(
+    func: Callable[..., Iterable[list[Any]]],
+    args: tuple[Any, ...],
+    chunk_queue: "queue.Queue[list[Any] | None]",
+    stop: Event,
+) -> None:
+    """Put the chunks of a job on a queue, followed by None."""
+    try:
+        for chunk in func(*args):
+            if stop.is_set():
+                break
+            chunk_queue.put(chunk)
+    finally:
+        chunk_queue.put(None)
+
+
+def _drain(chunk_queue: "queue.Queue[list[Any] | None]") -> None:
+    """Discard chunks until the end marker of a stopped job."""
+    while chunk_queue.get() is not None:
+        pass
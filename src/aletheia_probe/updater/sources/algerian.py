@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: MIT
 """Algerian Ministry of Higher Education predatory journal list data source."""
 
+import asyncio
+import hashlib
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +17,7 @@ from ...logging_config import get_detail_logger, get_status_logger
 from ..core import DataSource
 from ..utils import deduplicate_journals
 from .algerian_helpers import ArchiveDownloader, ArchiveExtractor, PDFTextExtractor
+from .algerian_helpers.pdf_parser import PDF_TEXT_EXTRACTOR, extract_pdf_text_timed
 
 
 detail_logger = get_detail_logger()
@@ -92,6 +95,8 @@ class AlgerianMinistrySource(DataSource):
                     f"Algerian Ministry: Starting download for year {year}"
                 )
                 journals = await self._fetch_year_data(year)
+                if self.downloads.unchanged:
+                    return []
                 if journals:
                     all_journals.extend(journals)
                     detail_logger.info(
@@ -137,6 +142,11 @@ class AlgerianMinistrySource(DataSource):
                 detail_logger.warning("Algerian Ministry: ZIP download failed")
                 status_logger.warning(f"    {self.get_name()}: ZIP download failed")
                 return []
+            if self.downloads.unchanged:
+                detail_logger.info(
+                    "Algerian Ministry: ZIP unchanged since last sync, skipping extraction"
+                )
+                return []
 
             detail_logger.info(
                 "Algerian Ministry: ZIP downloaded, starting extraction..."
@@ -154,7 +164,7 @@ class AlgerianMinistrySource(DataSource):
             )
 
             # Find and process PDF files
-            return self._process_pdf_files(extract_dir, year)
+            return await self._process_pdf_files(extract_dir, year)
 
     async def _download_archive(self, url: str, temp_dir: str) -> str | None:
         """Download archive file to temporary directory.
@@ -168,7 +178,7 @@ class AlgerianMinistrySource(DataSource):
         """
         async with ClientSession(timeout=self.timeout, trust_env=True) as session:
             result: str | None = await self.downloader.download_archive(
-                session, url, temp_dir
+                session, url, temp_dir, downloads=self.downloads
             )
             return result
 
@@ -184,9 +194,15 @@ class AlgerianMinistrySource(DataSource):
         """
         return await self.extractor.extract_zip(archive_path, temp_dir)
 
-    def _process_pdf_files(self, extract_dir: str, year: int) -> list[dict[str, Any]]:
+    async def _process_pdf_files(
+        self, extract_dir: str, year: int
+    ) -> list[dict[str, Any]]:
         """Process PDF files to extract journal and publisher lists from the target year only.
 
+        Text is extracted in the sync's parse pool, one job per PDF. During a sync
+        the text is cached by the PDF's content hash, so PDFs that did not
+        change since the last sync are not parsed again.
+
         Args:
             extract_dir: Directory containing extracted files
             year: Year of the data
@@ -194,9 +210,72 @@ class AlgerianMinistrySource(DataSource):
         Returns:
             List of journal entries
         """
+        pdf_files = self._find_pdf_files(Path(extract_dir), year)
+        if not pdf_files:
+            return []
+
+        hashes = await asyncio.to_thread(
+            lambda: {pdf_file: _file_hash(pdf_file) for pdf_file, _ in pdf_files}
+        )
+        text_cache = self.downloads.cache
+        cached_texts = (
+            text_cache.get_extracted_texts(
+                self.get_name(), PDF_TEXT_EXTRACTOR, list(hashes.values())
+            )
+            if text_cache is not None
+            else {}
+        )
+        to_extract = [
+            pdf_file
+            for pdf_file, _ in pdf_files
+            if hashes[pdf_file] not in cached_texts
+        ]
+        extracted = await self._extract_pdf_texts(to_extract)
+
         all_entries = []
-        extract_path = Path(extract_dir)
+        texts: dict[str, str] = {}
+        for pdf_file, entry_type in pdf_files:
+            content_hash = hashes[pdf_file]
+            if content_hash in cached_texts:
+                text, elapsed, origin = cached_texts[content_hash], 0.0, "cached"
+            else:
+                result = extracted[pdf_file]
+                if isinstance(result, Exception):
+                    detail_logger.error(f"Error processing PDF {pdf_file}: {result}")
+                    status_logger.error(
+                        f"    {self.get_name()}: Error processing PDF "
+                        f"{pdf_file.name} - {result}"
+                    )
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                text, elapsed = result
+                origin = "extracted"
+
+            texts[content_hash] = text
+            entries = self.pdf_parser.parse_text(text, pdf_file, year, entry_type)
+            all_entries.extend(entries)
+            status_logger.info(
+                f"    {self.get_name()}: {pdf_file.name}: {len(entries)} "
+                f"{entry_type.value}s ({origin}, {elapsed:.1f}s)"
+            )
 
+        if text_cache is not None:
+            text_cache.store_extracted_texts(self.get_name(), PDF_TEXT_EXTRACTOR, texts)
+        return all_entries
+
+    def _find_pdf_files(
+        self, extract_path: Path, year: int
+    ) -> list[tuple[Path, EntryType]]:
+        """Find the journal and publisher list PDFs of the target year.
+
+        Args:
+            extract_path: Directory containing extracted files
+            year: Year of the data
+
+        Returns:
+            PDF files with the type of entries they list
+        """
         # Navigate to the actual year directory (may be nested)
         # The structure is often: extracted/2024/2024/2024/ for the current year
         possible_year_dirs = [
@@ -227,30 +306,50 @@ class AlgerianMinistrySource(DataSource):
             "Liste des éditeurs*.pdf",  # Publisher lists
         ]
 
+        pdf_files = []
         for pattern in target_patterns:
             for pdf_file in year_dir.glob(pattern):
-                try:
-                    detail_logger.info(f"Processing PDF: {pdf_file.name}")
-
-                    # Determine entry type based on filename
-                    entry_type = (
-                        EntryType.JOURNAL
-                        if (
-                            "revues" in pdf_file.name.lower()
-                            or "actualisation" in pdf_file.name.lower()
-                        )
-                        else EntryType.PUBLISHER
+                # Determine entry type based on filename
+                entry_type = (
+                    EntryType.JOURNAL
+                    if (
+                        "revues" in pdf_file.name.lower()
+                        or "actualisation" in pdf_file.name.lower()
                     )
+                    else EntryType.PUBLISHER
+                )
+                pdf_files.append((pdf_file, entry_type))
+        return pdf_files
 
-                    entries = self.pdf_parser.parse_pdf_file(pdf_file, year, entry_type)
-                    all_entries.extend(entries)
-                    detail_logger.info(
-                        f"Extracted {len(entries)} {entry_type.value}s from {pdf_file.name}"
-                    )
-                except Exception as e:
-                    detail_logger.error(f"Error processing PDF {pdf_file}: {e}")
-                    status_logger.error(
-                        f"    {self.get_name()}: Error processing PDF {pdf_file.name} - {e}"
-                    )
+    async def _extract_pdf_texts(
+        self, pdf_files: list[Path]
+    ) -> dict[Path, tuple[str, float] | BaseException]:
+        """Extract the text of PDF files in the parse pool.
 
-        return all_entries
+        Args:
+            pdf_files: PDF files to extract
+
+        Returns:
+            Dictionary mapping each PDF to its text and extraction time, or
+            to the exception its extraction raised
+        """
+        for pdf_file in pdf_files:
+            detail_logger.info(f"Processing PDF: {pdf_file.name}")
+
+        results = await asyncio.gather(
+            *[
+                self.parse_pool.run(extract_pdf_text_timed, pdf_file)
+                for pdf_file in pdf_files
+            ],
+            return_exceptions=True,
+        )
+        return dict(zip(pdf_files, results, strict=True))
+
+
+def _file_hash(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file's content."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
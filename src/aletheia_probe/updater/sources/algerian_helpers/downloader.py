@@ -12,6 +12,7 @@ from aiohttp import ClientError, ClientResponse, ClientSession, ServerTimeoutErr
 from aletheia_probe.config import get_config_manager
 from aletheia_probe.logging_config import get_detail_logger, get_status_logger
 from aletheia_probe.retry_utils import async_retry_with_backoff
+from aletheia_probe.updater.downloads import SourceDownloads
 
 
 detail_logger = get_detail_logger()
@@ -60,7 +61,11 @@ class ArchiveDownloader:
         ),
     )
     async def download_archive(
-        self, session: ClientSession, url: str, temp_dir: str
+        self,
+        session: ClientSession,
+        url: str,
+        temp_dir: str,
+        downloads: SourceDownloads | None = None,
     ) -> str | None:
         """Download archive file to temporary directory with retry logic.
 
@@ -70,6 +75,8 @@ class ArchiveDownloader:
             session: HTTP session
             url: URL of the archive file
             temp_dir: Temporary directory path
+            downloads: Tracker for conditional downloads; if the archive was
+                not modified, the cached copy is written to the directory
 
         Returns:
             Path to downloaded archive file, or None if download failed
@@ -80,6 +87,8 @@ class ArchiveDownloader:
             asyncio.TimeoutError: On persistent timeout errors
         """
         archive_path = Path(temp_dir) / f"algerian_{datetime.now().year}.zip"
+        downloads = downloads or SourceDownloads("algerian_ministry")
+        headers = downloads.conditional_headers(url)
 
         try:
             detail_logger.info(f"Algerian downloader: Starting download from {url}")
@@ -109,13 +118,14 @@ class ArchiveDownloader:
                     async with session.get(
                         url,
                         ssl=ssl_context,
+                        headers=headers,
                         timeout=300,  # 5 minutes for large files
                     ) as response:
                         detail_logger.info(
                             f"Algerian downloader: Got response {response.status}"
                         )
                         return await self._process_download_response(
-                            response, archive_path, url
+                            response, archive_path, url, downloads
                         )
                 else:
                     raise ssl.SSLError("SSL context creation failed")
@@ -192,13 +202,13 @@ class ArchiveDownloader:
                     "connection is not secure and vulnerable to MITM attacks"
                 )
                 async with session.get(
-                    url, ssl=False, timeout=300
+                    url, ssl=False, headers=headers, timeout=300
                 ) as response:  # 5 minutes for large files
                     detail_logger.info(
                         f"Algerian downloader: Got response {response.status} (no SSL)"
                     )
                     return await self._process_download_response(
-                        response, archive_path, url
+                        response, archive_path, url, downloads
                     )
 
         except (ClientError, ServerTimeoutError, asyncio.TimeoutError) as e:
@@ -217,7 +227,11 @@ class ArchiveDownloader:
             return None
 
     async def _process_download_response(
-        self, response: ClientResponse, archive_path: Path, url: str
+        self,
+        response: ClientResponse,
+        archive_path: Path,
+        url: str,
+        downloads: SourceDownloads,
     ) -> str | None:
         """Process HTTP response and download file content.
 
@@ -225,12 +239,22 @@ class ArchiveDownloader:
             response: aiohttp response object
             archive_path: Path where to save the downloaded file
             url: Source URL for logging
+            downloads: Tracker recording the downloaded archive
 
         Returns:
             Path to downloaded file or None if failed
         """
         response.raise_for_status()  # Raise for 4xx/5xx status codes
 
+        if response.status == 304:
+            detail_logger.info(
+                "Algerian downloader: Archive not modified, using cached copy"
+            )
+            body = downloads.accept(url, response.status, response.headers, b"")
+            async with aiofiles.open(archive_path, "wb") as f:
+                await f.write(body)
+            return str(archive_path)
+
         if response.status == 200:
             detail_logger.info(
                 f"Algerian downloader: Starting file write to {archive_path}"
@@ -257,6 +281,9 @@ class ArchiveDownloader:
                         )
                         last_log_mb = current_mb
 
+            async with aiofiles.open(archive_path, "rb") as f:
+                downloads.accept(url, response.status, response.headers, await f.read())
+
             detail_logger.info(
                 f"Algerian downloader: Successfully downloaded {bytes_written} bytes to {archive_path}"
             )
@@ -2,6 +2,7 @@
 """PDF parsing utilities for Algerian Ministry data."""
 
 import re
+import time
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +19,95 @@ from ....logging_config import get_detail_logger, get_status_logger
 detail_logger = get_detail_logger()
 status_logger = get_status_logger()
 
+# Identifies the text extraction in the extracted text cache; texts cached by
+# another pypdf version are extracted again
+PDF_TEXT_EXTRACTOR = f"pypdf-{pypdf.__version__}"
+
+
+def extract_pdf_text(pdf_path: Path) -> str:
+    """Extract the text of all pages of a PDF file.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        Text of the pages joined by newlines; empty if the PDF cannot be parsed
+
+    Raises:
+        ValueError: If the PDF file path is invalid or insecure
+        FileNotFoundError: If the PDF file does not exist
+        PermissionError: If the PDF file cannot be read
+    """
+    # Validate and resolve paths to prevent path traversal attacks
+    try:
+        pdf_file = pdf_path.resolve()
+    except (OSError, RuntimeError) as e:
+        detail_logger.error(f"Failed to resolve PDF path {pdf_path}: {e}")
+        raise ValueError(f"Invalid PDF file path: {pdf_path}") from e
+
+    # Security validations
+    if not pdf_file.exists():
+        detail_logger.error(f"PDF file does not exist: {pdf_file}")
+        raise FileNotFoundError(f"PDF file not found: {pdf_file}")
+
+    if not pdf_file.is_file():
+        detail_logger.error(f"PDF path is not a file: {pdf_file}")
+        raise ValueError(f"PDF path must be a file, not a directory: {pdf_file}")
+
+    if pdf_file.suffix.lower() != ".pdf":
+        detail_logger.error(f"Invalid file extension: {pdf_file}")
+        raise ValueError(
+            f"Invalid file extension: expected .pdf, got {pdf_file.suffix}"
+        )
+
+    # Process PDF file with specific exception handling
+    try:
+        with open(pdf_file, "rb") as file:
+            pdf_reader = pypdf.PdfReader(file)
+
+            # Extract text from all pages
+            text_parts = []
+            for page in pdf_reader.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    text_parts.append(page_text)
+
+            return "\n".join(text_parts)
+
+    except FileNotFoundError:
+        # Re-raise to caller (shouldn't happen after validation, but included for completeness)
+        raise
+    except PermissionError as e:
+        detail_logger.error(f"Permission denied reading PDF {pdf_file}: {e}")
+        raise
+    except (
+        pypdf.errors.PdfReadError,
+        pypdf.errors.EmptyFileError,
+        pypdf.errors.ParseError,
+    ) as e:
+        detail_logger.error(f"Failed to parse PDF {pdf_file}: {e}")
+        # Return no text for PDF parsing errors to allow processing to continue
+        return ""
+    except OSError as e:
+        detail_logger.error(f"I/O error reading PDF {pdf_file}: {e}")
+        raise
+
+
+def extract_pdf_text_timed(pdf_path: Path) -> tuple[str, float]:
+    """Extract the text of a PDF file and measure how long it took.
+
+    Module-level so that a ProcessPoolExecutor can pickle it by name.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        Tuple of (text, extraction time in seconds)
+    """
+    start = time.perf_counter()
+    text = extract_pdf_text(pdf_path)
+    return text, time.perf_counter() - start
+
 
 class PDFTextExtractor:
     """Extracts and parses text from PDF files."""
@@ -45,68 +135,30 @@ class PDFTextExtractor:
             FileNotFoundError: If the PDF file does not exist
             PermissionError: If the PDF file cannot be read
         """
-        entries = []
+        text = extract_pdf_text(pdf_path)
+        return self.parse_text(text, pdf_path.resolve(), year, entry_type)
 
-        # Validate and resolve paths to prevent path traversal attacks
-        try:
-            pdf_file = pdf_path.resolve()
-        except (OSError, RuntimeError) as e:
-            detail_logger.error(f"Failed to resolve PDF path {pdf_path}: {e}")
-            raise ValueError(f"Invalid PDF file path: {pdf_path}") from e
-
-        # Security validations
-        if not pdf_file.exists():
-            detail_logger.error(f"PDF file does not exist: {pdf_file}")
-            raise FileNotFoundError(f"PDF file not found: {pdf_file}")
-
-        if not pdf_file.is_file():
-            detail_logger.error(f"PDF path is not a file: {pdf_file}")
-            raise ValueError(f"PDF path must be a file, not a directory: {pdf_file}")
-
-        if pdf_file.suffix.lower() != ".pdf":
-            detail_logger.error(f"Invalid file extension: {pdf_file}")
-            raise ValueError(
-                f"Invalid file extension: expected .pdf, got {pdf_file.suffix}"
-            )
+    def parse_text(
+        self,
+        text: str,
+        pdf_path: Path,
+        year: int,
+        entry_type: EntryType = EntryType.JOURNAL,
+    ) -> list[dict[str, Any]]:
+        """Parse the extracted text of a PDF file into entries.
 
-        # Process PDF file with specific exception handling
-        try:
-            with open(pdf_file, "rb") as file:
-                pdf_reader = pypdf.PdfReader(file)
-
-                # Extract text from all pages
-                text_parts = []
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-
-                full_text = "\n".join(text_parts)
-
-                # Parse the extracted text for entries
-                entries = self._parse_entry_text(
-                    full_text, str(pdf_file), year, entry_type
-                )
-
-        except FileNotFoundError:
-            # Re-raise to caller (shouldn't happen after validation, but included for completeness)
-            raise
-        except PermissionError as e:
-            detail_logger.error(f"Permission denied reading PDF {pdf_file}: {e}")
-            raise
-        except (
-            pypdf.errors.PdfReadError,
-            pypdf.errors.EmptyFileError,
-            pypdf.errors.ParseError,
-        ) as e:
-            detail_logger.error(f"Failed to parse PDF {pdf_file}: {e}")
-            # Return empty list for PDF parsing errors to allow processing to continue
-            return []
-        except OSError as e:
-            detail_logger.error(f"I/O error reading PDF {pdf_file}: {e}")
-            raise
+        Args:
+            text: Text extracted with extract_pdf_text()
+            pdf_path: Path of the PDF file the text was extracted from
+            year: Year of the data
+            entry_type: Type of entry (EntryType.JOURNAL or EntryType.PUBLISHER)
 
-        return entries
+        Returns:
+            List of parsed entries
+        """
+        if not text:
+            return []
+        return self._parse_entry_text(text, str(pdf_path), year, entry_type)
 
     def _parse_entry_text(
         self,
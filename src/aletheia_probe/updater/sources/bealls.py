@@ -72,31 +72,43 @@ class BeallsListSource(DataSource):
     async def fetch_data(self) -> list[dict[str, Any]]:
         """Fetch Beall's list data from multiple sources.
 
+        Both pages are downloaded before parsing, so parsing is skipped when
+        neither changed since the last sync.
+
         Returns:
             list[dict[str, Any]]: A list of unique journal entries fetched from
                 the configured sources.
         """
         status_logger.info(f"    {self.get_name()}: Starting data fetch")
-        all_journals = []
+        pages: dict[str, tuple[str, str]] = {}
 
         async with ClientSession(timeout=self.timeout, trust_env=True) as session:
             # Try each source
             for source_name, url in self.sources.items():
                 try:
                     detail_logger.info(f"Fetching data from {source_name}: {url}")
-                    journals = await self._fetch_from_source(session, url, source_name)
-                    all_journals.extend(journals)
-                    detail_logger.info(
-                        f"Successfully fetched {len(journals)} entries from {source_name}"
-                    )
-                    status_logger.info(
-                        f"    {self.get_name()}: Retrieved {len(journals)} entries from {source_name}"
-                    )
+                    html_content = await self._fetch_from_source(session, url)
+                    if html_content is not None:
+                        pages[source_name] = (url, html_content)
                 except (ClientError, asyncio.TimeoutError) as e:
                     status_logger.error(
                         f"    {self.get_name()}: Failed to fetch from {source_name} - {e}"
                     )
 
+        if self.downloads.unchanged:
+            return []
+
+        all_journals = []
+        for source_name, (url, html_content) in pages.items():
+            journals = self.parser.parse_beallslist_html(html_content, url)
+            all_journals.extend(journals)
+            detail_logger.info(
+                f"Successfully fetched {len(journals)} entries from {source_name}"
+            )
+            status_logger.info(
+                f"    {self.get_name()}: Retrieved {len(journals)} entries from {source_name}"
+            )
+
         # Remove duplicates based on normalized name
         unique_journals = deduplicate_journals(all_journals)
         detail_logger.info(
@@ -108,32 +120,25 @@ class BeallsListSource(DataSource):
 
         return unique_journals
 
-    async def _fetch_from_source(
-        self, session: ClientSession, url: str, source_name: str
-    ) -> list[dict[str, Any]]:
-        """Fetch journal data from a specific source.
+    async def _fetch_from_source(self, session: ClientSession, url: str) -> str | None:
+        """Download the HTML page of a specific source.
 
         Args:
             session (ClientSession): The aiohttp client session to use for the request.
             url (str): The URL to fetch data from.
-            source_name (str): The name of the source (e.g., 'beallslist_publishers').
 
         Returns:
-            list[dict[str, Any]]: A list of journal data dictionaries.
+            str | None: The page HTML, or None if it could not be downloaded.
         """
-        journals = []
-
         try:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    html_content = await response.text()
-                    journals = self.parser.parse_beallslist_html(html_content, url)
-
-                else:
-                    detail_logger.warning(f"HTTP {response.status} from {url}")
-                    status_logger.warning(
-                        f"    {self.get_name()}: HTTP {response.status} from {url}"
-                    )
+            download = await self.downloads.get(session, url)
+            if download.ok:
+                return download.text()
+
+            detail_logger.warning(f"HTTP {download.status} from {url}")
+            status_logger.warning(
+                f"    {self.get_name()}: HTTP {download.status} from {url}"
+            )
 
         except asyncio.TimeoutError:
             detail_logger.error(f"Timeout fetching from {url}")
@@ -142,4 +147,4 @@ class BeallsListSource(DataSource):
             detail_logger.error(f"Error fetching from {url}: {e}")
             status_logger.error(f"    {self.get_name()}: Error - {e}")
 
-        return journals
+        return None
@@ -5,8 +5,8 @@ import asyncio
 import math
 import re
 import ssl
-import urllib.request
 from datetime import datetime
+from email.message import Message
 from html import unescape
 from typing import Any
 from urllib.error import URLError
@@ -18,6 +18,8 @@ from ...enums import AssessmentType
 from ...logging_config import get_detail_logger, get_status_logger
 from ...normalizer import input_normalizer
 from ..core import DataSource
+from ..downloads import open_url
+from ..pagination import fetch_paginated
 from ..utils import deduplicate_journals
 
 
@@ -28,8 +30,6 @@ DEFAULT_TIMEOUT_SECONDS = 30
 DEFAULT_UPDATE_INTERVAL_DAYS = 30
 DEFAULT_PAGE_SIZE = 50
 DEFAULT_MAX_PAGES = 200
-DEFAULT_MAX_FETCH_RETRIES = 3
-DEFAULT_RETRY_BASE_DELAY_SECONDS = 1.0
 
 _VALID_LEGITIMATE_RANKS = {
     "A*",
@@ -79,32 +79,17 @@ class _CorePortalSourceBase(DataSource):
         """Fetch all portal pages and parse ranked venue entries."""
         status_logger.info(f"    {self.get_name()}: Starting data fetch")
 
-        all_entries: list[dict[str, Any]] = []
-        total_results: int | None = None
-
-        page = 1
-        while page <= DEFAULT_MAX_PAGES:
-            html_content = await self._fetch_page(page)
-            if not html_content:
-                break
-
-            if total_results is None:
-                total_results = self._extract_total_results(html_content)
-
-            page_entries = self._parse_entries(html_content)
-            if not page_entries:
-                break
-
-            all_entries.extend(page_entries)
-
-            if total_results is None:
-                page += 1
-                continue
-
-            total_pages = math.ceil(total_results / DEFAULT_PAGE_SIZE)
-            if page >= total_pages:
-                break
-            page += 1
+        result = await fetch_paginated(
+            self._fetch_page,
+            lambda _page, html_content: self._parse_entries(html_content),
+            self._count_pages,
+            max_pages=DEFAULT_MAX_PAGES,
+            source_name=self.get_name(),
+        )
+        result.raise_for_failed_pages(self.get_name())
+        if self.downloads.unchanged:
+            return []
+        all_entries = result.entries
 
         deduplicated_entries = deduplicate_journals(all_entries)
         status_logger.info(
@@ -116,7 +101,7 @@ class _CorePortalSourceBase(DataSource):
         return deduplicated_entries
 
     async def _fetch_page(self, page: int) -> str:
-        """Fetch one portal results page via urllib with retries."""
+        """Fetch one portal results page via urllib."""
         params = {
             "search": "",
             "by": "all",
@@ -126,28 +111,26 @@ class _CorePortalSourceBase(DataSource):
         }
         query = urlencode(params)
         url = f"{self.portal_url}?{query}"
-        for attempt in range(1, DEFAULT_MAX_FETCH_RETRIES + 1):
-            try:
-                return await asyncio.to_thread(self._fetch_page_once, url)
-            except (URLError, TimeoutError, OSError) as e:
-                if attempt >= DEFAULT_MAX_FETCH_RETRIES:
-                    status_logger.warning(
-                        f"    {self.get_name()}: Page {page} request failed after "
-                        f"{DEFAULT_MAX_FETCH_RETRIES} attempts - "
-                        f"{type(e).__name__}: {e!r}"
-                    )
-                    return ""
-
-                status_logger.warning(
-                    f"    {self.get_name()}: Page {page} attempt {attempt}/"
-                    f"{DEFAULT_MAX_FETCH_RETRIES} failed - {type(e).__name__}. Retrying..."
-                )
-                await asyncio.sleep(DEFAULT_RETRY_BASE_DELAY_SECONDS * attempt)
+        headers = self.downloads.conditional_headers(url)
+        status, response_headers, body = await asyncio.to_thread(
+            self._fetch_page_once, url, headers
+        )
+        content = self.downloads.accept(url, status, response_headers, body)
+        return content.decode("utf-8", errors="ignore")
 
-        return ""
+    def _count_pages(
+        self, html_content: str, _entries: list[dict[str, Any]]
+    ) -> int | None:
+        """Derive the portal page count from the first page summary line."""
+        total_results = self._extract_total_results(html_content)
+        if total_results is None:
+            return None
+        return math.ceil(total_results / DEFAULT_PAGE_SIZE)
 
-    def _fetch_page_once(self, url: str) -> str:
-        """Perform one blocking HTTPS fetch and return UTF-8 decoded body."""
+    def _fetch_page_once(
+        self, url: str, headers: dict[str, str]
+    ) -> tuple[int, Message, bytes]:
+        """Perform one blocking HTTPS fetch and return status, headers and body."""
         parsed_url = urlparse(url)
         base_host = urlparse(self.portal_url).hostname
 
@@ -159,14 +142,12 @@ class _CorePortalSourceBase(DataSource):
             raise URLError("CORE source URL host does not match configured portal")
 
         ssl_ctx = ssl.create_default_context()
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(  # nosec B310 - scheme validated as https above
-            req, timeout=DEFAULT_TIMEOUT_SECONDS, context=ssl_ctx
-        ) as response:
-            if response.status != 200:
-                raise URLError(f"HTTP {response.status}")
-            content: bytes = response.read()
-        return content.decode("utf-8", errors="ignore")
+        status, response_headers, body = open_url(
+            url, headers, DEFAULT_TIMEOUT_SECONDS, ssl_ctx
+        )
+        if status not in (200, 304):
+            raise URLError(f"HTTP {status}")
+        return status, response_headers, body
 
     @staticmethod
     def _extract_total_results(html_content: str) -> int | None:
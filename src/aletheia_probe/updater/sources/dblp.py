@@ -1,20 +1,24 @@
 # SPDX-License-Identifier: MIT
 """DBLP conference data source using locally cached XML dump."""
 
-import asyncio
 import gzip
 import html.entities
-import io
 import re
 import tempfile
+from collections.abc import AsyncIterator, Iterator
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from xml.parsers import expat
 
 from aiohttp import ClientSession, ClientTimeout
-from defusedxml import ElementTree as DefusedET
-from defusedxml.common import DefusedXmlException
+from defusedxml.common import (
+    DefusedXmlException,
+    EntitiesForbidden,
+    ExternalReferenceForbidden,
+)
 
 from ...cache import DataSourceManager
 from ...config import get_config_manager
@@ -36,14 +40,52 @@ DEFAULT_SOCKET_READ_TIMEOUT_SECONDS = 900
 DEFAULT_CONNECT_TIMEOUT_SECONDS = 30
 DEFAULT_PARSE_PROGRESS_STEP_BYTES = 100 * 1024 * 1024  # 100 MiB
 DEFAULT_PARSE_PROGRESS_STEP_RECORDS = 200_000
+DEFAULT_PARSE_CHUNK_SIZE = 1024 * 1024  # 1 MiB of uncompressed XML
+# Venue entries handed to the DB writer at a time
+DEFAULT_ENTRY_CHUNK_SIZE = 10_000
 
 CONFERENCE_KEY_PREFIX = "conf/"
 JOURNAL_KEY_PREFIX = "journals/"
 PROCEEDINGS_TAG = "proceedings"
 INPROCEEDINGS_TAG = "inproceedings"
 ARTICLE_TAG = "article"
-_NAMED_ENTITY_PATTERN = re.compile(r"&([A-Za-z][A-Za-z0-9]+);")
+
+# Children of <dblp> declared by dblp.dtd; each starts a new record
+_DBLP_RECORD_TAGS = frozenset(
+    {
+        "article",
+        "inproceedings",
+        "proceedings",
+        "book",
+        "incollection",
+        "phdthesis",
+        "mastersthesis",
+        "www",
+        "person",
+        "data",
+    }
+)
+
+# Key prefix and the child fields the venue aggregation reads, per record tag
+_RECORD_KEY_PREFIXES = {
+    PROCEEDINGS_TAG: CONFERENCE_KEY_PREFIX,
+    INPROCEEDINGS_TAG: CONFERENCE_KEY_PREFIX,
+    ARTICLE_TAG: JOURNAL_KEY_PREFIX,
+}
+_RECORD_FIELDS = {
+    PROCEEDINGS_TAG: frozenset({"year", "booktitle", "title"}),
+    INPROCEEDINGS_TAG: frozenset({"year", "booktitle"}),
+    ARTICLE_TAG: frozenset({"year", "journal", "issn"}),
+}
+
+# dblp.dtd declares the HTML 4 character entities. They are declared from
+# this map in place of loading the DTD; XML's own entities are predefined.
 _XML_CORE_ENTITIES = {"amp", "lt", "gt", "apos", "quot"}
+_DTD_ENTITY_DECLARATIONS = "".join(
+    f'<!ENTITY {name} "&#{codepoint};">'
+    for name, codepoint in html.entities.name2codepoint.items()
+    if name not in _XML_CORE_ENTITIES
+).encode("ascii")
 
 
 @dataclass
@@ -130,43 +172,71 @@ class DblpVenueSource(DataSource):
 
     async def fetch_data(self) -> list[dict[str, Any]]:
         """Download DBLP dump and extract venue series entries."""
+        return [entry async for chunk in self.fetch_chunks() for entry in chunk]
+
+    async def fetch_chunks(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Download DBLP dump and stream its venue series entries in chunks.
+
+        Yields:
+            Lists of venue entries; entries sharing a normalized name are
+            in the same chunk.
+        """
         self.data_dir.mkdir(parents=True, exist_ok=True)
         if self.dump_path.exists():
             status_logger.info(
                 f"    {self.get_name()}: Local dump found, skipping download"
             )
-        journals = await self._load_or_refresh_dump_data()
+        entry_count = 0
+        async for chunk in self._load_or_refresh_dump_chunks():
+            entry_count += len(chunk)
+            yield chunk
         status_logger.info(
-            f"    {self.get_name()}: Extracted {len(journals):,} venue entries"
+            f"    {self.get_name()}: Extracted {entry_count:,} venue entries"
         )
-        return journals
 
-    async def _load_or_refresh_dump_data(self) -> list[dict[str, Any]]:
-        """Load venue data from local dump, refreshing only on missing/corrupt files."""
+    async def _load_or_refresh_dump_chunks(
+        self,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Load venue data from local dump, refreshing only on missing/corrupt files.
+
+        The dump is scanned in full before the first chunk arrives, so an
+        invalid dump is detected before any entry was handed out.
+        """
         if self.dump_path.exists():
             status_logger.info(
                 f"    {self.get_name()}: Using existing local dump {self.dump_path}"
             )
-            try:
-                status_logger.info(f"    {self.get_name()}: Parsing local XML dump...")
-                return await asyncio.to_thread(self._parse_dump_file)
-            except (
-                DefusedET.ParseError,
-                DefusedXmlException,
-                OSError,
-                EOFError,
-                gzip.BadGzipFile,
-            ) as e:
-                status_logger.warning(
-                    "    "
-                    f"{self.get_name()}: Existing dump invalid ({e}); "
-                    "re-downloading"
-                )
-                detail_logger.exception("Failed to parse existing DBLP dump")
+            status_logger.info(f"    {self.get_name()}: Parsing local XML dump...")
+            async with aclosing(
+                self.parse_pool.stream(self._iter_dump_chunks)
+            ) as chunks:
+                try:
+                    first_chunk = await anext(chunks, None)
+                except (
+                    expat.ExpatError,
+                    DefusedXmlException,
+                    OSError,
+                    EOFError,
+                    gzip.BadGzipFile,
+                ) as e:
+                    status_logger.warning(
+                        "    "
+                        f"{self.get_name()}: Existing dump invalid ({e}); "
+                        "re-downloading"
+                    )
+                    detail_logger.exception("Failed to parse existing DBLP dump")
+                else:
+                    if first_chunk is not None:
+                        yield first_chunk
+                    async for chunk in chunks:
+                        yield chunk
+                    return
 
         await self._download_dump()
         status_logger.info(f"    {self.get_name()}: Parsing local XML dump...")
-        return await asyncio.to_thread(self._parse_dump_file)
+        async with aclosing(self.parse_pool.stream(self._iter_dump_chunks)) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
     async def _download_dump(self) -> None:
         """Download DBLP XML dump to local cache path."""
@@ -220,6 +290,27 @@ class DblpVenueSource(DataSource):
             if tmp_path.exists():
                 tmp_path.unlink(missing_ok=True)
 
+    def _iter_dump_chunks(self) -> Iterator[list[dict[str, Any]]]:
+        """Parse the local dump and yield its entries in chunks.
+
+        Entries are ordered by normalized name and a chunk only ends between
+        two names, so duplicates are merged within one DB write.
+        """
+        entries = sorted(
+            self._parse_dump_file(), key=lambda entry: entry["normalized_name"]
+        )
+        chunk: list[dict[str, Any]] = []
+        for entry in entries:
+            if (
+                len(chunk) >= DEFAULT_ENTRY_CHUNK_SIZE
+                and entry["normalized_name"] != chunk[-1]["normalized_name"]
+            ):
+                yield chunk
+                chunk = []
+            chunk.append(entry)
+        if chunk:
+            yield chunk
+
     def _parse_dump_file(self) -> list[dict[str, Any]]:
         """Parse local DBLP XML dump and build conference and journal entries."""
         series_map: dict[str, _ConferenceSeriesAggregate] = {}
@@ -228,16 +319,33 @@ class DblpVenueSource(DataSource):
         next_record_log = DEFAULT_PARSE_PROGRESS_STEP_RECORDS
         total_compressed_bytes = self.dump_path.stat().st_size
         next_byte_log = DEFAULT_PARSE_PROGRESS_STEP_BYTES
+        scanner = _DblpRecordScanner()
 
         with open(self.dump_path, "rb") as raw_file:
             with gzip.GzipFile(fileobj=raw_file, mode="rb") as gz_file:
-                text_stream = io.TextIOWrapper(
-                    gz_file, encoding="utf-8", errors="ignore"
-                )
-                sanitized_reader = _NamedEntitySanitizingReader(text_stream)
-                for _event, elem in DefusedET.iterparse(
-                    sanitized_reader, events=("end",)
-                ):
+                while True:
+                    chunk = gz_file.read(DEFAULT_PARSE_CHUNK_SIZE)
+                    for record in scanner.feed(chunk, final=not chunk):
+                        if record.tag == ARTICLE_TAG:
+                            self._accumulate_journal_entry(
+                                journal_map, record.key, record.fields
+                            )
+                        else:
+                            self._accumulate_conference_entry(
+                                series_map, record.key, record.tag, record.fields
+                            )
+                        processed_records += 1
+
+                        if processed_records >= next_record_log:
+                            status_logger.info(
+                                "    "
+                                f"{self.get_name()}: Parsed "
+                                f"{processed_records:,} records..."
+                            )
+                            next_record_log += DEFAULT_PARSE_PROGRESS_STEP_RECORDS
+                    if not chunk:
+                        break
+
                     compressed_pos = raw_file.tell()
                     if compressed_pos >= next_byte_log:
                         percent = (
@@ -254,35 +362,6 @@ class DblpVenueSource(DataSource):
                         )
                         next_byte_log += DEFAULT_PARSE_PROGRESS_STEP_BYTES
 
-                    tag = elem.tag
-                    key = elem.attrib.get("key", "")
-                    if tag in (PROCEEDINGS_TAG, INPROCEEDINGS_TAG):
-                        if not key.startswith(CONFERENCE_KEY_PREFIX):
-                            elem.clear()
-                            continue
-
-                        self._accumulate_conference_entry(series_map, key, tag, elem)
-                        processed_records += 1
-                    elif tag == ARTICLE_TAG:
-                        if not key.startswith(JOURNAL_KEY_PREFIX):
-                            elem.clear()
-                            continue
-
-                        self._accumulate_journal_entry(journal_map, key, elem)
-                        processed_records += 1
-                    else:
-                        continue
-
-                    if processed_records >= next_record_log:
-                        status_logger.info(
-                            "    "
-                            f"{self.get_name()}: Parsed "
-                            f"{processed_records:,} records..."
-                        )
-                        next_record_log += DEFAULT_PARSE_PROGRESS_STEP_RECORDS
-
-                    elem.clear()
-
         status_logger.info(
             "    "
             f"{self.get_name()}: XML scan complete "
@@ -301,7 +380,7 @@ class DblpVenueSource(DataSource):
         series_map: dict[str, _ConferenceSeriesAggregate],
         key: str,
         tag: str,
-        elem: Any,
+        fields: dict[str, str],
     ) -> None:
         """Accumulate one conference entry into aggregate map."""
         series_slug = self._extract_series_slug(key, CONFERENCE_KEY_PREFIX)
@@ -313,18 +392,18 @@ class DblpVenueSource(DataSource):
         )
         aggregate.entry_count += 1
 
-        year_value = self._parse_year(elem.findtext("year"))
+        year_value = self._parse_year(fields.get("year"))
         if year_value is not None:
             aggregate.years.add(year_value)
 
         # Keep memory bounded: capture only a small number of stable series names.
-        booktitle = self._clean_text(elem.findtext("booktitle"))
+        booktitle = self._clean_text(fields.get("booktitle"))
         self._update_preferred_names(aggregate, booktitle)
 
         # Proceedings titles can contain useful series aliases; paper titles do not.
         if tag == PROCEEDINGS_TAG:
             title_hint = self._extract_title_series_hint(
-                self._clean_text(elem.findtext("title"))
+                self._clean_text(fields.get("title"))
             )
             self._update_preferred_names(aggregate, title_hint)
 
@@ -332,7 +411,7 @@ class DblpVenueSource(DataSource):
         self,
         journal_map: dict[str, _JournalSeriesAggregate],
         key: str,
-        elem: Any,
+        fields: dict[str, str],
     ) -> None:
         """Accumulate one journal article entry into aggregate map."""
         series_slug = self._extract_series_slug(key, JOURNAL_KEY_PREFIX)
@@ -344,15 +423,15 @@ class DblpVenueSource(DataSource):
         )
         aggregate.entry_count += 1
 
-        year_value = self._parse_year(elem.findtext("year"))
+        year_value = self._parse_year(fields.get("year"))
         if year_value is not None:
             aggregate.years.add(year_value)
 
         # Journal field is stable series metadata; article titles are high-cardinality.
-        journal_name = self._clean_text(elem.findtext("journal"))
+        journal_name = self._clean_text(fields.get("journal"))
         self._update_preferred_names(aggregate, journal_name)
 
-        issn_value = self._normalize_issn(self._clean_text(elem.findtext("issn")))
+        issn_value = self._normalize_issn(self._clean_text(fields.get("issn")))
         if issn_value:
             aggregate.issn_values.add(issn_value)
 
@@ -578,46 +657,130 @@ class DblpVenueSource(DataSource):
         return f"{compact[:4]}-{compact[4:].upper()}"
 
 
-class _NamedEntitySanitizingReader:
-    """File-like wrapper that decodes named HTML entities safely for XML parsing."""
-
-    def __init__(self, wrapped: Any) -> None:
-        self._wrapped = wrapped
-        self._carry = ""
-
-    def read(self, size: int = -1) -> str:
-        """Read text and decode named entities while preserving XML core entities."""
-        chunk = self._wrapped.read(size)
-        if chunk == "":
-            data = self._carry
-            self._carry = ""
-            return self._decode_named_entities(data)
-
-        data = self._carry + chunk
-        main, self._carry = self._split_incomplete_entity_tail(data)
-        return self._decode_named_entities(main)
-
-    def _split_incomplete_entity_tail(self, data: str) -> tuple[str, str]:
-        """Keep incomplete trailing entity text for the next read call."""
-        last_amp = data.rfind("&")
-        if last_amp == -1:
-            return data, ""
-
-        trailing = data[last_amp:]
-        if ";" in trailing:
-            return data, ""
-
-        return data[:last_amp], trailing
+@dataclass
+class _DblpRecord:
+    """Venue record of the DBLP dump with the child fields that are read."""
+
+    tag: str
+    key: str
+    fields: dict[str, str] = field(default_factory=dict)
+
+
+class _DblpRecordScanner:
+    """Streaming expat scanner for the venue records of a DBLP dump.
+
+    No element tree is built: only ``proceedings``/``inproceedings`` records
+    with ``conf/`` keys and ``article`` records with ``journals/`` keys are
+    tracked, and of those only the children listed in _RECORD_FIELDS are
+    captured, so memory does not grow with the dump.
+
+    Python handlers cost more than expat itself, so only the start-element
+    handler runs for every element. A record ends where the next one starts
+    (or at the end of the dump), and the text and end-element handlers are
+    attached only while a captured field is open.
+
+    Named entities are resolved from _DTD_ENTITY_DECLARATIONS; entity
+    declarations in the dump itself are rejected, as defusedxml does.
+    """
+
+    def __init__(self) -> None:
+        self._records: list[_DblpRecord] = []
+        self._record: _DblpRecord | None = None
+        self._record_fields: frozenset[str] = frozenset()
+        self._field: str | None = None
+        self._text: list[str] = []
+
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        # Declare the entities from the map whether or not the dump
+        # references dblp.dtd
+        parser.UseForeignDTD(True)
+        parser.SetParamEntityParsing(expat.XML_PARAM_ENTITY_PARSING_UNLESS_STANDALONE)
+        parser.ExternalEntityRefHandler = self._declare_entities
+        parser.EntityDeclHandler = _forbid_entity_declaration
+        parser.StartElementHandler = self._start_element
+        parser.SkippedEntityHandler = self._skipped_entity
+        self._parser = parser
+
+    def feed(self, data: bytes, final: bool = False) -> list[_DblpRecord]:
+        """Parse the next part of the dump.
 
-    def _decode_named_entities(self, text: str) -> str:
-        """Decode HTML named entities except XML core entities."""
+        Args:
+            data: Next bytes of the XML document
+            final: Whether this is the end of the document
 
-        def replacer(match: re.Match[str]) -> str:
-            entity_name = match.group(1)
-            if entity_name in _XML_CORE_ENTITIES:
-                return match.group(0)
+        Returns:
+            Records completed by this part, in document order.
 
-            decoded = html.unescape(match.group(0))
-            return decoded if decoded != match.group(0) else " "
+        Raises:
+            ExpatError: If the XML is malformed.
+            DefusedXmlException: If the dump declares entities.
+        """
+        self._parser.Parse(data, final)
+        if final:
+            self._finish_record()
+        records, self._records = self._records, []
+        return records
 
-        return _NAMED_ENTITY_PATTERN.sub(replacer, text)
+    def _declare_entities(
+        self,
+        context: str | None,
+        base: str | None,
+        system_id: str | None,
+        public_id: str | None,
+    ) -> int:
+        if context is not None:
+            raise ExternalReferenceForbidden(context, base, system_id, public_id)
+        dtd_parser = self._parser.ExternalEntityParserCreate(None)
+        dtd_parser.EntityDeclHandler = None
+        dtd_parser.Parse(_DTD_ENTITY_DECLARATIONS, True)
+        return 1
+
+    def _start_element(self, name: str, attributes: dict[str, str]) -> None:
+        if name in self._record_fields:
+            assert self._record is not None  # fields are only set in a record
+            # Like findtext(), the first occurrence of a field counts
+            if self._field is None and name not in self._record.fields:
+                self._field = name
+                self._parser.CharacterDataHandler = self._text.append
+                self._parser.EndElementHandler = self._end_field
+        elif name in _DBLP_RECORD_TAGS:
+            self._finish_record()
+            prefix = _RECORD_KEY_PREFIXES.get(name)
+            key = attributes.get("key", "")
+            if prefix is not None and key.startswith(prefix):
+                self._record = _DblpRecord(name, key)
+                self._record_fields = _RECORD_FIELDS[name]
+
+    def _end_field(self, name: str) -> None:
+        # Also called for markup nested in the field, e.g. <i> in titles
+        if name == self._field:
+            assert self._record is not None  # fields are only set in a record
+            self._record.fields[name] = "".join(self._text)
+            self._text.clear()
+            self._field = None
+            self._parser.CharacterDataHandler = None
+            self._parser.EndElementHandler = None
+
+    def _finish_record(self) -> None:
+        if self._record is not None:
+            self._records.append(self._record)
+            self._record = None
+            self._record_fields = frozenset()
+
+    def _skipped_entity(self, name: str, is_parameter_entity: bool) -> None:
+        # Entities missing from the map read as a space
+        if self._field is not None:
+            self._text.append(" ")
+
+
+def _forbid_entity_declaration(
+    name: str,
+    is_parameter_entity: bool,
+    value: str | None,
+    base: str | None,
+    system_id: str | None,
+    public_id: str | None,
+    notation_name: str | None,
+) -> None:
+    raise EntitiesForbidden(name, value, base, system_id, public_id, notation_name)
@@ -1,7 +1,6 @@
 # SPDX-License-Identifier: MIT
 """DOAJ (Directory of Open Access Journals) data source (optional user-provided CSV)."""
 
-import asyncio
 import csv
 import glob
 from datetime import datetime
@@ -176,7 +175,7 @@ class DOAJSource(DataSource):
         )
 
         try:
-            journals = await asyncio.to_thread(self._parse_csv)
+            journals = await self.parse_pool.run(self._parse_csv)
             status_logger.info(
                 f"    {self.get_name()}: Processed {len(journals)} journals"
             )
@@ -188,7 +187,7 @@ class DOAJSource(DataSource):
             return []
 
     def _parse_csv(self) -> list[dict[str, Any]]:
-        """Parse the DOAJ CSV file synchronously (called via asyncio.to_thread)."""
+        """Parse the DOAJ CSV file synchronously (run in the parse pool)."""
         assert self.file_path is not None
         journals = []
         with open(self.file_path, newline="", encoding="utf-8-sig") as fh:
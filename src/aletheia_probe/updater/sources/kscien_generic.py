@@ -111,12 +111,16 @@ class KscienGenericSource(DataSource):
                     self.base_url,
                     self.max_pages,
                     self.get_name,
+                    downloads=self.downloads,
                 )
                 all_publications.extend(publications)
                 status_logger.info(
                     f"    {self.get_name()}: Retrieved {len(publications)} raw entries"
                 )
 
+            if self.downloads.unchanged:
+                return []
+
             # Remove duplicates based on normalized name
             unique_publications = deduplicate_entries(all_publications)
             detail_logger.info(
@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: MIT
 """Shared utility functions for fetching and parsing data from Kscien.org."""
 
-import asyncio
+import math
 import re
 from collections.abc import Callable
 from datetime import datetime
@@ -13,6 +13,8 @@ from aiohttp import ClientSession
 from ...enums import AssessmentType
 from ...logging_config import get_detail_logger, get_status_logger
 from ...normalizer import input_normalizer
+from ..downloads import SourceDownloads
+from ..pagination import PageFetchError, PageFetchPolicy, fetch_paginated
 
 
 # Maximum reasonable count for an individual Kscien publication type.
@@ -40,107 +42,99 @@ async def fetch_kscien_data(
     base_url: str,
     max_pages: int,
     get_name: Callable[[], str],
+    policy: PageFetchPolicy | None = None,
+    downloads: SourceDownloads | None = None,
 ) -> list[dict[str, Any]]:
     """Fetch publications from Kscien.org with pagination support.
 
+    Once the first page reports the expected count, the remaining pages are
+    fetched concurrently; see :func:`fetch_paginated`.
+
     Args:
         session: The aiohttp ClientSession to use for requests.
         publication_type: The type of publication to fetch.
         base_url: The base URL to start fetching from.
         max_pages: The maximum number of pages to fetch.
         get_name: A callback function to get the name of the caller for logging.
+        policy: Page fetch limits; defaults to the configured policy.
+        downloads: Tracker for conditional page downloads; pages are fetched
+            unconditionally without one.
 
     Returns:
         A list of dictionaries, where each dictionary represents a fetched publication
         containing details such as journal name, source, and metadata.
+
+    Raises:
+        IncompletePaginationError: If pages could not be fetched, so that the
+            stored publications are kept instead of a partial list
     """
-    all_publications = []
-    page = 1
     expected_count = None
+    page_downloads = downloads or SourceDownloads(get_name())
 
-    while page <= max_pages:
-        try:
-            # Construct URL for specific page
-            if page == 1:
-                url = base_url
-            else:
-                # Kscien pagination requires BOTH _publishing_list and _pagination parameters
-                url = f"https://kscien.org/predatory-publishing/?_publishing_list={publication_type.value}&_pagination={page}"
-
-            detail_logger.debug(
-                f"Fetching Kscien {publication_type} page {page}: {url}"
-            )
-
-            async with session.get(url) as response:
-                if response.status != 200:
-                    detail_logger.warning(f"HTTP {response.status} from {url}")
-                    status_logger.warning(
-                        f"    {get_name()}: HTTP {response.status} from page {page}"
-                    )
-                    break
-
-                html_content = await response.text()
-
-                # Extract expected count from first page
-                if page == 1:
-                    expected_count = _extract_expected_count(
-                        html_content, publication_type
-                    )
-                    if expected_count:
-                        detail_logger.info(
-                            f"Expecting {expected_count} total {publication_type} entries"
-                        )
-
-                page_publications = _parse_kscien_page(
-                    html_content, page, publication_type
-                )
-
-                if not page_publications:
-                    detail_logger.info(
-                        f"No {publication_type} found on page {page}, stopping pagination"
-                    )
-                    break
-
-                all_publications.extend(page_publications)
-                detail_logger.debug(
-                    f"Found {len(page_publications)} {publication_type} on page {page}"
-                )
+    async def fetch_page(page: int) -> str:
+        if page == 1:
+            url = base_url
+        else:
+            # Kscien pagination requires BOTH _publishing_list and _pagination parameters
+            url = f"https://kscien.org/predatory-publishing/?_publishing_list={publication_type.value}&_pagination={page}"
 
-                # Check if there's a next page
-                if not _has_next_page(
-                    html_content, page, expected_count, len(all_publications)
-                ):
-                    detail_logger.info(f"Reached last page at page {page}")
-                    break
+        detail_logger.debug(f"Fetching Kscien {publication_type} page {page}: {url}")
 
-            page += 1
+        download = await page_downloads.get(session, url)
+        if not download.ok:
+            detail_logger.warning(f"HTTP {download.status} from {url}")
+            raise PageFetchError(
+                f"HTTP {download.status}",
+                retryable=download.status == 429 or download.status >= 500,
+            )
+        return download.text()
 
-            # Small delay to be respectful to the server
-            await asyncio.sleep(0.5)
+    def parse_page(page: int, html_content: str) -> list[dict[str, Any]]:
+        page_publications = _parse_kscien_page(html_content, page, publication_type)
+        detail_logger.debug(
+            f"Found {len(page_publications)} {publication_type} on page {page}"
+        )
+        return page_publications
 
-        except Exception as e:
-            detail_logger.error(
-                f"Error fetching Kscien {publication_type} page {page}: {e}"
-            )
-            status_logger.error(f"    {get_name()}: Error fetching page {page} - {e}")
-            break
+    def count_pages(html_content: str, first_page: list[dict[str, Any]]) -> int | None:
+        nonlocal expected_count
+        expected_count = _extract_expected_count(html_content, publication_type)
+        if not expected_count:
+            return None
+        detail_logger.info(
+            f"Expecting {expected_count} total {publication_type} entries"
+        )
+        # The first page is full unless it is also the last one
+        return math.ceil(expected_count / len(first_page))
+
+    result = await fetch_paginated(
+        fetch_page,
+        parse_page,
+        count_pages,
+        max_pages=max_pages,
+        source_name=get_name(),
+        policy=policy,
+    )
+    result.raise_for_failed_pages(get_name())
+    all_publications = result.entries
+    pages_fetched = result.pages_fetched
 
     actual_count = len(all_publications)
     if expected_count:
         if actual_count == expected_count:
             detail_logger.info(
-                f"✅ Successfully fetched {actual_count}/{expected_count} {publication_type} from Kscien across {page - 1} pages"
+                f"✅ Successfully fetched {actual_count}/{expected_count} {publication_type} from Kscien across {pages_fetched} pages"
             )
         else:
             detail_logger.warning(
-                f"⚠️ Count mismatch: fetched {actual_count} but expected {expected_count} {publication_type} (across {page - 1} pages)"
+                f"⚠️ Count mismatch: fetched {actual_count} but expected {expected_count} {publication_type} (across {pages_fetched} pages)"
             )
             status_logger.warning(
                 f"    {get_name()}: Count mismatch - got {actual_count}, expected {expected_count}"
             )
     else:
         detail_logger.info(
-            f"Fetched {actual_count} {publication_type} from Kscien across {page - 1} pages"
+            f"Fetched {actual_count} {publication_type} from Kscien across {pages_fetched} pages"
         )
 
     return all_publications
@@ -342,48 +336,6 @@ def _parse_kscien_page(
     return publications
 
 
-def _has_next_page(
-    html: str, current_page: int, expected_count: int | None, items_fetched: int
-) -> bool:
-    """Check if there's a next page in Kscien pagination.
-
-    Args:
-        html: The HTML content of the current page.
-        current_page: The current page number.
-        expected_count: Expected total count for this publication type (if available).
-        items_fetched: Number of items fetched so far.
-
-    Returns:
-        True if there are more pages to fetch, False otherwise.
-    """
-    try:
-        # If we have the expected count for this specific publication type, use it
-        if expected_count is not None:
-            # If we've fetched all expected items, no more pages
-            if items_fetched >= expected_count:
-                detail_logger.debug(
-                    f"Fetched {items_fetched}/{expected_count} items, no more pages"
-                )
-                return False
-
-            detail_logger.debug(
-                f"Fetched {items_fetched}/{expected_count} items so far, continuing"
-            )
-            # Continue fetching if we haven't reached the expected count
-            return True
-
-        # If we don't have an expected count, continue fetching
-        # The empty page check in fetch_kscien_data will stop pagination
-        detail_logger.debug(
-            "No expected count available, continuing to fetch (rely on empty page detection)"
-        )
-        return True
-
-    except Exception as e:
-        detail_logger.debug(f"Error checking pagination: {e}")
-        return True  # Continue on error, let empty page detection stop us
-
-
 def deduplicate_entries(publications: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Remove duplicate publications based on normalized names.
 
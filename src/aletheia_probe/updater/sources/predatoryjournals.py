@@ -161,14 +161,13 @@ class PredatoryJournalsSource(DataSource):
 
             if csv_url:
                 # Fetch the CSV data
-                async with session.get(csv_url) as response:
-                    if response.status == 200:
-                        csv_content = await response.text()
-                        entries = self._parse_csv(csv_content, sheet_type)
-                    else:
-                        status_logger.warning(
-                            f"    {self.get_name()}: HTTP {response.status} from CSV URL"
-                        )
+                download = await self.downloads.get(session, csv_url)
+                if download.ok:
+                    entries = self._parse_csv(download.text(), sheet_type)
+                else:
+                    status_logger.warning(
+                        f"    {self.get_name()}: HTTP {download.status} from CSV URL"
+                    )
             else:
                 status_logger.warning(
                     f"    {self.get_name()}: Could not discover sheet URL from page"
@@ -2,10 +2,13 @@
 """PubMed NLM journal list data source (MEDLINE and NLM Catalog)."""
 
 import asyncio
+import io
 import ssl
-import urllib.request
+from collections.abc import AsyncIterator, Generator, Iterable, Iterator
 from datetime import datetime
-from typing import Any
+from email.message import Message
+from http.client import HTTPException
+from typing import IO, Any
 from urllib.error import URLError
 from urllib.parse import urlparse
 
@@ -16,6 +19,7 @@ from ...logging_config import get_detail_logger, get_status_logger
 from ...normalizer import input_normalizer
 from ...validation import validate_issn
 from ..core import DataSource
+from ..downloads import open_url_stream
 from ..utils import deduplicate_journals
 
 
@@ -26,28 +30,29 @@ _RECORD_DELIMITER = "--------------------------------------------------------"
 _DEFAULT_TIMEOUT_SECONDS = 60
 _DEFAULT_UPDATE_INTERVAL_DAYS = 30
 _ALLOWED_HOST = "ftp.ncbi.nlm.nih.gov"
+# Journal entries handed to the DB writer at a time
+_ENTRY_CHUNK_SIZE = 2000
 
 
-def _parse_nlm_records(text: str) -> list[dict[str, str]]:
-    """Parse NLM journal list flat-file text into field dictionaries.
+def _iter_nlm_records(lines: Iterable[str]) -> Iterator[dict[str, str]]:
+    """Parse NLM journal list flat-file lines into field dictionaries.
 
     Each record is delimited by a line of dashes. Fields are ``Key: Value``
     pairs, one per line.
 
     Args:
-        text: Raw text content of the NLM flat file.
+        lines: Lines of the NLM flat file.
 
-    Returns:
-        List of dicts, one per journal record, with raw string values.
+    Yields:
+        One dict per journal record, with raw string values.
     """
-    records: list[dict[str, str]] = []
     current: dict[str, str] = {}
 
-    for line in text.splitlines():
+    for line in lines:
         stripped = line.strip()
         if stripped == _RECORD_DELIMITER:
             if current:
-                records.append(current)
+                yield current
                 current = {}
             continue
 
@@ -56,9 +61,47 @@ def _parse_nlm_records(text: str) -> list[dict[str, str]]:
             current[key.strip()] = value.strip()
 
     if current:
-        records.append(current)
+        yield current
+
+
+def _iter_entry_chunks(
+    stream: IO[bytes], medline_nlm_ids: set[str], *, is_medline: bool
+) -> Generator[list[dict[str, Any]], None, None]:
+    """Parse an NLM flat file into chunks of journal entries.
+
+    MEDLINE entries add their NlmId to ``medline_nlm_ids``; NLM Catalog
+    entries whose NlmId is in it are skipped.
+
+    Args:
+        stream: Binary stream over the file content.
+        medline_nlm_ids: NlmIds of the MEDLINE journals parsed so far.
+        is_medline: Tag to apply to each parsed entry.
+
+    Yields:
+        Deduplicated lists of at most ``_ENTRY_CHUNK_SIZE`` entries.
+    """
+    lines = io.TextIOWrapper(stream, encoding="utf-8", errors="ignore")
+    chunk: list[dict[str, Any]] = []
 
-    return records
+    for record in _iter_nlm_records(lines):
+        entry = _build_journal_entry(record, is_medline=is_medline)
+        if entry is None:
+            continue
+
+        nlm_id = entry["metadata"]["nlm_id"]
+        if is_medline:
+            if nlm_id:
+                medline_nlm_ids.add(nlm_id)
+        elif nlm_id in medline_nlm_ids:
+            continue
+
+        chunk.append(entry)
+        if len(chunk) >= _ENTRY_CHUNK_SIZE:
+            yield deduplicate_journals(chunk)
+            chunk = []
+
+    if chunk:
+        yield deduplicate_journals(chunk)
 
 
 def _normalize_issn(raw: str, title: str) -> str | None:
@@ -182,100 +225,127 @@ class PubMedNLMSource(DataSource):
     async def fetch_data(self) -> list[dict[str, Any]]:
         """Download and parse NLM journal flat files.
 
-        Downloads J_Medline.txt first, then J_Entrez.txt.  Journals already
-        present in the MEDLINE set (matched by NlmId) are not duplicated from
-        the Entrez file.
-
         Returns:
             Deduplicated list of normalized journal entry dicts.
         """
-        status_logger.info(f"    {self.get_name()}: Starting data fetch")
+        entries = [entry async for chunk in self.fetch_chunks() for entry in chunk]
+        return deduplicate_journals(entries)
 
-        medline_text = await self._fetch_file(self.medline_url)
-        catalog_text = await self._fetch_file(self.catalog_url)
+    async def fetch_chunks(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream and parse NLM journal flat files in chunks.
 
-        medline_entries = self._parse_file(medline_text, is_medline=True)
-        medline_nlm_ids = {
-            str(e.get("metadata", {}).get("nlm_id", ""))
-            for e in medline_entries
-            if e.get("metadata", {}).get("nlm_id")
-        }
+        J_Medline.txt is parsed first, then J_Entrez.txt.  Journals already
+        present in the MEDLINE set (matched by NlmId) are not duplicated from
+        the Entrez file.  Both files are parsed line by line in a worker
+        thread while they download; only the MEDLINE NlmIds are kept across
+        chunks.
 
-        catalog_entries = self._parse_file(catalog_text, is_medline=False)
-        catalog_only = [
-            e
-            for e in catalog_entries
-            if str(e.get("metadata", {}).get("nlm_id", "")) not in medline_nlm_ids
-        ]
+        Yields:
+            Lists of normalized journal entry dicts.
+        """
+        status_logger.info(f"    {self.get_name()}: Starting data fetch")
 
-        all_entries = medline_entries + catalog_only
-        unique_entries = deduplicate_journals(all_entries)
+        # Both files are requested before either is parsed, so nothing is
+        # parsed when neither changed since the last sync
+        medline = await self._open_file(self.medline_url)
+        catalog = await self._open_file(self.catalog_url)
+        try:
+            if self.downloads.unchanged:
+                return
+
+            medline_nlm_ids: set[str] = set()
+            counts = {True: 0, False: 0}
+            for stream, is_medline in ((medline, True), (catalog, False)):
+                if stream is None:
+                    continue
+                async for chunk in self._parse_stream(
+                    stream, medline_nlm_ids, is_medline=is_medline
+                ):
+                    counts[is_medline] += len(chunk)
+                    yield chunk
+                detail_logger.info(
+                    f"pubmed_nlm: Parsed {counts[is_medline]} entries "
+                    f"({'MEDLINE' if is_medline else 'NLM Catalog'})"
+                )
+        finally:
+            for stream in (medline, catalog):
+                if stream is not None:
+                    stream.close()
 
         status_logger.info(
-            f"    {self.get_name()}: Processed {len(unique_entries)} unique entries "
-            f"({len(medline_entries)} MEDLINE, {len(catalog_only)} NLM Catalog only)"
+            f"    {self.get_name()}: Processed {counts[True] + counts[False]} entries "
+            f"({counts[True]} MEDLINE, {counts[False]} NLM Catalog only)"
         )
-        return unique_entries
 
-    def _parse_file(self, text: str, *, is_medline: bool) -> list[dict[str, Any]]:
-        """Parse a downloaded NLM flat file into journal entry dicts.
+    async def _parse_stream(
+        self, stream: IO[bytes], medline_nlm_ids: set[str], *, is_medline: bool
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Parse a downloading NLM flat file off the event loop.
 
         Args:
-            text: Raw file content.
+            stream: Binary stream over the file content.
+            medline_nlm_ids: NlmIds of the MEDLINE journals parsed so far.
             is_medline: Tag to apply to each parsed entry.
 
-        Returns:
-            List of journal entry dicts (entries with missing titles omitted).
-        """
-        if not text:
-            return []
-
-        records = _parse_nlm_records(text)
-        entries: list[dict[str, Any]] = []
-
-        for record in records:
-            entry = _build_journal_entry(record, is_medline=is_medline)
-            if entry is not None:
-                entries.append(entry)
+        Yields:
+            Lists of journal entry dicts.
 
-        detail_logger.info(
-            f"pubmed_nlm: Parsed {len(entries)} entries "
-            f"({'MEDLINE' if is_medline else 'NLM Catalog'})"
-        )
-        return entries
-
-    async def _fetch_file(self, url: str) -> str:
-        """Download a plain-text file from the NCBI FTP server.
+        Raises:
+            OSError: If the download fails while it is parsed.
+        """
+        chunks = _iter_entry_chunks(stream, medline_nlm_ids, is_medline=is_medline)
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.to_thread(next, chunks, None)
+                except HTTPException as exc:
+                    raise OSError(f"Download interrupted — {exc!r}") from exc
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            chunks.close()
+
+    async def _open_file(self, url: str) -> IO[bytes] | None:
+        """Start downloading a plain-text file from the NCBI FTP server.
 
         Args:
             url: HTTPS URL to fetch (must be on ``ftp.ncbi.nlm.nih.gov``).
 
         Returns:
-            Decoded UTF-8 text content, or empty string on failure.
+            Binary stream over the file content (from the download cache if
+            not modified), or None on failure.
         """
         try:
-            text: str = await asyncio.to_thread(self._fetch_file_blocking, url)
-            return text
+            headers = self.downloads.conditional_headers(url)
+            status, response_headers, response = await asyncio.to_thread(
+                self._open_file_blocking, url, headers
+            )
+            return self.downloads.stream(url, status, response_headers, response)
         except (URLError, OSError, TimeoutError) as exc:
             status_logger.warning(
                 f"    {self.get_name()}: Failed to fetch {url} — {exc}"
             )
-            return ""
+            return None
 
-    def _fetch_file_blocking(self, url: str) -> str:
-        """Perform a blocking HTTPS GET and return UTF-8 decoded body.
+    def _open_file_blocking(
+        self, url: str, headers: dict[str, str]
+    ) -> tuple[int, Message, IO[bytes] | None]:
+        """Open a blocking HTTPS GET of a file.
 
         Only requests to ``ftp.ncbi.nlm.nih.gov`` over HTTPS are allowed.
 
         Args:
             url: Validated HTTPS URL.
+            headers: Conditional request headers.
 
         Returns:
-            UTF-8 decoded response body.
+            Status (200, or 304 when not modified), headers and the open
+            response (None for 304).
 
         Raises:
             URLError: If the scheme is not HTTPS, the host is wrong, or the
-                server returns a non-200 status code.
+                server returns an unexpected status code.
         """
         parsed = urlparse(url)
 
@@ -285,12 +355,11 @@ class PubMedNLMSource(DataSource):
             raise URLError(f"PubMed NLM source URL host must be {_ALLOWED_HOST!r}")
 
         ssl_ctx = ssl.create_default_context()
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(  # nosec B310 - scheme validated as https above
-            req, timeout=_DEFAULT_TIMEOUT_SECONDS, context=ssl_ctx
-        ) as response:
-            if response.status != 200:
-                raise URLError(f"HTTP {response.status} from {url}")
-            content: bytes = response.read()
-
-        return content.decode("utf-8", errors="ignore")
+        status, response_headers, response = open_url_stream(
+            url, headers, _DEFAULT_TIMEOUT_SECONDS, ssl_ctx
+        )
+        if status not in (200, 304):
+            if response is not None:
+                response.close()
+            raise URLError(f"HTTP {status} from {url}")
+        return status, response_headers, response
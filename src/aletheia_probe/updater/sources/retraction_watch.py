@@ -1,11 +1,21 @@
 # SPDX-License-Identifier: MIT
-"""Retraction Watch database data source from GitLab."""
+"""Retraction Watch database data source from GitLab.
+
+During a sync the repository is kept as a shallow clone next to the cache
+database and updated with ``git fetch``. The commit a sync was written from
+is recorded with the source's downloads, so the next sync is skipped when
+upstream did not move, and otherwise only re-writes the article retractions
+of CSV records that changed between the two commits.
+"""
 
 import asyncio
 import csv
+import re
+import shutil
 import subprocess
 import tempfile
 from collections import defaultdict
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -35,6 +45,11 @@ NON_RETRACTION_NATURE_KEYWORDS = (
     "reinstatement",
 )
 RETRACTION_NATURE_KEYWORDS = ("retract", "withdraw")
+GIT_TIMEOUT_SECONDS = 300
+# Directory next to the cache database holding the persistent clone
+REPOSITORIES_DIRECTORY = "repositories"
+REPOSITORY_NAME = "retraction-watch-data"
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
 
 
 class RetractionWatchSource(DataSource):
@@ -75,6 +90,11 @@ class RetractionWatchSource(DataSource):
         """Fetch and aggregate retraction data from GitLab repository."""
         status_logger.info(f"    {self.get_name()}: Starting data fetch")
 
+        cache = self.downloads.cache
+        if cache is not None:
+            repo_dir = cache.db_path.parent / REPOSITORIES_DIRECTORY / REPOSITORY_NAME
+            return await self._fetch_from_persistent_clone(repo_dir)
+
         with tempfile.TemporaryDirectory() as temp_dir:
             # Clone the repository
             repo_path = await self._clone_repository(temp_dir)
@@ -84,19 +104,214 @@ class RetractionWatchSource(DataSource):
                 )
                 return []
 
-            # Find and parse the CSV file
-            csv_path = repo_path / self.csv_filename
-            if not csv_path.exists():
-                status_logger.error(f"    {self.get_name()}: CSV file not found")
-                return []
+            return await self._parse_repository(repo_path)
+
+    async def _fetch_from_persistent_clone(
+        self, repo_dir: Path
+    ) -> list[dict[str, Any]]:
+        """Update the persistent clone and parse what changed since last sync.
 
-            # Parse and aggregate the data
-            journals = await self._parse_and_aggregate_csv(csv_path)
-            status_logger.info(
-                f"    {self.get_name()}: Aggregated data for {len(journals)} journals"
+        Args:
+            repo_dir: Directory of the persistent clone
+
+        Returns:
+            Aggregated journals; empty if upstream did not change
+        """
+        repo_path = await self._update_repository(repo_dir)
+        revision = await self._head_revision(repo_path) if repo_path else None
+        if repo_path is None or revision is None:
+            status_logger.error(f"    {self.get_name()}: Failed to update repository")
+            return []
+
+        previous = self.downloads.previous_body(self.repo_url)
+        previous_revision = previous.decode() if previous else None
+        # The commit is recorded like a download, and stored once written
+        self.downloads.accept(self.repo_url, 200, {}, revision.encode())
+        if self.downloads.unchanged:
+            detail_logger.info(f"Retraction Watch repository still at {revision}")
+            return []
+
+        changed_dois = None
+        if previous_revision is not None:
+            changed_dois = await self._changed_dois(
+                repo_path, previous_revision, revision
             )
+            if changed_dois is None:
+                detail_logger.info(
+                    f"Cannot diff {previous_revision}..{revision}; processing all records"
+                )
+            else:
+                status_logger.info(
+                    f"    {self.get_name()}: {len(changed_dois):,} article DOIs "
+                    "changed since last sync"
+                )
+
+        return await self._parse_repository(repo_path, changed_dois)
+
+    async def _parse_repository(
+        self, repo_path: Path, changed_dois: set[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Parse the CSV file of a checked out repository.
+
+        Args:
+            repo_path: Path to the repository
+            changed_dois: DOIs whose article retractions changed since the
+                last sync, or None to write all article retractions
 
-            return journals
+        Returns:
+            Aggregated journals
+        """
+        # Find and parse the CSV file
+        csv_path = repo_path / self.csv_filename
+        if not csv_path.exists():
+            status_logger.error(f"    {self.get_name()}: CSV file not found")
+            return []
+
+        # Parse and aggregate the data
+        journals = await self._parse_and_aggregate_csv(csv_path, changed_dois)
+        status_logger.info(
+            f"    {self.get_name()}: Aggregated data for {len(journals)} journals"
+        )
+
+        return journals
+
+    async def _update_repository(self, repo_path: Path) -> Path | None:
+        """Fast-forward the persistent clone to upstream, cloning it if needed.
+
+        The clone is shallow, so the new commit is fetched with depth 1 and
+        checked out; the previously checked out commit stays in the object
+        store for diffing. A clone that cannot be updated is cloned again.
+
+        Args:
+            repo_path: Directory of the persistent clone
+
+        Returns:
+            Path to the updated clone, or None if it could not be updated
+        """
+        if (repo_path / ".git").is_dir():
+            try:
+                for args in (
+                    ["remote", "set-url", "origin", self.repo_url],
+                    ["fetch", "--depth", "1", "origin", "HEAD"],
+                    ["reset", "--hard", "FETCH_HEAD"],
+                ):
+                    result = await self._run_git(repo_path, args)
+                    if result.returncode != 0:
+                        detail_logger.warning(
+                            f"git {args[0]} failed: {result.stderr.strip()}"
+                        )
+                        break
+                else:
+                    detail_logger.info(f"Updated repository at {repo_path}")
+                    return repo_path
+            except (OSError, subprocess.TimeoutExpired) as e:
+                detail_logger.warning(f"Error updating repository: {e}")
+
+            status_logger.warning(
+                f"    {self.get_name()}: Could not update local clone, cloning again"
+            )
+            await asyncio.to_thread(shutil.rmtree, repo_path, True)
+
+        repo_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=repo_path.parent) as temp_dir:
+            cloned = await self._clone_repository(temp_dir)
+            if cloned is None:
+                return None
+            cloned.rename(repo_path)
+        return repo_path
+
+    async def _head_revision(self, repo_path: Path) -> str | None:
+        """Return the commit checked out in a repository."""
+        try:
+            result = await self._run_git(repo_path, ["rev-parse", "HEAD"])
+        except (OSError, subprocess.TimeoutExpired) as e:
+            detail_logger.error(f"Error reading repository revision: {e}")
+            return None
+        if result.returncode != 0:
+            detail_logger.error(f"git rev-parse failed: {result.stderr.strip()}")
+            return None
+        return result.stdout.strip()
+
+    async def _run_git(
+        self, repo_path: Path, args: list[str]
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a git command in a repository in a worker thread."""
+        return await asyncio.to_thread(
+            subprocess.run,
+            ["git", "-C", str(repo_path), *args],
+            capture_output=True,
+            text=True,
+            timeout=GIT_TIMEOUT_SECONDS,
+        )
+
+    async def _changed_dois(
+        self, repo_path: Path, old_revision: str, new_revision: str
+    ) -> set[str] | None:
+        """Find the DOIs of CSV records that differ between two commits.
+
+        The line ranges changed on either side are read from the hunk headers
+        of ``git diff``; DOIs are then taken from the records of the old and
+        the new CSV that overlap those ranges, so quoted multi-line records
+        are handled.
+
+        Args:
+            repo_path: Path to the repository
+            old_revision: Commit of the last sync
+            new_revision: Commit checked out now
+
+        Returns:
+            Normalized DOIs of added, changed and removed records, or None if
+            the commits cannot be diffed or the CSV header changed
+        """
+        return await asyncio.to_thread(
+            self._changed_dois_sync, repo_path, old_revision, new_revision
+        )
+
+    def _changed_dois_sync(
+        self, repo_path: Path, old_revision: str, new_revision: str
+    ) -> set[str] | None:
+        """Blocking implementation of _changed_dois()."""
+        git = ["git", "-C", str(repo_path)]
+        diff = subprocess.run(
+            [
+                *git,
+                "diff",
+                "--no-color",
+                "--no-ext-diff",
+                "--unified=0",
+                old_revision,
+                new_revision,
+                "--",
+                self.csv_filename,
+            ],
+            capture_output=True,
+            text=True,
+            errors="replace",
+            timeout=GIT_TIMEOUT_SECONDS,
+        )
+        if diff.returncode != 0:
+            return None
+
+        old_ranges, new_ranges = _changed_line_ranges(diff.stdout.splitlines())
+        if any(start == 1 for start, _ in old_ranges + new_ranges):
+            return None
+
+        dois: set[str] = set()
+        if new_ranges:
+            with open(repo_path / self.csv_filename, encoding="utf-8", newline="") as f:
+                dois |= _dois_in_line_ranges(f, new_ranges)
+        if old_ranges:
+            with subprocess.Popen(
+                [*git, "show", f"{old_revision}:{self.csv_filename}"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                encoding="utf-8",
+            ) as show:
+                assert show.stdout is not None  # stdout=PIPE
+                dois |= _dois_in_line_ranges(show.stdout, old_ranges)
+            if show.returncode != 0:
+                return None
+        return dois
 
     async def _clone_repository(self, temp_dir: str) -> Path | None:
         """Clone the Retraction Watch Git repository.
@@ -158,8 +373,56 @@ class RetractionWatchSource(DataSource):
             detail_logger.error(f"Error cloning repository: {e}")
             return None
 
-    async def _parse_and_aggregate_csv(self, csv_path: Path) -> list[dict[str, Any]]:
-        """Parse CSV and aggregate retractions by journal."""
+    async def _parse_and_aggregate_csv(
+        self, csv_path: Path, changed_dois: set[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Parse CSV and aggregate retractions by journal in the parse pool.
+
+        Journal statistics are always aggregated over the whole CSV, since
+        their recency counts shift with the current date; the DB writer
+        only writes the journals whose statistics changed. Article
+        retractions are limited to ``changed_dois`` when given.
+
+        Args:
+            csv_path: Path to CSV file
+            changed_dois: DOIs whose article retractions changed since the
+                last sync, or None to collect all article retractions
+
+        Returns:
+            Journals in final format; empty if the CSV could not be parsed
+        """
+        try:
+            final_journals, self.article_retractions = await self.parse_pool.run(
+                self._aggregate_csv, csv_path, changed_dois
+            )
+        except Exception as e:
+            status_logger.error(f"    {self.get_name()}: Error parsing CSV - {e}")
+            self.article_retractions = []
+            return []
+
+        # Store article retractions in metadata for AsyncDBWriter to process
+        removed_dois = None
+        if changed_dois is not None:
+            removed_dois = changed_dois.difference(
+                article["doi"] for article in self.article_retractions
+            )
+        self._attach_article_retractions(final_journals, removed_dois)
+
+        return final_journals
+
+    def _aggregate_csv(
+        self, csv_path: Path, changed_dois: set[str] | None
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Aggregate the CSV into journals and collect article retractions.
+
+        Args:
+            csv_path: Path to CSV file
+            changed_dois: Only collect article retractions for these DOIs;
+                None collects all of them
+
+        Returns:
+            Journals in final format and the collected article retractions
+        """
         # Reset article retractions list for this sync
         self.article_retractions = []
 
@@ -179,7 +442,7 @@ class RetractionWatchSource(DataSource):
         )
 
         # Process CSV rows and collect statistics
-        articles_cached = await self._process_csv_rows(csv_path, journal_stats)
+        articles_cached = self._process_csv_rows(csv_path, journal_stats, changed_dois)
 
         # Convert aggregated stats to journal list format
         journals = self._build_journals_from_stats(journal_stats)
@@ -199,21 +462,21 @@ class RetractionWatchSource(DataSource):
             "Retraction data aggregation complete (OpenAlex data will be fetched on-demand)"
         )
 
-        # Store article retractions in metadata for AsyncDBWriter to process
-        self._attach_article_retractions(final_journals)
-
-        return final_journals
+        return final_journals, self.article_retractions
 
-    async def _process_csv_rows(
+    def _process_csv_rows(
         self,
         csv_path: Path,
         journal_stats: defaultdict[str, dict[str, Any]],
+        changed_dois: set[str] | None = None,
     ) -> int:
-        """Process CSV rows and update journal statistics.
+        """Stream CSV rows and update journal statistics.
 
         Args:
             csv_path: Path to CSV file
             journal_stats: Dictionary to populate with journal statistics
+            changed_dois: Only collect article retractions for these DOIs;
+                None collects all of them
 
         Returns:
             Number of article DOIs cached
@@ -223,20 +486,10 @@ class RetractionWatchSource(DataSource):
         articles_cached = 0
         article_batch: list[dict[str, str]] = []
         batch_size = ARTICLE_BATCH_SIZE
+        normalized_names: dict[str, str | None] = {}
 
-        def _read_csv_sync() -> list[dict[str, Any]]:
-            """Read CSV file synchronously."""
-            rows = []
-            with open(csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    rows.append(dict(row))
-            return rows
-
-        try:
-            csv_rows = await asyncio.to_thread(_read_csv_sync)
-
-            for row in csv_rows:
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
                 records_processed += 1
 
                 # Log progress every PROGRESS_LOG_INTERVAL records
@@ -246,30 +499,29 @@ class RetractionWatchSource(DataSource):
                     )
 
                 # Extract and cache article retraction data
-                article_cached = self._process_article_data(
-                    row, article_batch, batch_size
-                )
-                if article_cached:
-                    articles_cached += 1
-                    if len(article_batch) >= batch_size:
-                        self._collect_article_retractions(article_batch)
-                        article_batch = []
+                if changed_dois is None or _normalize_doi(row) in changed_dois:
+                    article_cached = self._process_article_data(
+                        row, article_batch, batch_size
+                    )
+                    if article_cached:
+                        articles_cached += 1
+                        if len(article_batch) >= batch_size:
+                            self._collect_article_retractions(article_batch)
+                            article_batch = []
 
                 # Process journal statistics
-                self._update_journal_stats(row, journal_stats, current_year)
-
-            # Collect any remaining articles in the batch
-            if article_batch:
-                self._collect_article_retractions(article_batch)
+                self._update_journal_stats(
+                    row, journal_stats, current_year, normalized_names
+                )
 
-            status_logger.info(
-                f"    {self.get_name()}: Completed CSV parsing - {records_processed:,} records, {articles_cached:,} articles cached"
-            )
-            detail_logger.info(f"Processed {records_processed} retraction records")
+        # Collect any remaining articles in the batch
+        if article_batch:
+            self._collect_article_retractions(article_batch)
 
-        except Exception as e:
-            status_logger.error(f"    {self.get_name()}: Error parsing CSV - {e}")
-            return 0
+        status_logger.info(
+            f"    {self.get_name()}: Completed CSV parsing - {records_processed:,} records, {articles_cached:,} articles cached"
+        )
+        detail_logger.info(f"Processed {records_processed} retraction records")
 
         return articles_cached
 
@@ -309,6 +561,7 @@ class RetractionWatchSource(DataSource):
         row: dict[str, Any],
         journal_stats: defaultdict[str, dict[str, Any]],
         current_year: int,
+        normalized_names: dict[str, str | None] | None = None,
     ) -> None:
         """Update journal statistics from a CSV row.
 
@@ -316,26 +569,20 @@ class RetractionWatchSource(DataSource):
             row: CSV row data
             journal_stats: Dictionary to update with statistics
             current_year: Current year for recency calculations
+            normalized_names: Normalized names by journal name, filled in
+                as journals are normalized; most journals occur many times
         """
         journal = row.get("Journal", "").strip()
         if not journal:
             return
 
-        # Normalize journal name
-        try:
-            normalized_input = input_normalizer.normalize(journal)
-            normalized_journal = (
-                normalized_input.normalized_venue.name
-                if normalized_input.normalized_venue
-                else ""
-            )
-            if not normalized_journal:
-                detail_logger.debug(
-                    f"Failed to normalize journal '{journal}': normalized name is empty"
-                )
-                return
-        except Exception as e:
-            detail_logger.debug(f"Failed to normalize journal '{journal}': {e}")
+        if normalized_names is not None and journal in normalized_names:
+            normalized_journal = normalized_names[journal]
+        else:
+            normalized_journal = self._normalize_journal(journal)
+            if normalized_names is not None:
+                normalized_names[journal] = normalized_journal
+        if not normalized_journal:
             return
 
         # Parse retraction date
@@ -377,6 +624,25 @@ class RetractionWatchSource(DataSource):
         if publisher:
             stats["publishers"].add(publisher)
 
+    def _normalize_journal(self, journal: str) -> str | None:
+        """Return the normalized name of a journal, or None if it has none."""
+        try:
+            normalized_input = input_normalizer.normalize(journal)
+            normalized_journal = (
+                normalized_input.normalized_venue.name
+                if normalized_input.normalized_venue
+                else ""
+            )
+            if not normalized_journal:
+                detail_logger.debug(
+                    f"Failed to normalize journal '{journal}': normalized name is empty"
+                )
+                return None
+        except Exception as e:
+            detail_logger.debug(f"Failed to normalize journal '{journal}': {e}")
+            return None
+        return normalized_journal
+
     def _build_journals_from_stats(
         self,
         journal_stats: defaultdict[str, dict[str, Any]],
@@ -480,13 +746,21 @@ class RetractionWatchSource(DataSource):
 
         return final_journals
 
-    def _attach_article_retractions(self, final_journals: list[dict[str, Any]]) -> None:
+    def _attach_article_retractions(
+        self,
+        final_journals: list[dict[str, Any]],
+        removed_dois: set[str] | None = None,
+    ) -> None:
         """Attach article retractions to first journal's metadata.
 
         Args:
             final_journals: List of journals in final format
+            removed_dois: For a sync that only collected changed DOIs, the
+                changed DOIs no longer in the CSV; None for a full sync
         """
-        if not final_journals or not self.article_retractions:
+        if not final_journals or (
+            not self.article_retractions and removed_dois is None
+        ):
             return
 
         first_journal = final_journals[0]
@@ -498,6 +772,14 @@ class RetractionWatchSource(DataSource):
         # Add article retractions to metadata
         first_journal["metadata"]["_article_retractions"] = self.article_retractions
 
+        if removed_dois is not None:
+            # Rows of unchanged DOIs are kept; their expiry is extended
+            expires_at = datetime.now() + timedelta(hours=CACHE_EXPIRY_HOURS)
+            first_journal["metadata"]["_article_retractions_delta"] = {
+                "removed_dois": sorted(removed_dois),
+                "expires_at": expires_at.isoformat(),
+            }
+
     def _parse_date(self, date_str: str) -> datetime | None:
         """Parse date string from Retraction Watch CSV."""
         if not date_str or date_str == "0":
@@ -589,3 +871,68 @@ class RetractionWatchSource(DataSource):
             return False
 
         return any(keyword in normalized for keyword in RETRACTION_NATURE_KEYWORDS)
+
+
+def _normalize_doi(row: dict[str, Any]) -> str:
+    """Return the original paper DOI of a CSV row as stored in the cache."""
+    return str(row.get("OriginalPaperDOI") or "").strip().lower()
+
+
+def _changed_line_ranges(
+    diff_lines: Iterable[str],
+) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """Read the changed line ranges from the hunk headers of a diff.
+
+    Args:
+        diff_lines: Output lines of ``git diff --unified=0``
+
+    Returns:
+        Inclusive (first, last) line ranges changed in the old and the new
+        file, in file order
+    """
+    old_ranges: list[tuple[int, int]] = []
+    new_ranges: list[tuple[int, int]] = []
+    for line in diff_lines:
+        match = _HUNK_HEADER.match(line)
+        if not match:
+            continue
+        old_start, old_count, new_start, new_count = match.groups()
+        for start, count, ranges in (
+            (int(old_start), old_count, old_ranges),
+            (int(new_start), new_count, new_ranges),
+        ):
+            length = 1 if count is None else int(count)
+            if length:
+                ranges.append((start, start + length - 1))
+    return old_ranges, new_ranges
+
+
+def _dois_in_line_ranges(
+    lines: Iterable[str], ranges: list[tuple[int, int]]
+) -> set[str]:
+    """Collect the DOIs of CSV records overlapping the given line ranges.
+
+    The whole input is read, so that a piped producer runs to completion.
+
+    Args:
+        lines: Lines of a CSV file with header
+        ranges: Inclusive (first, last) line ranges in file order
+
+    Returns:
+        Normalized DOIs of the overlapping records
+    """
+    dois: set[str] = set()
+    reader = csv.DictReader(lines)
+    _ = reader.fieldnames  # consume the header
+    first_line = reader.line_num + 1
+    index = 0
+    for row in reader:
+        last_line = reader.line_num
+        while index < len(ranges) and ranges[index][1] < first_line:
+            index += 1
+        if index < len(ranges) and ranges[index][0] <= last_line:
+            doi = _normalize_doi(row)
+            if doi:
+                dois.add(doi)
+        first_line = last_line + 1
+    return dois
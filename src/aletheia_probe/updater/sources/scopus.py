@@ -1,8 +1,20 @@
 # SPDX-License-Identifier: MIT
-"""Scopus journal list data source (optional user-provided Excel file)."""
+"""Scopus journal list data source (optional user-provided Excel file).
+
+Walking every cell of the Scopus workbook with openpyxl takes minutes, so
+the workbook is converted once, in the sync's parse pool, into a CSV sidecar
+holding only the mapped columns. The sidecar is named after the workbook's
+content hash and the column mappings; later syncs of the same file read the
+sidecar instead of the workbook.
+"""
 
 import asyncio
+import csv
 import glob
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -21,6 +33,11 @@ from ..core import DataSource
 detail_logger = get_detail_logger()
 status_logger = get_status_logger()
 
+# Directory below the data directory holding the converted sidecars
+SIDECAR_DIR_NAME = ".sidecars"
+# Bump when the sidecar layout changes to invalidate existing sidecars
+SIDECAR_VERSION = 1
+
 
 class ScopusSource(DataSource):
     """Data source for Scopus journal list (optional user-provided Excel file)."""
@@ -111,27 +128,7 @@ class ScopusSource(DataSource):
         Returns:
             Dictionary mapping field names to column indices
         """
-        col_indices = {}
-        for i, header in enumerate(headers):
-            if header:
-                header_lower = str(header).lower()
-                # Check each configured mapping
-                for field_name, possible_headers in self.column_mappings.items():
-                    # Skip if we've already found this field
-                    if field_name in col_indices:
-                        continue
-
-                    if field_name == "quality_flag":
-                        # Special case: quality_flag needs both "discontinued" AND "quality"
-                        if all(keyword in header_lower for keyword in possible_headers):
-                            col_indices[field_name] = i
-                    else:
-                        # Regular case: match any of the possible headers
-                        for possible_header in possible_headers:
-                            if possible_header in header_lower:
-                                col_indices[field_name] = i
-                                break
-        return col_indices
+        return find_column_indices(headers, self.column_mappings)
 
     def _validate_and_normalize_issn(
         self, issn: str | None, journal_title: str
@@ -162,21 +159,6 @@ class ScopusSource(DataSource):
 
         return issn
 
-    def _extract_cell_value(
-        self, row: tuple[Any, ...], col_indices: dict[str, int], field_name: str
-    ) -> Any:
-        """Extract cell value from row using column indices.
-
-        Args:
-            row: Excel row tuple
-            col_indices: Dictionary mapping field names to column indices
-            field_name: Name of the field to extract
-
-        Returns:
-            Cell value or None if field not in col_indices
-        """
-        return row[col_indices[field_name]].value if field_name in col_indices else None
-
     def _create_journal_entry(
         self,
         title: str,
@@ -246,127 +228,245 @@ class ScopusSource(DataSource):
         if not self.file_path:
             return []
 
-        status_logger.info(
-            f"    {self.get_name()}: Loading journal list from {self.file_path.name}"
-        )
-
         try:
-            # Load workbook in thread pool to avoid blocking event loop
-            workbook = await asyncio.to_thread(
-                load_workbook, filename=self.file_path, read_only=True, data_only=True
-            )
-
-            # Find the sheet (usually "Scopus Sources Oct. 2024" or similar)
-            sheet = None
-            for sheet_name in workbook.sheetnames:
-                if "scopus" in sheet_name.lower() or "source" in sheet_name.lower():
-                    sheet = workbook[sheet_name]
-                    break
-
-            if sheet is None:
-                sheet = workbook.active
-
-            if sheet is None:
-                status_logger.error(
-                    f"    {self.get_name()}: No valid sheet found in Excel file"
+            sidecar_path = await asyncio.to_thread(self._sidecar_path, self.file_path)
+            if sidecar_path.exists():
+                status_logger.info(
+                    f"    {self.get_name()}: Reading converted journal list "
+                    f"for {self.file_path.name}"
+                )
+            else:
+                status_logger.info(
+                    f"    {self.get_name()}: Converting journal list "
+                    f"{self.file_path.name} (only needed once per file)"
                 )
-                return []
+                await self._convert_workbook(self.file_path, sidecar_path)
 
-            detail_logger.info(f"Reading sheet: {sheet.title}")
+            return await self.parse_pool.run(self._read_sidecar, sidecar_path)
 
-            # Read header row and find column indices
-            rows_iter = iter(sheet.rows)
-            header_row = next(rows_iter)
-            headers = [cell.value for cell in header_row]
-            col_indices = self._find_column_indices(headers)
+        except Exception as e:
+            status_logger.error(
+                f"    {self.get_name()}: Error loading journal list - {e}"
+            )
+            return []
 
-            # Validate required columns exist
-            if "title" not in col_indices:
-                status_logger.error(
-                    f"    {self.get_name()}: Could not find 'Source Title' column in file"
-                )
-                return []
-
-            detail_logger.info(f"Found columns: {list(col_indices.keys())}")
-
-            journals = []
-            active_count = 0
-            inactive_count = 0
-            quality_flagged_count = 0
-
-            # Process data rows
-            for row in rows_iter:
-                # Extract values using helper method
-                title = self._extract_cell_value(row, col_indices, "title")
-                issn = self._extract_cell_value(row, col_indices, "issn")
-                eissn = self._extract_cell_value(row, col_indices, "eissn")
-                publisher = self._extract_cell_value(row, col_indices, "publisher")
-                status = self._extract_cell_value(row, col_indices, "status")
-                quality_flag = self._extract_cell_value(
-                    row, col_indices, "quality_flag"
-                )
-                source_type = self._extract_cell_value(row, col_indices, "source_type")
-                coverage = self._extract_cell_value(row, col_indices, "coverage")
-                open_access = self._extract_cell_value(row, col_indices, "open_access")
+    def _sidecar_path(self, file_path: Path) -> Path:
+        """Return the sidecar path for a workbook's content and the mappings."""
+        content_hash = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            while block := f.read(1024 * 1024):
+                content_hash.update(block)
+        mappings_hash = hashlib.sha256(
+            json.dumps([SIDECAR_VERSION, self.column_mappings], sort_keys=True).encode()
+        ).hexdigest()
+        return (
+            self.data_dir
+            / SIDECAR_DIR_NAME
+            / f"{content_hash.hexdigest()}-{mappings_hash[:12]}.csv"
+        )
 
-                # Skip rows without title
-                if not title:
-                    continue
+    async def _convert_workbook(self, file_path: Path, sidecar_path: Path) -> None:
+        """Convert the workbook into a sidecar in the parse pool.
 
-                title = str(title).strip()
-                if not title or len(title) < 2:
-                    continue
+        Sidecars of other workbook versions are deleted afterwards.
+        """
+        sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        sheet_title, fields, row_count = await self.parse_pool.run(
+            convert_workbook, file_path, sidecar_path, self.column_mappings
+        )
+        detail_logger.info(
+            f"Converted sheet '{sheet_title}' ({row_count} rows, columns {fields}) "
+            f"to {sidecar_path}"
+        )
 
-                # Track statistics
-                status_str = str(status).strip() if status else ""
-                is_active = status_str.lower() == "active"
-                is_quality_flagged = bool(quality_flag and str(quality_flag).strip())
+        for stale in sidecar_path.parent.glob("*.csv"):
+            if stale != sidecar_path:
+                stale.unlink(missing_ok=True)
 
-                if is_active:
-                    active_count += 1
-                else:
-                    inactive_count += 1
+    def _read_sidecar(self, sidecar_path: Path) -> list[dict[str, Any]]:
+        """Parse the journal entries from a sidecar."""
+        with open(sidecar_path, encoding="utf-8", newline="") as f:
+            return self._parse_rows(csv.DictReader(f))
 
-                if is_quality_flagged:
-                    quality_flagged_count += 1
+    def _parse_rows(self, rows: Iterable[dict[str, str]]) -> list[dict[str, Any]]:
+        """Create journal entries from the active journals among sidecar rows.
 
-                # Only include active journals (skip inactive ones)
-                if not is_active:
-                    continue
+        Args:
+            rows: Rows mapping field names to cell text; missing columns
+                are absent or empty
 
-                # Validate and normalize ISSNs
-                issn_str = str(issn) if issn else None
-                eissn_str = str(eissn) if eissn else None
-                issn = self._validate_and_normalize_issn(issn_str, title)
-                eissn = self._validate_and_normalize_issn(eissn_str, title)
-
-                # Create journal entry
-                journal_entry = self._create_journal_entry(
-                    title,
-                    issn,
-                    eissn,
-                    publisher,
-                    source_type,
-                    coverage,
-                    open_access,
-                    is_quality_flagged,
-                    quality_flag,
-                )
+        Returns:
+            Journal entries of the active journals
+        """
+        journals = []
+        active_count = 0
+        inactive_count = 0
+        quality_flagged_count = 0
+
+        for row in rows:
+            title = row.get("title")
+            issn = row.get("issn")
+            eissn = row.get("eissn")
+            publisher = row.get("publisher")
+            status = row.get("status")
+            quality_flag = row.get("quality_flag")
+            source_type = row.get("source_type")
+            coverage = row.get("coverage")
+            open_access = row.get("open_access")
+
+            # Skip rows without title
+            if not title:
+                continue
+
+            title = title.strip()
+            if not title or len(title) < 2:
+                continue
+
+            # Track statistics
+            status_str = status.strip() if status else ""
+            is_active = status_str.lower() == "active"
+            is_quality_flagged = bool(quality_flag and quality_flag.strip())
+
+            if is_active:
+                active_count += 1
+            else:
+                inactive_count += 1
 
-                if journal_entry:
-                    journals.append(journal_entry)
+            if is_quality_flagged:
+                quality_flagged_count += 1
+
+            # Only include active journals (skip inactive ones)
+            if not is_active:
+                continue
+
+            # Validate and normalize ISSNs
+            issn = self._validate_and_normalize_issn(issn or None, title)
+            eissn = self._validate_and_normalize_issn(eissn or None, title)
+
+            # Create journal entry
+            journal_entry = self._create_journal_entry(
+                title,
+                issn,
+                eissn,
+                publisher,
+                source_type,
+                coverage,
+                open_access,
+                is_quality_flagged,
+                quality_flag,
+            )
 
-            workbook.close()
+            if journal_entry:
+                journals.append(journal_entry)
 
-            status_logger.info(
-                f"    {self.get_name()}: Processed {len(journals)} active journals "
-                f"({inactive_count} inactive excluded, {quality_flagged_count} quality-flagged found)"
-            )
+        status_logger.info(
+            f"    {self.get_name()}: Processed {len(journals)} active journals "
+            f"({inactive_count} inactive excluded, {quality_flagged_count} quality-flagged found)"
+        )
 
-            return journals
+        return journals
+
+
+def find_column_indices(
+    headers: list[Any], column_mappings: dict[str, list[str]]
+) -> dict[str, int]:
+    """Find column indices using column header mappings.
+
+    Args:
+        headers: List of header values from the Excel sheet
+        column_mappings: Possible header substrings per field name
+
+    Returns:
+        Dictionary mapping field names to column indices
+    """
+    col_indices: dict[str, int] = {}
+    for i, header in enumerate(headers):
+        if header:
+            header_lower = str(header).lower()
+            # Check each configured mapping
+            for field_name, possible_headers in column_mappings.items():
+                # Skip if we've already found this field
+                if field_name in col_indices:
+                    continue
 
-        except Exception as e:
-            status_logger.error(
-                f"    {self.get_name()}: Error loading journal list - {e}"
-            )
-            return []
+                if field_name == "quality_flag":
+                    # Special case: quality_flag needs both "discontinued" AND "quality"
+                    if all(keyword in header_lower for keyword in possible_headers):
+                        col_indices[field_name] = i
+                else:
+                    # Regular case: match any of the possible headers
+                    for possible_header in possible_headers:
+                        if possible_header in header_lower:
+                            col_indices[field_name] = i
+                            break
+    return col_indices
+
+
+def convert_workbook(
+    file_path: Path, sidecar_path: Path, column_mappings: dict[str, list[str]]
+) -> tuple[str, list[str], int]:
+    """Write the mapped columns of a Scopus workbook to a CSV sidecar.
+
+    Runs in a parse worker process. Cells are written as text, empty for missing
+    values; the header row holds the field names. The sidecar is written to
+    a temporary file and renamed, so an interrupted conversion leaves none.
+
+    Args:
+        file_path: Scopus workbook
+        sidecar_path: CSV file to create
+        column_mappings: Possible header substrings per field name
+
+    Returns:
+        Title of the converted sheet, field names and number of data rows.
+
+    Raises:
+        ValueError: If the workbook has no usable sheet or no title column.
+    """
+    workbook = load_workbook(filename=file_path, read_only=True, data_only=True)
+    try:
+        # Find the sheet (usually "Scopus Sources Oct. 2024" or similar)
+        sheet = None
+        for sheet_name in workbook.sheetnames:
+            if "scopus" in sheet_name.lower() or "source" in sheet_name.lower():
+                sheet = workbook[sheet_name]
+                break
+
+        if sheet is None:
+            sheet = workbook.active
+
+        if sheet is None:
+            raise ValueError("No valid sheet found in Excel file")
+
+        rows_iter: Iterator[tuple[Any, ...]] = sheet.iter_rows(values_only=True)
+        headers = list(next(rows_iter, ()))
+        col_indices = find_column_indices(headers, column_mappings)
+
+        # Validate required columns exist
+        if "title" not in col_indices:
+            raise ValueError("Could not find 'Source Title' column in file")
+
+        fields = list(col_indices)
+        row_count = 0
+        tmp_path = sidecar_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(fields)
+                for row in rows_iter:
+                    writer.writerow(
+                        _cell_text(row, col_indices[field]) for field in fields
+                    )
+                    row_count += 1
+            os.replace(tmp_path, sidecar_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        return str(sheet.title), fields, row_count
+    finally:
+        workbook.close()
+
+
+def _cell_text(row: tuple[Any, ...], index: int) -> str:
+    """Return a cell value as sidecar text; empty for missing values."""
+    value = row[index] if index < len(row) else None
+    return "" if value is None else str(value)
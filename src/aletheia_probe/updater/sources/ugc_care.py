@@ -61,18 +61,21 @@ class UgcCareListSource(DataSource):
         status_logger.info(f"    {self.get_name()}: Starting data fetch")
         try:
             async with ClientSession(timeout=self.timeout, trust_env=True) as session:
-                async with session.get(self.source_url) as response:
-                    if response.status != 200:
-                        status_logger.warning(
-                            f"    {self.get_name()}: HTTP {response.status} from source page"
-                        )
-                        return []
-                    html_content = await response.text()
+                download = await self.downloads.get(session, self.source_url)
         except (ClientError, TimeoutError) as e:
             status_logger.error(f"    {self.get_name()}: Failed to fetch data - {e}")
             return []
 
-        entries = self._parse_entries(html_content)
+        if not download.ok:
+            status_logger.warning(
+                f"    {self.get_name()}: HTTP {download.status} from source page"
+            )
+            return []
+        if self.downloads.unchanged:
+            return []
+
+        html_content = download.text()
+        entries = await self.parse_pool.run(self._parse_entries, html_content)
         deduplicated_entries = deduplicate_journals(entries)
         status_logger.info(
             f"    {self.get_name()}: Processed {len(deduplicated_entries)} unique entries"
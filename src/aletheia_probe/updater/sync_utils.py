@@ -1,21 +1,23 @@
 # SPDX-License-Identifier: MIT
 """Standalone utility functions for data source synchronization."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, cast
 
-from ..cache import DataSourceManager
+from ..cache import DataSourceManager, SourceUpdateTiming
 from ..cache_sync.db_writer import AsyncDBWriter
 from ..data_models import JournalDataDict
 from ..enums import UpdateStatus, UpdateType
 from ..logging_config import get_detail_logger, get_status_logger
 from .core import DataSource
+from .parse_pool import ParsePool
 
 
 async def update_source_data(
     source: DataSource,
     db_writer: AsyncDBWriter,
     force: bool = False,
+    parse_pool: ParsePool | None = None,
 ) -> dict[str, Any]:
     """Update database from a data source.
 
@@ -26,6 +28,8 @@ async def update_source_data(
         source: DataSource instance to fetch data from
         db_writer: AsyncDBWriter for queuing database writes
         force: Force update even if source.should_update() returns False
+        parse_pool: Pool of the sync run for the source's parse jobs; jobs
+            run in threads without one
 
     Returns:
         Dictionary with operation result:
@@ -33,7 +37,8 @@ async def update_source_data(
         - records_updated: Number of records (on success)
         - processing_time: Time taken in seconds (on success)
         - error: Error message (on failure)
-        - reason: Skip reason (when skipped)
+        - reason: Skip reason (when skipped); "not_modified" when none of
+          the files downloaded by the source changed since the last sync
     """
     source_name = source.get_name()
     status_logger = get_status_logger()
@@ -46,8 +51,10 @@ async def update_source_data(
         detail_logger.info(f"Source {source_name} does not need updating: {reason}")
         return {"status": "skipped", "reason": reason}
 
-    start_time = datetime.now()
+    start_time = datetime.now(timezone.utc)
     data_source_manager = DataSourceManager()
+    # A forced update downloads everything, but still records validators
+    downloads = source.track_downloads(revalidate=not force)
 
     # Register data source if not already registered
     data_source_manager.register_data_source(
@@ -60,12 +67,50 @@ async def update_source_data(
         source_name, UpdateType.FULL.value, UpdateStatus.IN_PROGRESS.value
     )
 
+    # Chunks are queued one behind the source, so that the last one can be
+    # marked final; a source yielding a single chunk is a single write
+    pending: list[dict[str, Any]] | None = None
+    chunks_queued = False
+    records_updated = 0
+    source.use_parse_pool(parse_pool)
+
     try:
         # Fetch data from source
         status_logger.info(f"    {source_name}: Downloading...")
-        journals = await source.fetch_data()
+        async for chunk in source.fetch_chunks():
+            if not chunk:
+                continue
+            if pending is not None:
+                await db_writer.queue_write(
+                    source_name,
+                    source.get_list_type(),
+                    cast(list[JournalDataDict], pending),
+                    final=False,
+                    force=force,
+                )
+                chunks_queued = True
+            pending = chunk
+            records_updated += len(chunk)
+
+        # Recorded so that the next sync can start the slowest sources first
+        timing = SourceUpdateTiming(
+            started_at=start_time,
+            duration_seconds=(datetime.now(timezone.utc) - start_time).total_seconds(),
+            bytes_downloaded=downloads.bytes_downloaded,
+        )
 
-        if not journals:
+        if downloads.unchanged and not chunks_queued:
+            detail_logger.info(f"Source {source_name} is unchanged since last sync")
+            status_logger.info(f"    {source_name}: Not modified since last sync")
+            data_source_manager.log_update(
+                source_name,
+                UpdateType.VERIFICATION.value,
+                UpdateStatus.SUCCESS.value,
+                timing=timing,
+            )
+            return {"status": "skipped", "reason": "not_modified"}
+
+        if pending is None:
             detail_logger.warning(f"No data received from source {source_name}")
             status_logger.warning(f"    {source_name}: No data received")
             data_source_manager.log_update(
@@ -78,12 +123,15 @@ async def update_source_data(
 
         # Queue the data for asynchronous writing
         # Cast to JournalDataDict list - data sources return dicts that conform to this structure
+        # Validators are stored once the writer has written the data
         await db_writer.queue_write(
             source_name,
             source.get_list_type(),
-            cast(list[JournalDataDict], journals),
+            cast(list[JournalDataDict], pending),
+            on_written=downloads.commit,
+            timing=timing,
+            force=force,
         )
-        records_updated = len(journals)
         status_logger.info(
             f"    {source_name}: Queued {records_updated} records for writing"
         )
@@ -95,10 +143,12 @@ async def update_source_data(
         return {
             "status": "success",
             "records_updated": records_updated,
-            "processing_time": (datetime.now() - start_time).total_seconds(),
+            "processing_time": timing.duration_seconds,
         }
 
     except (ValueError, OSError, KeyError) as e:
+        if chunks_queued:
+            await db_writer.discard_chunks(source_name)
         detail_logger.error(f"Failed to update source {source_name}: {e}")
         status_logger.error(f"    {source_name}: Error - {e}")
         data_source_manager.log_update(
@@ -108,3 +158,6 @@ async def update_source_data(
             error_message=str(e),
         )
         return {"status": "failed", "error": str(e)}
+
+    finally:
+        source.use_parse_pool(None)
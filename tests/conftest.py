@@ -44,6 +44,11 @@ def isolated_test_cache(tmp_path):
     # Yield the path for tests to use
     yield cache_path
 
+    # Drop shared cache instances so none leak into the next test
+    from aletheia_probe.cache import get_cache_registry
+
+    get_cache_registry().reset()
+
     # The tmp_path fixture automatically cleans up the temp directory
 
 
@@ -1,10 +1,133 @@
 # SPDX-License-Identifier: MIT
 """Pytest configuration and fixtures for performance tests."""
 
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
 
+from aletheia_probe.cache.connection_utils import get_configured_connection
+from aletheia_probe.cache_sync.synthetic import (
+    SyntheticCacheGenerator,
+    SyntheticCacheSpec,
+    SyntheticSource,
+)
+from aletheia_probe.config import get_config_manager
+from aletheia_probe.data_models import JournalDataDict
+from aletheia_probe.enums import AssessmentType
+
+
+# Sources populated in benchmark databases, each listing half of the journals
+SYNTHETIC_SOURCES: tuple[SyntheticSource, ...] = (
+    SyntheticSource("bealls", AssessmentType.PREDATORY, 1.0),
+    SyntheticSource("scopus", AssessmentType.LEGITIMATE, 1.0),
+)
+
+
+def synthetic_spec(row_count: int) -> SyntheticCacheSpec:
+    """Benchmark database specification for ``row_count`` journals.
+
+    Sources do not overlap, so every stored journal has exactly one
+    assessment and lookups have a single expected answer.
+    """
+    return SyntheticCacheSpec(
+        journal_count=row_count,
+        sources=SYNTHETIC_SOURCES,
+        overlap_ratio=0.0,
+        retractions_per_journal=0.0,
+        acronym_ratio=0.0,
+    )
+
+
+def synthetic_journals(row_count: int) -> list[JournalDataDict]:
+    """Generate journal records in the shape produced by data sources."""
+    return SyntheticCacheGenerator(synthetic_spec(row_count)).generate_journals()
+
+
+def sample_journals(
+    db_path: Path, source_name: str, count: int
+) -> list[tuple[str, str, str]]:
+    """Pick journals listed by a source, spread evenly over the table.
+
+    Only journals with both ISSN and eISSN are sampled.
+
+    Args:
+        db_path: Synthetic cache database
+        source_name: Source listing the journals
+        count: Number of journals to return
+
+    Returns:
+        List of (display name, ISSN, eISSN) tuples
+    """
+    with get_configured_connection(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT j.display_name, j.issn, j.eissn
+            FROM journals j
+            JOIN source_assessments sa ON sa.journal_id = j.id
+            JOIN data_sources ds ON ds.id = sa.source_id
+            WHERE ds.name = ? AND j.issn IS NOT NULL AND j.eissn IS NOT NULL
+            ORDER BY j.id
+            """,
+            (source_name,),
+        ).fetchall()
+    step = max(1, len(rows) // count)
+    return [tuple(row) for row in rows[::step][:count]]
+
+
+@contextmanager
+def cache_db_config(db_path: Path) -> Iterator[None]:
+    """Temporarily point the configured cache database at ``db_path``.
+
+    Cache components created inside the block (backends, JournalCache)
+    use the given database.
+    """
+    cache_config = get_config_manager().load_config().cache
+    previous_db_path = cache_config.db_path
+    cache_config.db_path = str(db_path)
+    try:
+        yield
+    finally:
+        cache_config.db_path = previous_db_path
+
+
+@pytest.fixture(scope="session")
+def synthetic_cache_db(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[int], Path]:
+    """
+    Provide synthetic cache databases, built once per size and session.
+
+    Returns:
+        Callable mapping a row count to a populated database path
+    """
+    databases: dict[int, Path] = {}
+
+    def _get(row_count: int) -> Path:
+        if row_count not in databases:
+            db_dir = tmp_path_factory.mktemp(f"synthetic_{row_count}")
+            db_path = db_dir / "cache.db"
+            generator = SyntheticCacheGenerator(synthetic_spec(row_count))
+            asyncio.run(generator.generate(db_path))
+            databases[row_count] = db_path
+        return databases[row_count]
+
+    return _get
+
+
+@pytest.fixture
+def run_async() -> Iterator[Callable[..., object]]:
+    """
+    Provide a runner executing coroutines on one event loop per test.
+
+    Reusing the loop keeps loop creation out of per-call benchmark timings.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
 
 @pytest.fixture
 def generated_bibtex_file(tmp_path: Path):
@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: MIT
+"""Benchmarks for BibtexParser on large files.
+
+Run them with:
+    pytest tests/performance/test_bibtex_parser_performance.py --benchmark-only
+"""
+
+import pytest
+
+from aletheia_probe.bibtex_parser import BibtexParser
+
+
+@pytest.mark.benchmark(group="bibtex_parser")
+class TestBibtexParserPerformance:
+    """Performance benchmarks for BibTeX parsing."""
+
+    @pytest.mark.parametrize(
+        "entry_count",
+        [
+            500,
+            pytest.param(5_000, marks=pytest.mark.benchmark_comprehensive),
+            pytest.param(20_000, marks=pytest.mark.benchmark_comprehensive),
+        ],
+    )
+    def test_parse_large_file(self, benchmark, generated_bibtex_file, entry_count):
+        """Measure parsing of a generated BibTeX file."""
+        bibtex_file = generated_bibtex_file(entry_count)
+
+        benchmark.extra_info["entry_count"] = entry_count
+        entries, skipped, preprints = benchmark(
+            BibtexParser.parse_bibtex_file, bibtex_file
+        )
+
+        assert len(entries) == entry_count
+        assert skipped == 0
+        assert preprints == 0
+        benchmark.extra_info["entries_per_second"] = (
+            entry_count / benchmark.stats["mean"]
+        )
@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: MIT
+"""Write-throughput benchmarks for AsyncDBWriter._batch_write_journals.
+
+Run them with:
+    pytest tests/performance/test_db_writer_performance.py --benchmark-only
+"""
+
+from pathlib import Path
+
+import pytest
+
+from aletheia_probe.cache.schema import init_database
+from aletheia_probe.cache_sync.bulk_load import BulkLoadBuild
+from aletheia_probe.cache_sync.db_writer import AsyncDBWriter
+from aletheia_probe.data_models import JournalDataDict
+
+from .conftest import cache_db_config, synthetic_journals
+
+
+# Rounds per size; each round writes into a freshly initialized database
+WRITE_ROUNDS = 3
+
+
+@pytest.mark.benchmark(group="db_writer")
+class TestDBWriterPerformance:
+    """Performance benchmarks for batch journal writes."""
+
+    @pytest.mark.parametrize(
+        "row_count",
+        [
+            1_000,
+            pytest.param(10_000, marks=pytest.mark.benchmark_comprehensive),
+            pytest.param(100_000, marks=pytest.mark.benchmark_comprehensive),
+        ],
+    )
+    def test_batch_write_journals(self, benchmark, tmp_path, row_count):
+        """Measure rows/sec for an initial load into an empty database."""
+        writer = AsyncDBWriter()
+        journals = synthetic_journals(row_count)
+        db_path = tmp_path / "cache.db"
+
+        def fresh_database() -> tuple[tuple[str, str, list[JournalDataDict]], dict]:
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+            init_database(db_path)
+            return ("bealls", "predatory", journals), {}
+
+        with cache_db_config(db_path):
+            stats = benchmark.pedantic(
+                writer._batch_write_journals,
+                setup=fresh_database,
+                rounds=WRITE_ROUNDS,
+            )
+
+        assert stats["unique_journals"] == row_count
+        benchmark.extra_info["row_count"] = row_count
+        benchmark.extra_info["rows_per_second"] = row_count / benchmark.stats["mean"]
+
+    @pytest.mark.parametrize(
+        "row_count",
+        [
+            1_000,
+            pytest.param(10_000, marks=pytest.mark.benchmark_comprehensive),
+            pytest.param(100_000, marks=pytest.mark.benchmark_comprehensive),
+        ],
+    )
+    def test_bulk_load_write(self, benchmark, tmp_path, row_count):
+        """Measure rows/sec for a bulk build: deferred indexes, ANALYZE and swap."""
+        journals = synthetic_journals(row_count)
+        db_path = tmp_path / "cache.db"
+
+        def fresh_build() -> tuple[tuple[BulkLoadBuild], dict]:
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+            build = BulkLoadBuild(db_path)
+            build.prepare()
+            return (build,), {}
+
+        def load(build: BulkLoadBuild) -> dict:
+            stats = AsyncDBWriter(build.build_path)._batch_write_journals(
+                "bealls", "predatory", journals
+            )
+            build.finalize()
+            return stats
+
+        with cache_db_config(db_path):
+            stats = benchmark.pedantic(load, setup=fresh_build, rounds=WRITE_ROUNDS)
+
+        assert stats["unique_journals"] == row_count
+        benchmark.extra_info["row_count"] = row_count
+        benchmark.extra_info["rows_per_second"] = row_count / benchmark.stats["mean"]
+
+    @pytest.mark.parametrize("changed_percent", [0, 1])
+    @pytest.mark.parametrize(
+        "row_count",
+        [
+            10_000,
+            pytest.param(100_000, marks=pytest.mark.benchmark_comprehensive),
+        ],
+    )
+    def test_resync_write(self, benchmark, tmp_path, row_count, changed_percent):
+        """Measure a re-sync of a mostly unchanged source against its fingerprints."""
+        writer = AsyncDBWriter()
+        journals = synthetic_journals(row_count)
+        step = 100 // changed_percent if changed_percent else 0
+        resync_journals: list[JournalDataDict] = [
+            {**journal, "publisher": "Changed Publisher"}
+            if step and i % step == 0
+            else journal
+            for i, journal in enumerate(journals)
+        ]
+        db_path = tmp_path / "cache.db"
+
+        def synced_database() -> tuple[tuple[str, str, list[JournalDataDict]], dict]:
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+            init_database(db_path)
+            writer._batch_write_journals("bealls", "predatory", journals)
+            return ("bealls", "predatory", resync_journals), {}
+
+        with cache_db_config(db_path):
+            stats = benchmark.pedantic(
+                writer._batch_write_journals,
+                setup=synced_database,
+                rounds=WRITE_ROUNDS,
+            )
+
+        assert stats["records_updated"] == row_count * changed_percent // 100
+        benchmark.extra_info["row_count"] = row_count
+        benchmark.extra_info["rows_per_second"] = row_count / benchmark.stats["mean"]
@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: MIT
+"""Benchmarks for scanning the DBLP XML dump.
+
+A synthetic dump mixes journal articles, conference papers and proceedings
+with the records DBLP interleaves but the venue source skips (theses, home
+pages, CoRR articles). The expat scanner is compared against the
+ElementTree ``iterparse`` scan it replaced.
+
+Run them with:
+    pytest tests/performance/test_dblp_parse_performance.py --benchmark-only
+"""
+
+import gzip
+import html
+import io
+import re
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from defusedxml import ElementTree as DefusedET
+
+from aletheia_probe.updater.sources.dblp import (
+    DEFAULT_PARSE_CHUNK_SIZE,
+    DblpVenueSource,
+    _DblpRecordScanner,
+)
+
+
+RECORD_COUNTS = [
+    50_000,
+    pytest.param(500_000, marks=pytest.mark.benchmark_comprehensive),
+]
+VENUE_COUNT = 200
+
+_RECORD_TEMPLATES = (
+    """<article mdate="2024-01-0{d}" key="journals/j{v}/A{i}">
+<author>J&uuml;rgen M&uuml;ller {i}</author><author>Ana Garc&iacute;a</author>
+<title>On the <i>Analysis</i> of Record {i}</title><pages>{i}-{e}</pages>
+<year>{y}</year><volume>{d}</volume><journal>Journal {v} of Studies</journal>
+<issn>1234-567{d}</issn><ee>https://doi.org/10.1000/{i}</ee><url>db/journals/j{v}/j{v}{d}.html#A{i}</url>
+</article>
+""",
+    """<inproceedings mdate="2024-01-0{d}" key="conf/c{v}/P{i}">
+<author>Fran&ccedil;ois Dupont</author><author>Kim Lee {i}</author>
+<title>A Paper on Record {i}</title><pages>{i}-{e}</pages><year>{y}</year>
+<booktitle>Conf{v} M&uuml;nchen</booktitle><ee>https://doi.org/10.1000/c{i}</ee>
+<crossref>conf/c{v}/{y}</crossref><url>db/conf/c{v}/c{v}{y}.html#P{i}</url>
+</inproceedings>
+""",
+    """<article mdate="2024-01-0{d}" key="journals/corr/abs-{i}" publtype="informal">
+<author>Some Author {i}</author><title>Preprint {i}</title><journal>CoRR</journal>
+<volume>abs/{i}</volume><year>{y}</year><ee>https://arxiv.org/abs/{i}</ee>
+</article>
+""",
+    """<www mdate="2024-01-0{d}" key="homepages/{i}/x"><author>Person {i}</author>
+<title>Home Page</title><url>https://example.org/{i}</url></www>
+""",
+    """<proceedings mdate="2024-01-0{d}" key="conf/c{v}/{y}">
+<editor>Editor {i}</editor><title>Proceedings of Conf{v} {y}</title>
+<booktitle>Conf{v}</booktitle><publisher>ACM</publisher><year>{y}</year>
+<isbn>978-1-0000-{i}</isbn></proceedings>
+""",
+)
+
+
+def _write_synthetic_dump(path: Path, record_count: int) -> None:
+    with gzip.open(path, "wt", encoding="iso-8859-1") as dump:
+        dump.write('<?xml version="1.0" encoding="ISO-8859-1"?>\n')
+        dump.write('<!DOCTYPE dblp SYSTEM "dblp.dtd">\n<dblp>\n')
+        for i in range(record_count):
+            template = _RECORD_TEMPLATES[i % len(_RECORD_TEMPLATES)]
+            dump.write(
+                template.format(
+                    i=i, v=i % VENUE_COUNT, d=i % 9 + 1, e=i + 9, y=2000 + i % 25
+                )
+            )
+        dump.write("</dblp>\n")
+
+
+@pytest.fixture(scope="module")
+def synthetic_dump(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[int], Path]:
+    """Provide synthetic DBLP dumps, written once per record count."""
+    dumps: dict[int, Path] = {}
+
+    def _get(record_count: int) -> Path:
+        if record_count not in dumps:
+            path = tmp_path_factory.mktemp(f"dblp_{record_count}") / "dblp.xml.gz"
+            _write_synthetic_dump(path, record_count)
+            dumps[record_count] = path
+        return dumps[record_count]
+
+    return _get
+
+
+def _iterparse_scan(dump_path: Path) -> int:
+    """Scan the dump like the former ElementTree implementation."""
+    entity = re.compile(r"&([A-Za-z][A-Za-z0-9]+);")
+
+    def decode(match: re.Match[str]) -> str:
+        if match.group(1) in {"amp", "lt", "gt", "apos", "quot"}:
+            return match.group(0)
+        return html.unescape(match.group(0))
+
+    class _Reader:
+        def __init__(self, wrapped: io.TextIOWrapper) -> None:
+            self.wrapped = wrapped
+            self.carry = ""
+
+        def read(self, size: int = -1) -> str:
+            data = self.carry + self.wrapped.read(size)
+            # Keep an entity split across reads for the next one
+            tail = data.rfind("&")
+            if tail != -1 and ";" not in data[tail:]:
+                data, self.carry = data[:tail], data[tail:]
+            else:
+                self.carry = ""
+            return entity.sub(decode, data)
+
+    records = 0
+    with gzip.open(dump_path, "rb") as gz_file:
+        text = io.TextIOWrapper(gz_file, encoding="iso-8859-1")
+        # iterparse would reject the DOCTYPE of the external DTD
+        text.readline()
+        text.readline()
+        stream = _Reader(text)
+        for _event, elem in DefusedET.iterparse(stream, events=("end",)):
+            key = elem.attrib.get("key", "")
+            if elem.tag in ("proceedings", "inproceedings", "article"):
+                if key.startswith(("conf/", "journals/")):
+                    elem.findtext("year")
+                    elem.findtext("booktitle")
+                    elem.findtext("journal")
+                    records += 1
+                elem.clear()
+    return records
+
+
+def _scanner_scan(dump_path: Path) -> int:
+    scanner = _DblpRecordScanner()
+    records = 0
+    with gzip.open(dump_path, "rb") as gz_file:
+        while chunk := gz_file.read(DEFAULT_PARSE_CHUNK_SIZE):
+            records += len(scanner.feed(chunk))
+        records += len(scanner.feed(b"", final=True))
+    return records
+
+
+def _expected_records(record_count: int) -> int:
+    """All records except the home pages."""
+    return sum(1 for i in range(record_count) if i % len(_RECORD_TEMPLATES) != 3)
+
+
+@pytest.mark.benchmark(group="dblp_scan")
+@pytest.mark.parametrize("record_count", RECORD_COUNTS)
+@pytest.mark.parametrize(
+    "scan", [_scanner_scan, _iterparse_scan], ids=["expat_scanner", "iterparse"]
+)
+def test_dblp_scan(benchmark, synthetic_dump, record_count, scan):
+    """Measure scanning the venue records out of the dump."""
+    dump_path = synthetic_dump(record_count)
+
+    records = benchmark.pedantic(scan, args=(dump_path,), rounds=3, iterations=1)
+
+    assert records == _expected_records(record_count)
+    benchmark.extra_info["records_per_second"] = record_count / benchmark.stats["mean"]
+
+
+@pytest.mark.benchmark(group="dblp_parse")
+@pytest.mark.parametrize("record_count", RECORD_COUNTS)
+def test_dblp_parse_dump_file(benchmark, synthetic_dump, tmp_path, record_count):
+    """Measure the full parse including venue aggregation."""
+    source = DblpVenueSource(data_dir=tmp_path)
+    source.dump_path = synthetic_dump(record_count)
+
+    entries = benchmark.pedantic(source._parse_dump_file, rounds=3, iterations=1)
+
+    assert entries
+
+
+@pytest.mark.benchmark(group="dblp_scan_memory")
+def test_dblp_scan_memory_is_constant(synthetic_dump):
+    """Test that the scanner's peak memory does not grow with the dump."""
+
+    def peak_bytes(record_count: int) -> int:
+        dump_path = synthetic_dump(record_count)
+        tracemalloc.start()
+        try:
+            _scanner_scan(dump_path)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak_bytes(5_000), peak_bytes(50_000)
+
+    assert large < 1.5 * small
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: MIT
+"""End-to-end benchmarks for QueryDispatcher.assess_journal.
+
+The dispatcher queries the cached Beall's and Scopus backends against a
+synthetic database. OpenAlex identifier resolution is stubbed so the
+benchmark never touches the network.
+
+Run them with:
+    pytest tests/performance/test_dispatcher_performance.py --benchmark-only
+"""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aletheia_probe.backends.base import get_backend_registry
+from aletheia_probe.dispatcher import QueryDispatcher
+from aletheia_probe.models import QueryInput, VenueType
+
+from .conftest import cache_db_config, sample_journals
+
+
+# Backends queried by the benchmark dispatcher (see SYNTHETIC_SOURCES)
+BENCHMARK_BACKENDS = ("bealls", "scopus")
+
+# Queries per benchmark round: hits in each source plus unknown venues
+QUERIES_PER_ROUND = 20
+
+
+def _queries(db_path: Path) -> list[QueryInput]:
+    """Build a mix of predatory hits, legitimate hits and misses."""
+    predatory = sample_journals(db_path, "bealls", QUERIES_PER_ROUND)
+    legitimate = sample_journals(db_path, "scopus", QUERIES_PER_ROUND)
+    queries = []
+    for i in range(QUERIES_PER_ROUND):
+        if i % 3 == 0:
+            name = predatory[i][0]
+        elif i % 3 == 1:
+            name = legitimate[i][0]
+        else:
+            name = f"Unlisted Venue of Synthetic Studies {i}"
+        queries.append(QueryInput(raw_input=name, venue_type=VenueType.JOURNAL))
+    return queries
+
+
+@pytest.mark.benchmark(group="dispatcher")
+class TestDispatcherPerformance:
+    """Performance benchmarks for journal assessment dispatch."""
+
+    @pytest.mark.parametrize(
+        "row_count",
+        [
+            10_000,
+            pytest.param(100_000, marks=pytest.mark.benchmark_comprehensive),
+        ],
+    )
+    def test_assess_journal(self, benchmark, synthetic_cache_db, run_async, row_count):
+        """Measure assessment of a query mix against cached backends."""
+        db_path = synthetic_cache_db(row_count)
+        queries = _queries(db_path)
+
+        with (
+            cache_db_config(db_path),
+            patch.object(
+                QueryDispatcher,
+                "_resolve_identifiers_from_openalex",
+                AsyncMock(return_value=None),
+            ),
+        ):
+            dispatcher = QueryDispatcher()
+            backends = [
+                get_backend_registry().create_backend(name)
+                for name in BENCHMARK_BACKENDS
+            ]
+
+            async def assess_all() -> list[str]:
+                return [
+                    (await dispatcher.assess_journal(query)).assessment
+                    for query in queries
+                ]
+
+            with patch.object(
+                dispatcher, "_get_enabled_backends", return_value=backends
+            ):
+                assessments = benchmark(lambda: run_async(assess_all()))
+
+        assert assessments[0] == "predatory"
+        assert assessments[1] == "legitimate"
+        benchmark.extra_info["row_count"] = row_count
+        benchmark.extra_info["queries_per_second"] = (
+            len(queries) / benchmark.stats["mean"]
+        )
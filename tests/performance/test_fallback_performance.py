@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: MIT
+"""Per-strategy cost benchmarks for FallbackStrategyExecutor.
+
+Each strategy runs against a cached backend backed by a synthetic database,
+with a query that matches a stored journal.
+
+Run them with:
+    pytest tests/performance/test_fallback_performance.py --benchmark-only
+"""
+
+import pytest
+
+from aletheia_probe.backends.base import get_backend_registry
+from aletheia_probe.fallback_chain import FallbackStrategy, QueryFallbackChain
+from aletheia_probe.fallback_executor import FallbackStrategyExecutor
+from aletheia_probe.models import NormalizedVenueInput, QueryInput, VenueType
+
+from .conftest import cache_db_config, sample_journals
+
+
+# Strategies implemented by the default FallbackStrategyMixin handlers
+BENCHMARKED_STRATEGIES = [
+    FallbackStrategy.ISSN,
+    FallbackStrategy.EISSN,
+    FallbackStrategy.EXACT_NAME,
+    FallbackStrategy.NORMALIZED_NAME,
+    FallbackStrategy.FUZZY_NAME,
+    FallbackStrategy.RAW_INPUT,
+    FallbackStrategy.ALIASES,
+    FallbackStrategy.SUBSTRING_MATCH,
+    FallbackStrategy.WORD_SIMILARITY,
+]
+
+
+def _query_for_journal(name: str, issn: str, eissn: str) -> QueryInput:
+    """Build a normalized query for a journal stored in the synthetic DB."""
+    return QueryInput(
+        raw_input=name,
+        venue_type=VenueType.JOURNAL,
+        normalized_venue=NormalizedVenueInput(
+            original_text=name,
+            name=name.lower(),
+            issn=issn,
+            eissn=eissn,
+            venue_type=VenueType.JOURNAL,
+            aliases=[f"{name} Online", name],
+        ),
+    )
+
+
+@pytest.mark.benchmark(group="fallback_strategies")
+class TestFallbackStrategyPerformance:
+    """Performance benchmarks for individual fallback strategies."""
+
+    @pytest.mark.parametrize(
+        "strategy", BENCHMARKED_STRATEGIES, ids=lambda strategy: strategy.value
+    )
+    @pytest.mark.parametrize(
+        "row_count",
+        [
+            10_000,
+            pytest.param(100_000, marks=pytest.mark.benchmark_comprehensive),
+        ],
+    )
+    def test_strategy_cost(
+        self, benchmark, synthetic_cache_db, run_async, row_count, strategy
+    ):
+        """Measure one strategy handler against a cached backend."""
+        db_path = synthetic_cache_db(row_count)
+        with cache_db_config(db_path):
+            backend = get_backend_registry().create_backend("bealls")
+        # A journal from the middle of the source's rows
+        query_input = _query_for_journal(*sample_journals(db_path, "bealls", 2)[1])
+        executor = FallbackStrategyExecutor(
+            backend, query_input, QueryFallbackChain([strategy])
+        )
+
+        benchmark.extra_info["row_count"] = row_count
+        result = benchmark(lambda: run_async(executor.execute_strategy(strategy)))
+
+        assert result is not None
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MIT
+"""Benchmarks for JournalCache search queries on synthetic databases.
+
+Database sizes above 10k rows are comprehensive benchmarks; building the
+1M-row database takes a few minutes.
+
+Run them with:
+    pytest tests/performance/test_journal_cache_performance.py --benchmark-only
+"""
+
+import pytest
+
+from aletheia_probe.cache import JournalCache
+
+from .conftest import sample_journals
+
+
+# Number of lookups per benchmark round (spread over the whole table)
+LOOKUPS_PER_ROUND = 50
+
+ROW_COUNTS = [
+    10_000,
+    pytest.param(100_000, marks=pytest.mark.benchmark_comprehensive),
+    pytest.param(1_000_000, marks=pytest.mark.benchmark_comprehensive),
+]
+
+
+@pytest.mark.benchmark(group="journal_cache")
+class TestJournalCachePerformance:
+    """Performance benchmarks for journal cache searches."""
+
+    @pytest.mark.parametrize("row_count", ROW_COUNTS)
+    def test_search_by_name(self, benchmark, synthetic_cache_db, row_count):
+        """Measure exact-name lookups as used by cached backends."""
+        db_path = synthetic_cache_db(row_count)
+        cache = JournalCache(db_path)
+        names = [
+            name for name, _, _ in sample_journals(db_path, "bealls", LOOKUPS_PER_ROUND)
+        ]
+
+        def search_all() -> int:
+            return sum(
+                len(cache.search_journals_by_name(name, "bealls", "predatory"))
+                for name in names
+            )
+
+        benchmark.extra_info["row_count"] = row_count
+        assert benchmark(search_all) == len(names)
+
+    @pytest.mark.parametrize("row_count", ROW_COUNTS)
+    def test_search_by_issn(self, benchmark, synthetic_cache_db, row_count):
+        """Measure ISSN lookups filtered by source and assessment."""
+        db_path = synthetic_cache_db(row_count)
+        cache = JournalCache(db_path)
+        issns = [
+            issn for _, issn, _ in sample_journals(db_path, "bealls", LOOKUPS_PER_ROUND)
+        ]
+
+        def search_all() -> int:
+            return sum(
+                len(
+                    cache.search_journals(
+                        issn=issn, source_name="bealls", assessment="predatory"
+                    )
+                )
+                for issn in issns
+            )
+
+        benchmark.extra_info["row_count"] = row_count
+        assert benchmark(search_all) == len(issns)
+
+    @pytest.mark.parametrize("row_count", ROW_COUNTS)
+    def test_search_by_name_substring(self, benchmark, synthetic_cache_db, row_count):
+        """Measure a substring (LIKE) search, which scans the journals table."""
+        db_path = synthetic_cache_db(row_count)
+        cache = JournalCache(db_path)
+        fragment = sample_journals(db_path, "bealls", LOOKUPS_PER_ROUND)[-1][0].lower()
+
+        benchmark.extra_info["row_count"] = row_count
+        results = benchmark(cache.search_journals, normalized_name=fragment)
+
+        assert len(results) >= 1
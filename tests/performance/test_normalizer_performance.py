@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: MIT
+"""Throughput benchmarks for InputNormalizer.normalize.
+
+Run them with:
+    pytest tests/performance/test_normalizer_performance.py --benchmark-only
+"""
+
+import pytest
+
+from aletheia_probe.normalizer import InputNormalizer
+
+from .conftest import synthetic_journals
+
+
+# Realistic raw inputs: abbreviations, ISSNs, LaTeX escapes and parentheticals
+RAW_INPUT_TEMPLATES = (
+    "{name}",
+    "Proc. of the {name}",
+    "{name} (ISSN 0378-5955)",
+    "J. {name} \\& Applications",
+    "The {name} - Online Edition",
+)
+
+
+def _raw_inputs(count: int) -> list[str]:
+    """Build a list of varied raw venue strings."""
+    return [
+        RAW_INPUT_TEMPLATES[i % len(RAW_INPUT_TEMPLATES)].format(
+            name=journal["journal_name"]
+        )
+        for i, journal in enumerate(synthetic_journals(count))
+    ]
+
+
+@pytest.mark.benchmark(group="normalizer")
+class TestNormalizerPerformance:
+    """Performance benchmarks for input normalization."""
+
+    @pytest.mark.parametrize(
+        "input_count",
+        [
+            100,
+            pytest.param(1_000, marks=pytest.mark.benchmark_comprehensive),
+            pytest.param(10_000, marks=pytest.mark.benchmark_comprehensive),
+        ],
+    )
+    def test_normalize_throughput(self, benchmark, input_count):
+        """Measure normalization of a batch of raw venue strings."""
+        normalizer = InputNormalizer()
+        raw_inputs = _raw_inputs(input_count)
+
+        def normalize_all() -> int:
+            return sum(
+                1 for raw in raw_inputs if normalizer.normalize(raw).normalized_venue
+            )
+
+        benchmark.extra_info["input_count"] = input_count
+        normalized = benchmark(normalize_all)
+
+        assert normalized == input_count
+        benchmark.extra_info["inputs_per_second"] = (
+            input_count / benchmark.stats["mean"]
+        )
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: MIT
+"""Benchmarks for removing a source and cleaning up orphaned journals.
+
+Each round works on a fresh copy of a synthetic database in which two
+non-overlapping sources list half of the journals each.
+
+Run them with:
+    pytest tests/performance/test_source_removal_performance.py --benchmark-only
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from aletheia_probe.cache import DataSourceManager
+from aletheia_probe.cache.connection_utils import get_configured_connection
+
+
+REMOVAL_ROUNDS = 3
+
+ROW_COUNTS = [
+    100_000,
+    pytest.param(1_000_000, marks=pytest.mark.benchmark_comprehensive),
+]
+
+
+def _copy_database(source: Path, target: Path) -> DataSourceManager:
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{target}{suffix}").unlink(missing_ok=True)
+    shutil.copyfile(source, target)
+    return DataSourceManager(target)
+
+
+def _journal_count(db_path: Path) -> int:
+    with get_configured_connection(db_path) as conn:
+        return int(conn.execute("SELECT COUNT(*) FROM journals").fetchone()[0])
+
+
+def _bealls_count(db_path: Path) -> int:
+    with get_configured_connection(db_path) as conn:
+        return int(
+            conn.execute(
+                """
+                SELECT COUNT(*) FROM source_assessments sa
+                JOIN data_sources ds ON ds.id = sa.source_id
+                WHERE ds.name = 'bealls'
+                """
+            ).fetchone()[0]
+        )
+
+
+@pytest.mark.benchmark(group="source_removal")
+@pytest.mark.parametrize("row_count", ROW_COUNTS)
+def test_remove_source_data(benchmark, synthetic_cache_db, tmp_path, row_count):
+    """Measure removing one of two sources, including its orphaned journals."""
+    source_db = synthetic_cache_db(row_count)
+    expected = _bealls_count(source_db)
+    db_path = tmp_path / "cache.db"
+
+    def fresh_copy() -> tuple[tuple[DataSourceManager], dict]:
+        return (_copy_database(source_db, db_path),), {}
+
+    def remove(manager: DataSourceManager) -> int:
+        removed = manager.remove_source_data("bealls")
+        manager.close()
+        return removed
+
+    removed = benchmark.pedantic(remove, setup=fresh_copy, rounds=REMOVAL_ROUNDS)
+
+    assert removed == expected
+    assert _journal_count(db_path) == row_count - removed
+    benchmark.extra_info["rows_per_second"] = removed / benchmark.stats["mean"]
+
+
+@pytest.mark.benchmark(group="source_removal")
+@pytest.mark.parametrize("row_count", ROW_COUNTS)
+def test_cleanup_orphaned_records(benchmark, synthetic_cache_db, tmp_path, row_count):
+    """Measure a full orphan sweep after a source was unregistered."""
+    source_db = synthetic_cache_db(row_count)
+    expected = _bealls_count(source_db)
+    db_path = tmp_path / "cache.db"
+
+    def fresh_copy() -> tuple[tuple[DataSourceManager], dict]:
+        manager = _copy_database(source_db, db_path)
+        with manager.get_connection() as conn:
+            conn.execute("DELETE FROM data_sources WHERE name = 'bealls'")
+        return (manager,), {}
+
+    def cleanup(manager: DataSourceManager) -> int:
+        removed = manager.cleanup_orphaned_records()
+        manager.close()
+        return removed
+
+    removed = benchmark.pedantic(cleanup, setup=fresh_copy, rounds=REMOVAL_ROUNDS)
+
+    assert removed == expected
+    benchmark.extra_info["journals_per_second"] = row_count / benchmark.stats["mean"]
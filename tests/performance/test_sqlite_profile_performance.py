@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: MIT
+"""Benchmarks comparing the built-in SQLite connection profiles.
+
+Each profile is applied to the workload under test through
+``cache.sqlite_profiles`` (lookups as "query", batch writes as "sync").
+
+Run them with:
+    pytest tests/performance/test_sqlite_profile_performance.py --benchmark-only
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from aletheia_probe.cache import JournalCache
+from aletheia_probe.cache.schema import init_database
+from aletheia_probe.cache_sync.db_writer import AsyncDBWriter
+from aletheia_probe.config import (
+    SqliteProfileConfig,
+    SqliteWorkload,
+    get_config_manager,
+)
+from aletheia_probe.data_models import JournalDataDict
+
+from .conftest import cache_db_config, sample_journals, synthetic_journals
+
+
+LOOKUP_ROW_COUNT = 10_000
+LOOKUPS_PER_ROUND = 100
+WRITE_ROUNDS = 3
+
+# "readonly" behaves like "reader" for lookups and cannot write
+LOOKUP_PROFILES = [
+    "default",
+    "interactive",
+    "reader",
+    "readonly",
+    "writer",
+    "bulk_load",
+]
+WRITE_PROFILES = ["default", "interactive", "reader", "writer", "bulk_load"]
+
+
+@contextmanager
+def workload_profile(workload: SqliteWorkload, profile: str) -> Iterator[None]:
+    """Temporarily run a workload with a built-in profile."""
+    cache_config = get_config_manager().load_config().cache
+    previous = cache_config.sqlite_profiles
+    cache_config.sqlite_profiles = {workload: SqliteProfileConfig(base=profile)}
+    try:
+        yield
+    finally:
+        cache_config.sqlite_profiles = previous
+
+
+@pytest.mark.benchmark(group="sqlite_profile_lookup")
+@pytest.mark.parametrize("profile", LOOKUP_PROFILES)
+def test_lookup_throughput(benchmark, synthetic_cache_db, profile):
+    """Measure ISSN and name lookups on one connection opened with the profile."""
+    db_path = synthetic_cache_db(LOOKUP_ROW_COUNT)
+    samples = sample_journals(db_path, "bealls", LOOKUPS_PER_ROUND)
+
+    with workload_profile("query", profile):
+        cache = JournalCache(db_path)
+
+        def lookup_all() -> int:
+            found = 0
+            for name, issn, _ in samples:
+                found += len(cache.search_journals(issn=issn, source_name="bealls"))
+                found += len(cache.search_journals_by_name(name, "bealls", "predatory"))
+            return found
+
+        result = benchmark(lookup_all)
+        cache.close()
+
+    assert result == 2 * len(samples)
+    benchmark.extra_info["lookups_per_second"] = (
+        2 * len(samples) / benchmark.stats["mean"]
+    )
+
+
+@pytest.mark.benchmark(group="sqlite_profile_sync")
+@pytest.mark.parametrize(
+    "row_count",
+    [5_000, pytest.param(50_000, marks=pytest.mark.benchmark_comprehensive)],
+)
+@pytest.mark.parametrize("profile", WRITE_PROFILES)
+def test_sync_throughput(benchmark, tmp_path, profile, row_count):
+    """Measure rows/sec of an initial batch write with the profile."""
+    writer = AsyncDBWriter()
+    journals = synthetic_journals(row_count)
+    db_path = tmp_path / "cache.db"
+
+    def fresh_database() -> tuple[tuple[str, str, list[JournalDataDict]], dict]:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        init_database(db_path)
+        return ("bealls", "predatory", journals), {}
+
+    with cache_db_config(db_path), workload_profile("sync", profile):
+        stats = benchmark.pedantic(
+            writer._batch_write_journals, setup=fresh_database, rounds=WRITE_ROUNDS
+        )
+
+    assert stats["unique_journals"] == row_count
+    benchmark.extra_info["rows_per_second"] = row_count / benchmark.stats["mean"]
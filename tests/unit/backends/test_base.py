@@ -397,6 +397,106 @@ class TestApiBackendWithCache:
             assert result.status == BackendStatus.NOT_FOUND
             assert result.confidence == 0.0
 
+    @pytest.mark.asyncio
+    async def test_api_with_cache_backend_serves_stale_and_refreshes(
+        self,
+        mock_api_with_cache_backend: ApiBackendWithCache,
+        sample_query_input: QueryInput,
+    ) -> None:
+        """Test stale-while-revalidate serves expired entries and refreshes them."""
+        from aletheia_probe.backends.stale_refresh import StaleRefresher
+        from aletheia_probe.models import AssessmentResult
+
+        stale_assessment = AssessmentResult(
+            input_query="Test Journal",
+            assessment=AssessmentType.PREDATORY,
+            confidence=0.9,
+            overall_score=0.9,
+            backend_results=[
+                BackendResult(
+                    fallback_chain=QueryFallbackChain([]),
+                    backend_name="mock_api_with_cache",
+                    status=BackendStatus.FOUND,
+                    confidence=0.9,
+                    assessment=AssessmentType.PREDATORY,
+                    data={"test": "stale_data"},
+                    sources=["cache"],
+                    response_time=0.1,
+                )
+            ],
+            metadata=None,
+            processing_time=1.0,
+        )
+        refresher = StaleRefresher(enabled=True, max_stale_hours=24)
+
+        with (
+            patch(
+                "aletheia_probe.backends.base.get_stale_refresher",
+                return_value=refresher,
+            ),
+            patch.object(
+                mock_api_with_cache_backend.assessment_cache,
+                "get_cached_assessment",
+                return_value=None,
+            ),
+            patch.object(
+                mock_api_with_cache_backend.assessment_cache,
+                "get_stale_assessment",
+                return_value=(stale_assessment, 120.04),
+            ),
+            patch.object(
+                mock_api_with_cache_backend.assessment_cache,
+                "cache_assessment_result",
+            ) as mock_cache,
+        ):
+            result = await mock_api_with_cache_backend.query(sample_query_input)
+
+            assert result.cached is True
+            assert result.data["test"] == "stale_data"
+            assert result.data["stale"] is True
+            assert result.data["stale_age_seconds"] == 120.0
+            assert refresher.in_flight_count == 1
+
+            await refresher.drain()
+
+            assert refresher.in_flight_count == 0
+            mock_cache.assert_called_once()
+            refreshed = mock_cache.call_args.args[2]
+            assert refreshed.backend_results[0].data == {"api": "data"}
+
+    @pytest.mark.asyncio
+    async def test_api_with_cache_backend_stale_disabled_queries_api(
+        self,
+        mock_api_with_cache_backend: ApiBackendWithCache,
+        sample_query_input: QueryInput,
+    ) -> None:
+        """Test that stale entries are not consulted when the policy is off."""
+        from aletheia_probe.backends.stale_refresh import StaleRefresher
+
+        with (
+            patch(
+                "aletheia_probe.backends.base.get_stale_refresher",
+                return_value=StaleRefresher(enabled=False),
+            ),
+            patch.object(
+                mock_api_with_cache_backend.assessment_cache,
+                "get_cached_assessment",
+                return_value=None,
+            ),
+            patch.object(
+                mock_api_with_cache_backend.assessment_cache, "get_stale_assessment"
+            ) as mock_stale,
+            patch.object(
+                mock_api_with_cache_backend.assessment_cache,
+                "cache_assessment_result",
+            ),
+        ):
+            result = await mock_api_with_cache_backend.query(sample_query_input)
+
+            mock_stale.assert_not_called()
+            assert result.data == {"api": "data"}
+            assert result.cached is False
+
 
 class TestBackendRegistry:
     """Test cases for backend registry."""
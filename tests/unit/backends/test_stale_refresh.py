@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the stale-while-revalidate background refresher."""
+
+import asyncio
+
+import pytest
+
+from aletheia_probe.backends.stale_refresh import StaleRefresher
+
+
+class TestStaleRefresher:
+    """Test cases for StaleRefresher."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_disabled_does_nothing(self) -> None:
+        """Test that a disabled refresher never starts refreshes."""
+        refresher = StaleRefresher(enabled=False)
+        calls: list[str] = []
+
+        async def refresh() -> None:
+            calls.append("called")
+
+        assert refresher.schedule("key", refresh) is False
+        await refresher.drain()
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_schedule_deduplicates_by_key(self) -> None:
+        """Test that a key is refreshed at most once at a time."""
+        refresher = StaleRefresher(enabled=True, max_concurrent_refreshes=4)
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        async def refresh() -> None:
+            calls.append("called")
+            await release.wait()
+
+        assert refresher.schedule("key", refresh) is True
+        assert refresher.schedule("key", refresh) is False
+
+        release.set()
+        await refresher.drain()
+        assert calls == ["called"]
+        assert refresher.in_flight_count == 0
+
+    @pytest.mark.asyncio
+    async def test_schedule_respects_concurrency_cap(self) -> None:
+        """Test that no more than the configured number of refreshes run."""
+        refresher = StaleRefresher(enabled=True, max_concurrent_refreshes=2)
+        release = asyncio.Event()
+
+        async def refresh() -> None:
+            await release.wait()
+
+        started = [refresher.schedule(f"key-{i}", refresh) for i in range(5)]
+
+        assert started == [True, True, False, False, False]
+        assert refresher.in_flight_count == 2
+
+        release.set()
+        await refresher.drain()
+
+        # Slots are released once refreshes complete
+        assert refresher.schedule("key-2", refresh) is True
+        await refresher.drain()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_logged_and_released(self, caplog) -> None:
+        """Test that refresh errors do not propagate and free their slot."""
+        refresher = StaleRefresher(enabled=True, max_concurrent_refreshes=1)
+
+        async def refresh() -> None:
+            raise ConnectionError("API down")
+
+        assert refresher.schedule("key", refresh) is True
+        await refresher.drain()
+
+        assert refresher.in_flight_count == 0
+        assert "Stale refresh for 'key' failed: API down" in caplog.text
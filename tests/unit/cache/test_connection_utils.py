@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: MIT
+"""Tests for SQLite connection profiles."""
+
+import sqlite3
+
+import pytest
+from pydantic import ValidationError
+
+from aletheia_probe.cache.connection_utils import (
+    SQLITE_PROFILES,
+    get_configured_connection,
+    get_sqlite_profile,
+    set_sqlite_workload,
+)
+from aletheia_probe.config import CacheConfig, SqliteProfileConfig, get_config_manager
+
+
+@pytest.fixture
+def sqlite_profiles():
+    """Provide the configured profile mapping and restore it afterwards."""
+    cache_config = get_config_manager().load_config().cache
+    previous = cache_config.sqlite_profiles
+    cache_config.sqlite_profiles = {}
+    yield cache_config.sqlite_profiles
+    cache_config.sqlite_profiles = previous
+    set_sqlite_workload("query")
+
+
+def _pragma(conn: sqlite3.Connection, name: str) -> object:
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+class TestSqliteProfiles:
+    """Tests for profile resolution and application."""
+
+    def test_workload_defaults(self, sqlite_profiles):
+        """Test the built-in profile used by each workload."""
+        assert get_sqlite_profile("query") == SQLITE_PROFILES["interactive"]
+        assert get_sqlite_profile("mass_eval") == SQLITE_PROFILES["reader"]
+        assert get_sqlite_profile("sync") == SQLITE_PROFILES["writer"]
+        assert get_sqlite_profile("bulk_sync") == SQLITE_PROFILES["bulk_load"]
+
+    def test_active_workload_selects_profile(self, sqlite_profiles):
+        """Test that set_sqlite_workload() changes the default profile."""
+        set_sqlite_workload("mass_eval")
+
+        assert get_sqlite_profile() == SQLITE_PROFILES["reader"]
+
+    def test_unknown_workload_rejected(self):
+        """Test that unknown workloads raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown SQLite workload"):
+            set_sqlite_workload("batch")
+
+    def test_configured_overrides_apply_to_base(self, sqlite_profiles):
+        """Test that configured settings override the base profile."""
+        sqlite_profiles["mass_eval"] = SqliteProfileConfig(
+            base="reader", mmap_size=0, cached_statements=64
+        )
+
+        profile = get_sqlite_profile("mass_eval")
+
+        assert profile.mmap_size == 0
+        assert profile.cached_statements == 64
+        assert profile.cache_size == SQLITE_PROFILES["reader"].cache_size
+
+    def test_pragmas_applied_to_connection(self, sqlite_profiles, tmp_path):
+        """Test that a profile's PRAGMA values are set on new connections."""
+        profile = get_sqlite_profile("bulk_sync")
+
+        with get_configured_connection(tmp_path / "db.sqlite", profile=profile) as conn:
+            assert _pragma(conn, "synchronous") == 0
+            assert _pragma(conn, "cache_size") == profile.cache_size
+            assert _pragma(conn, "temp_store") == 2
+            assert _pragma(conn, "locking_mode") == "normal"
+
+    def test_readonly_profile_rejects_writes(self, tmp_path):
+        """Test that the readonly profile sets query_only."""
+        db_path = tmp_path / "db.sqlite"
+        with get_configured_connection(db_path) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        with get_configured_connection(
+            db_path, profile=SQLITE_PROFILES["readonly"]
+        ) as conn:
+            assert _pragma(conn, "query_only") == 1
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO t VALUES (1)")
+
+    def test_config_validates_pragma_values(self):
+        """Test that PRAGMA values outside the allowed choices are rejected."""
+        with pytest.raises(ValidationError):
+            CacheConfig(sqlite_profiles={"sync": {"synchronous": "OFF; DROP"}})
+        with pytest.raises(ValidationError):
+            CacheConfig(sqlite_profiles={"sync": {"base": "turbo"}})
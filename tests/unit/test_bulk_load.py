@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: MIT
+"""Tests for bulk-load cache builds and ``sync --bulk``."""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aletheia_probe.cache import (
+    AcronymCache,
+    DataSourceManager,
+    DownloadCache,
+    DownloadRecord,
+)
+from aletheia_probe.cache.connection_utils import get_configured_connection
+from aletheia_probe.cache.schema import init_database
+from aletheia_probe.cache_sync import AsyncDBWriter, CacheSyncManager
+from aletheia_probe.cache_sync.bulk_load import BulkLoadBuild
+from aletheia_probe.cache_sync.db_writer import _sync_profile
+from aletheia_probe.config import get_config_manager
+
+
+JOURNALS = [
+    {
+        "journal_name": f"Journal of Bulk Loading {i}",
+        "normalized_name": f"journal of bulk loading {i}",
+        "issn": f"1234-{i:04d}",
+    }
+    for i in range(20)
+]
+
+
+def _index_names(db_path) -> set[str]:
+    with get_configured_connection(db_path) as conn:
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        ).fetchall()
+    return {name for (name,) in rows}
+
+
+def _journal_count(db_path) -> int:
+    with get_configured_connection(db_path) as conn:
+        return int(conn.execute("SELECT COUNT(*) FROM journals").fetchone()[0])
+
+
+@pytest.fixture
+def live_db(tmp_path):
+    """Point the configured cache database at a live DB with an acronym."""
+    db_path = tmp_path / "cache.db"
+    init_database(db_path)
+    AcronymCache(db_path).store_acronym_mapping(
+        "JBL", "Journal of Bulk Loading", "journal", source="test"
+    )
+
+    cache_config = get_config_manager().load_config().cache
+    previous = cache_config.db_path
+    cache_config.db_path = str(db_path)
+    yield db_path
+    cache_config.db_path = previous
+
+
+class TestBulkLoadBuild:
+    """Tests for BulkLoadBuild."""
+
+    def test_prepare_drops_secondary_indexes(self, live_db):
+        """Test that journal table indexes are deferred but UNIQUE ones kept."""
+        build = BulkLoadBuild(live_db)
+        build.prepare()
+
+        indexes = _index_names(build.build_path)
+        assert "idx_journal_names_name" not in indexes
+        assert "idx_journals_normalized_name_lower" not in indexes
+        assert "idx_custom_lists_list_name" in indexes
+        build.abort()
+
+    def test_finalize_swaps_in_indexed_database(self, live_db):
+        """Test that finalize rebuilds indexes, keeps acronyms and swaps files."""
+        build = BulkLoadBuild(live_db)
+        build.prepare()
+        AsyncDBWriter(build.build_path)._batch_write_journals(
+            "bealls", "predatory", JOURNALS
+        )
+
+        build.finalize()
+
+        assert not build.build_path.exists()
+        assert _journal_count(live_db) == len(JOURNALS)
+        assert "idx_journal_names_name" in _index_names(live_db)
+        with get_configured_connection(live_db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+        assert (
+            AcronymCache(live_db).get_full_name_for_acronym("JBL", "journal")
+            == "journal of bulk loading"
+        )
+
+    def test_finalize_keeps_sync_history_and_downloads(self, live_db):
+        """Test that update history and download validators are carried over."""
+        sources = DataSourceManager(live_db)
+        sources.register_data_source("bealls", "Beall's List", "predatory")
+        sources.log_update("bealls", "full", "success", 5)
+        sources.close()
+        downloads = DownloadCache(live_db)
+        body = b"title,issn"
+        record = DownloadRecord(
+            "https://example.org/doaj.csv", hashlib.sha256(body).hexdigest()
+        )
+        downloads.store_downloads("doaj", [(record, body)])
+        downloads.close()
+        build = BulkLoadBuild(live_db)
+        build.prepare()
+        AsyncDBWriter(build.build_path)._batch_write_journals(
+            "bealls", "predatory", JOURNALS
+        )
+
+        build.finalize()
+
+        with get_configured_connection(live_db) as conn:
+            history = conn.execute(
+                """
+                SELECT su.records_added FROM source_updates su
+                JOIN data_sources ds ON ds.id = su.source_id
+                WHERE ds.name = 'bealls' ORDER BY su.id
+                """
+            ).fetchall()
+        assert history[0] == (5,)
+        assert (
+            DownloadCache(live_db).get_download("doaj", "https://example.org/doaj.csv")
+            == record
+        )
+
+    def test_finalize_refuses_database_in_use(self, live_db):
+        """Test that the live database is not replaced under a connection."""
+        build = BulkLoadBuild(live_db)
+        build.prepare()
+        AsyncDBWriter(build.build_path)._batch_write_journals(
+            "bealls", "predatory", JOURNALS
+        )
+
+        reader = sqlite3.connect(live_db)
+        try:
+            reader.execute("SELECT COUNT(*) FROM journals").fetchone()
+            with pytest.raises(sqlite3.OperationalError, match="in use"):
+                build.finalize()
+        finally:
+            reader.close()
+        build.abort()
+
+        assert _journal_count(live_db) == 0
+        assert not build.build_path.exists()
+
+    def test_abort_leaves_live_database(self, live_db):
+        """Test that an aborted build does not touch the live database."""
+        build = BulkLoadBuild(live_db)
+        build.prepare()
+        AsyncDBWriter(build.build_path)._batch_write_journals(
+            "bealls", "predatory", JOURNALS
+        )
+
+        build.abort()
+
+        assert not build.build_path.exists()
+        assert _journal_count(live_db) == 0
+
+
+class TestSyncCacheBulk:
+    """Tests for CacheSyncManager.sync_cache_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_successful_sync_replaces_live_database(self, live_db):
+        """Test that writes during the sync land in the swapped-in database."""
+        manager = CacheSyncManager()
+        seen_db_paths = []
+
+        async def fake_sync(**kwargs):
+            assert kwargs["force"] is True
+            assert kwargs["backend_filter"] is None
+            seen_db_paths.append(get_config_manager().load_config().cache.db_path)
+            # Only the throwaway build skips fsync
+            assert _sync_profile(Path(seen_db_paths[-1])).synchronous == "OFF"
+            assert _sync_profile(live_db).synchronous == "NORMAL"
+            AsyncDBWriter()._batch_write_journals("bealls", "predatory", JOURNALS)
+            return {"bealls": {"status": "success", "records_updated": 20}}
+
+        with patch.object(manager, "sync_cache_with_config", side_effect=fake_sync):
+            results = await manager.sync_cache_bulk(show_progress=False)
+
+        assert results["bealls"]["status"] == "success"
+        assert seen_db_paths == [f"{live_db}.bulk"]
+        assert get_config_manager().load_config().cache.db_path == str(live_db)
+        assert _journal_count(live_db) == len(JOURNALS)
+
+    @pytest.mark.asyncio
+    async def test_failed_backend_keeps_live_database(self, live_db):
+        """Test that a failing backend aborts the build."""
+        manager = CacheSyncManager()
+
+        async def fake_sync(**kwargs):
+            AsyncDBWriter()._batch_write_journals("bealls", "predatory", JOURNALS)
+            return {
+                "bealls": {"status": "success", "records_updated": 20},
+                "doaj": {"status": "failed", "error": "No data received"},
+            }
+
+        with patch.object(manager, "sync_cache_with_config", side_effect=fake_sync):
+            results = await manager.sync_cache_bulk(show_progress=False)
+
+        assert results["doaj"]["status"] == "failed"
+        assert _journal_count(live_db) == 0
+        assert not (live_db.parent / "cache.db.bulk").exists()
@@ -152,6 +152,44 @@ class TestCacheAssessment:
         result = temp_cache.get_cached_assessment(query_hash)
         assert result is None
 
+    def test_get_stale_assessment_within_window(
+        self, temp_cache, sample_assessment_result
+    ):
+        """Test that recently expired assessments are returned with their age."""
+        query_hash = hashlib.md5(b"stale_hash").hexdigest()
+        temp_cache.cache_assessment_result(
+            query_hash, "Test Journal", sample_assessment_result, ttl_hours=-1
+        )
+
+        stale = temp_cache.get_stale_assessment(query_hash, max_stale_hours=2)
+
+        assert stale is not None
+        result, stale_age_seconds = stale
+        assert result.assessment == sample_assessment_result.assessment
+        assert 3500 < stale_age_seconds < 3700
+
+    def test_get_stale_assessment_outside_window(
+        self, temp_cache, sample_assessment_result
+    ):
+        """Test that entries expired beyond the stale window are not returned."""
+        query_hash = hashlib.md5(b"too_old_hash").hexdigest()
+        temp_cache.cache_assessment_result(
+            query_hash, "Test Journal", sample_assessment_result, ttl_hours=-3
+        )
+
+        assert temp_cache.get_stale_assessment(query_hash, max_stale_hours=2) is None
+
+    def test_get_stale_assessment_ignores_fresh_entries(
+        self, temp_cache, sample_assessment_result
+    ):
+        """Test that fresh entries are not reported as stale."""
+        query_hash = hashlib.md5(b"fresh_hash").hexdigest()
+        temp_cache.cache_assessment_result(
+            query_hash, "Test Journal", sample_assessment_result, ttl_hours=24
+        )
+
+        assert temp_cache.get_stale_assessment(query_hash, max_stale_hours=2) is None
+
     def test_cleanup_expired_cache(self, temp_cache, sample_assessment_result):
         """Test cleanup of expired cache entries."""
         recent_hash = hashlib.md5(b"recent_hash").hexdigest()
@@ -65,9 +65,9 @@ class TestCacheBaseErrorHandling:
                 db_path
             )
 
-            # Mock init_database to raise sqlite3.Error
+            # Mock ensure_database to raise sqlite3.Error
             with patch(
-                "aletheia_probe.cache.base.init_database",
+                "aletheia_probe.cache.base.ensure_database",
                 side_effect=sqlite3.Error("Database locked"),
             ):
                 with pytest.raises(
@@ -86,7 +86,7 @@ class TestCacheBaseErrorHandling:
                 db_path
             )
 
-            # Mock init_database to do nothing (we're testing error handling, not schema)
-            with patch("aletheia_probe.cache.base.init_database"):
+            # Mock ensure_database to do nothing (we're testing error handling, not schema)
+            with patch("aletheia_probe.cache.base.ensure_database"):
                 cache_base = CacheBase()
                 assert cache_base.db_path == db_path
@@ -4,12 +4,14 @@
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from aletheia_probe.cache import DataSourceManager
+from aletheia_probe.cache import DataSourceManager, SourceUpdateTiming
 from aletheia_probe.cache.connection_utils import get_configured_connection
 from aletheia_probe.cache.schema import init_database
+from aletheia_probe.cache_sync import AsyncDBWriter
 from aletheia_probe.enums import AssessmentType, UpdateStatus, UpdateType
 
 
@@ -95,3 +97,106 @@ class TestDataSourceManager:
             assert result[-1] == "test_source"  # ds.name (last column)
             assert result[3] == UpdateStatus.SUCCESS.value  # status
             assert result[4] == 100  # records_added
+
+    def test_expected_durations_average_recent_timed_updates(self, temp_cache):
+        """Test that durations of recent successful updates are averaged."""
+        temp_cache.register_data_source(
+            "dblp_venues", "DBLP", AssessmentType.QUALITY_INDICATOR.value
+        )
+        temp_cache.register_data_source(
+            "bealls", "Beall's", AssessmentType.PREDATORY.value
+        )
+        started_at = datetime.now(timezone.utc)
+        for duration, status in [
+            (900.0, UpdateStatus.SUCCESS),
+            (30.0, UpdateStatus.FAILED),
+            (600.0, UpdateStatus.SUCCESS),
+            (300.0, UpdateStatus.SUCCESS),
+            (450.0, UpdateStatus.SUCCESS),
+        ]:
+            temp_cache.log_update(
+                "dblp_venues",
+                UpdateType.FULL.value,
+                status.value,
+                timing=SourceUpdateTiming(started_at, duration, 1_000_000),
+            )
+        # Updates logged without timing are ignored
+        temp_cache.log_update(
+            "bealls", UpdateType.FULL.value, UpdateStatus.SUCCESS.value
+        )
+        # Not-modified runs parse nothing and would lower the estimate
+        temp_cache.log_update(
+            "dblp_venues",
+            UpdateType.VERIFICATION.value,
+            UpdateStatus.SUCCESS.value,
+            timing=SourceUpdateTiming(started_at, 5.0, 0),
+        )
+
+        durations = temp_cache.get_expected_durations(["dblp_venues", "bealls"])
+
+        assert durations == {"dblp_venues": 450.0}
+        with get_configured_connection(temp_cache.db_path) as conn:
+            row = conn.execute(
+                "SELECT started_at, bytes_downloaded FROM source_updates "
+                "ORDER BY id LIMIT 1"
+            ).fetchone()
+        assert row == (started_at.strftime("%Y-%m-%d %H:%M:%S"), 1_000_000)
+
+
+def _write_source(db_path: Path, source_name: str, names: list[str]) -> None:
+    AsyncDBWriter(db_path)._batch_write_journals(
+        source_name,
+        AssessmentType.PREDATORY.value,
+        [
+            {
+                "journal_name": name.title(),
+                "normalized_name": name,
+                "urls": [f"https://{name.replace(' ', '-')}.example"],
+            }
+            for name in names
+        ],
+    )
+
+
+def _count(db_path: Path, table: str) -> int:
+    with get_configured_connection(db_path) as conn:
+        return int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+
+class TestSourceDataRemoval:
+    """Tests for chunked source removal and orphan cleanup."""
+
+    def test_remove_source_keeps_shared_journals(self, temp_cache):
+        """Test that only journals no other source lists are deleted."""
+        db_path = temp_cache.db_path
+        _write_source(db_path, "bealls", [f"journal {i}" for i in range(10)])
+        _write_source(db_path, "doaj", ["journal 0", "journal 1"])
+
+        with patch("aletheia_probe.cache.data_source_manager.CLEANUP_CHUNK_SIZE", 3):
+            removed = temp_cache.remove_source_data("bealls")
+
+        assert removed == 10
+        assert _count(db_path, "source_assessments") == 2
+        assert _count(db_path, "journals") == 2
+        assert _count(db_path, "journal_names") == 2
+        assert _count(db_path, "journal_urls") == 2
+        assert _count(db_path, "source_fingerprints") == 2
+
+    def test_cleanup_orphaned_records(self, temp_cache):
+        """Test that rows of unregistered sources and missing journals are removed."""
+        db_path = temp_cache.db_path
+        _write_source(db_path, "bealls", [f"journal {i}" for i in range(5)])
+        _write_source(db_path, "doaj", ["journal 0", "journal 9"])
+        with get_configured_connection(db_path) as conn:
+            conn.execute("DELETE FROM data_sources WHERE name = 'bealls'")
+            conn.execute(
+                "INSERT INTO journal_urls (journal_id, url) VALUES (9999, 'x')"
+            )
+
+        with patch("aletheia_probe.cache.data_source_manager.CLEANUP_CHUNK_SIZE", 2):
+            removed = temp_cache.cleanup_orphaned_records()
+
+        assert removed == 4
+        assert _count(db_path, "source_assessments") == 2
+        assert _count(db_path, "journals") == 2
+        assert _count(db_path, "journal_urls") == 2
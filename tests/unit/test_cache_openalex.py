@@ -254,6 +254,54 @@ class TestOpenAlexCache:
         result = temp_cache.get_openalex_data(issn="9999-9999")
         assert result is None
 
+    def test_get_stale_returns_recently_expired_entry(self, temp_cache):
+        """Test that get_stale_openalex_data serves entries within the window."""
+        expired_time = datetime.now() - timedelta(hours=1)
+        with get_configured_connection(temp_cache.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO openalex_cache (
+                    issn, normalized_journal_name, openalex_id, display_name,
+                    total_publications, expires_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    "9999-9999",
+                    "stale_journal",
+                    "S999",
+                    "Stale",
+                    100,
+                    expired_time.isoformat(),
+                ),
+            )
+            conn.commit()
+
+        stale = temp_cache.get_stale_openalex_data(issn="9999-9999", max_stale_hours=2)
+        assert stale is not None
+        data, stale_age_seconds = stale
+        assert data["openalex_id"] == "S999"
+        assert data["total_publications"] == 100
+        assert 3500 < stale_age_seconds < 3700
+
+        # Outside the stale window the entry is a miss
+        assert (
+            temp_cache.get_stale_openalex_data(
+                journal_name="stale_journal", max_stale_hours=0.5
+            )
+            is None
+        )
+
+    def test_get_stale_ignores_fresh_entries(self, temp_cache, sample_openalex_data):
+        """Test that fresh entries are not reported as stale."""
+        temp_cache.set_openalex_data(
+            issn="0028-0836",
+            journal_name="nature",
+            openalex_data=sample_openalex_data,
+        )
+
+        assert temp_cache.get_stale_openalex_data(issn="0028-0836") is None
+
     def test_update_existing_entry(self, temp_cache, sample_openalex_data):
         """Test that setting an existing entry updates it."""
         # Set initial data
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the process-wide cache registry."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from aletheia_probe.cache import (
+    AcronymCache,
+    CacheRegistry,
+    DataSourceManager,
+    JournalCache,
+    get_cache_registry,
+)
+from aletheia_probe.cache.schema import (
+    ensure_database,
+    forget_ensured_databases,
+    init_database,
+)
+
+
+@pytest.fixture
+def registry():
+    """Provide a fresh registry with no validated schemas."""
+    forget_ensured_databases()
+    registry = CacheRegistry()
+    yield registry
+    registry.reset()
+
+
+class TestEnsureDatabase:
+    """Tests for once-per-process schema initialization."""
+
+    def test_schema_initialized_once_per_path(self, tmp_path):
+        """Test that repeated calls do not re-run init_database."""
+        db_path = tmp_path / "cache.db"
+        forget_ensured_databases()
+
+        with patch(
+            "aletheia_probe.cache.schema.init_database", wraps=init_database
+        ) as mock_init:
+            ensure_database(db_path)
+            ensure_database(db_path)
+            ensure_database(tmp_path / "." / "cache.db")
+
+        assert mock_init.call_count == 1
+
+    def test_deleted_database_is_reinitialized(self, tmp_path):
+        """Test that a removed database file is created again."""
+        db_path = tmp_path / "cache.db"
+        ensure_database(db_path)
+        db_path.unlink()
+
+        ensure_database(db_path)
+
+        assert db_path.exists()
+        assert DataSourceManager(db_path).get_available_sources() == []
+
+
+class TestCacheRegistry:
+    """Tests for shared cache instances."""
+
+    def test_returns_shared_instance_per_class_and_path(self, registry, tmp_path):
+        """Test that instances are shared per cache class and database path."""
+        db_path = tmp_path / "cache.db"
+
+        journal_cache = registry.get(JournalCache, db_path)
+
+        assert registry.get(JournalCache, db_path) is journal_cache
+        assert isinstance(registry.get(AcronymCache, db_path), AcronymCache)
+        assert registry.get(JournalCache, tmp_path / "other.db") is not journal_cache
+
+    def test_default_path_from_config(self, registry, tmp_path):
+        """Test that the configured database path is used by default."""
+        db_path = tmp_path / "configured.db"
+        with patch("aletheia_probe.cache.base.get_config_manager") as mock_config:
+            mock_config.return_value.load_config.return_value.cache.db_path = str(
+                db_path
+            )
+            journal_cache = registry.get(JournalCache)
+
+        assert journal_cache.db_path == db_path
+        assert db_path.exists()
+
+    def test_reset_drops_instances(self, registry, tmp_path):
+        """Test that reset() hands out new instances afterwards."""
+        db_path = tmp_path / "cache.db"
+        journal_cache = registry.get(JournalCache, db_path)
+
+        registry.reset()
+
+        assert registry.get(JournalCache, db_path) is not journal_cache
+
+    def test_global_registry_is_singleton(self):
+        """Test that get_cache_registry() returns one instance."""
+        assert get_cache_registry() is get_cache_registry()
+
+
+class TestSharedConnections:
+    """Tests for per-thread connection management."""
+
+    def test_each_thread_gets_own_connection(self, registry, tmp_path):
+        """Test that a shared instance is usable from several threads."""
+        journal_cache = registry.get(JournalCache, tmp_path / "cache.db")
+        connections = []
+        errors = []
+
+        def _use_cache() -> None:
+            try:
+                with journal_cache.get_connection() as conn:
+                    conn.execute("SELECT COUNT(*) FROM journals").fetchone()
+                    connections.append(conn)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=_use_cache) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len({id(conn) for conn in connections}) == 4
+
+    def test_close_all_reopens_on_next_use(self, registry, tmp_path):
+        """Test that closed instances open a new connection when used again."""
+        journal_cache = registry.get(JournalCache, tmp_path / "cache.db")
+        with journal_cache.get_connection() as conn:
+            first = conn
+
+        registry.close_all()
+
+        with journal_cache.get_connection() as conn:
+            assert conn is not first
+            assert conn.execute("SELECT 1").fetchone() == (1,)
@@ -64,6 +64,9 @@ class TestCacheSchema:
             "source_assessments",
             "retraction_statistics",
             "source_updates",
+            "source_fingerprints",
+            "source_downloads",
+            "extracted_texts",
             "assessment_cache",
             "article_retractions",
             "openalex_cache",
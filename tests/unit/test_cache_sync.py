@@ -457,7 +457,10 @@ class TestCacheSyncManager:
                 assert result["status"] == "success"
                 assert result["records_updated"] == 100
                 mock_update.assert_called_once_with(
-                    mock_data_source, db_writer=sync_manager.db_writer, force=False
+                    mock_data_source,
+                    db_writer=sync_manager.db_writer,
+                    force=False,
+                    parse_pool=None,
                 )
 
     @pytest.mark.asyncio
@@ -748,6 +751,10 @@ class TestAsyncDBWriter:
                     "total_records": 1,
                     "unique_journals": 1,
                     "duplicates": 0,
+                    "records_added": 1,
+                    "records_updated": 0,
+                    "records_removed": 0,
+                    "previous_records": 0,
                 },
             ) as mock_batch_write,
             patch(
@@ -772,7 +779,7 @@ class TestAsyncDBWriter:
 
             # Verify batch write was called
             mock_batch_write.assert_called_once_with(
-                "test_source", "predatory", test_journals
+                "test_source", "predatory", test_journals, force=False
             )
             mock_cache_manager.log_update.assert_called_once()
 
@@ -1014,6 +1021,10 @@ class TestAsyncDBWriter:
                     "total_records": 5,
                     "unique_journals": 3,
                     "duplicates": 2,  # This will trigger the duplicates > 0 branch
+                    "records_added": 3,
+                    "records_updated": 0,
+                    "records_removed": 0,
+                    "previous_records": 0,
                 },
             ) as mock_batch_write,
             patch(
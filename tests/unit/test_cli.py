@@ -10,9 +10,11 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 from click.testing import CliRunner
 
+from aletheia_probe.cache_sync.synthetic import count_table_rows
 from aletheia_probe.cli import main
 from aletheia_probe.enums import AssessmentType
 from aletheia_probe.fallback_chain import QueryFallbackChain
+from aletheia_probe.loadtest import LoadTestReport
 from aletheia_probe.lookup import LookupCandidate, LookupResult
 from aletheia_probe.models import (
     AssessmentResult,
@@ -241,6 +243,48 @@ class TestAssessCommand:
                 confidence_min=0.9,
             )
 
+    def test_assess_with_profile_writes_trace(self, runner, tmp_path):
+        """Test journal command with --profile exports a Chrome trace."""
+        from aletheia_probe.tracing import span, tracer
+
+        async def fake_assess(*args, **kwargs):
+            with span("backend:test", "backend"):
+                await asyncio.sleep(0)
+
+        trace_path = tmp_path / "trace.json"
+        with patch(
+            "aletheia_probe.cli._async_assess_publication", side_effect=fake_assess
+        ) as mock_async_assess:
+            result = runner.invoke(
+                main, ["journal", "Test Journal", "--profile", str(trace_path)]
+            )
+
+        assert result.exit_code == 0
+        mock_async_assess.assert_called_once_with(
+            "Test Journal",
+            "journal",
+            False,
+            "text",
+            use_acronyms=True,
+            confidence_min=0.8,
+        )
+        trace = json.loads(trace_path.read_text())
+        assert any(e["name"] == "backend:test" for e in trace["traceEvents"])
+        assert tracer.enabled is False
+
+    def test_assess_with_metrics_out_writes_snapshot(self, runner, tmp_path):
+        """Test journal command with --metrics-out writes a metrics snapshot."""
+        metrics_path = tmp_path / "metrics.json"
+        with patch("aletheia_probe.cli._async_assess_publication") as mock_async_assess:
+            result = runner.invoke(
+                main, ["journal", "Test Journal", "--metrics-out", str(metrics_path)]
+            )
+
+        assert result.exit_code == 0
+        mock_async_assess.assert_called_once()
+        metrics = json.loads(metrics_path.read_text())
+        assert {"backends", "caches", "retries"} <= set(metrics)
+
     def test_assess_invalid_format(self, runner):
         """Test journal command with invalid format."""
         result = runner.invoke(main, ["journal", "Test Journal", "--format", "invalid"])
@@ -723,6 +767,30 @@ class TestSyncCommand:
                 force=False, backend_filter=["dblp_venues"], show_progress=True
             )
 
+    def test_sync_command_bulk(self, runner, mock_cache_sync_manager):
+        """Test that --bulk runs the bulk rebuild instead of a regular sync."""
+
+        async def _mock_bulk(*args, **kwargs):
+            return {}
+
+        mock_bulk = Mock(side_effect=_mock_bulk)
+        mock_cache_sync_manager.sync_cache_bulk = mock_bulk
+        mock_sync = Mock()
+        mock_cache_sync_manager.sync_cache_with_config = mock_sync
+
+        result = runner.invoke(main, ["sync", "--bulk"])
+
+        assert result.exit_code == 0
+        mock_bulk.assert_called_once_with(show_progress=True)
+        mock_sync.assert_not_called()
+
+    def test_sync_command_bulk_rejects_backend_names(self, runner):
+        """Test that --bulk cannot be limited to named backends."""
+        result = runner.invoke(main, ["sync", "--bulk", "dblp_venues"])
+
+        assert result.exit_code == 2
+        assert "--bulk rebuilds all backends" in result.output
+
     def test_sync_command_skipped(self, runner):
         """Test sync command when sync is skipped."""
         mock_sync_result = {"status": "skipped", "reason": "auto_sync_disabled"}
@@ -1939,3 +2007,138 @@ class TestAsyncMain:
                 mock_cache.import_acronyms.call_args.kwargs["source_file"]
                 == "github-release-v1"
             )
+
+
+class TestDbGenerateSyntheticCommand:
+    """Test cases for the db generate-synthetic command."""
+
+    def test_generate_synthetic_writes_database(self, runner, tmp_path):
+        """Test generating a small synthetic database with a custom source mix."""
+        output = tmp_path / "synthetic.db"
+
+        result = runner.invoke(
+            main,
+            [
+                "db",
+                "generate-synthetic",
+                str(output),
+                "--journals",
+                "100",
+                "--source",
+                "scopus=2",
+                "--source",
+                "mylist:predatory=1",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert count_table_rows(output)["journals"] == 100
+
+    def test_generate_synthetic_refuses_existing_file(self, runner, tmp_path):
+        """Test that an existing output file requires --force."""
+        output = tmp_path / "synthetic.db"
+        output.write_text("existing")
+
+        result = runner.invoke(main, ["db", "generate-synthetic", str(output)])
+
+        assert result.exit_code == 1
+        assert output.read_text() == "existing"
+
+    def test_generate_synthetic_rejects_unknown_source_without_type(
+        self, runner, tmp_path
+    ):
+        """Test that a source outside the defaults needs an explicit list type."""
+        result = runner.invoke(
+            main,
+            [
+                "db",
+                "generate-synthetic",
+                str(tmp_path / "synthetic.db"),
+                "--source",
+                "mylist=1",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert not (tmp_path / "synthetic.db").exists()
+
+
+class TestDbCleanupCommand:
+    """Test cases for the db cleanup command."""
+
+    def test_cleanup_reports_removed_journals(self, runner, tmp_path):
+        """Test that db cleanup runs the orphan cleanup on the configured DB."""
+        db_path = tmp_path / "cache.db"
+        db_path.touch()
+
+        with (
+            patch("aletheia_probe.cli_commands.db.get_config_manager") as mock_config,
+            patch("aletheia_probe.cli_commands.db.DataSourceManager") as mock_dsm,
+        ):
+            mock_config.return_value.load_config.return_value.cache.db_path = str(
+                db_path
+            )
+            mock_dsm.return_value.cleanup_orphaned_records.return_value = 1234
+            result = runner.invoke(main, ["db", "cleanup"])
+
+        assert result.exit_code == 0
+        mock_dsm.assert_called_once_with(db_path)
+        assert "1,234" in result.output
+
+
+class TestLoadtestCommand:
+    """Test cases for the loadtest command group."""
+
+    def test_loadtest_run_reports_throughput(self, runner, tmp_path):
+        """Test that loadtest run passes options through and prints the report."""
+        bib_file = tmp_path / "refs.bib"
+        bib_file.write_text("@article{a, journal={Journal of Tests}}\n")
+        report = LoadTestReport(
+            processed_entries=10,
+            written_records=10,
+            failed_files=0,
+            elapsed_seconds=2.0,
+            exit_code=0,
+        )
+
+        with patch(
+            "aletheia_probe.cli_commands.loadtest.run_mass_eval_load_test",
+            new=AsyncMock(return_value=report),
+        ) as mock_run:
+            result = runner.invoke(
+                main,
+                [
+                    "loadtest",
+                    "run",
+                    str(bib_file),
+                    "--work-dir",
+                    str(tmp_path / "work"),
+                    "--max-concurrency",
+                    "3",
+                    "--override",
+                    "openalex.latency_ms=250",
+                    "--report-out",
+                    str(tmp_path / "report.json"),
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert mock_run.call_args.kwargs["max_concurrency"] == 3
+        server = mock_run.call_args.args[2]
+        assert server._services["openalex"].profile.latency_ms == 250.0
+        assert (
+            json.loads((tmp_path / "report.json").read_text())["entries_per_second"]
+            == 5.0
+        )
+
+    def test_loadtest_run_rejects_invalid_override(self, runner, tmp_path):
+        """Test that malformed per-service overrides are rejected."""
+        bib_file = tmp_path / "refs.bib"
+        bib_file.write_text("")
+
+        result = runner.invoke(
+            main,
+            ["loadtest", "run", str(bib_file), "--override", "scopus.latency_ms=1"],
+        )
+
+        assert result.exit_code != 0
@@ -137,6 +137,18 @@ class TestConfigManager:
         assert config.output.verbose is True
         assert config.output.format == "yaml"
 
+    def test_endpoint_env_override(self, tmp_path) -> None:
+        """Test overriding an API base URL via environment variable."""
+        env_vars = {
+            "ALETHEIA_PROBE_ENDPOINTS_OPENALEX": "http://127.0.0.1:8700/openalex"
+        }
+
+        with patch.dict(os.environ, env_vars, clear=False):
+            config = ConfigManager(tmp_path / "missing.yaml").load_config()
+
+        assert config.endpoints.openalex == "http://127.0.0.1:8700/openalex"
+        assert config.endpoints.crossref == "https://api.crossref.org"
+
     def test_get_enabled_backends(self, temp_config_file) -> None:
         """Test getting list of enabled backend names."""
         manager = ConfigManager(temp_config_file)
@@ -3,7 +3,7 @@
 
 import asyncio
 import sqlite3
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
@@ -122,6 +122,10 @@ class TestAsyncDBWriter:
                     "total_records": 1,
                     "unique_journals": 1,
                     "duplicates": 0,
+                    "records_added": 1,
+                    "records_updated": 0,
+                    "records_removed": 0,
+                    "previous_records": 0,
                 },
             ) as mock_batch_write,
             patch(
@@ -146,7 +150,7 @@ class TestAsyncDBWriter:
 
             # Verify batch write was called
             mock_batch_write.assert_called_once_with(
-                "test_source", "predatory", test_journals
+                "test_source", "predatory", test_journals, force=False
             )
             mock_cache_manager.log_update.assert_called_once()
 
@@ -176,6 +180,36 @@ class TestAsyncDBWriter:
 
             # The error should be handled gracefully (not crash the test)
 
+    @pytest.mark.asyncio
+    async def test_on_written_called_only_after_successful_write(
+        self, db_writer, memory_db
+    ):
+        """Test that the post-write callback runs only when the write succeeded."""
+        db_writer.db_path = memory_db
+        journals: list[JournalDataDict] = [
+            {"journal_name": "Test", "normalized_name": "test"}
+        ]
+        written = Mock()
+        not_written = Mock()
+
+        await db_writer.start_writer()
+        await db_writer.queue_write(
+            "test_source", "predatory", journals, on_written=written
+        )
+        await db_writer.stop_writer()
+
+        with patch.object(
+            db_writer, "_batch_write_journals", side_effect=sqlite3.Error("boom")
+        ):
+            await db_writer.start_writer()
+            await db_writer.queue_write(
+                "error_source", "predatory", journals, on_written=not_written
+            )
+            await db_writer.stop_writer()
+
+        written.assert_called_once_with()
+        not_written.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_batch_write_journals(self, db_writer, memory_db):
         """Test batch writing of journals."""
@@ -461,6 +495,10 @@ class TestAsyncDBWriter:
                     "total_records": 5,
                     "unique_journals": 3,
                     "duplicates": 2,  # This will trigger the duplicates > 0 branch
+                    "records_added": 3,
+                    "records_updated": 0,
+                    "records_removed": 0,
+                    "previous_records": 0,
                 },
             ) as mock_batch_write,
             patch(
@@ -534,3 +572,262 @@ class TestAsyncDBWriter:
             cursor.execute("SELECT normalized_name FROM journals")
             result = cursor.fetchone()
             assert result[0] == "test_journal"  # Original data unchanged
+
+    def test_get_journal_ids_chunks_large_lookups(self, db_writer, memory_db):
+        """Test that lookups larger than SQLite's parameter limit succeed."""
+        names = [f"journal_{i}" for i in range(2500)]
+
+        with get_configured_connection(memory_db) as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "INSERT INTO journals (normalized_name, display_name) VALUES (?, ?)",
+                [(name, name) for name in names],
+            )
+
+            journal_ids = db_writer._get_journal_ids(cursor, names + ["missing"])
+
+        assert len(journal_ids) == len(names)
+        assert "missing" not in journal_ids
+
+
+def _journals(count: int, publisher: str = "Test Publisher") -> list[JournalDataDict]:
+    return [
+        {
+            "journal_name": f"Diff Journal {i}",
+            "normalized_name": f"diff journal {i}",
+            "issn": f"1111-{i:04d}",
+            "publisher": publisher,
+        }
+        for i in range(count)
+    ]
+
+
+def _source_rows(db_path, query: str) -> list[tuple]:
+    with get_configured_connection(db_path) as conn:
+        return conn.execute(query).fetchall()
+
+
+class TestDifferentialSync:
+    """Tests for fingerprint-based differential writes."""
+
+    @pytest.fixture
+    def writer(self, tmp_path):
+        """Create a writer for a fresh database."""
+        db_path = tmp_path / "cache.db"
+        init_database(db_path)
+        return AsyncDBWriter(db_path)
+
+    def test_first_sync_writes_everything(self, writer):
+        """Test that a source without fingerprints is written in full."""
+        result = writer._batch_write_journals("bealls", "predatory", _journals(5))
+
+        assert result["records_added"] == 5
+        assert result["previous_records"] == 0
+        assert _source_rows(writer.db_path, "SELECT COUNT(*) FROM source_fingerprints")[
+            0
+        ] == (5,)
+
+    def test_unchanged_resync_writes_nothing(self, writer):
+        """Test that an identical re-sync skips all journal writes."""
+        journals = _journals(5)
+        writer._batch_write_journals("bealls", "predatory", journals)
+
+        with patch.object(
+            writer, "_upsert_journals_batch", wraps=writer._upsert_journals_batch
+        ) as mock_upsert:
+            result = writer._batch_write_journals("bealls", "predatory", journals)
+
+        mock_upsert.assert_called_once_with(ANY, [])
+        assert result["records_added"] == 0
+        assert result["records_updated"] == 0
+        assert result["records_removed"] == 0
+        assert result["unique_journals"] == 5
+
+    def test_resync_applies_diff(self, writer):
+        """Test that additions, changes and removals are applied."""
+        writer._batch_write_journals("bealls", "predatory", _journals(5))
+
+        journals = _journals(6)
+        journals[0]["publisher"] = "New Publisher"
+        del journals[1]
+        result = writer._batch_write_journals("bealls", "predatory", journals)
+
+        assert (
+            result["records_added"],
+            result["records_updated"],
+            result["records_removed"],
+        ) == (1, 1, 1)
+        assert _source_rows(
+            writer.db_path,
+            "SELECT publisher FROM journals WHERE normalized_name = 'diff journal 0'",
+        ) == [("New Publisher",)]
+        assessed = _source_rows(
+            writer.db_path,
+            """SELECT j.normalized_name FROM source_assessments sa
+               JOIN journals j ON j.id = sa.journal_id ORDER BY j.normalized_name""",
+        )
+        assert [name for (name,) in assessed] == [
+            f"diff journal {i}" for i in (0, 2, 3, 4, 5)
+        ]
+        # The dropped journal was listed by no other source
+        assert _source_rows(
+            writer.db_path,
+            "SELECT COUNT(*) FROM journals WHERE normalized_name = 'diff journal 1'",
+        ) == [(0,)]
+
+    def test_source_id_stable_across_syncs(self, writer):
+        """Test that re-registering a source keeps assessments attached."""
+        writer._batch_write_journals("bealls", "predatory", _journals(3))
+        writer._batch_write_journals("bealls", "predatory", _journals(3))
+
+        assert _source_rows(
+            writer.db_path,
+            """SELECT COUNT(*) FROM source_assessments sa
+               JOIN data_sources ds ON ds.id = sa.source_id""",
+        ) == [(3,)]
+
+    def test_removed_source_is_rewritten(self, writer):
+        """Test that removing source data forgets its fingerprints."""
+        journals = _journals(3)
+        writer._batch_write_journals("bealls", "predatory", journals)
+        DataSourceManager(writer.db_path).remove_source_data("bealls")
+
+        result = writer._batch_write_journals("bealls", "predatory", journals)
+
+        assert result["records_added"] == 3
+        assert _source_rows(
+            writer.db_path, "SELECT COUNT(*) FROM source_assessments"
+        ) == [(3,)]
+
+    def test_mass_removal_refused_without_force(self, writer):
+        """Test that a sync dropping most of a source's records writes nothing."""
+        writer._batch_write_journals("bealls", "predatory", _journals(30))
+        journals = _journals(10)
+        journals[0]["publisher"] = "New Publisher"
+
+        with pytest.raises(ValueError, match="no longer lists 20 of its 30"):
+            writer._batch_write_journals("bealls", "predatory", journals)
+
+        assert _source_rows(
+            writer.db_path, "SELECT COUNT(*) FROM source_assessments"
+        ) == [(30,)]
+        assert _source_rows(
+            writer.db_path,
+            "SELECT publisher FROM journals WHERE normalized_name = 'diff journal 0'",
+        ) == [("Test Publisher",)]
+
+    def test_mass_removal_allowed_with_force(self, writer):
+        """Test that a forced sync removes the records the source dropped."""
+        writer._batch_write_journals("bealls", "predatory", _journals(30))
+
+        result = writer._batch_write_journals(
+            "bealls", "predatory", _journals(10), force=True
+        )
+
+        assert result["records_removed"] == 20
+        assert _source_rows(
+            writer.db_path, "SELECT COUNT(*) FROM source_assessments"
+        ) == [(10,)]
+
+    @pytest.mark.asyncio
+    async def test_writer_loop_logs_change_counts(self, writer):
+        """Test that the change counts are recorded in source_updates."""
+        await writer.start_writer()
+        await writer.queue_write("bealls", "predatory", _journals(4))
+        await writer.queue_write("bealls", "predatory", _journals(3))
+        await writer.stop_writer()
+
+        rows = _source_rows(
+            writer.db_path,
+            """SELECT update_type, records_added, records_updated, records_removed
+               FROM source_updates ORDER BY id""",
+        )
+        assert rows == [("full", 4, 0, 0), ("incremental", 0, 0, 1)]
+
+    @pytest.mark.asyncio
+    async def test_chunked_write_removes_dropped_records_at_end(self, writer):
+        """Test that a source queued in chunks is diffed as a whole."""
+        writer._batch_write_journals("bealls", "predatory", _journals(5))
+        journals = _journals(6)
+        del journals[1]
+        written = Mock()
+
+        await writer.start_writer()
+        await writer.queue_write("bealls", "predatory", journals[:2], final=False)
+        await writer.queue_write("bealls", "predatory", journals[1:4], final=False)
+        await writer.queue_write(
+            "bealls", "predatory", journals[4:], on_written=written
+        )
+        await writer.stop_writer()
+
+        written.assert_called_once()
+        rows = _source_rows(
+            writer.db_path,
+            """SELECT update_type, records_added, records_updated, records_removed
+               FROM source_updates ORDER BY id""",
+        )
+        assert rows == [("incremental", 1, 0, 1)]
+        assert _source_rows(
+            writer.db_path, "SELECT COUNT(*) FROM source_assessments"
+        ) == [(5,)]
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_skips_rest_of_source(self, writer):
+        """Test that a failed chunk keeps the source's other records."""
+        writer._batch_write_journals("bealls", "predatory", _journals(4))
+        written = Mock()
+
+        await writer.start_writer()
+        await writer.queue_write("bealls", "predatory", _journals(2), final=False)
+        # Records without a journal name fail the chunk with a KeyError
+        broken = [{"normalized_name": "broken journal"}]
+        await writer.queue_write("bealls", "predatory", broken, final=False)
+        await writer.queue_write("bealls", "predatory", [], on_written=written)
+        await writer.stop_writer()
+
+        written.assert_not_called()
+        assert _source_rows(
+            writer.db_path, "SELECT COUNT(*) FROM source_assessments"
+        ) == [(4,)]
+
+    def test_article_retraction_delta(self, writer):
+        """Test that a delta sync deletes dropped DOIs and keeps the others."""
+
+        def article(doi: str, reason: str, expires_at: str = "2025-01-01") -> dict:
+            return {
+                "doi": doi,
+                "is_retracted": True,
+                "retraction_type": "Retraction",
+                "retraction_date": "2024-01-02",
+                "retraction_doi": None,
+                "retraction_reason": reason,
+                "source": "retraction_watch",
+                "expires_at": expires_at,
+            }
+
+        journals = _journals(1)
+        journals[0]["metadata"] = {
+            "_article_retractions": [
+                article("10.1/a", "Fraud"),
+                article("10.1/b", "Error"),
+                article("10.1/c", "Error"),
+            ]
+        }
+        writer._batch_write_journals("retraction_watch", "quality_indicator", journals)
+
+        journals[0]["metadata"] = {
+            "_article_retractions": [article("10.1/b", "Plagiarism", "2030-01-01")],
+            "_article_retractions_delta": {
+                "removed_dois": ["10.1/a"],
+                "expires_at": "2030-01-01",
+            },
+        }
+        writer._batch_write_journals("retraction_watch", "quality_indicator", journals)
+
+        assert _source_rows(
+            writer.db_path,
+            "SELECT doi, retraction_reason, expires_at FROM article_retractions ORDER BY doi",
+        ) == [
+            ("10.1/b", "Plagiarism", "2030-01-01"),
+            ("10.1/c", "Error", "2030-01-01"),
+        ]
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from aiohttp import ClientSession
 
+from aletheia_probe.updater.pagination import PageFetchPolicy
 from aletheia_probe.updater.sources.kscien_generic import KscienGenericSource
 from aletheia_probe.updater.sources.kscien_helpers import (
     PublicationType,
@@ -99,6 +100,48 @@ async def test_fetch_kscien_data_pagination(mock_session):
     assert result[2]["journal_name"] == "Test Journal 3"
 
 
+@pytest.mark.asyncio
+async def test_fetch_kscien_data_uses_expected_count_for_page_total(mock_session):
+    """Test that the expected count bounds the pages fetched concurrently."""
+    publication_type: PublicationType = PublicationType.STANDALONE_JOURNALS
+    base_url = f"https://kscien.org/predatory-publishing/?_publishing_list={publication_type.value}"
+
+    def page_content(page: int) -> str:
+        header = "Standalone Journals (5)" if page == 1 else ""
+        return header + "".join(
+            f'<h4 class="p-title">Test Journal {page}-{i}</h4>'
+            f'<p><a href="http://example.com/{page}/{i}">Visit Website</a></p>'
+            for i in range(2 if page < 3 else 1)
+        )
+
+    requested: list[str] = []
+
+    def get_side_effect(url: str, *args: Any, **kwargs: Any) -> AsyncMock:
+        requested.append(url)
+        page = int(url.split("_pagination=")[1]) if "_pagination=" in url else 1
+        return create_mock_response(page_content(page))
+
+    mock_session.get.side_effect = get_side_effect
+
+    result = await fetch_kscien_data(
+        mock_session,
+        publication_type,
+        base_url,
+        10,
+        lambda: "test_source",
+        policy=PageFetchPolicy(requests_per_second=1000.0),
+    )
+
+    assert len(requested) == 3
+    assert [entry["journal_name"] for entry in result] == [
+        "Test Journal 1-0",
+        "Test Journal 1-1",
+        "Test Journal 2-0",
+        "Test Journal 2-1",
+        "Test Journal 3-0",
+    ]
+
+
 def test_deduplicate_entries():
     """Test deduplication of entries."""
     entries = [
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: MIT
 """Tests for mass evaluation workflow helpers."""
 
+import asyncio
+import json
 from pathlib import Path
 
 import pytest
@@ -276,3 +278,331 @@ async def test_collect_dedupe_cache_reads_existing_keys_and_skips(
     is_owner, wait_future = await cache.claim_or_wait("abc123")
     assert is_owner is False
     assert wait_future is None
+
+
+def test_jsonl_output_writer_flushes_before_checkpoint(tmp_path: Path) -> None:
+    """Buffered records reach the file before the checkpoint counting them."""
+    output_file = tmp_path / "out" / "input.jsonl"
+    state = mass_eval.MassEvalState(
+        state_path=tmp_path / "state.json",
+        mode="assess",
+        input_path=tmp_path,
+    )
+    writer = mass_eval.JsonlOutputWriter(output_file)
+    state.register_writer(writer)
+
+    writer.write({"record_id": "a"})
+    writer.write({"record_id": "b"})
+    assert output_file.read_bytes() == b""
+
+    mass_eval._checkpoint_state(state, force=True)
+    assert output_file.read_text(encoding="utf-8").splitlines() == [
+        '{"record_id": "a"}',
+        '{"record_id": "b"}',
+    ]
+
+    state.unregister_writer(writer)
+    writer.close()
+
+
+@pytest.mark.parametrize("compression", ["gzip", "xz"])
+def test_compressed_jsonl_output_is_readable_after_each_flush(
+    tmp_path: Path, compression: str
+) -> None:
+    """Every flush appends a complete member that resume can read back."""
+    suffix = mass_eval.OUTPUT_COMPRESSION[compression][0]
+    output_file = tmp_path / f"input{suffix}"
+
+    writer = mass_eval.JsonlOutputWriter(output_file, compression)
+    writer.write({"record_id": "a"})
+    writer.flush()
+    writer.write({"record_id": "b"})
+    writer.flush()
+    assert mass_eval._load_existing_record_ids(output_file) == {"a", "b"}
+
+    # A resumed run appends to the same file
+    writer.write({"record_id": "c"})
+    writer.close()
+    writer = mass_eval.JsonlOutputWriter(output_file, compression)
+    writer.write({"record_id": "d"})
+    writer.close()
+
+    assert mass_eval._load_existing_record_ids(output_file) == {"a", "b", "c", "d"}
+
+
+@pytest.mark.parametrize("compression", ["gzip", "xz"])
+def test_incomplete_compressed_member_is_truncated(
+    tmp_path: Path, compression: str
+) -> None:
+    """A member torn by a crash is cut off before the next run appends."""
+    suffix = mass_eval.OUTPUT_COMPRESSION[compression][0]
+    output_file = tmp_path / f"input{suffix}"
+    writer = mass_eval.JsonlOutputWriter(output_file, compression)
+    writer.write({"record_id": "a"})
+    writer.close()
+    complete_size = output_file.stat().st_size
+    compress = mass_eval.OUTPUT_COMPRESSION[compression][1]
+    assert compress is not None
+    torn_member = compress(b'{"record_id": "b"}\n' * 100)
+    with open(output_file, "ab") as f:
+        f.write(torn_member[: len(torn_member) // 2])
+
+    assert mass_eval._load_existing_record_ids(output_file) == {"a"}
+    removed = mass_eval._truncate_incomplete_member(output_file)
+
+    assert removed == len(torn_member) // 2
+    assert output_file.stat().st_size == complete_size
+    writer = mass_eval.JsonlOutputWriter(output_file, compression)
+    writer.write({"record_id": "c"})
+    writer.close()
+    assert mass_eval._load_existing_record_ids(output_file) == {"a", "c"}
+
+
+def test_checkpoint_journals_only_changed_files(tmp_path: Path) -> None:
+    """A checkpoint appends the changed files; loading replays the journal."""
+    state_path = tmp_path / "state.json"
+    state = mass_eval.MassEvalState(
+        state_path=state_path, mode="assess", input_path=tmp_path
+    )
+    for index in range(100):
+        state.begin_file(f"f{index}.bib")
+        state.mark_file_completed(f"f{index}.bib")
+    mass_eval._checkpoint_state(state, force=True)
+    snapshot = state_path.read_bytes()
+
+    progress = state.begin_file("big.bib")
+    progress["next_entry_index"] = 7
+    state.processed_entries = 107
+    mass_eval._checkpoint_state(state, force=True)
+    state.mark_file_failed("f3.bib", "boom")
+    mass_eval._checkpoint_state(state, force=True)
+
+    assert state_path.read_bytes() == snapshot
+    journal = state.journal_path.read_text(encoding="utf-8").splitlines()
+    # Header, then run and big.bib, then run, big.bib (still active) and f3.bib
+    assert len(journal) == 6
+
+    restored = mass_eval.MassEvalState.load(state_path)
+    assert len(restored.completed_files) == 99
+    assert restored.failed_files == {"f3.bib": "boom"}
+    assert restored.file_progress["big.bib"]["next_entry_index"] == 7
+    assert restored.processed_entries == 107
+
+
+def test_checkpoint_journal_is_compacted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An outgrown journal is folded into a new snapshot."""
+    monkeypatch.setattr(mass_eval, "STATE_JOURNAL_COMPACT_MIN_BYTES", 0)
+    state_path = tmp_path / "state.json"
+    state = mass_eval.MassEvalState(
+        state_path=state_path, mode="collect", input_path=tmp_path
+    )
+    state.begin_file("a.bib")
+    for processed in range(1, 20):
+        state.processed_entries = processed
+        mass_eval._checkpoint_state(state, force=True)
+        assert state.journal_path.stat().st_size <= 2 * state_path.stat().st_size
+
+    restored = mass_eval.MassEvalState.load(state_path)
+    assert restored.processed_entries == 19
+
+
+def test_stale_or_truncated_journal_is_ignored(tmp_path: Path) -> None:
+    """Journal lines of an older snapshot or cut short by a crash are skipped."""
+    state_path = tmp_path / "state.json"
+    state = mass_eval.MassEvalState(
+        state_path=state_path, mode="assess", input_path=tmp_path
+    )
+    mass_eval._checkpoint_state(state, force=True)
+    state.processed_entries = 5
+    mass_eval._checkpoint_state(state, force=True)
+    with open(state.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"type":"run","processed_entr')
+
+    resumed = mass_eval.MassEvalState.load(state_path)
+    assert resumed.processed_entries == 5
+    # Saves after the resume do not land behind the cut-short line
+    resumed.processed_entries = 6
+    mass_eval._checkpoint_state(resumed, force=True)
+    assert mass_eval.MassEvalState.load(state_path).processed_entries == 6
+
+    stale_journal = state.journal_path.read_bytes()
+    state._write_snapshot()
+    state.journal_path.write_bytes(stale_journal)
+    state.processed_entries = 0
+
+    resumed = mass_eval.MassEvalState.load(state_path)
+    assert resumed.processed_entries == 5
+    # ...nor in a journal of another snapshot, which the next load ignores
+    resumed.processed_entries = 7
+    mass_eval._checkpoint_state(resumed, force=True)
+    assert mass_eval.MassEvalState.load(state_path).processed_entries == 7
+
+
+@pytest.mark.asyncio
+async def test_resume_truncates_output_to_checkpoint_without_rescanning(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Records written after the last checkpoint are dropped and rewritten."""
+    bib_file = tmp_path / "input.bib"
+    bib_file.write_text("@article{a,title={x}}\n", encoding="utf-8")
+    output_dir = tmp_path / "out"
+    output_file = output_dir / "input.jsonl"
+
+    entries = [
+        BibtexEntry(
+            key=f"k{index}",
+            journal_name=f"Journal {index}",
+            entry_type="article",
+            venue_type=VenueType.JOURNAL,
+        )
+        for index in range(3)
+    ]
+    monkeypatch.setattr(
+        mass_eval.BibtexParser,
+        "parse_bibtex_file_all",
+        lambda _path, relax_parsing=False: entries,
+    )
+
+    async def _fake_assess(*_args, **_kwargs) -> AssessmentResult:
+        return AssessmentResult(
+            input_query="q",
+            assessment=AssessmentType.LEGITIMATE,
+            confidence=0.9,
+            overall_score=0.9,
+            backend_results=[],
+            metadata=None,
+            reasoning=[],
+            processing_time=0.01,
+        )
+
+    def _no_rescan(_output_file: Path) -> set[str]:
+        raise AssertionError("output rescanned")
+
+    monkeypatch.setattr(mass_eval, "_assess_with_retry", _fake_assess)
+    monkeypatch.setattr(mass_eval, "_load_existing_record_ids", _no_rescan)
+
+    # Checkpoint after entry 0; entry 1's record was flushed before a crash
+    first_record = mass_eval._build_minimal_record(bib_file, entries[0])
+    output_dir.mkdir()
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(json.dumps(first_record) + "\n")
+    checkpointed_bytes = output_file.stat().st_size
+    with open(output_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"record_id": "entry 1 before crash"}) + "\n")
+
+    state = mass_eval.MassEvalState(
+        state_path=tmp_path / "state.json",
+        mode="assess",
+        input_path=bib_file,
+    )
+    state.file_progress[str(bib_file)] = {
+        "next_entry_index": 1,
+        "completed_entry_indices": [],
+        "written_records": 1,
+        "last_error": None,
+        "output_file": str(output_file),
+        "output_bytes": checkpointed_bytes,
+    }
+
+    await mass_eval._process_single_file(
+        file_path=bib_file,
+        input_root=bib_file,
+        mode="assess",
+        retry_forever=False,
+        relax_bibtex=False,
+        output_dir=output_dir,
+        max_concurrency=1,
+        state=state,
+        detail_logger=mass_eval.get_detail_logger(),
+        status_logger=mass_eval.get_status_logger(),
+    )
+
+    record_ids = [
+        json.loads(line)["record_id"]
+        for line in output_file.read_text(encoding="utf-8").splitlines()
+    ]
+    assert record_ids == [
+        mass_eval._record_id_for_entry(bib_file, entry) for entry in entries
+    ]
+    progress = state.file_progress[str(bib_file)]
+    assert progress["output_bytes"] == output_file.stat().st_size
+
+
+def test_shard_spec_partitions_keys_stably() -> None:
+    """Every key belongs to exactly one shard, the same on every machine."""
+    shards = [mass_eval.ShardSpec.parse(f"{index}/3") for index in (1, 2, 3)]
+    keys = [f"dir{index % 7}/file{index}.bib" for index in range(300)]
+
+    owners = [[shard.owns(key) for shard in shards].count(True) for key in keys]
+
+    assert owners == [1] * len(keys)
+    assert all(sum(shard.owns(key) for key in keys) > 50 for shard in shards)
+    assert shards[1].label == "shard-2-of-3"
+    assert shards[1].file_path(Path("/s/state.json")) == Path(
+        "/s/state.shard-2-of-3.json"
+    )
+
+
+@pytest.mark.parametrize("value", ["0/2", "3/2", "2", "a/b", "1/0"])
+def test_shard_spec_rejects_invalid_values(value: str) -> None:
+    """Shards are numbered 1 to N."""
+    with pytest.raises(ValueError, match="Invalid shard"):
+        mass_eval.ShardSpec.parse(value)
+
+
+@pytest.mark.asyncio
+async def test_entry_scheduler_shares_workers_across_files() -> None:
+    """Files take turns, and a large file uses the workers of finished ones."""
+    started: list[tuple[str, int]] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    def _processor(name: str):
+        async def _process(index: int) -> None:
+            nonlocal in_flight, max_in_flight
+            started.append((name, index))
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        return _process
+
+    async with mass_eval.EntryScheduler(3) as scheduler:
+        await asyncio.gather(
+            scheduler.run(_processor("large"), list(range(8))),
+            scheduler.run(_processor("small"), [0, 1]),
+        )
+
+    assert started[:4] == [("large", 0), ("small", 0), ("large", 1), ("small", 1)]
+    assert [index for name, index in started if name == "large"] == list(range(8))
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_entry_scheduler_fails_only_the_failing_file() -> None:
+    """A failing entry drops the rest of its file; other files continue."""
+    processed: list[tuple[str, int]] = []
+
+    async def _failing(index: int) -> None:
+        processed.append(("failing", index))
+        if index == 1:
+            raise ValueError("bad entry")
+
+    async def _healthy(index: int) -> None:
+        await asyncio.sleep(0)
+        processed.append(("healthy", index))
+
+    async with mass_eval.EntryScheduler(1) as scheduler:
+        results = await asyncio.gather(
+            scheduler.run(_failing, [0, 1, 2, 3]),
+            scheduler.run(_healthy, [0, 1, 2]),
+            return_exceptions=True,
+        )
+
+    assert isinstance(results[0], ValueError)
+    assert results[1] is None
+    assert ("failing", 2) not in processed
+    assert [index for name, index in processed if name == "healthy"] == [0, 1, 2]
@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: MIT
+"""Tests for merging the shards of a mass-eval run."""
+
+from pathlib import Path
+
+import pytest
+
+from aletheia_probe.cache import AcronymCache, JournalCache
+from aletheia_probe.cache.schema import init_database
+from aletheia_probe.cli_logic import mass_eval
+from aletheia_probe.cli_logic.mass_eval_merge import mass_eval_merge_main
+
+
+def _write_shard(
+    tmp_path: Path, index: int, file_names: list[str], completed: int
+) -> None:
+    """Write the state and output of one of two assess mode shards."""
+    shard = mass_eval.ShardSpec(index, 2)
+    state = mass_eval.MassEvalState(
+        state_path=shard.file_path(tmp_path / "state.json"),
+        mode="assess",
+        input_path=tmp_path / "bibs",
+    )
+    state.shard = shard.label
+    state.files_total = len(file_names)
+    output_dir = tmp_path / "out" / shard.label
+    output_dir.mkdir(parents=True)
+    for file_name in file_names[:completed]:
+        output_file = output_dir / f"{file_name}.jsonl"
+        output_file.write_text('{"record_id": "r"}\n', encoding="utf-8")
+        progress = state.begin_file(f"/bibs/{file_name}.bib")
+        progress.update(
+            next_entry_index=1,
+            written_records=1,
+            output_file=str(output_file),
+            output_bytes=output_file.stat().st_size,
+        )
+        state.mark_file_completed(f"/bibs/{file_name}.bib")
+        state.processed_entries += 1
+        state.written_records += 1
+    mass_eval._checkpoint_state(state, force=True)
+
+
+def test_merge_moves_outputs_and_combines_state(tmp_path: Path) -> None:
+    """Shard outputs land in one directory and the counters are summed."""
+    _write_shard(tmp_path, 1, ["a", "b"], completed=2)
+    _write_shard(tmp_path, 2, ["c"], completed=1)
+
+    with pytest.raises(SystemExit) as exit_info:
+        mass_eval_merge_main(
+            state_file=str(tmp_path / "state.json"),
+            shard_count=2,
+            output_dir=str(tmp_path / "out"),
+        )
+
+    assert exit_info.value.code == 0
+    output_dir = tmp_path / "out"
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "a.jsonl",
+        "b.jsonl",
+        "c.jsonl",
+    ]
+    merged = mass_eval.MassEvalState.load(tmp_path / "state.json")
+    assert merged.shard is None
+    assert merged.files_total == 3
+    assert merged.completed_files == {"/bibs/a.bib", "/bibs/b.bib", "/bibs/c.bib"}
+    assert merged.processed_entries == 3
+    assert merged.written_records == 3
+    assert merged.file_progress["/bibs/c.bib"]["output_file"] == str(
+        output_dir / "c.jsonl"
+    )
+
+
+def test_merge_refuses_incomplete_shards(tmp_path: Path) -> None:
+    """Outputs of shards with unprocessed files stay in place."""
+    _write_shard(tmp_path, 1, ["a", "b"], completed=1)
+    _write_shard(tmp_path, 2, ["c"], completed=1)
+
+    with pytest.raises(SystemExit) as exit_info:
+        mass_eval_merge_main(
+            state_file=str(tmp_path / "state.json"),
+            shard_count=2,
+            output_dir=str(tmp_path / "out"),
+        )
+
+    assert exit_info.value.code == 1
+    assert (tmp_path / "out" / "shard-1-of-2" / "a.jsonl").exists()
+    assert not (tmp_path / "state.json").exists()
+
+
+def test_merge_refuses_shards_of_another_input_path(tmp_path: Path) -> None:
+    """Shards keyed by different absolute input paths are not combined."""
+    _write_shard(tmp_path, 1, ["a"], completed=1)
+    shard = mass_eval.ShardSpec(2, 2)
+    state = mass_eval.MassEvalState(
+        state_path=shard.file_path(tmp_path / "state.json"),
+        mode="assess",
+        input_path=tmp_path / "other-bibs",
+    )
+    state.shard = shard.label
+    mass_eval._checkpoint_state(state, force=True)
+
+    with pytest.raises(SystemExit) as exit_info:
+        mass_eval_merge_main(
+            state_file=str(tmp_path / "state.json"),
+            shard_count=2,
+            output_dir=str(tmp_path / "out"),
+        )
+
+    assert exit_info.value.code == 1
+    assert (tmp_path / "out" / "shard-1-of-2" / "a.jsonl").exists()
+    assert not (tmp_path / "state.json").exists()
+
+
+def test_merge_by_venues_restarts_files_not_completed_by_every_shard(
+    tmp_path: Path,
+) -> None:
+    """Only files every venue shard completed keep their progress."""
+    for index, completed in ((1, ["a", "b"]), (2, ["a"])):
+        shard = mass_eval.ShardSpec(index, 2)
+        state = mass_eval.MassEvalState(
+            state_path=shard.file_path(tmp_path / "state.json"),
+            mode="collect",
+            input_path=tmp_path / "bibs",
+        )
+        state.shard = shard.label
+        state.shard_by = "venues"
+        state.files_total = 2
+        for file_name in ("a", "b"):
+            progress = state.begin_file(f"/bibs/{file_name}.bib")
+            if file_name in completed:
+                progress["next_entry_index"] = 4
+                state.mark_file_completed(f"/bibs/{file_name}.bib")
+            else:
+                progress["next_entry_index"] = 2
+        state.processed_entries = 4 * len(completed)
+        mass_eval._checkpoint_state(state, force=True)
+
+    with pytest.raises(SystemExit) as exit_info:
+        mass_eval_merge_main(
+            state_file=str(tmp_path / "state.json"),
+            shard_count=2,
+            allow_incomplete=True,
+            cache_db=str(tmp_path / "cache.db"),
+        )
+
+    assert exit_info.value.code == 1
+    merged = mass_eval.MassEvalState.load(tmp_path / "state.json")
+    assert merged.completed_files == {"/bibs/a.bib"}
+    assert merged.file_progress["/bibs/a.bib"]["next_entry_index"] == 4
+    assert merged.file_progress["/bibs/b.bib"] == mass_eval._new_file_progress()
+    assert merged.processed_entries == 8
+
+
+def test_merge_collect_copies_shard_cache_databases(tmp_path: Path) -> None:
+    """Acronyms and identifiers collected on other machines are merged."""
+    cache_db = tmp_path / "cache.db"
+    init_database(cache_db)
+    AcronymCache(cache_db).store_acronym_mapping(
+        "JBL", "Journal of Bulk Loading", "journal", source="test"
+    )
+    for index in (1, 2):
+        shard = mass_eval.ShardSpec(index, 2)
+        state = mass_eval.MassEvalState(
+            state_path=shard.file_path(tmp_path / "state.json"),
+            mode="collect",
+            input_path=tmp_path / "bibs",
+        )
+        state.shard = shard.label
+        mass_eval._checkpoint_state(state, force=True)
+
+    shard_db = mass_eval.ShardSpec(2, 2).file_path(cache_db)
+    init_database(shard_db)
+    AcronymCache(shard_db).store_acronym_mapping(
+        "JBL", "Journal of Broken Links", "journal", source="mass_eval_collect"
+    )
+    AcronymCache(shard_db).store_acronym_mapping(
+        "ICSE",
+        "International Conference on Software Engineering",
+        "conference",
+        source="mass_eval_collect",
+    )
+    JournalCache(shard_db).upsert_journal_identifiers(
+        "journal of testing", "Journal of Testing", issn="1234-5678"
+    )
+
+    with pytest.raises(SystemExit) as exit_info:
+        mass_eval_merge_main(
+            state_file=str(tmp_path / "state.json"),
+            shard_count=2,
+            collect_cache_file=str(tmp_path / "keys"),
+            cache_db=str(cache_db),
+        )
+
+    assert exit_info.value.code == 0
+    acronyms = AcronymCache(cache_db)
+    assert (
+        acronyms.get_full_name_for_acronym("ICSE", "conference")
+        == "international conference on software engineering"
+    )
+    # The common database keeps its own mapping
+    assert (
+        acronyms.get_full_name_for_acronym("JBL", "journal")
+        == "journal of bulk loading"
+    )
+    identifiers = JournalCache(cache_db).get_journal_identifiers_by_normalized_name(
+        "journal of testing"
+    )
+    assert identifiers is not None
+    assert identifiers["issn"] == "1234-5678"
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the runtime metrics registry."""
+
+import json
+
+import pytest
+
+from aletheia_probe.metrics import LatencyHistogram, MetricsRegistry
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram reports no percentiles."""
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(50) is None
+        assert histogram.to_dict()["p99_ms"] is None
+        assert histogram.to_dict()["mean_ms"] is None
+
+    def test_percentiles_follow_distribution(self):
+        """Test percentile estimates for a skewed distribution."""
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.observe(20)
+        for _ in range(10):
+            histogram.observe(4000)
+
+        p50 = histogram.percentile(50)
+        p99 = histogram.percentile(99)
+
+        assert p50 is not None and 10 < p50 <= 25
+        assert p99 is not None and 2500 < p99 <= 4000
+        assert histogram.count == 100
+        assert histogram.min_ms == 20
+        assert histogram.max_ms == 4000
+
+    def test_values_beyond_last_bucket(self):
+        """Test that very slow observations land in the open-ended bucket."""
+        histogram = LatencyHistogram(bounds_ms=(10, 100))
+        histogram.observe(500)
+
+        summary = histogram.to_dict()
+
+        assert summary["buckets"] == {"le_10": 0, "le_100": 0, "le_inf": 1}
+        assert summary["p50_ms"] == pytest.approx(500)
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry."""
+
+    def test_backend_results_are_aggregated(self):
+        """Test request counts, status distribution and latency per backend."""
+        registry = MetricsRegistry()
+        registry.record_backend_result("doaj", "found", 0.1)
+        registry.record_backend_result("doaj", "timeout", 10.0)
+        registry.record_backend_result("crossref", "not_found", 0.2)
+
+        snapshot = registry.snapshot()
+
+        assert snapshot["backend_totals"]["requests"] == 3
+        assert snapshot["backend_totals"]["statuses"] == {
+            "found": 1,
+            "timeout": 1,
+            "not_found": 1,
+        }
+        doaj = snapshot["backends"]["doaj"]
+        assert doaj["requests"] == 2
+        assert doaj["statuses"] == {"found": 1, "timeout": 1}
+        assert doaj["latency"]["count"] == 2
+        assert doaj["latency"]["max_ms"] == pytest.approx(10_000)
+
+    def test_cache_hit_ratio(self):
+        """Test cache outcome counters and hit ratio."""
+        registry = MetricsRegistry()
+        for outcome in ("hit", "hit", "hit", "miss"):
+            registry.record_cache_lookup("assessment_cache", outcome)
+        registry.record_cache_lookup("openalex_cache", "stale")
+
+        caches = registry.snapshot()["caches"]
+
+        assert caches["assessment_cache"] == {
+            "lookups": 4,
+            "hit": 3,
+            "miss": 1,
+            "hit_ratio": 0.75,
+        }
+        assert caches["openalex_cache"]["hit_ratio"] == 0.0
+
+    def test_retries_and_reset(self):
+        """Test retry counters and that reset clears all metrics."""
+        registry = MetricsRegistry()
+        registry.record_retry("fetch_openalex")
+        registry.record_retry("fetch_openalex")
+
+        assert registry.snapshot()["retries"] == {
+            "total": 2,
+            "by_operation": {"fetch_openalex": 2},
+        }
+
+        registry.reset()
+        snapshot = registry.snapshot()
+        assert snapshot["retries"]["total"] == 0
+        assert snapshot["backends"] == {}
+
+    def test_write_json(self, tmp_path):
+        """Test that snapshots are written as JSON without temp leftovers."""
+        registry = MetricsRegistry()
+        registry.record_backend_result("doaj", "found", 0.05)
+
+        output_path = tmp_path / "out" / "metrics.json"
+        registry.write_json(output_path)
+
+        document = json.loads(output_path.read_text())
+        assert document["backends"]["doaj"]["requests"] == 1
+        assert list(output_path.parent.iterdir()) == [output_path]
@@ -0,0 +1,226 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the mock API server and load-test harness helpers."""
+
+import random
+
+import aiohttp
+import pytest
+
+from aletheia_probe.loadtest import (
+    FaultProfile,
+    LoadTestReport,
+    MockApiServer,
+    build_subprocess_env,
+)
+from aletheia_probe.openalex import OpenAlexClient
+
+
+async def _get(url: str) -> tuple[int, dict[str, str], object]:
+    """Fetch a URL and return status, headers and decoded JSON body."""
+    async with aiohttp.ClientSession() as session, session.get(url) as response:
+        return response.status, dict(response.headers), await response.json()
+
+
+class TestFaultProfile:
+    """Test cases for FaultProfile."""
+
+    def test_invalid_profile_raises(self):
+        """Test validation of ratios and distributions."""
+        with pytest.raises(ValueError):
+            FaultProfile(rate_limit_ratio=1.5)
+        with pytest.raises(ValueError):
+            FaultProfile(latency_distribution="pareto")
+
+    def test_with_overrides_converts_types(self):
+        """Test string overrides are converted to the field types."""
+        profile = FaultProfile().with_overrides(
+            {
+                "latency_ms": "400",
+                "retry_after_seconds": "7",
+                "max_requests_per_second": "12.5",
+                "latency_distribution": "constant",
+            }
+        )
+
+        assert profile.latency_ms == 400.0
+        assert profile.retry_after_seconds == 7
+        assert profile.max_requests_per_second == 12.5
+        assert profile.latency_distribution == "constant"
+        assert (
+            FaultProfile()
+            .with_overrides({"retry_after_seconds": "none"})
+            .retry_after_seconds
+            is None
+        )
+
+    def test_with_overrides_rejects_unknown_field(self):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(ValueError, match="Unknown fault profile field"):
+            FaultProfile().with_overrides({"latency": "1"})
+
+    def test_sample_latency_is_capped(self):
+        """Test that sampled latencies never exceed the cap."""
+        profile = FaultProfile(latency_ms=100, latency_sigma=3.0, latency_max_ms=150)
+        rng = random.Random(0)
+
+        assert all(profile.sample_latency(rng) <= 0.15 for _ in range(200))
+        assert FaultProfile(latency_distribution="constant").sample_latency(rng) == 0.05
+
+
+class TestMockApiServer:
+    """Test cases for MockApiServer."""
+
+    @pytest.mark.asyncio
+    async def test_serves_all_services(self):
+        """Test one endpoint of every mocked service."""
+        profile = FaultProfile(latency_ms=0, found_ratio=1.0)
+        async with MockApiServer(profile, seed=1) as server:
+            urls = server.endpoint_urls()
+
+            status, _, body = await _get(
+                f"{urls['openalex']}/sources?filter=issn:1234-5678"
+            )
+            assert status == 200
+            assert body["results"][0]["issn"] == ["1234-5678"]
+
+            status, _, body = await _get(f"{urls['crossref']}/journals/1234-5678")
+            assert status == 200
+            assert body["message"]["counts"]["total-dois"] > 0
+
+            status, _, body = await _get(
+                f"{urls['doaj']}/search/journals/issn%3A1234-5678?pageSize=10"
+            )
+            assert status == 200
+            assert body["results"][0]["bibjson"]["pissn"] == "1234-5678"
+
+            status, _, body = await _get(
+                f"{urls['opencitations']}/venue-citation-count/issn:1234-5678"
+            )
+            assert status == 200
+            assert int(body[0]["count"]) >= 0
+
+        assert server.stats()["openalex"] == {"requests": 1, "statuses": {"200": 1}}
+
+    @pytest.mark.asyncio
+    async def test_unknown_venues_are_not_found(self):
+        """Test found_ratio=0 yields empty results and 404s."""
+        async with MockApiServer(FaultProfile(latency_ms=0, found_ratio=0.0)) as server:
+            urls = server.endpoint_urls()
+
+            _, _, body = await _get(f"{urls['openalex']}/sources?search=Some Journal")
+            status, _, _ = await _get(f"{urls['crossref']}/journals/1234-5678")
+
+        assert body["results"] == []
+        assert status == 404
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_injection_sends_retry_after(self):
+        """Test injected 429 responses carry Retry-After."""
+        profile = FaultProfile(
+            latency_ms=0, rate_limit_ratio=1.0, retry_after_seconds=3
+        )
+        async with MockApiServer(profile) as server:
+            status, headers, _ = await _get(
+                f"{server.endpoint_urls()['crossref']}/journals/1234-5678"
+            )
+
+        assert status == 429
+        assert headers["Retry-After"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_requests_per_second_limit(self):
+        """Test that requests above the per-second limit are rejected."""
+        profile = FaultProfile(latency_ms=0, max_requests_per_second=2)
+        async with MockApiServer(profile) as server:
+            url = f"{server.endpoint_urls()['opencitations']}/venue-citation-count/x"
+            statuses = [(await _get(url))[0] for _ in range(4)]
+
+        assert statuses[:2] == [200, 200]
+        assert statuses[2:] == [429, 429]
+
+    @pytest.mark.asyncio
+    async def test_server_error_injection(self):
+        """Test injected 5xx responses."""
+        profile = FaultProfile(latency_ms=0, server_error_ratio=1.0)
+        async with MockApiServer(profile) as server:
+            status, _, _ = await _get(
+                f"{server.endpoint_urls()['doaj']}/search/journals/x"
+            )
+
+        assert status in (500, 502, 503)
+
+    @pytest.mark.asyncio
+    async def test_service_profiles_apply_per_service(self):
+        """Test that a per-service profile only affects that service."""
+        async with MockApiServer(
+            FaultProfile(latency_ms=0),
+            {"crossref": FaultProfile(latency_ms=0, rate_limit_ratio=1.0)},
+        ) as server:
+            urls = server.endpoint_urls()
+            crossref_status, _, _ = await _get(f"{urls['crossref']}/works")
+            openalex_status, _, _ = await _get(f"{urls['openalex']}/works?filter=x")
+
+        assert crossref_status == 429
+        assert openalex_status == 200
+
+    def test_unknown_service_profile_raises(self):
+        """Test that profiles for unknown services are rejected."""
+        with pytest.raises(ValueError, match="Unknown mock services"):
+            MockApiServer(service_profiles={"scopus": FaultProfile()})
+
+    @pytest.mark.asyncio
+    async def test_openalex_client_against_mock(self):
+        """Test the OpenAlex client end to end against the mock."""
+        async with MockApiServer(FaultProfile(latency_ms=0, found_ratio=1.0)) as server:
+            async with OpenAlexClient(
+                base_url=server.endpoint_urls()["openalex"]
+            ) as client:
+                data = await client.enrich_journal_data(
+                    "Journal of Mock Studies", issn="1234-5678"
+                )
+
+        assert data is not None
+        assert data["issns"] == ["1234-5678"]
+        assert len(data["recent_publications_by_year"]) == 6
+
+
+class TestHarnessHelpers:
+    """Test cases for load-test harness helpers."""
+
+    def test_build_subprocess_env(self):
+        """Test endpoint variables and forced remote modes."""
+        env = build_subprocess_env({"openalex": "http://127.0.0.1:1/openalex"})
+
+        assert env["ALETHEIA_PROBE_ENDPOINTS_OPENALEX"] == "http://127.0.0.1:1/openalex"
+        assert env["OPENALEX_MODE"] == "remote"
+        assert env["DOAJ_MODE"] == "remote"
+
+    def test_report_summary(self):
+        """Test throughput and per-service figures in the summary."""
+        report = LoadTestReport(
+            processed_entries=100,
+            written_records=100,
+            failed_files=0,
+            elapsed_seconds=4.0,
+            exit_code=0,
+            server_stats={
+                "openalex": {"requests": 12, "statuses": {"200": 10, "429": 2}}
+            },
+            metrics={
+                "backends": {
+                    "doaj": {
+                        "requests": 5,
+                        "latency": {"p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": None},
+                    }
+                },
+                "retries": {"total": 2},
+            },
+        )
+
+        summary = report.format_summary()
+
+        assert report.entries_per_second == 25.0
+        assert "25.00 entries/s" in summary
+        assert "200: 10, 429: 2" in summary
+        assert "Retries: 2" in summary
+        assert report.to_dict()["entries_per_second"] == 25.0
@@ -19,6 +19,7 @@ from aletheia_probe.models import (
     VenueType,
 )
 from aletheia_probe.updater.sources import ScopusSource
+from aletheia_probe.updater.sources.scopus import SIDECAR_DIR_NAME, convert_workbook
 
 
 class TestScopusSource:
@@ -299,6 +300,78 @@ class TestScopusSource:
                 assert len(data) == 1
                 assert data[0]["issn"] is None
 
+    @staticmethod
+    def _write_workbook(path: Path, *titles: str) -> None:
+        """Write a minimal Scopus workbook listing active journals."""
+        wb = Workbook()
+        ws = wb.active
+        assert ws is not None  # Type assertion for mypy
+        ws.title = "Scopus Sources Oct. 2024"
+        ws.append(["Source Title", "ISSN", "Publisher", "Active or Inactive"])
+        for title in titles:
+            ws.append([title, 12345679, None, "Active"])
+        wb.save(path)
+        wb.close()
+
+    def test_convert_workbook_writes_mapped_columns(self, tmp_path):
+        """Test that the sidecar holds only the mapped columns as text."""
+        workbook_path = tmp_path / "ext_list_October_2024.xlsx"
+        self._write_workbook(workbook_path, "Test Journal")
+        source = ScopusSource(data_dir=tmp_path)
+        sidecar_path = tmp_path / "sidecar.csv"
+
+        sheet, fields, row_count = convert_workbook(
+            workbook_path, sidecar_path, source.column_mappings
+        )
+
+        assert (sheet, fields, row_count) == (
+            "Scopus Sources Oct. 2024",
+            ["title", "issn", "publisher", "status"],
+            1,
+        )
+        assert sidecar_path.read_text(encoding="utf-8").splitlines() == [
+            "title,issn,publisher,status",
+            "Test Journal,12345679,,Active",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fetch_data_reuses_sidecar(self, tmp_path):
+        """Test that an unchanged workbook is converted only once."""
+        workbook_path = tmp_path / "ext_list_October_2024.xlsx"
+        self._write_workbook(workbook_path, "Test Journal")
+        source = ScopusSource(data_dir=tmp_path)
+
+        first = await source.fetch_data()
+        with patch(
+            "aletheia_probe.updater.sources.scopus.load_workbook"
+        ) as mock_load_workbook:
+            second = await source.fetch_data()
+
+        mock_load_workbook.assert_not_called()
+        assert first == second
+        assert [journal["issn"] for journal in second] == ["1234-5679"]
+        assert len(list((tmp_path / SIDECAR_DIR_NAME).iterdir())) == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_data_converts_changed_workbook(self, tmp_path):
+        """Test that a changed workbook replaces the previous sidecar."""
+        workbook_path = tmp_path / "ext_list_October_2024.xlsx"
+        self._write_workbook(workbook_path, "Test Journal")
+        source = ScopusSource(data_dir=tmp_path)
+        await source.fetch_data()
+        old_sidecars = set((tmp_path / SIDECAR_DIR_NAME).iterdir())
+
+        self._write_workbook(workbook_path, "Test Journal", "Other Journal")
+        data = await source.fetch_data()
+
+        assert [journal["journal_name"] for journal in data] == [
+            "Test Journal",
+            "Other Journal",
+        ]
+        new_sidecars = set((tmp_path / SIDECAR_DIR_NAME).iterdir())
+        assert len(new_sidecars) == 1
+        assert new_sidecars.isdisjoint(old_sidecars)
+
 
 class TestScopusBackend:
     """Test cases for ScopusBackend."""
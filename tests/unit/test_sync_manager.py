@@ -459,7 +459,10 @@ class TestCacheSyncManager:
                 assert result["status"] == "success"
                 assert result["records_updated"] == 100
                 mock_update.assert_called_once_with(
-                    mock_data_source, db_writer=sync_manager.db_writer, force=False
+                    mock_data_source,
+                    db_writer=sync_manager.db_writer,
+                    force=False,
+                    parse_pool=None,
                 )
 
     @pytest.mark.asyncio
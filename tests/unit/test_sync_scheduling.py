@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the backend schedule of a sync run."""
+
+from unittest.mock import patch
+
+import pytest
+
+from aletheia_probe.cache_sync.scheduling import SyncSchedule, format_eta
+
+
+class TestSyncSchedule:
+    """Tests for SyncSchedule."""
+
+    def test_longest_expected_backends_start_first(self):
+        """Test that unknown backends lead, then known ones by duration."""
+        schedule = SyncSchedule(
+            ["bealls", "new_list", "dblp_venues", "doaj", "other_new_list"],
+            {"bealls": 5.0, "dblp_venues": 600.0, "doaj": 60.0},
+            slots=2,
+        )
+
+        assert schedule.order == [
+            "new_list",
+            "other_new_list",
+            "dblp_venues",
+            "doaj",
+            "bealls",
+        ]
+
+    def test_no_estimate_without_history(self):
+        """Test that a first sync has no ETA."""
+        assert SyncSchedule(["bealls"], {}, slots=2).remaining_seconds() is None
+
+    def test_remaining_time_packs_waiting_backends_into_slots(self):
+        """Test the prediction for running, waiting and finished backends."""
+        schedule = SyncSchedule(
+            ["dblp_venues", "doaj", "bealls", "kscien", "finished"],
+            {
+                "dblp_venues": 600.0,
+                "doaj": 100.0,
+                "bealls": 50.0,
+                "kscien": 50.0,
+                "finished": 700.0,
+            },
+            slots=2,
+        )
+
+        # finished and dblp_venues start; doaj follows dblp_venues, the rest
+        # queue behind finished
+        assert schedule.remaining_seconds() == 750.0
+
+        with patch(
+            "aletheia_probe.cache_sync.scheduling.time.monotonic",
+            side_effect=[1000.0, 1000.0, 1000.0, 1060.0],
+        ):
+            schedule.start("finished")
+            schedule.finish("finished")
+            schedule.start("dblp_venues")
+            schedule.start("doaj")
+            # dblp_venues: 540s left; doaj: 40s left, then bealls and kscien
+            remaining = schedule.remaining_seconds()
+
+        assert remaining == 540.0
+        assert schedule.finished_count == 1
+
+
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [(42.4, "42s"), (245, "4m 05s"), (3 * 3600 + 125, "3h 02m")],
+)
+def test_format_eta(seconds, expected):
+    """Test progress formatting of predicted durations."""
+    assert format_eta(seconds) == expected
@@ -0,0 +1,169 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the synthetic cache database generator."""
+
+import pytest
+
+from aletheia_probe.cache import JournalCache
+from aletheia_probe.cache_sync.synthetic import (
+    SyntheticCacheGenerator,
+    SyntheticCacheSpec,
+    SyntheticSource,
+    generate_synthetic_cache,
+    issn_check_digit,
+)
+from aletheia_probe.enums import AssessmentType
+from aletheia_probe.normalizer import input_normalizer
+from aletheia_probe.validation import validate_issn
+
+
+class TestSyntheticCacheSpec:
+    """Test cases for SyntheticCacheSpec validation."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"journal_count": 0},
+            {"journal_count": 10, "sources": ()},
+            {
+                "journal_count": 10,
+                "sources": (SyntheticSource("a", AssessmentType.PREDATORY, 0.0),),
+            },
+            {
+                "journal_count": 10,
+                "sources": (
+                    SyntheticSource("a", AssessmentType.PREDATORY, 1.0),
+                    SyntheticSource("a", AssessmentType.LEGITIMATE, 1.0),
+                ),
+            },
+            {"journal_count": 10, "overlap_ratio": 1.5},
+            {"journal_count": 10, "acronym_ratio": -0.1},
+            {"journal_count": 10, "retractions_per_journal": -1.0},
+        ],
+    )
+    def test_invalid_spec_raises(self, kwargs):
+        """Test that invalid specifications are rejected."""
+        with pytest.raises(ValueError):
+            SyntheticCacheSpec(**kwargs)
+
+
+class TestSyntheticCacheGenerator:
+    """Test cases for SyntheticCacheGenerator."""
+
+    def test_issn_check_digit(self):
+        """Test ISSN check characters against known ISSNs."""
+        assert issn_check_digit("0378595") == "5"
+        assert issn_check_digit("2049363") == "0"
+        assert issn_check_digit("0000006") == "X"
+
+    def test_generate_journals_is_deterministic(self):
+        """Test that the same seed produces the same journals."""
+        spec = SyntheticCacheSpec(journal_count=200, seed=7)
+
+        first = SyntheticCacheGenerator(spec).generate_journals()
+        second = SyntheticCacheGenerator(spec).generate_journals()
+        other = SyntheticCacheGenerator(
+            SyntheticCacheSpec(journal_count=200, seed=8)
+        ).generate_journals()
+
+        assert first == second
+        assert first != other
+
+    def test_generate_journals_unique_names_and_valid_issns(self):
+        """Test that names are unique and ISSNs are valid and unused."""
+        journals = SyntheticCacheGenerator(
+            SyntheticCacheSpec(journal_count=2000)
+        ).generate_journals()
+
+        names = [journal["normalized_name"].lower() for journal in journals]
+        issns = [
+            value
+            for journal in journals
+            for value in (journal["issn"], journal["eissn"])
+            if value
+        ]
+        assert len(set(names)) == len(journals)
+        assert len(set(issns)) == len(issns)
+        assert all(validate_issn(issn) for issn in issns)
+        # Some journals are online-only or print-only
+        assert any(journal["issn"] is None for journal in journals)
+        assert any(journal["eissn"] is None for journal in journals)
+
+    def test_generate_journals_stores_normalized_names(self):
+        """Test that names are normalized like data sources normalize them."""
+        journals = SyntheticCacheGenerator(
+            SyntheticCacheSpec(journal_count=50)
+        ).generate_journals()
+
+        for journal in journals:
+            normalized = input_normalizer.normalize(journal["journal_name"])
+            assert normalized.normalized_venue is not None
+            assert journal["normalized_name"] == normalized.normalized_venue.name
+
+    def test_assign_sources_without_overlap(self):
+        """Test that every journal gets exactly one source without overlap."""
+        generator = SyntheticCacheGenerator(
+            SyntheticCacheSpec(journal_count=500, overlap_ratio=0.0)
+        )
+        journals = generator.generate_journals()
+
+        assignments = generator.assign_sources(journals)
+
+        assert sum(len(listed) for listed in assignments.values()) == 500
+        assert all(assignments.values())
+
+    def test_assign_sources_with_full_overlap(self):
+        """Test that overlapping journals are listed by two distinct sources."""
+        generator = SyntheticCacheGenerator(
+            SyntheticCacheSpec(journal_count=300, overlap_ratio=1.0)
+        )
+        journals = generator.generate_journals()
+
+        assignments = generator.assign_sources(journals)
+
+        for journal in journals:
+            listing_sources = [
+                name
+                for name, listed in assignments.items()
+                if any(entry is journal for entry in listed)
+            ]
+            assert len(listing_sources) == 2
+
+    def test_attach_retraction_data(self):
+        """Test retraction statistics and article records in source layout."""
+        generator = SyntheticCacheGenerator(
+            SyntheticCacheSpec(journal_count=50, retractions_per_journal=3.0)
+        )
+        journals = generator.generate_journals()
+        original_first = journals[0]
+
+        article_count = generator.attach_retraction_data(journals)
+
+        articles = journals[0]["metadata"]["_article_retractions"]
+        assert len(articles) == article_count
+        assert sum(j["metadata"]["total_retractions"] for j in journals) == (
+            article_count
+        )
+        # Shared journal records are not modified in place
+        assert "metadata" not in original_first
+
+    @pytest.mark.asyncio
+    async def test_generate_populates_database(self, tmp_path):
+        """Test generating a database end to end."""
+        db_path = tmp_path / "synthetic.db"
+        spec = SyntheticCacheSpec(journal_count=400, acronym_ratio=0.2, seed=3)
+
+        counts = await generate_synthetic_cache(db_path, spec)
+
+        assert counts["journals"] == 400
+        assert counts["journal_names"] == 400
+        assert counts["source_assessments"] > 400
+        assert counts["retraction_statistics"] > 0
+        assert counts["article_retractions"] > 0
+        assert counts["venue_acronyms"] > 0
+
+        journal = SyntheticCacheGenerator(spec).generate_journals()[0]
+        results = JournalCache(db_path).search_journals(
+            normalized_name=journal["normalized_name"]
+        )
+        assert results
+        assert results[0]["display_name"] == journal["journal_name"]
@@ -0,0 +1,115 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the span tracing module."""
+
+import asyncio
+import json
+
+import pytest
+
+from aletheia_probe.tracing import Tracer
+
+
+class TestTracer:
+    """Test cases for Tracer."""
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test that spans are no-ops while tracing is disabled."""
+        tracer = Tracer()
+
+        with tracer.span("work", "test"):
+            pass
+
+        assert tracer.records == []
+        # Disabled spans share a single no-op context manager
+        assert tracer.span("a") is tracer.span("b")
+
+    def test_enabled_tracer_records_spans(self):
+        """Test that enabled spans are recorded with name, category and args."""
+        tracer = Tracer()
+        tracer.enable()
+
+        with tracer.span("work", "test", item=1):
+            pass
+
+        records = tracer.records
+        assert len(records) == 1
+        assert records[0].name == "work"
+        assert records[0].category == "test"
+        assert records[0].args == {"item": 1}
+        assert records[0].duration_ms >= 0
+
+    def test_span_records_exception_type(self):
+        """Test that a span closed by an exception records the error type."""
+        tracer = Tracer()
+        tracer.enable()
+
+        with pytest.raises(ValueError), tracer.span("failing"):
+            raise ValueError("boom")
+
+        assert tracer.records[0].args == {"error": "ValueError"}
+
+    def test_enable_resets_previous_recording(self):
+        """Test that enabling the tracer starts a fresh recording."""
+        tracer = Tracer()
+        tracer.enable()
+        with tracer.span("first"):
+            pass
+
+        tracer.enable()
+
+        assert tracer.records == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_get_separate_lanes(self):
+        """Test that spans from concurrent tasks are placed on distinct lanes."""
+        tracer = Tracer()
+        tracer.enable()
+
+        async def work(name: str) -> None:
+            with tracer.span(name, "backend"):
+                await asyncio.sleep(0)
+
+        await asyncio.gather(
+            asyncio.create_task(work("a"), name="backend_a"),
+            asyncio.create_task(work("b"), name="backend_b"),
+        )
+
+        lanes = {record.name: record.lane for record in tracer.records}
+        assert lanes["a"] != lanes["b"]
+
+    def test_chrome_trace_export(self, tmp_path):
+        """Test export in Chrome trace-event format."""
+        tracer = Tracer()
+        tracer.enable()
+        with tracer.span("outer", "dispatch"), tracer.span("inner", "backend"):
+            pass
+
+        trace_path = tmp_path / "profile" / "trace.json"
+        tracer.export_chrome_trace(trace_path)
+
+        document = json.loads(trace_path.read_text())
+        complete_events = [e for e in document["traceEvents"] if e["ph"] == "X"]
+        metadata_events = [e for e in document["traceEvents"] if e["ph"] == "M"]
+
+        assert {e["name"] for e in complete_events} == {"outer", "inner"}
+        assert all(e["dur"] >= 0 and e["ts"] >= 0 for e in complete_events)
+        assert metadata_events[0]["name"] == "thread_name"
+
+    def test_format_summary_ranks_by_total_time(self):
+        """Test that the summary lists span names by total time."""
+        tracer = Tracer()
+        tracer._record("fast", "test", 0, 1_000_000, {})
+        tracer._record("slow", "test", 0, 5_000_000, {})
+        tracer._record("slow", "test", 0, 5_000_000, {})
+
+        summary = tracer.format_summary(top_n=1)
+        lines = summary.splitlines()
+
+        assert "top 1 of 2" in lines[0]
+        assert lines[2].startswith("slow")
+        assert "10.0" in lines[2]
+        assert "fast" not in summary
+
+    def test_format_summary_without_spans(self):
+        """Test the summary when nothing was recorded."""
+        assert "no spans recorded" in Tracer().format_summary()
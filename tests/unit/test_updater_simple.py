@@ -5,8 +5,10 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from aletheia_probe.cache import DownloadCache
 from aletheia_probe.enums import AssessmentType
 from aletheia_probe.updater.core import DataSource
+from aletheia_probe.updater.downloads import SourceDownloads
 from aletheia_probe.updater.sync_utils import update_source_data
 from aletheia_probe.updater.utils import deduplicate_journals
 from aletheia_probe.validation import validate_issn
@@ -186,6 +188,96 @@ class TestUpdateSourceData:
 
             assert result["status"] == "success"
 
+    @pytest.mark.asyncio
+    async def test_update_source_skip_when_not_modified(self, isolated_test_cache):
+        """Test that a source whose downloads did not change skips the write."""
+
+        class DownloadingSource(MockDataSource):
+            async def fetch_data(self):
+                self.downloads.accept(
+                    "https://example.org/list.csv", 200, {"ETag": '"v1"'}, b"list"
+                )
+                return await super().fetch_data()
+
+        source = DownloadingSource("downloading_source")
+        mock_db_writer = AsyncMock()
+        mock_db_writer.queue_write = AsyncMock()
+        cache = DownloadCache(isolated_test_cache)
+
+        with (
+            patch(
+                "aletheia_probe.updater.sync_utils.DataSourceManager"
+            ) as mock_manager_class,
+            patch(
+                "aletheia_probe.updater.core.SourceDownloads.for_sync",
+                side_effect=lambda name, revalidate: SourceDownloads(
+                    name, cache, revalidate=revalidate
+                ),
+            ),
+        ):
+            mock_manager_class.return_value = Mock()
+
+            first = await update_source_data(source, mock_db_writer)
+            mock_db_writer.queue_write.call_args.kwargs["on_written"]()
+            second = await update_source_data(source, mock_db_writer)
+            forced = await update_source_data(source, mock_db_writer, force=True)
+
+        assert first["status"] == "success"
+        assert second == {"status": "skipped", "reason": "not_modified"}
+        assert forced["status"] == "success"
+        assert mock_db_writer.queue_write.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_source_queues_chunks(self):
+        """Test that a chunked source is queued chunk by chunk."""
+
+        class ChunkedSource(MockDataSource):
+            async def fetch_chunks(self):
+                journals = await self.fetch_data()
+                for journal in journals:
+                    yield [journal]
+
+        source = ChunkedSource("chunked_source")
+        mock_db_writer = AsyncMock()
+
+        with patch(
+            "aletheia_probe.updater.sync_utils.DataSourceManager"
+        ) as mock_manager_class:
+            mock_manager_class.return_value = Mock()
+
+            result = await update_source_data(source, mock_db_writer)
+
+        assert result["records_updated"] == 2
+        calls = mock_db_writer.queue_write.call_args_list
+        assert [call.kwargs.get("final", True) for call in calls] == [False, True]
+        assert [call.kwargs["force"] for call in calls] == [False, False]
+        assert "on_written" in calls[1].kwargs
+
+    @pytest.mark.asyncio
+    async def test_update_source_discards_chunks_on_error(self):
+        """Test that a source failing after queued chunks is not finished."""
+
+        class FailingChunkedSource(MockDataSource):
+            async def fetch_chunks(self):
+                journals = await self.fetch_data()
+                yield journals[:1]
+                yield journals[1:]
+                raise OSError("Connection reset")
+
+        source = FailingChunkedSource("failing_source")
+        mock_db_writer = AsyncMock()
+
+        with patch(
+            "aletheia_probe.updater.sync_utils.DataSourceManager"
+        ) as mock_manager_class:
+            mock_manager_class.return_value = Mock()
+
+            result = await update_source_data(source, mock_db_writer)
+
+        assert result == {"status": "failed", "error": "Connection reset"}
+        mock_db_writer.queue_write.assert_called_once()
+        mock_db_writer.discard_chunks.assert_called_once_with("failing_source")
+
 
 class TestUtilityFunctions:
     """Test utility functions."""
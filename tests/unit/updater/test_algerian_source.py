@@ -9,7 +9,10 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from aiohttp import ClientTimeout
 
+from aletheia_probe.cache import DownloadCache
 from aletheia_probe.enums import AssessmentType, EntryType
+from aletheia_probe.updater.downloads import SourceDownloads
+from aletheia_probe.updater.parse_pool import ParsePool
 from aletheia_probe.updater.sources.algerian import AlgerianMinistrySource
 
 
@@ -218,7 +221,13 @@ class TestAlgerianMinistrySource:
         assert result == "/path/to/extracted"
         mock_extractor.extract_zip.assert_called_once_with("/path/to/file.zip", "/tmp")
 
-    def test_process_pdf_files_nested_structure(self, source):
+    @staticmethod
+    def _extracted(text: str = "1 Test Journal"):
+        """Mock _extract_pdf_texts returning the same text for every PDF."""
+        return AsyncMock(side_effect=lambda files: dict.fromkeys(files, (text, 0.5)))
+
+    @pytest.mark.asyncio
+    async def test_process_pdf_files_nested_structure(self, source):
         """Test _process_pdf_files with nested directory structure."""
         mock_entries = [
             {"journal_name": "Journal 1", "type": "journal"},
@@ -231,22 +240,24 @@ class TestAlgerianMinistrySource:
             year_dir.mkdir(parents=True)
 
             # Create mock PDF files
-            (year_dir / "Liste des revues predatrices 2024.pdf").touch()
-            (year_dir / "Liste des éditeurs predateurs 2024.pdf").touch()
+            (year_dir / "Liste des revues predatrices 2024.pdf").write_bytes(b"a")
+            (year_dir / "Liste des éditeurs predateurs 2024.pdf").write_bytes(b"b")
 
             mock_pdf_parser = Mock()
-            mock_pdf_parser.parse_pdf_file.return_value = mock_entries[
+            mock_pdf_parser.parse_text.return_value = mock_entries[
                 :1
             ]  # One entry per call
             source.pdf_parser = mock_pdf_parser
 
-            result = source._process_pdf_files(temp_dir, 2024)
+            with patch.object(source, "_extract_pdf_texts", self._extracted()):
+                result = await source._process_pdf_files(temp_dir, 2024)
 
             # Should find nested structure and process both PDFs
-            assert mock_pdf_parser.parse_pdf_file.call_count == 2
+            assert mock_pdf_parser.parse_text.call_count == 2
             assert len(result) == 2
 
-    def test_process_pdf_files_simple_structure(self, source):
+    @pytest.mark.asyncio
+    async def test_process_pdf_files_simple_structure(self, source):
         """Test _process_pdf_files with simple directory structure."""
         mock_entries = [{"journal_name": "Journal 1", "type": "journal"}]
 
@@ -259,69 +270,62 @@ class TestAlgerianMinistrySource:
             (year_dir / "Liste des revues predatrices 2024.pdf").touch()
 
             mock_pdf_parser = Mock()
-            mock_pdf_parser.parse_pdf_file.return_value = mock_entries
+            mock_pdf_parser.parse_text.return_value = mock_entries
             source.pdf_parser = mock_pdf_parser
 
-            result = source._process_pdf_files(temp_dir, 2024)
+            with patch.object(source, "_extract_pdf_texts", self._extracted()):
+                result = await source._process_pdf_files(temp_dir, 2024)
 
             assert len(result) == 1
             assert result[0]["journal_name"] == "Journal 1"
 
-    def test_process_pdf_files_no_year_directory(self, source):
+    @pytest.mark.asyncio
+    async def test_process_pdf_files_no_year_directory(self, source):
         """Test _process_pdf_files when no year directory is found."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Don't create any directories
 
-            result = source._process_pdf_files(temp_dir, 2024)
+            result = await source._process_pdf_files(temp_dir, 2024)
 
             assert result == []
 
-    def test_process_pdf_files_different_patterns(self, source):
+    @pytest.mark.asyncio
+    async def test_process_pdf_files_different_patterns(self, source):
         """Test _process_pdf_files recognizes different PDF file patterns."""
         with tempfile.TemporaryDirectory() as temp_dir:
             year_dir = Path(temp_dir) / "2024"
             year_dir.mkdir(parents=True)
 
             # Create different pattern files
-            (year_dir / "Liste des revues 2024.pdf").touch()
-            (year_dir / "Actualisation liste 2024.pdf").touch()
-            (year_dir / "Liste des éditeurs 2024.pdf").touch()
+            (year_dir / "Liste des revues 2024.pdf").write_bytes(b"a")
+            (year_dir / "Actualisation liste 2024.pdf").write_bytes(b"b")
+            (year_dir / "Liste des éditeurs 2024.pdf").write_bytes(b"c")
 
             mock_pdf_parser = Mock()
-            mock_pdf_parser.parse_pdf_file.return_value = [{"name": "test"}]
+            mock_pdf_parser.parse_text.return_value = [{"name": "test"}]
             source.pdf_parser = mock_pdf_parser
 
-            result = source._process_pdf_files(temp_dir, 2024)
+            with patch.object(source, "_extract_pdf_texts", self._extracted()):
+                result = await source._process_pdf_files(temp_dir, 2024)
 
             # Should process all three files
-            assert mock_pdf_parser.parse_pdf_file.call_count == 3
+            assert mock_pdf_parser.parse_text.call_count == 3
             assert len(result) == 3
 
-    def test_process_pdf_files_entry_type_detection(self, source):
-        """Test _process_pdf_files correctly detects entry types."""
+    def test_find_pdf_files_entry_type_detection(self, source):
+        """Test _find_pdf_files correctly detects entry types."""
         with tempfile.TemporaryDirectory() as temp_dir:
             year_dir = Path(temp_dir) / "2024"
             year_dir.mkdir(parents=True)
 
             # Create files with different names
-            journal_file = year_dir / "Liste des revues 2024.pdf"
-            journal_file.touch()
-
-            publisher_file = year_dir / "Liste des éditeurs 2024.pdf"
-            publisher_file.touch()
-
-            actualisation_file = year_dir / "Actualisation liste 2024.pdf"
-            actualisation_file.touch()
-
-            mock_pdf_parser = Mock()
-            mock_pdf_parser.parse_pdf_file.return_value = [{"name": "test"}]
-            source.pdf_parser = mock_pdf_parser
+            (year_dir / "Liste des revues 2024.pdf").touch()
+            (year_dir / "Liste des éditeurs 2024.pdf").touch()
+            (year_dir / "Actualisation liste 2024.pdf").touch()
 
-            result = source._process_pdf_files(temp_dir, 2024)
+            pdf_files = source._find_pdf_files(Path(temp_dir), 2024)
 
-            # Check that correct entry types were passed
-            calls = mock_pdf_parser.parse_pdf_file.call_args_list
-            entry_types = [call[0][2] for call in calls]  # Third argument is entry_type
+            entry_types = [entry_type for _, entry_type in pdf_files]
 
             assert EntryType.JOURNAL in entry_types
             assert EntryType.PUBLISHER in entry_types
@@ -329,24 +333,75 @@ class TestAlgerianMinistrySource:
                 len([t for t in entry_types if t == EntryType.JOURNAL]) == 2
             )  # revues and actualisation
 
-    def test_process_pdf_files_pdf_processing_error(self, source):
+    @pytest.mark.asyncio
+    async def test_process_pdf_files_pdf_processing_error(self, source):
         """Test _process_pdf_files handles PDF processing errors."""
         with tempfile.TemporaryDirectory() as temp_dir:
             year_dir = Path(temp_dir) / "2024"
             year_dir.mkdir(parents=True)
 
             # Create PDF file
-            (year_dir / "Liste des revues 2024.pdf").touch()
-
-            mock_pdf_parser = Mock()
-            mock_pdf_parser.parse_pdf_file.side_effect = Exception("PDF parsing error")
-            source.pdf_parser = mock_pdf_parser
+            pdf_file = year_dir / "Liste des revues 2024.pdf"
+            pdf_file.touch()
 
-            result = source._process_pdf_files(temp_dir, 2024)
+            failed = AsyncMock(return_value={pdf_file: OSError("PDF parsing error")})
+            with patch.object(source, "_extract_pdf_texts", failed):
+                result = await source._process_pdf_files(temp_dir, 2024)
 
             # Should handle error and return empty list
             assert result == []
 
+    @pytest.mark.asyncio
+    async def test_process_pdf_files_reuses_cached_text(
+        self, source, isolated_test_cache
+    ):
+        """Test that unchanged PDFs are not extracted again during a sync."""
+        source._downloads = SourceDownloads(
+            source.get_name(), DownloadCache(isolated_test_cache)
+        )
+        source.pdf_parser = Mock()
+        source.pdf_parser.parse_text.return_value = [{"journal_name": "Journal 1"}]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            year_dir = Path(temp_dir) / "2024"
+            year_dir.mkdir(parents=True)
+            (year_dir / "Liste des revues 2024.pdf").write_bytes(b"same")
+            changed = year_dir / "Liste des éditeurs 2024.pdf"
+            changed.write_bytes(b"old")
+
+            extract = self._extracted("1 Cached Journal")
+            with patch.object(source, "_extract_pdf_texts", extract):
+                await source._process_pdf_files(temp_dir, 2024)
+                changed.write_bytes(b"new")
+                result = await source._process_pdf_files(temp_dir, 2024)
+
+        assert len(result) == 2
+        assert [call.args[0] for call in extract.call_args_list] == [
+            sorted(extract.call_args_list[0].args[0]),
+            [changed],
+        ]
+        texts = [call.args[0] for call in source.pdf_parser.parse_text.call_args_list]
+        assert texts == ["1 Cached Journal"] * 4
+
+    @pytest.mark.asyncio
+    async def test_extract_pdf_texts_in_worker_processes(self, source):
+        """Test that several PDFs are extracted in a process pool."""
+        pool = ParsePool(2)
+        source.use_parse_pool(pool)
+
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                pdf_files = [Path(temp_dir) / f"list {i}.pdf" for i in range(2)]
+                for pdf_file in pdf_files:
+                    pdf_file.touch()
+
+                results = await source._extract_pdf_texts(pdf_files)
+        finally:
+            pool.shutdown()
+
+        # Empty files are not valid PDFs and yield no text
+        assert [results[pdf_file][0] for pdf_file in pdf_files] == ["", ""]
+
     def test_helper_classes_initialization(self, source):
         """Test that helper classes are properly initialized."""
         assert hasattr(source, "downloader")
@@ -4,11 +4,14 @@
 from datetime import datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
+from urllib.error import URLError
 
 import pytest
 
 from aletheia_probe.enums import AssessmentType
+from aletheia_probe.updater.pagination import PageFetchPolicy
 from aletheia_probe.updater.sources.core import CoreConferenceSource, CoreJournalSource
+from aletheia_probe.updater.sync_utils import update_source_data
 
 
 def _normalized_name_result(name: str) -> Mock:
@@ -179,3 +182,35 @@ async def test_fetch_data_paginates_and_deduplicates(mocked_config):
         "conference alpha",
         "conference beta",
     }
+
+
+@pytest.mark.asyncio
+async def test_failed_page_fails_update_without_writing(mocked_config):
+    """Test that a listing missing a page does not replace the stored records."""
+    source = CoreConferenceSource()
+    row = '<tr class="evenrow"><td>Conference {0}</td><td>C</td><td>ICORE2026</td><td>A</td></tr>'
+
+    async def fetch_page(page: int) -> str:
+        if page == 2:
+            raise URLError("HTTP 503")
+        return f"Showing results 1 - 50 of 150 <table>{row.format(page)}</table>"
+
+    db_writer = AsyncMock()
+    with (
+        patch.object(source, "_fetch_page", new=fetch_page),
+        patch(
+            "aletheia_probe.updater.pagination.PageFetchPolicy.from_config",
+            return_value=PageFetchPolicy(
+                requests_per_second=1000.0, max_retries=1, retry_base_delay=0.0
+            ),
+        ),
+        patch("aletheia_probe.updater.sources.core.input_normalizer.normalize") as norm,
+        patch("aletheia_probe.updater.sync_utils.DataSourceManager") as mock_dsm,
+    ):
+        norm.return_value = _normalized_name_result("conference")
+        result = await update_source_data(source, db_writer, force=True)
+
+    assert result["status"] == "failed"
+    assert "page(s) 2" in result["error"]
+    db_writer.queue_write.assert_not_called()
+    assert mock_dsm.return_value.log_update.call_args.args[2] == "failed"
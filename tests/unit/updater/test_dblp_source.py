@@ -5,12 +5,13 @@ import gzip
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
+from xml.parsers import expat
 
 import pytest
-from defusedxml import ElementTree as DefusedET
+from defusedxml.common import EntitiesForbidden
 
 from aletheia_probe.enums import AssessmentType
-from aletheia_probe.updater.sources.dblp import DblpVenueSource
+from aletheia_probe.updater.sources.dblp import DblpVenueSource, _DblpRecordScanner
 
 
 @pytest.fixture
@@ -134,6 +135,57 @@ def test_parse_dump_file_handles_named_xml_entities(source: DblpVenueSource):
     assert journals
 
 
+def test_scanner_captures_only_venue_fields():
+    """Test that the scanner keeps matching records and their read fields."""
+    xml_content = b"""<?xml version="1.0" encoding="ISO-8859-1"?>
+<!DOCTYPE dblp SYSTEM "dblp.dtd">
+<dblp>
+  <article key="journals/tosem/A1" mdate="2024-01-01">
+    <author>J\xfcrgen M&uuml;ller</author>
+    <title>The <i>Title</i></title>
+    <journal>ACM Trans. Softw. Eng. &amp; Methodol.</journal>
+    <year>2024</year>
+    <issn>1049-331X</issn>
+    <issn>1557-7392</issn>
+  </article>
+  <article key="tr/internal/A2"><journal>Tech Report</journal></article>
+  <inproceedings key="conf/icse/P1">
+    <booktitle>ICSE M&uuml;nchen &unknownentity;</booktitle>
+    <title>Ignored paper title</title>
+    <year>2023</year>
+  </inproceedings>
+  <www key="homepages/x/Y"><title>Home</title></www>
+</dblp>
+"""
+    scanner = _DblpRecordScanner()
+    split = len(xml_content) // 2
+
+    records = scanner.feed(xml_content[:split]) + scanner.feed(
+        xml_content[split:], final=True
+    )
+
+    assert [(record.tag, record.key) for record in records] == [
+        ("article", "journals/tosem/A1"),
+        ("inproceedings", "conf/icse/P1"),
+    ]
+    assert records[0].fields == {
+        "journal": "ACM Trans. Softw. Eng. & Methodol.",
+        "year": "2024",
+        "issn": "1049-331X",
+    }
+    assert records[1].fields == {"booktitle": "ICSE M\u00fcnchen  ", "year": "2023"}
+
+
+def test_scanner_rejects_entity_declarations():
+    """Test that entity declarations in the dump are not expanded."""
+    scanner = _DblpRecordScanner()
+
+    with pytest.raises(EntitiesForbidden):
+        scanner.feed(
+            b'<!DOCTYPE dblp [<!ENTITY lol "lol">]><dblp>&lol;</dblp>', final=True
+        )
+
+
 @pytest.mark.asyncio
 async def test_fetch_data_uses_download_and_parse(source: DblpVenueSource):
     """Test fetch_data orchestration when local dump is missing."""
@@ -183,7 +235,7 @@ async def test_fetch_data_redownloads_when_existing_dump_invalid(
             source,
             "_parse_dump_file",
             side_effect=[
-                DefusedET.ParseError("invalid xml"),
+                expat.ExpatError("invalid xml"),
                 [{"journal_name": "Recovered", "normalized_name": "recovered"}],
             ],
         ) as parse_mock,
@@ -192,3 +244,27 @@ async def test_fetch_data_redownloads_when_existing_dump_invalid(
         download_mock.assert_awaited_once()
         assert parse_mock.call_count == 2
         assert len(result) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_chunks_keeps_names_in_one_chunk(source: DblpVenueSource):
+    """Test that chunks are cut between normalized names only."""
+    _write_gz(source.dump_path, "<dblp></dblp>")
+    entries = [
+        {"journal_name": "B Conf", "normalized_name": "b"},
+        {"journal_name": "A Conf", "normalized_name": "a"},
+        {"journal_name": "B Journal", "normalized_name": "b"},
+        {"journal_name": "C Conf", "normalized_name": "c"},
+    ]
+
+    with (
+        patch("aletheia_probe.updater.sources.dblp.DEFAULT_ENTRY_CHUNK_SIZE", 1),
+        patch.object(source, "_parse_dump_file", return_value=entries),
+    ):
+        chunks = [chunk async for chunk in source.fetch_chunks()]
+
+    assert [[entry["journal_name"] for entry in chunk] for chunk in chunks] == [
+        ["A Conf"],
+        ["B Conf", "B Journal"],
+        ["C Conf"],
+    ]
@@ -0,0 +1,324 @@
+# SPDX-License-Identifier: MIT
+"""Tests for conditional source downloads."""
+
+import io
+from email.message import Message
+from unittest.mock import patch
+from urllib.error import HTTPError
+
+import pytest
+
+from aletheia_probe.cache import DownloadCache
+from aletheia_probe.updater.downloads import SourceDownloads, open_url
+
+
+URL = "https://example.org/list.html"
+OTHER_URL = "https://example.org/other.html"
+VALIDATORS = {"ETag": '"v1"', "Last-Modified": "Mon, 05 Jan 2026 10:00:00 GMT"}
+
+
+@pytest.fixture
+def cache(isolated_test_cache):
+    """Download cache on the isolated test database."""
+    return DownloadCache(isolated_test_cache)
+
+
+def _synced(cache: DownloadCache, *responses: tuple[str, bytes]) -> None:
+    """Record a completed sync that downloaded the given payloads."""
+    downloads = SourceDownloads("bealls", cache)
+    for url, body in responses:
+        downloads.accept(url, 200, VALIDATORS, body)
+    downloads.commit()
+
+
+class _FakeResponse:
+    def __init__(self, status: int, text: str = "", headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._text = text
+
+    async def text(self) -> str:
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+
+class _FakeSession:
+    def __init__(self, response: _FakeResponse):
+        self.response = response
+        self.requests: list[tuple[str, dict]] = []
+
+    def get(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        return self.response
+
+
+class TestSourceDownloads:
+    """Tests for SourceDownloads."""
+
+    def test_passive_tracker_records_nothing(self):
+        """Test that a tracker without cache passes payloads through."""
+        downloads = SourceDownloads("bealls")
+
+        assert downloads.conditional_headers(URL) == {}
+        assert downloads.accept(URL, 200, VALIDATORS, b"payload") == b"payload"
+        assert not downloads.unchanged
+        downloads.commit()
+
+    def test_first_download_is_changed(self, cache):
+        """Test that a URL without stored validators counts as changed."""
+        downloads = SourceDownloads("bealls", cache)
+
+        assert downloads.conditional_headers(URL) == {}
+        downloads.accept(URL, 200, VALIDATORS, b"payload")
+
+        assert not downloads.unchanged
+
+    def test_conditional_headers_from_previous_sync(self, cache):
+        """Test that stored validators are sent on the next sync."""
+        _synced(cache, (URL, b"payload"))
+
+        headers = SourceDownloads("bealls", cache).conditional_headers(URL)
+
+        assert headers == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 05 Jan 2026 10:00:00 GMT",
+        }
+
+    def test_not_modified_is_served_from_cache(self, cache):
+        """Test that a 304 answer returns the stored payload."""
+        _synced(cache, (URL, b"payload"))
+        downloads = SourceDownloads("bealls", cache)
+        downloads.conditional_headers(URL)
+
+        body = downloads.accept(URL, 304, {}, b"")
+
+        assert body == b"payload"
+        assert downloads.unchanged
+
+    def test_same_content_without_validators_is_unchanged(self, cache):
+        """Test that an identical payload counts as unchanged."""
+        _synced(cache, (URL, b"payload"))
+        downloads = SourceDownloads("bealls", cache)
+
+        downloads.accept(URL, 200, {}, b"payload")
+
+        assert downloads.unchanged
+
+    def test_one_changed_file_marks_source_changed(self, cache):
+        """Test that the source is changed when any of its files changed."""
+        _synced(cache, (URL, b"payload"), (OTHER_URL, b"other"))
+        downloads = SourceDownloads("bealls", cache)
+        downloads.conditional_headers(URL)
+
+        assert downloads.accept(URL, 304, {}, b"") == b"payload"
+        downloads.accept(OTHER_URL, 200, {}, b"other, edited")
+
+        assert not downloads.unchanged
+
+    def test_vanished_url_marks_source_changed(self, cache):
+        """Test that a URL no longer fetched makes the source changed."""
+        _synced(cache, (URL, b"payload"), (OTHER_URL, b"other"))
+        downloads = SourceDownloads("bealls", cache)
+        downloads.conditional_headers(URL)
+
+        downloads.accept(URL, 304, {}, b"")
+
+        assert not downloads.unchanged
+
+    def test_commit_deletes_records_of_vanished_urls(self, cache):
+        """Test that only the URLs fetched in the committed run are kept."""
+        _synced(cache, (URL, b"payload"), (OTHER_URL, b"other"))
+        downloads = SourceDownloads("bealls", cache)
+        downloads.conditional_headers(URL)
+        downloads.accept(URL, 304, {}, b"")
+        downloads.commit()
+
+        assert cache.get_download_urls("bealls") == {URL}
+        assert cache.get_download("bealls", OTHER_URL) is None
+        downloads = SourceDownloads("bealls", cache)
+        downloads.conditional_headers(URL)
+        downloads.accept(URL, 304, {}, b"")
+        assert downloads.unchanged
+
+    def test_bytes_downloaded_counts_received_payloads(self, cache):
+        """Test that only payloads received over the network are counted."""
+        _synced(cache, (URL, b"payload"))
+        downloads = SourceDownloads("bealls", cache)
+        downloads.conditional_headers(URL)
+
+        downloads.accept(URL, 304, {}, b"")
+        with downloads.stream(OTHER_URL, 200, {}, io.BytesIO(b"other")) as body:
+            body.read()
+
+        assert downloads.bytes_downloaded == len(b"other")
+
+    def test_forced_sync_ignores_but_records_validators(self, cache):
+        """Test that revalidate=False downloads in full and still stores."""
+        _synced(cache, (URL, b"payload"))
+        downloads = SourceDownloads("bealls", cache, revalidate=False)
+
+        assert downloads.conditional_headers(URL) == {}
+        downloads.accept(URL, 200, {"ETag": '"v2"'}, b"payload")
+        assert not downloads.unchanged
+        downloads.commit()
+
+        assert cache.get_download("bealls", URL).etag == '"v2"'
+
+    def test_uncommitted_run_keeps_previous_validators(self, cache):
+        """Test that validators are only replaced by commit()."""
+        _synced(cache, (URL, b"payload"))
+        SourceDownloads("bealls", cache).accept(URL, 200, {}, b"new payload")
+
+        record = cache.get_download("bealls", URL)
+
+        assert record is not None
+        assert cache.read_body(record.content_hash) == b"payload"
+
+    def test_commit_prunes_replaced_payloads(self, cache):
+        """Test that payloads no longer referenced are deleted."""
+        _synced(cache, (URL, b"old"))
+        _synced(cache, (URL, b"new"))
+
+        stored = [path.name for path in cache.body_dir.iterdir()]
+
+        assert stored == [cache.get_download("bealls", URL).content_hash]
+        assert cache.read_body(stored[0]) == b"new"
+
+    def test_missing_payload_disables_conditional_request(self, cache):
+        """Test that validators without a stored payload are not used."""
+        _synced(cache, (URL, b"payload"))
+        for path in cache.body_dir.iterdir():
+            path.unlink()
+
+        assert SourceDownloads("bealls", cache).conditional_headers(URL) == {}
+
+    def test_streamed_payload_is_recorded_when_read_to_end(self, cache):
+        """Test that a streamed payload is spooled and stored on commit."""
+        downloads = SourceDownloads("bealls", cache)
+
+        with downloads.stream(URL, 200, VALIDATORS, io.BytesIO(b"payload")) as body:
+            assert body.read() == b"payload"
+        downloads.commit()
+
+        record = cache.get_download("bealls", URL)
+        assert record is not None
+        assert record.etag == '"v1"'
+        assert cache.read_body(record.content_hash) == b"payload"
+        assert [path.name for path in cache.body_dir.iterdir()] == [record.content_hash]
+
+    def test_partially_read_stream_is_discarded(self, cache):
+        """Test that an interrupted stream records nothing."""
+        downloads = SourceDownloads("bealls", cache)
+
+        with downloads.stream(URL, 200, VALIDATORS, io.BytesIO(b"payload")) as body:
+            body.read(3)
+        downloads.commit()
+
+        assert cache.get_download("bealls", URL) is None
+        assert list(cache.body_dir.iterdir()) == []
+
+    def test_not_modified_stream_reads_cache(self, cache):
+        """Test that a 304 answer streams the stored payload."""
+        _synced(cache, (URL, b"payload"))
+        downloads = SourceDownloads("bealls", cache)
+        downloads.conditional_headers(URL)
+
+        with downloads.stream(URL, 304, {}, None) as body:
+            assert body.read() == b"payload"
+        assert downloads.unchanged
+
+    def test_unread_stream_marks_source_changed(self, cache):
+        """Test that a 200 stream counts as changed before it is read."""
+        _synced(cache, (URL, b"payload"), (OTHER_URL, b"other"))
+        downloads = SourceDownloads("bealls", cache)
+        downloads.conditional_headers(URL)
+
+        with downloads.stream(URL, 304, {}, None) as medline:
+            with downloads.stream(
+                OTHER_URL, 200, {}, io.BytesIO(b"other, edited")
+            ) as catalog:
+                assert not downloads.unchanged
+                medline.read()
+                catalog.read()
+
+        assert not downloads.unchanged
+
+    @pytest.mark.asyncio
+    async def test_get_sends_conditional_request(self, cache):
+        """Test the aiohttp helper on a 304 answer."""
+        _synced(cache, (URL, "payload ✓".encode()))
+        downloads = SourceDownloads("bealls", cache)
+        session = _FakeSession(_FakeResponse(304))
+
+        download = await downloads.get(session, URL)
+
+        assert session.requests[0][1]["headers"]["If-None-Match"] == '"v1"'
+        assert download.ok
+        assert download.text() == "payload ✓"
+        assert downloads.unchanged
+
+    @pytest.mark.asyncio
+    async def test_get_reports_error_status(self, cache):
+        """Test that error statuses are returned without a payload."""
+        downloads = SourceDownloads("bealls", cache)
+
+        download = await downloads.get(_FakeSession(_FakeResponse(503)), URL)
+
+        assert not download.ok
+        assert download.status == 503
+        assert not downloads.unchanged
+
+
+class TestExtractedTexts:
+    """Tests for the extracted text cache of DownloadCache."""
+
+    def test_texts_are_keyed_by_extractor(self, cache):
+        """Test that texts of another extractor version are not returned."""
+        cache.store_extracted_texts("algerian", "pypdf-1", {"abc": "text"})
+
+        assert cache.get_extracted_texts("algerian", "pypdf-1", ["abc", "def"]) == {
+            "abc": "text"
+        }
+        assert cache.get_extracted_texts("algerian", "pypdf-2", ["abc"]) == {}
+
+    def test_storing_replaces_previous_texts(self, cache):
+        """Test that texts of files no longer downloaded are dropped."""
+        cache.store_extracted_texts("algerian", "pypdf-1", {"old": "old text"})
+        cache.store_extracted_texts("algerian", "pypdf-1", {"new": "new text"})
+
+        assert cache.get_extracted_texts("algerian", "pypdf-1", ["old", "new"]) == {
+            "new": "new text"
+        }
+
+
+class TestOpenUrl:
+    """Tests for open_url."""
+
+    def test_not_modified_is_returned_as_status(self):
+        """Test that urllib's 304 HTTPError becomes a status."""
+        headers = Message()
+        headers["ETag"] = '"v1"'
+        error = HTTPError(URL, 304, "Not Modified", headers, None)
+
+        with patch("urllib.request.urlopen", side_effect=error):
+            status, response_headers, body = open_url(
+                URL, {"If-None-Match": '"v1"'}, 5, None
+            )
+
+        assert (status, body) == (304, b"")
+        assert response_headers["ETag"] == '"v1"'
+
+    def test_error_status_is_raised(self):
+        """Test that other HTTP errors propagate."""
+        error = HTTPError(URL, 404, "Not Found", Message(), None)
+
+        with (
+            patch("urllib.request.urlopen", side_effect=error),
+            pytest.raises(HTTPError),
+        ):
+            open_url(URL, {}, 5, None)
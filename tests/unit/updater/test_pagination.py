@@ -0,0 +1,253 @@
+# SPDX-License-Identifier: MIT
+"""Tests for concurrent paginated fetching."""
+
+import asyncio
+import time
+
+import pytest
+
+from aletheia_probe.updater.pagination import (
+    IncompletePaginationError,
+    PageFetchError,
+    PageFetchPolicy,
+    PaginatedFetchResult,
+    fetch_paginated,
+)
+
+
+FAST_POLICY = PageFetchPolicy(
+    concurrency=4, requests_per_second=1000.0, max_retries=3, retry_base_delay=0.0
+)
+
+
+def _parse(page: int, html_content: str) -> list[dict]:
+    return [{"page": page, "name": name} for name in html_content.split()]
+
+
+def _count_from_header(html_content: str, _entries: list[dict]) -> int | None:
+    return 5
+
+
+class TestFetchPaginated:
+    """Tests for fetch_paginated."""
+
+    @pytest.mark.asyncio
+    async def test_returns_entries_in_page_order(self):
+        """Test that pages finishing out of order are returned in order."""
+
+        async def fetch_page(page: int) -> str:
+            # Later pages answer first
+            await asyncio.sleep(0.01 * (6 - page))
+            return f"p{page}a p{page}b"
+
+        result = await fetch_paginated(
+            fetch_page,
+            _parse,
+            _count_from_header,
+            max_pages=10,
+            source_name="test",
+            policy=FAST_POLICY,
+        )
+
+        assert [entry["page"] for entry in result.entries] == [
+            1,
+            1,
+            2,
+            2,
+            3,
+            3,
+            4,
+            4,
+            5,
+            5,
+        ]
+        assert result.pages_fetched == 5
+        assert result.total_pages == 5
+        assert result.failed_pages == []
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than the configured pages are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def fetch_page(page: int) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"p{page}"
+
+        policy = PageFetchPolicy(concurrency=2, requests_per_second=1000.0)
+        result = await fetch_paginated(
+            fetch_page,
+            _parse,
+            lambda html_content, entries: 8,
+            max_pages=10,
+            source_name="test",
+            policy=policy,
+        )
+
+        assert result.pages_fetched == 8
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_request_rate_is_limited(self):
+        """Test that request starts are spaced by the configured rate."""
+        starts: list[float] = []
+
+        async def fetch_page(page: int) -> str:
+            starts.append(time.monotonic())
+            return f"p{page}"
+
+        policy = PageFetchPolicy(concurrency=4, requests_per_second=50.0)
+        await fetch_paginated(
+            fetch_page,
+            _parse,
+            lambda html_content, entries: 4,
+            max_pages=10,
+            source_name="test",
+            policy=policy,
+        )
+
+        assert len(starts) == 4
+        assert starts[-1] - starts[0] >= 3 * 0.02 * 0.9
+
+    @pytest.mark.asyncio
+    async def test_failed_page_is_retried_on_its_own(self):
+        """Test that a transient failure only repeats the failing page."""
+        calls: list[int] = []
+
+        async def fetch_page(page: int) -> str:
+            calls.append(page)
+            if page == 3 and calls.count(3) < 3:
+                raise OSError("connection reset")
+            return f"p{page}"
+
+        result = await fetch_paginated(
+            fetch_page,
+            _parse,
+            _count_from_header,
+            max_pages=10,
+            source_name="test",
+            policy=FAST_POLICY,
+        )
+
+        assert sorted(calls) == [1, 2, 3, 3, 3, 4, 5]
+        assert result.pages_fetched == 5
+        assert result.failed_pages == []
+
+    @pytest.mark.asyncio
+    async def test_page_failing_all_retries_is_skipped(self):
+        """Test that a page failing every attempt does not stop the others."""
+
+        async def fetch_page(page: int) -> str:
+            if page == 2:
+                raise PageFetchError("HTTP 503")
+            return f"p{page}"
+
+        result = await fetch_paginated(
+            fetch_page,
+            _parse,
+            _count_from_header,
+            max_pages=10,
+            source_name="test",
+            policy=FAST_POLICY,
+        )
+
+        assert [entry["name"] for entry in result.entries] == ["p1", "p3", "p4", "p5"]
+        assert result.failed_pages == [2]
+        with pytest.raises(IncompletePaginationError, match=r"page\(s\) 2;"):
+            result.raise_for_failed_pages("test")
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_is_not_retried(self):
+        """Test that a non-retryable failure gives up after one attempt."""
+        calls: list[int] = []
+
+        async def fetch_page(page: int) -> str:
+            calls.append(page)
+            if page == 2:
+                raise PageFetchError("HTTP 404", retryable=False)
+            return f"p{page}"
+
+        result = await fetch_paginated(
+            fetch_page,
+            _parse,
+            lambda html_content, entries: 2,
+            max_pages=10,
+            source_name="test",
+            policy=FAST_POLICY,
+        )
+
+        assert calls == [1, 2]
+        assert result.failed_pages == [2]
+
+    @pytest.mark.asyncio
+    async def test_unknown_total_fetches_until_empty_page(self):
+        """Test sequential fallback when the first page has no page count."""
+        bodies = {1: "a b", 2: "c", 3: ""}
+
+        async def fetch_page(page: int) -> str:
+            return bodies[page]
+
+        result = await fetch_paginated(
+            fetch_page,
+            _parse,
+            lambda html_content, entries: None,
+            max_pages=10,
+            source_name="test",
+            policy=FAST_POLICY,
+        )
+
+        assert [entry["name"] for entry in result.entries] == ["a", "b", "c"]
+        assert result.pages_fetched == 2
+        assert result.total_pages is None
+
+    @pytest.mark.asyncio
+    async def test_total_pages_is_capped_by_max_pages(self):
+        """Test that max_pages bounds a large reported page count."""
+        calls: list[int] = []
+
+        async def fetch_page(page: int) -> str:
+            calls.append(page)
+            return f"p{page}"
+
+        result = await fetch_paginated(
+            fetch_page,
+            _parse,
+            lambda html_content, entries: 100,
+            max_pages=3,
+            source_name="test",
+            policy=FAST_POLICY,
+        )
+
+        assert sorted(calls) == [1, 2, 3]
+        assert result.total_pages == 100
+
+    @pytest.mark.asyncio
+    async def test_first_page_failure_returns_nothing(self):
+        """Test that an unreachable first page yields an empty result."""
+
+        async def fetch_page(page: int) -> str:
+            raise TimeoutError
+
+        result = await fetch_paginated(
+            fetch_page,
+            _parse,
+            _count_from_header,
+            max_pages=10,
+            source_name="test",
+            policy=FAST_POLICY,
+        )
+
+        assert result.entries == []
+        assert result.failed_pages == [1]
+
+
+def test_complete_result_is_not_rejected():
+    """Test that a listing without failed pages passes the check."""
+    PaginatedFetchResult(
+        entries=[{"name": "p1"}], pages_fetched=1
+    ).raise_for_failed_pages("test")
@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the sync-wide parse pool."""
+
+import asyncio
+import logging
+import os
+import pickle
+
+import pytest
+
+from aletheia_probe.enums import AssessmentType
+from aletheia_probe.logging_config import DETAIL_LOGGER_NAME
+from aletheia_probe.updater.core import DataSource
+from aletheia_probe.updater.downloads import SourceDownloads
+from aletheia_probe.updater.parse_pool import NetworkSlot, ParsePool
+
+
+class _ListSource(DataSource):
+    def get_name(self) -> str:
+        return "list_source"
+
+    def get_list_type(self) -> AssessmentType:
+        return AssessmentType.PREDATORY
+
+    def should_update(self) -> bool:
+        return True
+
+    async def fetch_data(self) -> list[dict]:
+        return []
+
+    def parse(self, names: list[str]) -> list[str]:
+        return [name.lower() for name in names]
+
+
+def _square(value: int) -> tuple[int, int]:
+    """Return the square and the worker's process ID."""
+    return value * value, os.getpid()
+
+
+def _chunks(count: int) -> list[list[int]]:
+    return [[i, i + 1] for i in range(0, 2 * count, 2)]
+
+
+def _fail() -> None:
+    raise ValueError("Malformed input")
+
+
+def _log_and_return() -> str:
+    logging.getLogger(DETAIL_LOGGER_NAME).warning("parsed in worker")
+    return "done"
+
+
+@pytest.fixture
+def process_pool():
+    """Parse pool with one worker process."""
+    pool = ParsePool(1)
+    yield pool
+    pool.shutdown()
+
+
+class TestParsePool:
+    """Tests for ParsePool."""
+
+    @pytest.mark.asyncio
+    async def test_thread_pool_runs_in_this_process(self):
+        """Test that the default pool runs jobs in threads."""
+        pool = ParsePool()
+
+        assert await pool.run(_square, 3) == (9, os.getpid())
+        assert [chunk async for chunk in pool.stream(_chunks, 2)] == [[0, 1], [2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_process_pool_runs_in_worker(self, process_pool):
+        """Test that jobs run in a worker process."""
+        result, pid = await process_pool.run(_square, 4)
+
+        assert result == 16
+        assert pid != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_process_pool_streams_chunks(self, process_pool):
+        """Test that chunks of a worker job arrive in order."""
+        chunks = [chunk async for chunk in process_pool.stream(_chunks, 3)]
+
+        assert chunks == [[0, 1], [2, 3], [4, 5]]
+
+    @pytest.mark.asyncio
+    async def test_stopped_stream_frees_worker(self, process_pool):
+        """Test that leaving a stream early stops the job."""
+        async for chunk in process_pool.stream(_chunks, 50):
+            assert chunk == [0, 1]
+            break
+
+        assert (await process_pool.run(_square, 2))[0] == 4
+
+    @pytest.mark.asyncio
+    async def test_job_exceptions_propagate(self, process_pool):
+        """Test that a failing job raises in the caller."""
+        with pytest.raises(ValueError, match="Malformed input"):
+            await process_pool.run(_fail)
+
+    @pytest.mark.asyncio
+    async def test_worker_logs_are_forwarded(self, process_pool, caplog):
+        """Test that log records of workers reach the local loggers."""
+        with caplog.at_level(logging.WARNING, logger=DETAIL_LOGGER_NAME):
+            assert await process_pool.run(_log_and_return) == "done"
+            process_pool.shutdown()
+
+        assert "parsed in worker" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_source_methods_run_in_worker(self, process_pool):
+        """Test that a bound method of a syncing source can be a job."""
+        source = _ListSource()
+        source.use_parse_pool(process_pool)
+        source.track_downloads()
+
+        assert await source.parse_pool.run(source.parse, ["A", "B"]) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_network_slot_is_released_while_parsing(self):
+        """Test that another source may download while one parses."""
+        semaphore = asyncio.Semaphore(1)
+        pool = ParsePool()
+        parsing = asyncio.Event()
+        downloaded = asyncio.Event()
+
+        def parse() -> str:
+            parsing.set()
+            asyncio.run_coroutine_threadsafe(downloaded.wait(), loop).result(5)
+            return "parsed"
+
+        async def parsing_source() -> str:
+            async with NetworkSlot(semaphore):
+                results = await asyncio.gather(pool.run(parse), pool.run(str, 1))
+                assert semaphore.locked()
+                return results[0]
+
+        async def downloading_source() -> None:
+            await parsing.wait()
+            async with NetworkSlot(semaphore):
+                downloaded.set()
+
+        loop = asyncio.get_running_loop()
+        result, _ = await asyncio.gather(parsing_source(), downloading_source())
+
+        assert result == "parsed"
+        assert not semaphore.locked()
+
+    def test_source_is_pickled_without_sync_state(self):
+        """Test that a source submitted as job drops its sync-run state."""
+        source = _ListSource()
+        source.use_parse_pool(ParsePool(1))
+        source._downloads = SourceDownloads("list_source")
+
+        copy = pickle.loads(pickle.dumps(source))
+
+        assert copy._downloads is None
+        assert copy.parse_pool.max_workers == 0
@@ -1,18 +1,22 @@
 # SPDX-License-Identifier: MIT
 """Unit tests for the PubMed NLM data source."""
 
+import io
 from datetime import datetime, timedelta
+from email.message import Message
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from aletheia_probe.cache import DownloadCache
 from aletheia_probe.enums import AssessmentType
+from aletheia_probe.updater.downloads import SourceDownloads
 from aletheia_probe.updater.sources.pubmed import (
     PubMedNLMSource,
     _build_journal_entry,
+    _iter_nlm_records,
     _normalize_issn,
-    _parse_nlm_records,
 )
 
 
@@ -66,6 +70,16 @@ def _normalized_name_result(name: str) -> Mock:
     return Mock(normalized_venue=SimpleNamespace(name=name))
 
 
+def _parse_nlm_records(text: str) -> list[dict[str, str]]:
+    """Parse flat-file text with the streaming record parser."""
+    return list(_iter_nlm_records(text.splitlines()))
+
+
+def _file_stream(text: str) -> io.BytesIO:
+    """Binary stream over flat-file text, as returned by _open_file."""
+    return io.BytesIO(text.encode())
+
+
 # ---------------------------------------------------------------------------
 # _parse_nlm_records
 # ---------------------------------------------------------------------------
@@ -264,8 +278,13 @@ async def test_fetch_data_deduplicates_medline_from_catalog(mocked_config):
     with (
         patch.object(
             source,
-            "_fetch_file",
-            new=AsyncMock(side_effect=[_SAMPLE_MEDLINE_TEXT, _SAMPLE_CATALOG_TEXT]),
+            "_open_file",
+            new=AsyncMock(
+                side_effect=[
+                    _file_stream(_SAMPLE_MEDLINE_TEXT),
+                    _file_stream(_SAMPLE_CATALOG_TEXT),
+                ]
+            ),
         ),
         patch(
             "aletheia_probe.updater.sources.pubmed.input_normalizer.normalize"
@@ -296,8 +315,8 @@ async def test_fetch_data_medline_entries_tagged(mocked_config):
     with (
         patch.object(
             source,
-            "_fetch_file",
-            new=AsyncMock(side_effect=[_SAMPLE_MEDLINE_TEXT, ""]),
+            "_open_file",
+            new=AsyncMock(side_effect=[_file_stream(_SAMPLE_MEDLINE_TEXT), None]),
         ),
         patch(
             "aletheia_probe.updater.sources.pubmed.input_normalizer.normalize"
@@ -315,14 +334,112 @@ async def test_fetch_data_medline_entries_tagged(mocked_config):
 
 @pytest.mark.asyncio
 async def test_fetch_data_empty_files_return_empty_list(mocked_config):
-    """Both files returning empty text yields no entries."""
+    """Both downloads failing yields no entries."""
     source = PubMedNLMSource()
 
     with patch.object(
         source,
-        "_fetch_file",
-        new=AsyncMock(return_value=""),
+        "_open_file",
+        new=AsyncMock(return_value=None),
     ):
         entries = await source.fetch_data()
 
     assert entries == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_chunks_emits_entries_in_chunks(mocked_config):
+    """Entries are handed out in chunks, MEDLINE file first."""
+    source = PubMedNLMSource()
+
+    with (
+        patch("aletheia_probe.updater.sources.pubmed._ENTRY_CHUNK_SIZE", 1),
+        patch.object(
+            source,
+            "_open_file",
+            new=AsyncMock(
+                side_effect=[
+                    _file_stream(_SAMPLE_MEDLINE_TEXT),
+                    _file_stream(_SAMPLE_CATALOG_TEXT),
+                ]
+            ),
+        ),
+    ):
+        chunks = [chunk async for chunk in source.fetch_chunks()]
+
+    assert [[e["journal_name"] for e in chunk] for chunk in chunks] == [
+        ["New England Journal of Medicine"],
+        ["Lancet"],
+        ["Journal of Rare Biology"],
+    ]
+    assert [chunk[0]["metadata"]["is_medline"] for chunk in chunks] == [
+        True,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_chunks_skips_parsing_when_not_modified(
+    mocked_config, isolated_test_cache
+):
+    """Nothing is parsed when both files were not modified."""
+    source = PubMedNLMSource()
+    cache = DownloadCache(isolated_test_cache)
+    headers = Message()
+    headers["ETag"] = '"v1"'
+
+    previous = SourceDownloads(source.get_name(), cache)
+    for url, text in (
+        (source.medline_url, _SAMPLE_MEDLINE_TEXT),
+        (source.catalog_url, _SAMPLE_CATALOG_TEXT),
+    ):
+        with previous.stream(url, 200, headers, _file_stream(text)) as stream:
+            stream.read()
+    previous.commit()
+
+    source._downloads = SourceDownloads(source.get_name(), cache)
+    with patch.object(
+        source, "_open_file_blocking", return_value=(304, Message(), None)
+    ) as mock_open:
+        chunks = [chunk async for chunk in source.fetch_chunks()]
+
+    assert chunks == []
+    assert source.downloads.unchanged
+    assert mock_open.call_args_list[0].args[1] == {"If-None-Match": '"v1"'}
+
+
+@pytest.mark.asyncio
+async def test_fetch_chunks_parses_when_one_file_changed(
+    mocked_config, isolated_test_cache
+):
+    """Both files are parsed when only J_Medline.txt was not modified."""
+    source = PubMedNLMSource()
+    cache = DownloadCache(isolated_test_cache)
+
+    previous = SourceDownloads(source.get_name(), cache)
+    for url, text in (
+        (source.medline_url, _SAMPLE_MEDLINE_TEXT),
+        (source.catalog_url, ""),
+    ):
+        with previous.stream(url, 200, Message(), _file_stream(text)) as stream:
+            stream.read()
+    previous.commit()
+
+    source._downloads = SourceDownloads(source.get_name(), cache)
+    with patch.object(
+        source,
+        "_open_file_blocking",
+        side_effect=[
+            (304, Message(), None),
+            (200, Message(), _file_stream(_SAMPLE_CATALOG_TEXT)),
+        ],
+    ):
+        chunks = [chunk async for chunk in source.fetch_chunks()]
+
+    assert [e["journal_name"] for chunk in chunks for e in chunk] == [
+        "New England Journal of Medicine",
+        "Lancet",
+        "Journal of Rare Biology",
+    ]
+    assert not source.downloads.unchanged
@@ -1,13 +1,48 @@
 # SPDX-License-Identifier: MIT
 """Tests for RetractionWatchSource data source."""
 
+import subprocess
 from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+from aletheia_probe.cache import DownloadCache
 from aletheia_probe.enums import AssessmentType
-from aletheia_probe.updater.sources.retraction_watch import RetractionWatchSource
+from aletheia_probe.updater.downloads import SourceDownloads
+from aletheia_probe.updater.sources.retraction_watch import (
+    RetractionWatchSource,
+    _changed_line_ranges,
+)
+
+
+CSV_HEADER = (
+    "Title,Journal,Publisher,RetractionDate,OriginalPaperDOI,"
+    "RetractionNature,Reason,RetractionDOI\n"
+)
+ROW_A = (
+    '"Paper A\nwith a long title",Journal of Tests,Test Press,'
+    "01/15/2024 00:00,10.1/A,Retraction,Fraud,\n"
+)
+ROW_B = (
+    "Paper B,Journal of Tests,Test Press,02/15/2024 00:00,10.1/b,Retraction,Error,\n"
+)
+ROW_C = "Paper C,Other Journal,Other Press,03/15/2024 00:00,10.1/c,Retraction,Error,\n"
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _commit_csv(repo: Path, filename: str, content: str) -> None:
+    (repo / filename).write_text(content, encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "update")
 
 
 class TestRetractionWatchSource:
@@ -93,6 +128,59 @@ class TestRetractionWatchSource:
                 result = await source.fetch_data()
                 assert result == []
 
+    def test_changed_line_ranges(self, source):
+        """Test that hunk headers are read as inclusive line ranges."""
+        diff = [
+            "diff --git a/data.csv b/data.csv",
+            "@@ -3 +3 @@",
+            "@@ -5,2 +4,0 @@",
+            "@@ -9,0 +8,3 @@",
+        ]
+
+        assert _changed_line_ranges(diff) == ([(3, 3), (5, 6)], [(3, 3), (8, 10)])
+
+    @pytest.mark.asyncio
+    async def test_persistent_clone_processes_changed_dois(
+        self, source, tmp_path, isolated_test_cache
+    ):
+        """Test that later syncs fetch into the clone and only write changed DOIs."""
+        upstream = tmp_path / "upstream"
+        upstream.mkdir()
+        _git(upstream, "init", "-q")
+        _commit_csv(upstream, source.csv_filename, CSV_HEADER + ROW_A + ROW_B + ROW_C)
+        source.repo_url = upstream.as_uri()
+        cache = DownloadCache(isolated_test_cache)
+
+        async def sync() -> list[dict]:
+            source._downloads = SourceDownloads(source.get_name(), cache)
+            journals = await source.fetch_data()
+            source.downloads.commit()
+            return journals
+
+        first = await sync()
+        assert "_article_retractions_delta" not in first[0]["metadata"]
+        assert len(first[0]["metadata"]["_article_retractions"]) == 3
+
+        assert await sync() == []
+        assert source.downloads.unchanged
+
+        row_d = ROW_C.replace("Paper C", "Paper D").replace("10.1/c", "10.1/d")
+        _commit_csv(
+            upstream,
+            source.csv_filename,
+            CSV_HEADER + ROW_A + ROW_B.replace("Error", "Plagiarism") + row_d,
+        )
+        journals = await sync()
+
+        metadata = journals[0]["metadata"]
+        assert [a["doi"] for a in metadata["_article_retractions"]] == [
+            "10.1/b",
+            "10.1/d",
+        ]
+        assert metadata["_article_retractions_delta"]["removed_dois"] == ["10.1/c"]
+        # Journal statistics still cover the whole CSV
+        assert sum(j["metadata"]["total_retractions"] for j in journals) == 3
+
     @pytest.mark.parametrize(
         ("retraction_nature", "expected"),
         [